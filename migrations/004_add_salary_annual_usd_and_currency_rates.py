@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Migration 004: Add annualized USD salary and the currency rates table.
+
+This migration adds:
+1. salary_annual_usd column to jobs and rejected_jobs (salary_min annualized and
+   converted to USD at ingest time)
+2. currency_rates table holding USD rates per currency with effective dates
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import CurrencyRate
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import Column, Numeric, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - add salary_annual_usd and create currency_rates."""
+    print("Adding salary_annual_usd columns...")
+
+    column = Column("salary_annual_usd", Numeric(12, 2), nullable=True)
+    tables = ["jobs", "rejected_jobs"]
+
+    with engine.connect() as conn:
+        for table_name in tables:
+            print(f"  Updating {table_name} table...")
+            try:
+                if engine.dialect.name == "sqlite":
+                    result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+                    existing_columns = [row[1] for row in result.fetchall()]
+                else:  # PostgreSQL
+                    result = conn.execute(
+                        text(
+                            "SELECT column_name FROM information_schema.columns "
+                            f"WHERE table_name = '{table_name}'"
+                        )
+                    )
+                    existing_columns = [row[0] for row in result.fetchall()]
+
+                if column.name not in existing_columns:
+                    conn.execute(
+                        text(f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column.type}")
+                    )
+                    print(f"    Added column: {column.name}")
+                else:
+                    print(f"    Column {column.name} already exists, skipping")
+
+            except Exception as e:
+                print(f"    Warning: Could not add column {column.name} to {table_name}: {e}")
+
+        conn.commit()
+
+    print("  Creating currency_rates table (if missing)...")
+    CurrencyRate.__table__.create(bind=engine, checkfirst=True)
+
+    print("Migration 004 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop currency_rates and the salary_annual_usd columns."""
+    print("Rolling back migration 004...")
+
+    CurrencyRate.__table__.drop(bind=engine, checkfirst=True)
+    print("  Dropped currency_rates table")
+
+    # Note: Removing columns from SQLite is complex and requires recreating the table
+    print("  Warning: Column removal not implemented for SQLite. Manual intervention required.")
+    print("  For PostgreSQL, you can manually run:")
+    print("    ALTER TABLE jobs DROP COLUMN salary_annual_usd;")
+    print("    ALTER TABLE rejected_jobs DROP COLUMN salary_annual_usd;")
+    print("Migration 004 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 004 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Migration 005: Add the companies table and company references on jobs.
+
+This migration adds:
+1. companies table with one row per canonical company key
+2. company_id column (referencing companies.id) to jobs and rejected_jobs
+3. Backfill of companies and company_id from existing company_name values
+
+The backfill is set-based: companies are inserted for every distinct name, the
+name -> company id map is loaded into a temporary table, and company_id is set with
+one UPDATE ... FROM that table per id batch, each committed on its own.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import Company
+from job_ingestion.transformation.normalizers import company_storage_key
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+TABLES = ["jobs", "rejected_jobs"]
+BATCH_SIZE = 10_000
+NAME_MAX_LENGTH = 255
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - create companies, add company_id and backfill it."""
+    print("  Creating companies table (if missing)...")
+    Company.__table__.create(bind=engine, checkfirst=True)
+
+    print("Adding company_id columns...")
+    with engine.connect() as conn:
+        for table_name in TABLES:
+            print(f"  Updating {table_name} table...")
+            try:
+                if engine.dialect.name == "sqlite":
+                    result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+                    existing_columns = [row[1] for row in result.fetchall()]
+                else:  # PostgreSQL
+                    result = conn.execute(
+                        text(
+                            "SELECT column_name FROM information_schema.columns "
+                            f"WHERE table_name = '{table_name}'"
+                        )
+                    )
+                    existing_columns = [row[0] for row in result.fetchall()]
+
+                if "company_id" not in existing_columns:
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {table_name} ADD COLUMN company_id INTEGER "
+                            "REFERENCES companies(id)"
+                        )
+                    )
+                    conn.execute(
+                        text(
+                            f"CREATE INDEX IF NOT EXISTS ix_{table_name}_company_id "
+                            f"ON {table_name} (company_id)"
+                        )
+                    )
+                    print("    Added column: company_id")
+                else:
+                    print("    Column company_id already exists, skipping")
+
+            except Exception as e:
+                print(f"    Warning: Could not add column company_id to {table_name}: {e}")
+
+        conn.commit()
+
+    print("Backfilling companies from company_name...")
+    with engine.connect() as conn:
+        names: set[str] = set()
+        for table_name in TABLES:
+            names.update(
+                conn.execute(
+                    text(
+                        f"SELECT DISTINCT company_name FROM {table_name} "
+                        "WHERE company_name IS NOT NULL AND company_id IS NULL"
+                    )
+                ).scalars()
+            )
+        # Same keys as the ingest-time CompanyIndex, so no company is created twice
+        key_by_name = {name: key for name in names if (key := company_storage_key(name))}
+
+        ids = dict(conn.execute(text("SELECT canonical_key, id FROM companies")).tuples().all())
+        new_companies: dict[str, str] = {}
+        for name, key in sorted(key_by_name.items()):
+            if key not in ids:
+                new_companies.setdefault(key, name.strip()[:NAME_MAX_LENGTH])
+        if new_companies:
+            conn.execute(
+                text("INSERT INTO companies (canonical_key, name) VALUES (:key, :name)"),
+                [{"key": key, "name": name} for key, name in new_companies.items()],
+            )
+            ids = dict(conn.execute(text("SELECT canonical_key, id FROM companies")).tuples().all())
+        print(f"  Created {len(new_companies)} companies")
+
+        conn.execute(
+            text(
+                "CREATE TEMPORARY TABLE company_name_ids "
+                "(company_name TEXT PRIMARY KEY, company_id INTEGER NOT NULL)"
+            )
+        )
+        if key_by_name:
+            conn.execute(
+                text("INSERT INTO company_name_ids VALUES (:name, :id)"),
+                [{"name": name, "id": ids[key]} for name, key in key_by_name.items()],
+            )
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("ANALYZE company_name_ids"))
+        conn.commit()
+
+        for table_name in TABLES:
+            low, high = conn.execute(text(f"SELECT min(id), max(id) FROM {table_name}")).one()
+            conn.commit()
+            if low is None:
+                continue
+            linked = 0
+            for start in range(low, high + 1, BATCH_SIZE):
+                result = conn.execute(
+                    text(
+                        f"UPDATE {table_name} SET company_id = m.company_id "
+                        "FROM company_name_ids AS m "
+                        f"WHERE {table_name}.company_name = m.company_name "
+                        f"AND {table_name}.company_id IS NULL "
+                        f"AND {table_name}.id >= :low AND {table_name}.id < :high"
+                    ),
+                    {"low": start, "high": start + BATCH_SIZE},
+                )
+                conn.commit()
+                linked += result.rowcount or 0
+            print(f"  Linked {linked} rows in {table_name}")
+
+        conn.execute(text("DROP TABLE company_name_ids"))
+        conn.commit()
+
+    print("Migration 005 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop company_id references and the companies table."""
+    print("Rolling back migration 005...")
+
+    # Note: Removing columns from SQLite is complex and requires recreating the table
+    print("  Warning: Column removal not implemented for SQLite. Manual intervention required.")
+    print("  For PostgreSQL, you can manually run:")
+    print("    ALTER TABLE jobs DROP COLUMN company_id;")
+    print("    ALTER TABLE rejected_jobs DROP COLUMN company_id;")
+    print("    DROP TABLE companies;")
+    print("Migration 005 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 005 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
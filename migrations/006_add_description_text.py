@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Migration 006: Add plain-text description columns.
+
+This migration adds to jobs and rejected_jobs:
+1. description_text - plain text extracted from the HTML description at ingest
+2. description_length - character count of description_text
+3. description_word_count - word count of description_text
+
+Existing rows are backfilled from full_description (or short_description).
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.transformation.html_text import extract_text
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import Column, Integer, Text, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+TABLES = ["jobs", "rejected_jobs"]
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - add description text columns and backfill them."""
+    print("Adding description text columns...")
+
+    new_columns = [
+        Column("description_text", Text, nullable=True),
+        Column("description_length", Integer, nullable=True),
+        Column("description_word_count", Integer, nullable=True),
+    ]
+
+    with engine.connect() as conn:
+        for table_name in TABLES:
+            print(f"  Updating {table_name} table...")
+            try:
+                if engine.dialect.name == "sqlite":
+                    result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+                    existing_columns = [row[1] for row in result.fetchall()]
+                else:  # PostgreSQL
+                    result = conn.execute(
+                        text(
+                            "SELECT column_name FROM information_schema.columns "
+                            f"WHERE table_name = '{table_name}'"
+                        )
+                    )
+                    existing_columns = [row[0] for row in result.fetchall()]
+
+                for column in new_columns:
+                    if column.name not in existing_columns:
+                        conn.execute(
+                            text(f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column.type}")
+                        )
+                        print(f"    Added column: {column.name}")
+                    else:
+                        print(f"    Column {column.name} already exists, skipping")
+
+            except Exception as e:
+                print(f"    Warning: Could not add columns to {table_name}: {e}")
+
+        conn.commit()
+
+    print("Backfilling description text...")
+    for table_name in TABLES:
+        updated = 0
+        last_id = 0
+        while True:
+            with engine.begin() as conn:
+                rows = conn.execute(
+                    text(
+                        f"SELECT id, full_description, short_description FROM {table_name} "
+                        "WHERE id > :last_id AND description_text IS NULL ORDER BY id LIMIT :n"
+                    ),
+                    {"last_id": last_id, "n": BACKFILL_BATCH_SIZE},
+                ).all()
+                if not rows:
+                    break
+                for row_id, full, short in rows:
+                    extracted = extract_text(full or short)
+                    if extracted is not None:
+                        conn.execute(
+                            text(
+                                f"UPDATE {table_name} SET description_text = :text, "
+                                "description_length = :length, "
+                                "description_word_count = :words WHERE id = :id"
+                            ),
+                            {
+                                "text": extracted.text,
+                                "length": extracted.length,
+                                "words": extracted.word_count,
+                                "id": row_id,
+                            },
+                        )
+                        updated += 1
+                last_id = rows[-1][0]
+        print(f"  Backfilled {updated} rows in {table_name}")
+
+    print("Migration 006 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - remove description text columns."""
+    print("Rolling back migration 006...")
+
+    # Note: Removing columns from SQLite is complex and requires recreating the table
+    print("  Warning: Column removal not implemented for SQLite. Manual intervention required.")
+    print("  For PostgreSQL, you can manually run:")
+    for table_name in TABLES:
+        for column in ("description_text", "description_length", "description_word_count"):
+            print(f"    ALTER TABLE {table_name} DROP COLUMN {column};")
+    print("Migration 006 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 006 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Migration 007: Add per-rule approval outcomes.
+
+This migration:
+1. Creates approval_rule_sets (rule set versions and their ordered rules)
+2. Adds to jobs and rejected_jobs:
+   - rule_set_version - version of the rule set that produced the outcomes
+   - rule_failures - bitmask of the rules that rejected the job
+   - rule_checked - bitmask of the rules that were evaluated
+   - approval_context - evaluated fields that have no column of their own
+
+Existing rows keep NULL outcomes; they can be re-evaluated with
+`job_ingestion.ingestion.reevaluation.reevaluate_stored_jobs(..., include_unversioned=True)`.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import ApprovalRuleSet
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import JSON, BigInteger, Column, String, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+TABLES = ["jobs", "rejected_jobs"]
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - create approval_rule_sets and add outcome columns."""
+    print("Creating approval_rule_sets table...")
+    ApprovalRuleSet.__table__.create(bind=engine, checkfirst=True)
+
+    print("Adding rule outcome columns...")
+
+    new_columns = [
+        Column("rule_set_version", String(32), nullable=True),
+        Column("rule_failures", BigInteger, nullable=True),
+        Column("rule_checked", BigInteger, nullable=True),
+        Column("approval_context", JSON, nullable=True),
+    ]
+
+    with engine.connect() as conn:
+        for table_name in TABLES:
+            print(f"  Updating {table_name} table...")
+            try:
+                if engine.dialect.name == "sqlite":
+                    result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+                    existing_columns = [row[1] for row in result.fetchall()]
+                else:  # PostgreSQL
+                    result = conn.execute(
+                        text(
+                            "SELECT column_name FROM information_schema.columns "
+                            f"WHERE table_name = '{table_name}'"
+                        )
+                    )
+                    existing_columns = [row[0] for row in result.fetchall()]
+
+                for column in new_columns:
+                    if column.name not in existing_columns:
+                        column_type = column.type.compile(dialect=engine.dialect)
+                        conn.execute(
+                            text(f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column_type}")
+                        )
+                        print(f"    Added column: {column.name}")
+                    else:
+                        print(f"    Column {column.name} already exists, skipping")
+
+                conn.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_rule_set_version "
+                        f"ON {table_name} (rule_set_version)"
+                    )
+                )
+                print(f"    Ensured index: ix_{table_name}_rule_set_version")
+
+            except Exception as e:
+                print(f"    Warning: Could not add columns to {table_name}: {e}")
+
+        conn.commit()
+
+    print("Migration 007 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - remove rule outcome columns and approval_rule_sets."""
+    print("Rolling back migration 007...")
+
+    ApprovalRuleSet.__table__.drop(bind=engine, checkfirst=True)
+    print("  Dropped approval_rule_sets table")
+
+    # Note: Removing columns from SQLite is complex and requires recreating the table
+    print("  Warning: Column removal not implemented for SQLite. Manual intervention required.")
+    print("  For PostgreSQL, you can manually run:")
+    for table_name in TABLES:
+        print(f"    DROP INDEX IF EXISTS ix_{table_name}_rule_set_version;")
+        for column in ("rule_set_version", "rule_failures", "rule_checked", "approval_context"):
+            print(f"    ALTER TABLE {table_name} DROP COLUMN {column};")
+    print("Migration 007 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 007 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
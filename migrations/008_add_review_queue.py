@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Migration 008: Add the manual-review queue.
+
+This migration:
+1. Adds MANUAL_REVIEW to the approvalstatus enum type (PostgreSQL only; SQLite
+   stores the status as plain text)
+2. Creates review_queue with its covering indexes for reviewer listings
+   (ix_review_queue_score_job, ix_review_queue_schema_score_job)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import ReviewQueueItem
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - add the MANUAL_REVIEW status and create review_queue."""
+    if engine.dialect.name == "postgresql":
+        print("Adding MANUAL_REVIEW to approvalstatus...")
+        # ALTER TYPE ... ADD VALUE cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ALTER TYPE approvalstatus ADD VALUE IF NOT EXISTS 'MANUAL_REVIEW'"))
+
+    print("Creating review_queue table and indexes...")
+    ReviewQueueItem.__table__.create(bind=engine, checkfirst=True)
+
+    print("Migration 008 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop review_queue."""
+    print("Rolling back migration 008...")
+
+    ReviewQueueItem.__table__.drop(bind=engine, checkfirst=True)
+    print("  Dropped review_queue table")
+
+    # PostgreSQL cannot drop a value from an enum type
+    print("  Note: jobs still in MANUAL_REVIEW keep that status; approve or reject them")
+    print("  before downgrading. The enum value itself is left in place.")
+    print("Migration 008 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 008 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
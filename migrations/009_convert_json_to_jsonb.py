@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Migration 009: Store JSON columns as JSONB on PostgreSQL.
+
+This migration (PostgreSQL only; SQLite keeps storing JSON as text):
+1. Converts the JSON columns of jobs and rejected_jobs to JSONB without rewriting
+   the table under an exclusive lock:
+   - adds a JSONB shadow column <column>__jsonb and a trigger that keeps it in
+     sync with rows inserted or updated from then on
+   - backfills it in id batches, one short transaction per batch
+   - under a brief lock, drops the trigger and the old column and renames the
+     shadow column (no rows are reparsed while writes are blocked)
+2. Converts approval_rule_sets.rules (a small table) in place
+3. Creates the GIN indexes (jsonb_path_ops) used by containment queries, with
+   CREATE INDEX CONCURRENTLY (skip with --skip-gin-indexes):
+   - ix_jobs_classifications_data_gin
+   - ix_jobs_locations_data_gin
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import text
+
+TABLES = ["jobs", "rejected_jobs"]
+JSON_COLUMNS = [
+    "locations_data",
+    "classifications_data",
+    "posted_dates",
+    "candidate_residency",
+    "questions",
+    "featured_data",
+    "additional_metadata",
+    "approval_context",
+]
+GIN_INDEXES = [("jobs", "classifications_data"), ("jobs", "locations_data")]
+
+
+def _column_type(conn: Connection, table_name: str, column: str) -> str | None:
+    result = conn.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = :column"
+        ),
+        {"table": table_name, "column": column},
+    )
+    row = result.fetchone()
+    return None if row is None else str(row[0])
+
+
+def _sync_names(table_name: str, column: str) -> tuple[str, str]:
+    """Names of the trigger function and trigger keeping ``<column>__jsonb`` current."""
+    return f"{table_name}_{column}_jsonb_sync", f"{table_name}_{column}_jsonb_sync_trigger"
+
+
+def _sync_ddl(table_name: str, column: str) -> list[str]:
+    shadow = f"{column}__jsonb"
+    function, trigger = _sync_names(table_name, column)
+    return [
+        f"CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$ "
+        f"BEGIN NEW.{shadow} := NEW.{column}::text::jsonb; RETURN NEW; END "
+        "$$ LANGUAGE plpgsql",
+        f"DROP TRIGGER IF EXISTS {trigger} ON {table_name}",
+        f"CREATE TRIGGER {trigger} BEFORE INSERT OR UPDATE OF {column} ON {table_name} "
+        f"FOR EACH ROW EXECUTE FUNCTION {function}()",
+    ]
+
+
+def _drop_sync_ddl(table_name: str, column: str) -> list[str]:
+    function, trigger = _sync_names(table_name, column)
+    return [
+        f"DROP TRIGGER IF EXISTS {trigger} ON {table_name}",
+        f"DROP FUNCTION IF EXISTS {function}()",
+    ]
+
+
+def _convert_column(engine: Engine, table_name: str, column: str, batch_size: int) -> None:
+    shadow = f"{column}__jsonb"
+    with engine.begin() as conn:
+        current = _column_type(conn, table_name, column)
+        if current is None or current == "jsonb":
+            print(f"    {column}: {current or 'missing'}, skipping")
+            return
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {shadow} jsonb"))
+        # Rows written from here on are kept in sync by the trigger; the backfill
+        # below only has to cover rows that existed before it was created
+        for statement in _sync_ddl(table_name, column):
+            conn.execute(text(statement))
+        low, high = conn.execute(text(f"SELECT min(id), max(id) FROM {table_name}")).one()
+
+    if low is not None:
+        for start in range(low, high + 1, batch_size):
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        f"UPDATE {table_name} SET {shadow} = {column}::text::jsonb "
+                        f"WHERE id >= :low AND id < :high AND {column} IS NOT NULL"
+                    ),
+                    {"low": start, "high": start + batch_size},
+                )
+        print(f"    {column}: backfilled ids {low}..{high}")
+
+    with engine.begin() as conn:
+        # The shadow column is already current, so the lock is held only for the swap
+        for statement in _drop_sync_ddl(table_name, column):
+            conn.execute(text(statement))
+        conn.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column}"))
+        conn.execute(text(f"ALTER TABLE {table_name} RENAME COLUMN {shadow} TO {column}"))
+    print(f"    {column}: converted to jsonb")
+
+
+def upgrade(engine: Engine, batch_size: int = 10_000, gin_indexes: bool = True) -> None:
+    """Apply the migration - convert JSON columns to JSONB and add GIN indexes."""
+    if engine.dialect.name != "postgresql":
+        print("Not PostgreSQL: JSON columns are stored as text, nothing to convert.")
+        print("Migration 009 completed successfully!")
+        return
+
+    print("Converting JSON columns to JSONB...")
+    for table_name in TABLES:
+        print(f"  Updating {table_name} table...")
+        for column in JSON_COLUMNS:
+            _convert_column(engine, table_name, column, batch_size)
+
+    print("  Updating approval_rule_sets table...")
+    with engine.begin() as conn:
+        if _column_type(conn, "approval_rule_sets", "rules") not in (None, "jsonb"):
+            conn.execute(
+                text(
+                    "ALTER TABLE approval_rule_sets "
+                    "ALTER COLUMN rules TYPE jsonb USING rules::text::jsonb"
+                )
+            )
+            print("    rules: converted to jsonb")
+
+    if gin_indexes:
+        print("Creating GIN indexes...")
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for table_name, column in GIN_INDEXES:
+                name = f"ix_{table_name}_{column}_gin"
+                conn.execute(
+                    text(
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                        f"ON {table_name} USING gin ({column} jsonb_path_ops)"
+                    )
+                )
+                print(f"    Ensured index: {name}")
+
+    print("Migration 009 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop the GIN indexes and convert JSONB back to JSON."""
+    print("Rolling back migration 009...")
+    if engine.dialect.name != "postgresql":
+        print("Migration 009 rollback completed!")
+        return
+
+    with engine.begin() as conn:
+        for table_name, column in GIN_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_{table_name}_{column}_gin"))
+        print("  Dropped GIN indexes")
+        for table_name in TABLES:
+            for column in JSON_COLUMNS:
+                # Left behind if an upgrade stopped mid-conversion
+                for statement in _drop_sync_ddl(table_name, column):
+                    conn.execute(text(statement))
+                conn.execute(
+                    text(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS {column}__jsonb")
+                )
+                if _column_type(conn, table_name, column) == "jsonb":
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {table_name} "
+                            f"ALTER COLUMN {column} TYPE json USING {column}::json"
+                        )
+                    )
+            print(f"  Converted {table_name} JSON columns back to json")
+        conn.execute(
+            text("ALTER TABLE approval_rule_sets ALTER COLUMN rules TYPE json USING rules::json")
+        )
+    print("Migration 009 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    parser = argparse.ArgumentParser(description="Migration 009: JSON columns to JSONB")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per backfill batch")
+    parser.add_argument("--skip-gin-indexes", action="store_true", help="Do not create GIN indexes")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 009 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine, batch_size=args.batch_size, gin_indexes=not args.skip_gin_indexes)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Migration 010: Partition rejected_jobs by created_at month (PostgreSQL only).
+
+Optional: apply it when rejected_jobs retention should drop whole partitions
+instead of deleting rows (see job_ingestion.storage.partitions). Stop ingestion
+while it runs; existing rows are copied once.
+
+This migration:
+1. Renames rejected_jobs to rejected_jobs_unpartitioned
+2. Creates rejected_jobs partitioned by RANGE (created_at), keeping the id sequence
+3. Creates monthly partitions (rejected_jobs_pYYYY_MM) from the oldest row's month
+   through PARTITION_MONTHS_AHEAD months ahead, plus rejected_jobs_default
+4. Copies the rows in id batches and drops the old table
+5. Adds the primary key (id, created_at; a partitioned table's unique keys must
+   include the partition column), the companies foreign key and the indexes
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import RejectedJob
+from job_ingestion.storage.partitions import ensure_partitions, is_partitioned
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+TABLE = "rejected_jobs"
+LEGACY = "rejected_jobs_unpartitioned"
+
+
+def upgrade(engine: Engine, months_ahead: int = 3, batch_size: int = 50_000) -> None:
+    """Apply the migration - convert rejected_jobs into a partitioned table."""
+    if engine.dialect.name != "postgresql":
+        print("Not PostgreSQL: rejected_jobs stays a plain table (batched retention).")
+        print("Migration 010 completed successfully!")
+        return
+
+    today = datetime.now(timezone.utc).date()
+    with engine.begin() as conn:
+        if is_partitioned(conn, TABLE):
+            print("rejected_jobs is already partitioned; ensuring upcoming partitions...")
+            for name in ensure_partitions(conn, months_ahead, today):
+                print(f"  Created partition: {name}")
+            print("Migration 010 completed successfully!")
+            return
+
+        print("Creating partitioned rejected_jobs...")
+        conn.execute(text(f"ALTER TABLE {TABLE} RENAME TO {LEGACY}"))
+        conn.execute(
+            text(
+                f"CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS) "
+                "PARTITION BY RANGE (created_at)"
+            )
+        )
+        # The id sequence would be dropped with the old table otherwise
+        sequence = conn.execute(text(f"SELECT pg_get_serial_sequence('{LEGACY}', 'id')")).scalar()
+        if sequence:
+            conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE}.id"))
+
+        oldest, low, high = conn.execute(
+            text(f"SELECT min(created_at), min(id), max(id) FROM {LEGACY}")
+        ).one()
+        first_month = oldest.date() if oldest is not None else today
+        for name in ensure_partitions(conn, months_ahead, today, first_month=first_month):
+            print(f"  Created partition: {name}")
+        conn.execute(
+            text(f"CREATE TABLE IF NOT EXISTS {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        )
+        print(f"  Created partition: {TABLE}_default")
+
+    if low is not None:
+        print("Copying rows...")
+        for start in range(low, high + 1, batch_size):
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        f"INSERT INTO {TABLE} SELECT * FROM {LEGACY} "
+                        "WHERE id >= :low AND id < :high"
+                    ),
+                    {"low": start, "high": start + batch_size},
+                )
+        print(f"  Copied ids {low}..{high}")
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE {LEGACY}"))
+        print(f"  Dropped {LEGACY}")
+        conn.execute(text(f"ALTER TABLE {TABLE} ADD PRIMARY KEY (id, created_at)"))
+        conn.execute(
+            text(f"ALTER TABLE {TABLE} ADD FOREIGN KEY (company_id) REFERENCES companies (id)")
+        )
+        for index in RejectedJob.__table__.indexes:
+            index.create(bind=conn)
+            print(f"  Created index: {index.name}")
+
+    print("Migration 010 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - print how to return to a plain table."""
+    print("Rolling back migration 010...")
+    print("  Warning: automatic rollback not implemented. For PostgreSQL, you can run:")
+    print(f"    ALTER TABLE {TABLE} RENAME TO {TABLE}_partitioned;")
+    print(f"    CREATE TABLE {TABLE} (LIKE {TABLE}_partitioned INCLUDING ALL);")
+    print(f"    INSERT INTO {TABLE} SELECT * FROM {TABLE}_partitioned;")
+    print(f"    ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id;")
+    print(f"    DROP TABLE {TABLE}_partitioned;")
+    print("  then restore the primary key on (id) and the foreign key to companies.")
+    print("Migration 010 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Migration 010: partition rejected_jobs")
+    parser.add_argument("--months-ahead", type=int, default=settings.partition_months_ahead)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows copied per batch")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 010 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine, months_ahead=args.months_ahead, batch_size=args.batch_size)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Migration 011: Add indexes for the job read paths.
+
+This migration creates (IF NOT EXISTS; CONCURRENTLY on PostgreSQL, so writes are not
+blocked while they build, except on a partitioned rejected_jobs):
+1. Partial indexes over active approved jobs:
+   - ix_jobs_active_posting_date (posting_date, id)
+   - ix_jobs_active_company_posting_date (company_id, posting_date, id)
+   - ix_jobs_active_collapse_key (collapse_key, posting_date), non-null keys only
+2. ix_jobs_approval_status_created_at (approval_status, created_at)
+3. ix_rejected_jobs_created_at (created_at), used by age-based retention
+
+Check the result with `python -m job_ingestion.storage.index_advisor`.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import Job, RejectedJob
+from job_ingestion.storage.partitions import is_partitioned
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import Index, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql import text
+
+INDEX_NAMES = {
+    "jobs": [
+        "ix_jobs_active_posting_date",
+        "ix_jobs_active_company_posting_date",
+        "ix_jobs_active_collapse_key",
+        "ix_jobs_approval_status_created_at",
+    ],
+    "rejected_jobs": ["ix_rejected_jobs_created_at"],
+}
+
+
+def _indexes() -> list[Index]:
+    by_name = {i.name: i for model in (Job, RejectedJob) for i in model.__table__.indexes}
+    return [by_name[name] for names in INDEX_NAMES.values() for name in names]
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - create the read path indexes."""
+    print("Creating indexes...")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in _indexes():
+            ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+            # Partitioned tables (migration 010) do not support CONCURRENTLY
+            table = index.table.name if index.table is not None else ""
+            if engine.dialect.name == "postgresql" and not is_partitioned(conn, table):
+                ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+            conn.execute(text(ddl))
+            print(f"  Ensured index: {index.name}")
+
+    print("Migration 011 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop the read path indexes."""
+    print("Rolling back migration 011...")
+
+    with engine.begin() as conn:
+        for names in INDEX_NAMES.values():
+            for name in names:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                print(f"  Dropped index: {name}")
+
+    print("Migration 011 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 011 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
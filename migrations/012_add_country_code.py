@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Migration 012: Add country_code and the job listing indexes.
+
+This migration:
+1. Adds country_code (ISO alpha-2) to jobs and rejected_jobs
+2. Backfills it in id batches from the reverse-geocoded country kept in
+   approval_context (rows ingested before migration 007 stay NULL)
+3. Creates the listing indexes (IF NOT EXISTS; CONCURRENTLY on PostgreSQL, except
+   on a partitioned rejected_jobs):
+   - ix_jobs_active_country_posting_date (country_code, posting_date, id), partial
+   - ix_rejected_jobs_posting_date (posting_date, id)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.models import Job, RejectedJob
+from job_ingestion.storage.partitions import is_partitioned
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import Index, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql import text
+
+TABLES = ["jobs", "rejected_jobs"]
+INDEX_NAMES = ["ix_jobs_active_country_posting_date", "ix_rejected_jobs_posting_date"]
+BATCH_SIZE = 10_000
+
+
+def _indexes() -> list[Index]:
+    by_name = {i.name: i for model in (Job, RejectedJob) for i in model.__table__.indexes}
+    return [by_name[name] for name in INDEX_NAMES]
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - add and backfill country_code, create listing indexes."""
+    print("Adding country_code columns...")
+    if engine.dialect.name == "postgresql":
+        country = "approval_context->>'geo_country_code'"
+    else:
+        country = "json_extract(approval_context, '$.geo_country_code')"
+
+    for table_name in TABLES:
+        print(f"  Updating {table_name} table...")
+        with engine.begin() as conn:
+            if engine.dialect.name == "sqlite":
+                result = conn.execute(text(f"PRAGMA table_info({table_name})"))
+                existing_columns = [row[1] for row in result.fetchall()]
+            else:  # PostgreSQL
+                result = conn.execute(
+                    text(
+                        "SELECT column_name FROM information_schema.columns "
+                        f"WHERE table_name = '{table_name}'"
+                    )
+                )
+                existing_columns = [row[0] for row in result.fetchall()]
+            if "country_code" in existing_columns:
+                print("    Column country_code already exists, skipping")
+                continue
+            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN country_code VARCHAR(2)"))
+            print("    Added column: country_code")
+            low, high = conn.execute(text(f"SELECT min(id), max(id) FROM {table_name}")).one()
+
+        if low is None:
+            continue
+        for start in range(low, high + 1, BATCH_SIZE):
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        f"UPDATE {table_name} SET country_code = {country} "
+                        "WHERE id >= :low AND id < :high AND approval_context IS NOT NULL"
+                    ),
+                    {"low": start, "high": start + BATCH_SIZE},
+                )
+        print(f"    Backfilled ids {low}..{high}")
+
+    print("Creating indexes...")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in _indexes():
+            ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=engine.dialect))
+            table = index.table.name if index.table is not None else ""
+            if engine.dialect.name == "postgresql" and not is_partitioned(conn, table):
+                ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+            conn.execute(text(ddl))
+            print(f"  Ensured index: {index.name}")
+
+    print("Migration 012 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop the listing indexes and country_code."""
+    print("Rolling back migration 012...")
+
+    with engine.begin() as conn:
+        for name in INDEX_NAMES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            print(f"  Dropped index: {name}")
+
+    # Note: Removing columns from SQLite is complex and requires recreating the table
+    print("  Warning: Column removal not implemented for SQLite. Manual intervention required.")
+    print("  For PostgreSQL, you can manually run:")
+    for table_name in TABLES:
+        print(f"    ALTER TABLE {table_name} DROP COLUMN country_code;")
+    print("Migration 012 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 012 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Migration 013: Add full-text search over active approved jobs.
+
+This migration:
+1. Creates the search structures (see job_ingestion.storage.search):
+   - PostgreSQL: jobs.search_vector (tsvector) and the trigger that maintains it
+   - SQLite: the FTS5 table jobs_fts and the triggers that maintain it
+2. Indexes the jobs already stored (in id batches on PostgreSQL)
+3. PostgreSQL: creates the partial GIN index ix_jobs_search_vector CONCURRENTLY
+
+New rows are indexed by the triggers from step 1, so the backfill can run while
+ingestion continues.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from job_ingestion.storage.search import (
+    backfill_statements,
+    drop_search_index,
+    install_search_index,
+)
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import text
+
+BATCH_SIZE = 10_000
+
+
+def upgrade(engine: Engine) -> None:
+    """Apply the migration - create and backfill the search index."""
+    print("Creating search structures...")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if not install_search_index(conn, concurrently=engine.dialect.name == "postgresql"):
+            print(f"  Full-text search is not supported on {engine.dialect.name}, skipping")
+            return
+
+    print("Indexing stored jobs...")
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            for statement in backfill_statements("sqlite"):
+                conn.execute(text(statement))
+    else:  # PostgreSQL
+        [statement] = backfill_statements("postgresql")
+        with engine.begin() as conn:
+            low, high = conn.execute(text("SELECT min(id), max(id) FROM jobs")).one()
+        if low is not None:
+            for start in range(low, high + 1, BATCH_SIZE):
+                with engine.begin() as conn:
+                    conn.execute(text(statement), {"low": start, "high": start + BATCH_SIZE})
+            print(f"  Backfilled ids {low}..{high}")
+
+    print("Migration 013 completed successfully!")
+
+
+def downgrade(engine: Engine) -> None:
+    """Rollback the migration - drop the search index and its triggers."""
+    print("Rolling back migration 013...")
+
+    with engine.begin() as conn:
+        drop_search_index(conn)
+        print("  Dropped search index and triggers")
+
+    if engine.dialect.name == "postgresql":
+        print("  To remove the column, manually run:")
+        print("    ALTER TABLE jobs DROP COLUMN search_vector;")
+    print("Migration 013 rollback completed!")
+
+
+def main() -> None:
+    """Run the migration."""
+    settings = get_settings()
+    engine = create_engine(settings.database_url)
+
+    print(f"Running migration 013 on database: {settings.database_url}")
+    print(f"Database dialect: {engine.dialect.name}")
+
+    try:
+        upgrade(engine)
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
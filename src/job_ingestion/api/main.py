@@ -4,6 +4,9 @@ from typing import Any, TypeVar
 from fastapi import FastAPI
 
 from job_ingestion.api.routes import api_router
+from job_ingestion.storage.repositories import get_shared_sessionmaker
+from job_ingestion.transformation.companies import get_company_index
+from job_ingestion.utils.config import get_settings
 from job_ingestion.utils.logging import get_logger
 
 app = FastAPI(title="Job Ingestion Service API", version="0.1.0")
@@ -40,6 +43,13 @@ def health() -> dict[str, str]:
 def on_startup() -> None:
     # Minimal startup log to verify logging is configured
     logger.info("app.startup", message="Live reload test - modified")
+    # Create the tables and warm the company index so the first request pays for neither
+    try:
+        database_url = get_settings().database_url
+        get_shared_sessionmaker(database_url)
+        get_company_index(database_url).warm()
+    except Exception:
+        logger.warning("app.company_index_warm_failed", exc_info=True)
 
 
 # Register startup event handler without using untyped decorator
@@ -84,16 +84,169 @@ class ProcessingStatusResponse(BaseModel):
     processed: int
     approved: int
     rejected: int
+    review: int = Field(0, description="Jobs sent to manual review")
+    invalid: int = 0
     errors: int
     started_at: datetime | None
     finished_at: datetime | None
 
 
+_PERCENTILE_DESCRIPTION = (
+    "Percentile of sampled latencies; for vectorized rules in batch ingest each sample "
+    "is the per-job mean of one chunk, not a single job's latency"
+)
+
+
+class RuleProfileEntry(BaseModel):
+    """Profiling counters and sampled latency of one approval rule for one schema."""
+
+    rule: str = Field(..., example="salary_meets_requirements")
+    schema_name: str = Field(..., example="linkedin")
+    calls: int
+    rejections: int
+    rejection_rate: float
+    timed_calls: int = Field(..., description="Invocations covered by latency samples")
+    mean_ns: float
+    total_ns: float = Field(..., description="Estimated cumulative time (mean x calls)")
+    p50_ns: float = Field(..., description=_PERCENTILE_DESCRIPTION)
+    p95_ns: float = Field(..., description=_PERCENTILE_DESCRIPTION)
+    p99_ns: float = Field(..., description=_PERCENTILE_DESCRIPTION)
+
+
+class RuleProfileResponse(BaseModel):
+    """Per-rule profiling snapshot of the shared approval engine."""
+
+    sample_every: int = Field(..., description="One in N evaluations is timed")
+    rules: list[RuleProfileEntry]
+
+
+class ShadowDiffEntry(BaseModel):
+    """One job on which the candidate rule set decides differently."""
+
+    external_id: str | None = None
+    schema_name: str | None = None
+    active_approved: bool
+    candidate_approved: bool
+    active_failed: list[str]
+    candidate_failed: list[str]
+
+
+class ShadowRuleEntry(BaseModel):
+    """Divergence counts of one rule between the active and candidate rule sets."""
+
+    rule: str = Field(..., example="salary_meets_requirements")
+    compared: int = Field(..., description="Jobs on which both outcomes were known")
+    newly_failing: int
+    newly_passing: int
+    divergence_rate: float
+    samples: list[ShadowDiffEntry]
+
+
+class ShadowReportResponse(BaseModel):
+    """Aggregated shadow evaluation of the candidate approval rule set."""
+
+    enabled: bool
+    submitted: int = 0
+    evaluated: int = 0
+    dropped: int = Field(default=0, description="Jobs skipped because the shadow queue was full")
+    errors: int = 0
+    newly_approved: int = 0
+    newly_rejected: int = 0
+    rules: list[ShadowRuleEntry] = []
+    samples: list[ShadowDiffEntry] = []
+
+
+class ReviewQueueEntry(BaseModel):
+    """A job waiting for manual review."""
+
+    job_id: int
+    external_id: str | None
+    title: str
+    schema_name: str | None
+    score: float = Field(..., description="Weighted approval score; higher is closer to approval")
+    review_reasons: str
+    created_at: datetime | None
+
+
+class ReviewQueueResponse(BaseModel):
+    """One page of the manual-review queue."""
+
+    items: list[ReviewQueueEntry]
+    next_cursor: str | None = Field(None, description="Pass as `cursor` for the next page")
+
+
+class ReviewActionRequest(BaseModel):
+    """Bulk approve/reject request for jobs in manual review."""
+
+    job_ids: list[int] = Field(..., example=[101, 102], max_items=5000)
+    reason: str | None = Field(None, description="Rejection reason (reject only)")
+
+
+class ReviewActionResponse(BaseModel):
+    requested: int
+    updated: int = Field(..., description="Jobs that were in review and were moved")
+
+
+class JobSummary(BaseModel):
+    """Listing fields of a stored job (descriptions are not included)."""
+
+    id: int
+    external_id: str | None
+    title: str
+    company_id: int | None
+    company_name: str | None
+    primary_location: str | None
+    country_code: str | None
+    remote_flag: str | None
+    salary_min: float | None
+    salary_max: float | None
+    salary_currency: str | None
+    salary_unit: str | None
+    salary_annual_usd: float | None
+    posting_date: datetime | None
+    created_at: datetime | None
+    approval_status: str | None = None
+    rejection_reasons: str | None = None
+
+
+class JobListResponse(BaseModel):
+    """One page of stored jobs, newest posting date first."""
+
+    items: list[JobSummary]
+    next_cursor: str | None = Field(None, description="Pass as `cursor` for the next page")
+
+
+class JobSearchHit(JobSummary):
+    """A job matching a full-text search, with its relevance score."""
+
+    score: float = Field(..., description="Relevance; higher is better")
+
+
+class JobSearchResponse(BaseModel):
+    """One page of search results, most relevant first."""
+
+    items: list[JobSearchHit]
+    next_cursor: str | None = Field(None, description="Pass as `cursor` for the next page")
+
+
 __all__ = [
     "JobPosting",
     "PingResponse",
     "SingleJobPostingRequest",
     "IngestBatchRequest",
     "IngestResponse",
+    "JobListResponse",
+    "JobSearchHit",
+    "JobSearchResponse",
+    "JobSummary",
     "ProcessingStatusResponse",
+    "RuleProfileEntry",
+    "ReviewActionRequest",
+    "ReviewActionResponse",
+    "ReviewQueueEntry",
+    "ReviewQueueResponse",
+    "RuleProfileResponse",
+    "ShadowDiffEntry",
+    "ShadowReportResponse",
+    "ShadowRuleEntry",
 ]
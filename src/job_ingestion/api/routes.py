@@ -1,18 +1,35 @@
 from collections.abc import Callable
+from datetime import datetime
 from typing import Any, TypeVar
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Body, HTTPException
+from fastapi import APIRouter, Body, HTTPException, Query
 
 from job_ingestion.api.models import (
     IngestBatchRequest,
     IngestResponse,
+    JobListResponse,
     JobPosting,
+    JobSearchHit,
+    JobSearchResponse,
+    JobSummary,
     PingResponse,
     ProcessingStatusResponse,
+    ReviewActionRequest,
+    ReviewActionResponse,
+    ReviewQueueEntry,
+    ReviewQueueResponse,
+    RuleProfileEntry,
+    RuleProfileResponse,
+    ShadowDiffEntry,
+    ShadowReportResponse,
+    ShadowRuleEntry,
     SingleJobPostingRequest,
 )
+from job_ingestion.approval.shadow import ShadowDiff
 from job_ingestion.ingestion.service import IngestionService
+from job_ingestion.storage.job_queries import JobFilters, JobPage
+from job_ingestion.storage.models import ApprovalStatus
 from job_ingestion.utils.logging import get_logger
 
 logger = get_logger("api.routes")
@@ -54,6 +71,9 @@ INGEST_BODY_EXAMPLES: Any = {
 # Module-level Body specification referencing examples (mypy-safe via Any)
 INGEST_REQUEST_BODY: Any = Body(..., examples=INGEST_BODY_EXAMPLES)
 
+# Module-level Query specification for datetime parameters (ruff B008)
+POSTED_TO_QUERY: Any = Query(None, description="Exclusive upper bound")
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -178,7 +198,254 @@ def get_status(processing_id: UUID) -> ProcessingStatusResponse:
         processed=int(status.get("processed", 0)),
         approved=int(status.get("approved", 0)),
         rejected=int(status.get("rejected", 0)),
+        review=int(status.get("review", 0)),
+        invalid=int(status.get("invalid", 0)),
         errors=int(status.get("errors", 0)),
         started_at=status.get("started_at"),
         finished_at=status.get("finished_at"),
     )
+
+
+def _job_list_response(page: JobPage) -> JobListResponse:
+    return JobListResponse(
+        items=[JobSummary(**row._asdict()) for row in page.rows],
+        next_cursor=page.next_cursor,
+    )
+
+
+def _job_filters(
+    company_id: int | None,
+    company: str | None,
+    country: str | None,
+    remote: str | None,
+    posted_from: datetime | None,
+    posted_to: datetime | None,
+    salary_min: float | None,
+    salary_max: float | None,
+    status: str = "approved",
+    include_inactive: bool = False,
+) -> JobFilters:
+    return JobFilters(
+        status=None if status.lower() == "any" else ApprovalStatus(status.upper()),
+        active=None if include_inactive else True,
+        company_id=company_id,
+        company=company,
+        country_code=country,
+        remote_flag=remote,
+        posted_from=posted_from,
+        posted_to=posted_to,
+        salary_min=salary_min,
+        salary_max=salary_max,
+    )
+
+
+@route_get("/jobs", response_model=JobListResponse)
+def list_jobs(
+    status: str = Query("approved", description="approved, pending, manual_review or any"),
+    include_inactive: bool = False,
+    company_id: int | None = None,
+    company: str | None = Query(None, description="Company name"),
+    country: str | None = Query(None, description="ISO alpha-2 country code"),
+    remote: str | None = Query(None, description="Remote flag as stored"),
+    posted_from: datetime | None = None,
+    posted_to: datetime | None = POSTED_TO_QUERY,
+    salary_min: float | None = Query(None, description="Annualized USD salary"),
+    salary_max: float | None = Query(None, description="Annualized USD salary"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+) -> JobListResponse:
+    """Return a page of stored jobs, newest posting date first.
+
+    Defaults to active approved jobs. Pagination is keyset-based: pass the previous
+    page's ``next_cursor`` as ``cursor`` with the same filters.
+    """
+
+    try:
+        filters = _job_filters(
+            company_id,
+            company,
+            country,
+            remote,
+            posted_from,
+            posted_to,
+            salary_min,
+            salary_max,
+            status=status,
+            include_inactive=include_inactive,
+        )
+        page = IngestionService().list_jobs(filters=filters, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _job_list_response(page)
+
+
+@route_get("/jobs/rejected", response_model=JobListResponse)
+def list_rejected_jobs(
+    company_id: int | None = None,
+    company: str | None = Query(None, description="Company name"),
+    country: str | None = Query(None, description="ISO alpha-2 country code"),
+    remote: str | None = Query(None, description="Remote flag as stored"),
+    posted_from: datetime | None = None,
+    posted_to: datetime | None = POSTED_TO_QUERY,
+    salary_min: float | None = Query(None, description="Annualized USD salary"),
+    salary_max: float | None = Query(None, description="Annualized USD salary"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+) -> JobListResponse:
+    """Return a page of rejected jobs with their rejection reasons, newest first."""
+
+    filters = _job_filters(
+        company_id, company, country, remote, posted_from, posted_to, salary_min, salary_max
+    )
+    try:
+        page = IngestionService().list_jobs(
+            rejected=True, filters=filters, limit=limit, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _job_list_response(page)
+
+
+@route_get("/jobs/search", response_model=JobSearchResponse)
+def search_jobs(
+    q: str = Query(..., min_length=1, description="Words to find in title, company or description"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+) -> JobSearchResponse:
+    """Full-text search over active approved jobs, most relevant first.
+
+    Every word must match (stemmed). Pagination is keyset-based: pass the previous
+    page's ``next_cursor`` as ``cursor`` with the same ``q``.
+    """
+
+    try:
+        page = IngestionService().search_jobs(q, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return JobSearchResponse(
+        items=[JobSearchHit(**row._asdict()) for row in page.rows],
+        next_cursor=page.next_cursor,
+    )
+
+
+@route_get("/approval/rules/profile", response_model=RuleProfileResponse)
+def get_rule_profile(schema: str | None = None) -> RuleProfileResponse:
+    """Return per-rule invocation, rejection and latency statistics by source schema.
+
+    Latency figures come from sampled evaluations; counts are exact. Pass ``schema``
+    to restrict the snapshot to one source schema.
+    """
+
+    sample_every, snapshots = IngestionService.get_rule_profile(schema)
+    return RuleProfileResponse(
+        sample_every=sample_every,
+        rules=[
+            RuleProfileEntry(
+                rule=snap.rule,
+                schema_name=snap.schema,
+                calls=snap.calls,
+                rejections=snap.rejections,
+                rejection_rate=snap.rejection_rate,
+                timed_calls=snap.timed_calls,
+                mean_ns=snap.mean_ns,
+                total_ns=snap.total_ns,
+                p50_ns=snap.p50_ns,
+                p95_ns=snap.p95_ns,
+                p99_ns=snap.p99_ns,
+            )
+            for snap in snapshots
+        ],
+    )
+
+
+def _shadow_diff_entry(diff: ShadowDiff) -> ShadowDiffEntry:
+    return ShadowDiffEntry(
+        external_id=None if diff.external_id is None else str(diff.external_id),
+        schema_name=diff.schema,
+        active_approved=diff.active_approved,
+        candidate_approved=diff.candidate_approved,
+        active_failed=list(diff.active_failed),
+        candidate_failed=list(diff.candidate_failed),
+    )
+
+
+@route_get("/approval/shadow", response_model=ShadowReportResponse)
+def get_shadow_report() -> ShadowReportResponse:
+    """Return how the candidate (shadow) rule set diverges from the active one.
+
+    ``enabled`` is false when no candidate rule set is configured.
+    """
+
+    report = IngestionService.get_shadow_report()
+    if report is None:
+        return ShadowReportResponse(enabled=False)
+    return ShadowReportResponse(
+        enabled=True,
+        submitted=report.submitted,
+        evaluated=report.evaluated,
+        dropped=report.dropped,
+        errors=report.errors,
+        newly_approved=report.newly_approved,
+        newly_rejected=report.newly_rejected,
+        rules=[
+            ShadowRuleEntry(
+                rule=rule.rule,
+                compared=rule.compared,
+                newly_failing=rule.newly_failing,
+                newly_passing=rule.newly_passing,
+                divergence_rate=rule.divergence_rate,
+                samples=[_shadow_diff_entry(diff) for diff in rule.samples],
+            )
+            for rule in report.rules
+        ],
+        samples=[_shadow_diff_entry(diff) for diff in report.samples],
+    )
+
+
+@route_get("/review/queue", response_model=ReviewQueueResponse)
+def get_review_queue(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    schema: str | None = None,
+) -> ReviewQueueResponse:
+    """Return a page of jobs in manual review, highest score first.
+
+    Pagination is keyset-based: pass the previous page's ``next_cursor`` as
+    ``cursor``. ``schema`` restricts the queue to one source schema.
+    """
+
+    try:
+        page = IngestionService().get_review_queue(limit=limit, cursor=cursor, schema_name=schema)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ReviewQueueResponse(
+        items=[
+            ReviewQueueEntry(
+                job_id=item.job_id,
+                external_id=item.external_id,
+                title=item.title,
+                schema_name=item.schema_name,
+                score=item.score,
+                review_reasons=item.review_reasons,
+                created_at=item.created_at,
+            )
+            for item in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
+
+
+@route_post("/review/approve", response_model=ReviewActionResponse)
+def approve_reviewed(request: ReviewActionRequest) -> ReviewActionResponse:
+    """Approve jobs in manual review and remove them from the queue."""
+
+    updated = IngestionService().approve_reviewed(request.job_ids)
+    return ReviewActionResponse(requested=len(request.job_ids), updated=updated)
+
+
+@route_post("/review/reject", response_model=ReviewActionResponse)
+def reject_reviewed(request: ReviewActionRequest) -> ReviewActionResponse:
+    """Move jobs in manual review to the rejected jobs and remove them from the queue."""
+
+    updated = IngestionService().reject_reviewed(request.job_ids, request.reason)
+    return ReviewActionResponse(requested=len(request.job_ids), updated=updated)
@@ -0,0 +1,125 @@
+"""Columnar batch evaluation support for approval rules.
+
+`JobColumns` is a lazily built, cached columnar view over a chunk of canonical jobs.
+Rules may carry a vectorized form (attached with `vectorized`) that computes an
+approval mask for the whole chunk from these columns: numeric thresholds become a
+single NumPy comparison, and categorical checks are evaluated once per distinct value
+and broadcast back to every row. Rules without a vectorized form are
+evaluated row by row by `ApprovalEngine.evaluate_batch`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = ["BoolArray", "FloatArray", "JobColumns", "BatchRule", "vectorized", "batch_form"]
+
+BoolArray = npt.NDArray[np.bool_]
+FloatArray = npt.NDArray[np.float64]
+
+BatchRule = Callable[["JobColumns"], BoolArray]
+
+_BATCH_ATTR = "evaluate_batch"
+
+R = TypeVar("R")
+
+
+def vectorized(batch_rule: BatchRule) -> Callable[[R], R]:
+    """
+    Attach a vectorized form to a per-row rule.
+
+    The batch form receives a `JobColumns` for a chunk of jobs and returns a boolean
+    mask that must equal ``[rule(job)[0] for job in jobs]``.
+    """
+
+    def decorator(rule: R) -> R:
+        setattr(rule, _BATCH_ATTR, batch_rule)
+        return rule
+
+    return decorator
+
+
+def batch_form(rule: Any) -> BatchRule | None:
+    """Return the vectorized form attached to a rule, if any."""
+    form = getattr(rule, _BATCH_ATTR, None)
+    return form if callable(form) else None
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class JobColumns:
+    """
+    Columnar view over a sequence of job dicts.
+
+    Every accessor builds its column once per field (and per function, for derived
+    columns) and caches it, so several rules reading the same field share the work.
+    """
+
+    def __init__(self, jobs: Sequence[dict[str, Any]]) -> None:
+        self.jobs = jobs
+        self._values: dict[str, list[Any]] = {}
+        self._numeric: dict[str, FloatArray] = {}
+        self._mapped: dict[tuple[str, Callable[[Any], Any]], list[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def values(self, field: str) -> list[Any]:
+        """Raw field values (None when missing)."""
+        column = self._values.get(field)
+        if column is None:
+            column = [job.get(field) for job in self.jobs]
+            self._values[field] = column
+        return column
+
+    def numeric(self, field: str) -> FloatArray:
+        """Field values as float64, with NaN where the value is missing or not numeric."""
+        column = self._numeric.get(field)
+        if column is None:
+            column = np.fromiter(
+                (_to_float(v) for v in self.values(field)), dtype=np.float64, count=len(self)
+            )
+            self._numeric[field] = column
+        return column
+
+    def mapped(self, field: str, fn: Callable[[Any], Any]) -> list[Any]:
+        """
+        ``fn(value)`` for every row, computed once per distinct value.
+
+        Unhashable values (dicts, lists) are passed to ``fn`` individually.
+        """
+        cache_key = (field, fn)
+        column = self._mapped.get(cache_key)
+        if column is not None:
+            return column
+        # Keyed by type as well so that e.g. True, 1 and 1.0 stay distinct categories
+        seen: dict[tuple[type, Any], Any] = {}
+        column = []
+        for value in self.values(field):
+            key = (value.__class__, value)
+            try:
+                result = seen[key]
+            except KeyError:
+                result = seen[key] = fn(value)
+            except TypeError:
+                result = fn(value)
+            column.append(result)
+        self._mapped[cache_key] = column
+        return column
+
+    def mask(self, field: str, predicate: Callable[[Any], bool]) -> BoolArray:
+        """Boolean column of ``predicate(value)``, evaluated once per distinct value."""
+        return np.fromiter(
+            (bool(v) for v in self.mapped(field, predicate)), dtype=np.bool_, count=len(self)
+        )
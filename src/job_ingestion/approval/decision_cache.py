@@ -0,0 +1,119 @@
+"""Per-rule decision caching keyed by the features a rule reads.
+
+A rule declared with `approval.features.uses_features` is a pure function of its
+declared features and its configuration snapshot. Postings commonly share those values
+(same employment type, country, language, salary), so `RuleDecisionCache` keeps a
+bounded LRU from the tuple of feature values to the rule's result. The cache empties
+itself when the rule's configuration snapshot changes; `ApprovalEngine` creates fresh
+caches whenever its rule set changes.
+
+Only scalar rule calls go through the cache. In `ApprovalEngine.evaluate_batch`, a
+rule's vectorized form decides the chunk without it, and the cache is consulted when
+the reasons of rejected jobs are collected and for rules without a vectorized form.
+During ingest, rejection reasons for repeated feature values are therefore served
+from the cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from .features import declared_features, get_features, rule_config
+
+__all__ = ["RuleDecisionCache"]
+
+RuleResult = tuple[bool, str | None]
+
+_UNSET = object()
+
+
+class RuleDecisionCache:
+    """
+    Bounded LRU of one rule's results keyed by its declared feature values.
+
+    Example:
+        >>> from job_ingestion.approval.features import uses_features
+        >>> @uses_features("employment_type")
+        ... def full_time(job):
+        ...     return (True, None) if job.get("employment_type") == "Full-Time" else (False, "no")
+        >>> cache = RuleDecisionCache.for_rule(full_time, maxsize=16)
+        >>> key = cache.key({"employment_type": " Full-Time"})
+        >>> cache.get(key) is None
+        True
+        >>> cache.put(key, (False, "no")); cache.get(key)
+        (False, 'no')
+    """
+
+    __slots__ = ("features", "config", "maxsize", "_entries", "_snapshot", "hits", "misses")
+
+    def __init__(
+        self,
+        features: tuple[str, ...],
+        config: Callable[[], Any] | None = None,
+        maxsize: int = 4096,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.features = features
+        self.config = config
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, RuleResult] = OrderedDict()
+        self._snapshot: Any = _UNSET
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_rule(cls, rule: Any, maxsize: int = 4096) -> RuleDecisionCache | None:
+        """Return a cache for a rule that declares features, else None."""
+        features = declared_features(rule)
+        if not features:
+            return None
+        return cls(features, rule_config(rule), maxsize)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def key(self, job: dict[str, Any]) -> Hashable | None:
+        """
+        The cache key for a job, or None if a feature value is unhashable.
+
+        Checks the configuration snapshot first and drops every entry if it changed.
+        """
+        if self.config is not None:
+            snapshot = self.config()
+            if snapshot != self._snapshot:
+                self._entries.clear()
+                self._snapshot = snapshot
+        values = get_features(job)
+        key = tuple(values[name] for name in self.features)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> RuleResult | None:
+        entries = self._entries
+        result = entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: Hashable, result: RuleResult) -> None:
+        entries = self._entries
+        entries[key] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
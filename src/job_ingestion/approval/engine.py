@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from enum import Enum
+from typing import Any, Protocol
 
+import numpy as np
+
+from .batch import BoolArray, FloatArray, JobColumns, batch_form
+from .decision_cache import RuleDecisionCache
+from .features import FeaturedJob, declared_features
+from .outcomes import RuleSetSignature, rule_fingerprint
+from .profiling import RuleProfiler
 from .rules.base import ApprovalRule
+from .scoring import in_review_band, rule_required, rule_weight, scores
 
 RuleResult = tuple[bool, str | None]
 RuleCallable = Callable[[dict[str, Any]], RuleResult]
 
 
+class EvaluationMode(str, Enum):
+    """
+    How `ApprovalEngine.evaluate_job` runs the registered rules.
+
+    - AUDIT: run every rule in registration order and report every failure reason.
+    - FAST: stop at the first failing rule, trying rules in adaptive order (cheap,
+      frequently rejecting rules first). The decision is the same as in AUDIT mode but
+      only the first failure's reason is reported.
+    - SCORE: run every rule as in AUDIT mode, then send jobs whose failures are all
+      soft (optional rules, or review bands; see `approval.scoring`) to manual review
+      instead of rejecting them, with a weighted score.
+    """
+
+    AUDIT = "audit"
+    FAST = "fast"
+    SCORE = "score"
+
+
 @dataclass(frozen=True)
 class ApprovalDecision:
     """
@@ -18,6 +46,12 @@ class ApprovalDecision:
     Attributes:
         approved: Overall approval status. True only if all rules approve.
         reasons: Collected reasons from failed rules (empty if approved).
+        failed_rules: Names of the rules that rejected the job.
+        checked_rules: Names of the rules that were run; in FAST mode evaluation stops
+            at the first failure, so later rules are not checked.
+        review: SCORE mode only: the job is not approved, but every failure is soft,
+            so it goes to manual review.
+        score: SCORE mode only: ``1 - failed weight / total weight``.
 
     Example:
         >>> engine = ApprovalEngine()
@@ -34,6 +68,91 @@ class ApprovalDecision:
 
     approved: bool
     reasons: list[str]
+    failed_rules: tuple[str, ...] = ()
+    checked_rules: tuple[str, ...] = ()
+    review: bool = False
+    score: float | None = None
+
+
+@dataclass(frozen=True)
+class BatchDecision:
+    """
+    Result of evaluating a chunk of jobs with `ApprovalEngine.evaluate_batch`.
+
+    Attributes:
+        approved: Boolean approval mask, one entry per job.
+        failures: Boolean matrix of shape ``(len(rule_names), len(jobs))``; True where
+            the rule rejected the job. In FAST mode rules are not run for jobs that an
+            earlier rule already rejected, so only the first failures are recorded.
+        rule_names: Names of the evaluated rules, in registration order.
+        reasons: Per-job failure reasons when requested, else None.
+        evaluated: Boolean matrix shaped like ``failures``; True where the rule was run
+            for the job.
+        review: SCORE mode only: mask of jobs sent to manual review.
+        scores: SCORE mode only: weighted score of each job.
+    """
+
+    approved: BoolArray
+    failures: BoolArray
+    rule_names: tuple[str, ...]
+    reasons: list[list[str]] | None = None
+    evaluated: BoolArray | None = None
+    review: BoolArray | None = None
+    scores: FloatArray | None = None
+
+    def __len__(self) -> int:
+        return len(self.approved)
+
+    def reason_codes(self, index: int) -> list[str]:
+        """Names of the rules that rejected job ``index``."""
+        return [self.rule_names[r] for r in np.flatnonzero(self.failures[:, index]).tolist()]
+
+    def checked_codes(self, index: int) -> list[str]:
+        """Names of the rules that were run for job ``index``."""
+        if self.evaluated is None:
+            return list(self.rule_names)
+        return [self.rule_names[r] for r in np.flatnonzero(self.evaluated[:, index]).tolist()]
+
+
+@dataclass
+class RuleStats:
+    """Observed behaviour of a rule, used to order rules in FAST mode."""
+
+    name: str
+    calls: int = 0
+    rejections: int = 0
+    total_ns: int = 0
+    cache_hits: int = 0
+    # Calls covered by total_ns; only sampled evaluations are timed
+    timed_calls: int = 0
+
+    @property
+    def rejection_rate(self) -> float:
+        # Laplace-smoothed so unseen rules start at 0.5
+        return (self.rejections + 1) / (self.calls + 2)
+
+    @property
+    def mean_cost_ns(self) -> float:
+        return self.total_ns / self.timed_calls if self.timed_calls else 0.0
+
+    @property
+    def priority(self) -> float:
+        """Expected cost paid per rejection; lower runs earlier."""
+        return self.mean_cost_ns / self.rejection_rate
+
+
+class RuleSource(Protocol):
+    """A replaceable group of rules, e.g. a hot-reloaded rule file."""
+
+    generation: int
+
+    def rules(self) -> Sequence[ApprovalRule]:  # pragma: no cover - signature only
+        ...
+
+
+def _rule_name(rule: ApprovalRule) -> str:
+    name = getattr(rule, "__name__", None) or getattr(rule, "id", None)
+    return str(name) if name else type(rule).__name__
 
 
 class ApprovalEngine:
@@ -42,10 +161,55 @@ class ApprovalEngine:
 
     Rules can be registered as callables or objects implementing the `ApprovalRule` protocol
     (i.e., any callable that accepts a `dict` job and returns `(bool, str | None)`).
+
+    Rules may declare the derived features they read (see `approval.features`); the
+    engine validates the declarations on registration and shares one feature memo
+    across all rules evaluated on a job.
+
+    Results of rules that declare features are cached per rule in a bounded LRU
+    keyed by the declared feature values (``decision_cache_size`` entries per rule,
+    0 disables caching). Caches are rebuilt whenever the rule set changes and empty
+    themselves when a rule's configuration snapshot changes. They serve scalar rule
+    calls only: `evaluate_job`, rules without a vectorized form in `evaluate_batch`,
+    and the re-runs that collect a batch's rejection reasons. A vectorized form decides
+    a whole chunk in one pass, computing each distinct value once (see
+    `JobColumns.mapped`), so it bypasses the caches.
+
+    Every evaluation counts each executed rule's calls and rejections, overall and per
+    source schema (the job's ``_schema``); rule latency is timed on a sample of
+    evaluations (see `approval.profiling.RuleProfiler`). In FAST mode the rules are
+    tried in ascending order of expected cost per rejection, recomputed every
+    ``reorder_interval`` evaluations, so the rules that most cheaply reject jobs run
+    first and most rejections stop after one or two rules.
     """
 
-    def __init__(self, rules: Sequence[ApprovalRule] | None = None) -> None:
+    def __init__(
+        self,
+        rules: Sequence[ApprovalRule] | None = None,
+        mode: EvaluationMode | str = EvaluationMode.AUDIT,
+        reorder_interval: int = 256,
+        decision_cache_size: int = 4096,
+        profile_sample_every: int = 16,
+    ) -> None:
+        if reorder_interval < 1:
+            raise ValueError("reorder_interval must be >= 1")
+        if decision_cache_size < 0:
+            raise ValueError("decision_cache_size must be >= 0")
+        self.mode = EvaluationMode(mode)
+        self.reorder_interval = reorder_interval
+        self.decision_cache_size = decision_cache_size
+        self.profiler = RuleProfiler(sample_every=profile_sample_every)
+        self._registered: list[ApprovalRule] = []
+        self._sources: list[RuleSource] = []
+        self._generations: tuple[int, ...] = ()
+        # Active rules: registered rules followed by the current rules of each source
         self._rules: list[ApprovalRule] = []
+        self._stats: list[RuleStats] = []
+        self._caches: list[RuleDecisionCache | None] = []
+        self._weights: list[float] = []
+        # Indices into _rules in FAST-mode evaluation order
+        self._order: list[int] = []
+        self._evaluations = 0
         if rules:
             for r in rules:
                 self.register_rule(r)
@@ -55,21 +219,315 @@ class ApprovalEngine:
         # Anything callable with the correct signature will be accepted at runtime.
         if not callable(rule):  # pragma: no cover - defensive guard
             raise TypeError("rule must be callable")
+        declared_features(rule)  # fail fast on unknown feature names
         # Store as protocol type; plain callables are structurally compatible.
-        self._rules.append(rule)
+        self._registered.append(rule)
+        self._rebuild()
+
+    def register_rule_source(self, source: RuleSource) -> None:
+        """
+        Register a group of rules that can be replaced at runtime.
+
+        Whenever the source's ``generation`` changes, its new rules replace the old
+        ones before the next evaluation. Statistics carry over for rules whose name
+        is unchanged.
+        """
+        self._sources.append(source)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        rules = list(self._registered)
+        for source in self._sources:
+            rules.extend(source.rules())
+        previous = {s.name: s for s in self._stats}
+        stats = [previous.get(_rule_name(r)) or RuleStats(name=_rule_name(r)) for r in rules]
+
+        self._rules = rules
+        self._stats = stats
+        self._caches = [
+            (
+                RuleDecisionCache.for_rule(r, self.decision_cache_size)
+                if self.decision_cache_size
+                else None
+            )
+            for r in rules
+        ]
+        self._weights = [rule_weight(r) for r in rules]
+        self._order = list(range(len(rules)))
+        self.profiler.bind([s.name for s in stats])
+        self._generations = tuple(source.generation for source in self._sources)
+        if any(s.calls for s in stats):
+            self._reorder()
+
+    def _sync_sources(self) -> None:
+        for source in self._sources:
+            source.rules()  # gives the source a chance to reload
+        if tuple(source.generation for source in self._sources) != self._generations:
+            self._rebuild()
+
+    def required_features(self) -> list[str]:
+        """Features declared by the active rules, in first-use order."""
+        seen: dict[str, None] = {}
+        for rule in self._rules:
+            seen.update(dict.fromkeys(declared_features(rule)))
+        return list(seen)
+
+    def rule_set_signature(self) -> RuleSetSignature:
+        """
+        Signature of the active rules: their names in registration order, each with a
+        fingerprint of its definition or configuration (see `approval.outcomes`).
+        """
+        if self._sources:
+            self._sync_sources()
+        return RuleSetSignature.from_pairs(
+            (s.name, rule_fingerprint(rule))
+            for s, rule in zip(self._stats, self._rules, strict=True)
+        )
+
+    def run_rules(self, job: dict[str, Any], names: Sequence[str]) -> dict[str, RuleResult]:
+        """
+        Run only the named active rules on a job and return their results by name.
+
+        Used to re-check a subset of rules, e.g. those whose definition changed since
+        a stored decision was made. Statistics are not updated.
 
-    def evaluate_job(self, job: dict[str, Any]) -> ApprovalDecision:
+        Raises:
+            KeyError: If a name is not an active rule.
+        """
+        if self._sources:
+            self._sync_sources()
+        positions = {s.name: i for i, s in enumerate(self._stats)}
+        indices = [positions[name] for name in names]
+        if not isinstance(job, FeaturedJob):
+            job = FeaturedJob(job)
+        return {self._stats[i].name: self._call_rule(i, job) for i in indices}
+
+    def rule_stats(self) -> list[RuleStats]:
+        """Snapshot of per-rule statistics, in current FAST-mode order."""
+        return [
+            RuleStats(s.name, s.calls, s.rejections, s.total_ns, s.cache_hits, s.timed_calls)
+            for s in (self._stats[i] for i in self._order)
+        ]
+
+    def decision_cache_hit_rate(self) -> float:
+        """Share of cacheable rule calls answered from the decision caches."""
+        hits = sum(c.hits for c in self._caches if c is not None)
+        lookups = hits + sum(c.misses for c in self._caches if c is not None)
+        return hits / lookups if lookups else 0.0
+
+    def _call_rule(self, idx: int, job: dict[str, Any]) -> RuleResult:
+        cache = self._caches[idx]
+        if cache is None:
+            return self._rules[idx](job)
+        key = cache.key(job)
+        if key is None:
+            return self._rules[idx](job)
+        result = cache.get(key)
+        if result is None:
+            result = self._rules[idx](job)
+            cache.put(key, result)
+        else:
+            self._stats[idx].cache_hits += 1
+        return result
+
+    def _reorder(self) -> None:
+        stats = self._stats
+        self._order = sorted(range(len(stats)), key=lambda i: stats[i].priority)
+
+    def evaluate_job(
+        self, job: dict[str, Any], mode: EvaluationMode | str | None = None
+    ) -> ApprovalDecision:
         """
         Evaluate the job against all registered rules.
 
         - Overall approval is True only if all rules return True.
-        - Reasons are aggregated from rules that returned False and provided a reason.
+        - In AUDIT mode (default), reasons are aggregated from every rule that returned
+          False and provided a reason, in registration order.
+        - In FAST mode, evaluation stops at the first failing rule and only its reason
+          is returned.
+
+        Rules see the job as a `FeaturedJob`, so each derived feature is computed at
+        most once per evaluation however many rules use it.
         """
-        results: list[RuleResult] = []
-        for rule in self._rules:
-            approved, reason = rule(job)
-            results.append((approved, reason))
+        if self._sources:
+            self._sync_sources()
+        if not isinstance(job, FeaturedJob):
+            job = FeaturedJob(job)
+        mode = self.mode if mode is None else EvaluationMode(mode)
+        fast = mode is EvaluationMode.FAST
+        order = self._order if fast else range(len(self._rules))
+
+        self._evaluations += 1
+        if self._evaluations % self.reorder_interval == 0:
+            self._reorder()
+
+        approved = True
+        reasons: list[str] = []
+        failed: list[str] = []
+        checked: list[str] = []
+        hard_failure = False
+        failed_weight = 0.0
+        profiles = self.profiler.profiles_for(job.get("_schema"))
+        timed = self.profiler.should_time()
+        clock = time.perf_counter_ns
+        for idx in order:
+            stats = self._stats[idx]
+            profile = profiles[idx]
+            if timed:
+                started = clock()
+                ok, reason = self._call_rule(idx, job)
+                elapsed = clock() - started
+                stats.total_ns += elapsed
+                stats.timed_calls += 1
+                profile.record_timing(elapsed)
+            else:
+                ok, reason = self._call_rule(idx, job)
+            stats.calls += 1
+            profile.calls += 1
+            checked.append(stats.name)
+            if not ok:
+                stats.rejections += 1
+                profile.rejections += 1
+                approved = False
+                failed.append(stats.name)
+                if reason:
+                    reasons.append(reason)
+                if fast:
+                    break
+                if mode is EvaluationMode.SCORE:
+                    rule = self._rules[idx]
+                    failed_weight += self._weights[idx]
+                    if rule_required(rule) and not in_review_band(rule, job):
+                        hard_failure = True
+        if mode is not EvaluationMode.SCORE:
+            return ApprovalDecision(
+                approved=approved,
+                reasons=reasons,
+                failed_rules=tuple(failed),
+                checked_rules=tuple(checked),
+            )
+        total_weight = sum(self._weights)
+        return ApprovalDecision(
+            approved=approved,
+            reasons=reasons,
+            failed_rules=tuple(failed),
+            checked_rules=tuple(checked),
+            review=not approved and not hard_failure,
+            score=1.0 - failed_weight / total_weight if total_weight > 0 else 1.0,
+        )
+
+    def evaluate_batch(
+        self,
+        jobs: Sequence[dict[str, Any]],
+        mode: EvaluationMode | str | None = None,
+        with_reasons: bool = False,
+    ) -> BatchDecision:
+        """
+        Evaluate a chunk of jobs at once.
+
+        Rules with a vectorized form (see `approval.batch.vectorized`) run once over
+        columnar views of the whole chunk; the others run per job. Decisions match
+        `evaluate_job` for every job. In FAST mode, per-job rules only run for jobs
+        that are still approved. With ``with_reasons``, each job's reasons are
+        collected by re-running the rules that rejected it, through the decision caches
+        (jobs rejected for the same feature values share one call); in FAST mode that
+        is only the first failing rule, as in `evaluate_job`.
+        """
+        if self._sources:
+            self._sync_sources()
+        mode = self.mode if mode is None else EvaluationMode(mode)
+        fast = mode is EvaluationMode.FAST
+        order = self._order if fast else range(len(self._rules))
+        jobs = [job if isinstance(job, FeaturedJob) else FeaturedJob(job) for job in jobs]
+        count = len(jobs)
+        columns = JobColumns(jobs)
+        approved = np.ones(count, dtype=np.bool_)
+        failures = np.zeros((len(self._rules), count), dtype=np.bool_)
+        checked = np.zeros_like(failures)
+        schemas = columns.values("_schema")
+        groups = {
+            schema: np.fromiter((s == schema for s in schemas), dtype=np.bool_, count=count)
+            for schema in dict.fromkeys(schemas)
+        }
+        profiles_by_schema = {s: self.profiler.profiles_for(s) for s in groups}
+        group_profiles = [(profiles_by_schema[s], mask) for s, mask in groups.items()]
+        # Per-row rules are timed call by call on the sampled jobs, as in `evaluate_job`;
+        # batch forms only have a per-chunk time, recorded as its mean per job
+        timed = [self.profiler.should_time() for _ in range(count)]
+
+        clock = time.perf_counter_ns
+        for idx in order:
+            rule = self._rules[idx]
+            stats = self._stats[idx]
+            form = batch_form(rule)
+            evaluated = approved.copy() if fast else np.ones(count, dtype=np.bool_)
+            started = clock()
+            if form is not None:
+                passed = np.asarray(form(columns), dtype=np.bool_)
+                if passed.shape != (count,):
+                    raise ValueError(f"batch form of {stats.name} returned shape {passed.shape}")
+                failed = ~passed & evaluated
+            else:
+                failed = np.zeros(count, dtype=np.bool_)
+                for i in np.flatnonzero(evaluated).tolist():
+                    if timed[i]:
+                        row_started = clock()
+                        ok = self._call_rule(idx, jobs[i])[0]
+                        profiles_by_schema[schemas[i]][idx].record_timing(clock() - row_started)
+                    else:
+                        ok = self._call_rule(idx, jobs[i])[0]
+                    failed[i] = not ok
+            elapsed = clock() - started
+            calls = int(evaluated.sum())
+            stats.calls += calls
+            stats.total_ns += elapsed
+            stats.timed_calls += calls
+            stats.rejections += int(failed.sum())
+            for profiles, mask in group_profiles:
+                group_calls = int((evaluated & mask).sum())
+                if group_calls:
+                    profile = profiles[idx]
+                    profile.calls += group_calls
+                    profile.rejections += int((failed & mask).sum())
+                    if form is not None:
+                        profile.record_timing(elapsed * group_calls // calls, group_calls)
+            failures[idx] = failed
+            checked[idx] = evaluated
+            approved &= ~failed
+            if fast and not approved.any():
+                break
+
+        previous = self._evaluations
+        self._evaluations += count
+        if self._evaluations // self.reorder_interval != previous // self.reorder_interval:
+            self._reorder()
 
-        overall_approved = all(ok for ok, _ in results) if results else True
-        reasons = [reason for ok, reason in results if not ok and reason]
-        return ApprovalDecision(approved=overall_approved, reasons=reasons)
+        reasons: list[list[str]] | None = None
+        if with_reasons:
+            reasons = [[] for _ in range(count)]
+            for i in np.flatnonzero(~approved).tolist():
+                job = jobs[i]
+                for rule_idx in np.flatnonzero(failures[:, i]).tolist():
+                    _, reason = self._call_rule(rule_idx, job)
+                    if reason:
+                        reasons[i].append(reason)
+        review: BoolArray | None = None
+        job_scores: FloatArray | None = None
+        if mode is EvaluationMode.SCORE:
+            hard = np.zeros(count, dtype=np.bool_)
+            for rule_idx, rule in enumerate(self._rules):
+                if not rule_required(rule):
+                    continue
+                for i in np.flatnonzero(failures[rule_idx] & ~hard).tolist():
+                    hard[i] = not in_review_band(rule, jobs[i])
+            review = ~approved & ~hard
+            job_scores = scores(self._weights, failures)
+        return BatchDecision(
+            approved=approved,
+            failures=failures,
+            rule_names=tuple(s.name for s in self._stats),
+            reasons=reasons,
+            evaluated=checked,
+            review=review,
+            scores=job_scores,
+        )
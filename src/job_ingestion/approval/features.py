@@ -0,0 +1,318 @@
+"""Derived job features shared by approval rules.
+
+Several rules need the same derived values: the country of the job's location, whether
+it is remote, the salary converted to USD, the normalized employment type or language.
+Each such value is declared once here as a named feature. `JobFeatures` computes a
+feature lazily on first access and memoizes it for the job, so however many rules ask
+for it, it is parsed at most once per evaluation.
+
+Rules declare the features they read with `uses_features`; `ApprovalEngine` checks the
+declarations at registration and hands rules a `FeaturedJob` whose memo is shared by
+every rule evaluated on it. Rules called directly with a plain dict still work: they
+get a fresh memo for that call.
+
+A declaration is also a contract: the rule's result depends only on the declared
+features and on its ``config`` (thresholds and accepted values). That lets the engine
+cache decisions keyed by the feature values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from job_ingestion.transformation.currency import ANNUALIZATION_FACTORS, get_currency_converter
+from job_ingestion.transformation.language_id import get_language_identifier
+from job_ingestion.transformation.normalizers import get_location_normalizer
+from job_ingestion.transformation.reverse_geocoder import get_reverse_geocoder
+
+__all__ = [
+    "FEATURES",
+    "JobFeatures",
+    "FeaturedJob",
+    "feature",
+    "get_features",
+    "uses_features",
+    "declared_features",
+    "rule_config",
+]
+
+Extractor = Callable[["JobFeatures"], Any]
+
+# Registered feature extractors by name
+FEATURES: dict[str, Extractor] = {}
+
+_FEATURES_ATTR = "features"
+_CONFIG_ATTR = "feature_config"
+
+_HOURLY_UNITS = ("hourly", "hour", "per hour")
+
+# Language names and codes accepted on input, by ISO 639-1 code
+_LANGUAGE_CODES: dict[str, str] = {
+    "english": "en",
+    "en": "en",
+    "french": "fr",
+    "fr": "fr",
+    "spanish": "es",
+    "es": "es",
+    "german": "de",
+    "de": "de",
+}
+
+R = TypeVar("R")
+
+
+def feature(name: str) -> Callable[[Extractor], Extractor]:
+    """Register an extractor under ``name``; it receives the job's `JobFeatures`."""
+
+    def decorator(extractor: Extractor) -> Extractor:
+        if name in FEATURES:
+            raise ValueError(f"feature {name!r} is already registered")
+        FEATURES[name] = extractor
+        return extractor
+
+    return decorator
+
+
+class JobFeatures:
+    """
+    Lazily computed, memoized features of one job.
+
+    Example:
+        >>> features = JobFeatures({"salary_min": "50", "salary_unit": "Hourly"})
+        >>> features["salary_amount"], features["salary_unit"], features["annualized_usd"]
+        (50.0, 'hourly', 104000.0)
+    """
+
+    __slots__ = ("job", "_values")
+
+    def __init__(self, job: dict[str, Any]) -> None:
+        self.job = job
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        try:
+            extractor = FEATURES[name]
+        except KeyError:
+            raise KeyError(f"unknown feature {name!r}") from None
+        value = self._values[name] = extractor(self)
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the feature has already been computed."""
+        return name in self._values
+
+
+class FeaturedJob(dict[str, Any]):
+    """A job dict carrying the feature memo shared by every rule evaluated on it."""
+
+    __slots__ = ("features",)
+
+    def __init__(self, job: dict[str, Any]) -> None:
+        super().__init__(job)
+        self.features = JobFeatures(self)
+
+
+def get_features(job: dict[str, Any]) -> JobFeatures:
+    """Return the job's shared feature memo, or a fresh one for a plain dict."""
+    if isinstance(job, FeaturedJob):
+        return job.features
+    return JobFeatures(job)
+
+
+def uses_features(*names: str, config: Callable[[], Any] | None = None) -> Callable[[R], R]:
+    """
+    Declare the features a rule reads.
+
+    The rule must be a pure function of these features. ``config`` returns a hashable
+    snapshot of the settings the rule compares against (thresholds, accepted
+    values); cached decisions are dropped whenever that snapshot changes.
+    """
+
+    def decorator(rule: R) -> R:
+        setattr(rule, _FEATURES_ATTR, tuple(names))
+        setattr(rule, _CONFIG_ATTR, config)
+        return rule
+
+    return decorator
+
+
+def rule_config(rule: Any) -> Callable[[], Any] | None:
+    """The configuration snapshot function declared with `uses_features`, if any."""
+    config = getattr(rule, _CONFIG_ATTR, None)
+    return config if callable(config) else None
+
+
+def declared_features(rule: Any) -> tuple[str, ...]:
+    """
+    Features declared by a rule.
+
+    Raises:
+        ValueError: If a declared feature is not registered.
+    """
+    names = getattr(rule, _FEATURES_ATTR, ())
+    if not isinstance(names, Iterable) or isinstance(names, str):
+        return ()
+    unknown = [n for n in names if n not in FEATURES]
+    if unknown:
+        raise ValueError(f"rule declares unknown features: {', '.join(map(str, unknown))}")
+    return tuple(names)
+
+
+# --- Location ---
+
+
+def location_country(location: Any) -> str | None:
+    """Country code resolved from a location value (None when empty)."""
+    return get_location_normalizer().resolve_country(location) if location else None
+
+
+@feature("has_location")
+def _has_location(f: JobFeatures) -> bool:
+    return bool(f.job.get("location"))
+
+
+def location_label(location: Any) -> str:
+    """Country as written in a location (or the location text), for messages."""
+    if isinstance(location, dict):
+        return str(location.get("country") or "").strip()
+    if isinstance(location, str) and location:
+        resolved = get_location_normalizer().normalize(location)
+        return (resolved.country or resolved.text).strip() if resolved else ""
+    return ""
+
+
+@feature("location_label")
+def _location_label(f: JobFeatures) -> str:
+    return location_label(f.job.get("location"))
+
+
+@feature("location_country")
+def _location_country(f: JobFeatures) -> str | None:
+    return location_country(f.job.get("location"))
+
+
+@feature("country_code")
+def _country_code(f: JobFeatures) -> str | None:
+    """Location country, else the precomputed geo country, else the coordinates' country."""
+    country: str | None = f["location_country"]
+    if country:
+        return country
+    geo_country = f.job.get("geo_country_code")
+    if isinstance(geo_country, str) and geo_country:
+        return geo_country
+    match = get_reverse_geocoder().lookup(f.job.get("latitude"), f.job.get("longitude"))
+    return match.country_code if match else None
+
+
+@feature("is_remote")
+def _is_remote(f: JobFeatures) -> bool:
+    return bool(f.job.get("remote", False) or f.job.get("is_remote", False))
+
+
+# --- Salary ---
+
+
+def currency_code(currency: Any) -> str:
+    """Upper-cased currency code, defaulting to USD."""
+    return str(currency).upper() if currency else "USD"
+
+
+def is_hourly_unit(unit: Any) -> bool:
+    return bool(unit) and str(unit).lower() in _HOURLY_UNITS
+
+
+@feature("salary_amount")
+def _salary_amount(f: JobFeatures) -> float | None:
+    value = f.job.get("salary_min")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@feature("salary_currency")
+def _salary_currency(f: JobFeatures) -> str:
+    return currency_code(f.job.get("salary_currency"))
+
+
+@feature("salary_unit")
+def _salary_unit(f: JobFeatures) -> str:
+    """Either "hourly" or "annual"."""
+    return "hourly" if is_hourly_unit(f.job.get("salary_unit")) else "annual"
+
+
+@feature("salary_usd")
+def _salary_usd(f: JobFeatures) -> float | None:
+    """Minimum salary in USD per salary unit; None if missing or the currency is unknown."""
+    amount: float | None = f["salary_amount"]
+    if amount is None:
+        return None
+    return get_currency_converter().convert(amount, f["salary_currency"])
+
+
+@feature("annualized_usd")
+def _annualized_usd(f: JobFeatures) -> float | None:
+    usd: float | None = f["salary_usd"]
+    if usd is None:
+        return None
+    unit = str(f.job.get("salary_unit") or "annual").strip().lower()
+    return usd * ANNUALIZATION_FACTORS.get(unit, 1.0)
+
+
+# --- Employment type, company type and language ---
+
+
+def employment_type(value: Any) -> str | None:
+    return None if value is None else str(value).strip()
+
+
+@feature("employment_type")
+def _employment_type(f: JobFeatures) -> str | None:
+    return employment_type(f.job.get("employment_type"))
+
+
+@feature("company_type")
+def _company_type(f: JobFeatures) -> str | None:
+    value = f.job.get("company_type")
+    return None if value is None else str(value).strip()
+
+
+def language(value: Any) -> str | None:
+    """Stripped language value, or None when missing or blank."""
+    if not value or (isinstance(value, str) and not value.strip()):
+        return None
+    return str(value).strip()
+
+
+def detection_text(title: Any, description: Any) -> str | None:
+    """Text the language of a job is detected from: title and description."""
+    parts = [p for p in (title, description) if isinstance(p, str) and p.strip()]
+    return ". ".join(parts) if parts else None
+
+
+@feature("detected_language")
+def _detected_language(f: JobFeatures) -> str | None:
+    """Language code identified from the title and description text."""
+    text = detection_text(f.job.get("title"), f.job.get("description"))
+    return get_language_identifier().detect(text)
+
+
+@feature("language")
+def _language(f: JobFeatures) -> str | None:
+    """Declared language, or the detected one when the job does not declare it."""
+    declared = language(f.job.get("language"))
+    return declared if declared is not None else f["detected_language"]
+
+
+@feature("language_code")
+def _language_code(f: JobFeatures) -> str | None:
+    """ISO 639-1 code for known language names and codes."""
+    value: str | None = f["language"]
+    return _LANGUAGE_CODES.get(value.casefold()) if value else None
@@ -0,0 +1,120 @@
+"""Versioned per-rule outcome bitmasks.
+
+Every stored job records which rules rejected it (``rule_failures``) and which rules
+were evaluated at all (``rule_checked``) as integer bitmasks, together with the
+version of the rule set that produced them. A `RuleSetSignature` fixes the meaning of
+each bit: bit ``i`` is the ``i``-th rule of the signature. The signature also records a
+fingerprint per rule (its definition or configuration snapshot), so comparing two
+signatures tells exactly which rules changed and therefore which bits need to be
+recomputed when the rule set is updated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .features import rule_config
+
+__all__ = ["MAX_RULES", "RuleSetSignature", "rule_fingerprint"]
+
+# Bitmasks are stored in signed 64-bit columns
+MAX_RULES = 63
+
+
+def rule_fingerprint(rule: Any) -> str:
+    """
+    Digest identifying a rule's behaviour.
+
+    Uses the rule's own ``fingerprint`` (JSON rules) or its declared configuration
+    snapshot (see `approval.features.uses_features`); rules with neither are
+    identified by name only.
+    """
+    own = getattr(rule, "fingerprint", None)
+    if isinstance(own, str) and own:
+        return own
+    config = rule_config(rule)
+    if config is None:
+        return ""
+    snapshot = config()
+    if isinstance(snapshot, frozenset | set):
+        snapshot = sorted(map(repr, snapshot))
+    elif isinstance(snapshot, tuple):
+        snapshot = [sorted(map(repr, v)) if isinstance(v, frozenset | set) else v for v in snapshot]
+    return hashlib.sha1(repr(snapshot).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class RuleSetSignature:
+    """
+    Ordered ``(rule name, fingerprint)`` pairs and the version derived from them.
+
+    Example:
+        >>> old = RuleSetSignature.from_pairs([("salary", "a1"), ("language", "")])
+        >>> new = RuleSetSignature.from_pairs([("salary", "b2"), ("language", "")])
+        >>> old.version != new.version, new.changed_since(old)
+        (True, ['salary'])
+        >>> mask = old.encode(["language"])
+        >>> mask, old.decode(mask), new.remap(mask, old)
+        (2, ['language'], 2)
+    """
+
+    version: str
+    rules: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[str, str]]) -> RuleSetSignature:
+        rules = tuple((str(name), str(fp)) for name, fp in pairs)
+        if len(rules) > MAX_RULES:
+            raise ValueError(f"at most {MAX_RULES} rules can be tracked, got {len(rules)}")
+        names = [name for name, _ in rules]
+        if len(set(names)) != len(names):
+            raise ValueError("rule names must be unique to be tracked")
+        digest = hashlib.sha1(repr(rules).encode("utf-8")).hexdigest()[:16]
+        return cls(version=digest, rules=rules)
+
+    @property
+    def names(self) -> list[str]:
+        return [name for name, _ in self.rules]
+
+    @property
+    def all_bits(self) -> int:
+        return (1 << len(self.rules)) - 1
+
+    def bit(self, name: str) -> int:
+        for i, (rule_name, _) in enumerate(self.rules):
+            if rule_name == name:
+                return 1 << i
+        raise KeyError(name)
+
+    def encode(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+
+    def decode(self, mask: int) -> list[str]:
+        return [name for i, (name, _) in enumerate(self.rules) if mask >> i & 1]
+
+    def changed_since(self, old: RuleSetSignature) -> list[str]:
+        """Rules of this signature that are new or whose fingerprint differs in ``old``."""
+        previous = dict(old.rules)
+        return [name for name, fp in self.rules if previous.get(name) != fp]
+
+    def remap(self, mask: int, old: RuleSetSignature) -> int:
+        """Translate a mask from ``old`` bit positions to this signature's, dropping unknowns."""
+        result = 0
+        positions = {name: i for i, (name, _) in enumerate(self.rules)}
+        for i, (name, _) in enumerate(old.rules):
+            if mask >> i & 1 and name in positions:
+                result |= 1 << positions[name]
+        return result
+
+    def to_json(self) -> list[list[str]]:
+        return [[name, fp] for name, fp in self.rules]
+
+    @classmethod
+    def from_json(cls, data: Sequence[Sequence[str]]) -> RuleSetSignature:
+        return cls.from_pairs((str(pair[0]), str(pair[1])) for pair in data)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .base import ApprovalRule
+from .company_type_rules import get_rules as company_type_rules
+from .content_rules import get_rules as content_rules
+from .employment_type_rules import get_rules as employment_type_rules
+from .language_rules import get_rules as language_rules
+from .location_rules import get_rules as location_rules
+from .salary_rules import get_rules as salary_rules
+
+
+def get_rules(exclude: Iterable[str] = ()) -> list[ApprovalRule]:
+    """
+    Return the built-in approval rules in evaluation order.
+
+    Rules whose name is in ``exclude`` are left out (used to build candidate rule sets
+    that replace a built-in rule).
+    """
+    excluded = set(exclude)
+    rules = [
+        *content_rules(),
+        *location_rules(),
+        *salary_rules(),
+        *employment_type_rules(),
+        *company_type_rules(),
+        *language_rules(),
+    ]
+    return [rule for rule in rules if getattr(rule, "__name__", None) not in excluded]
+
+
+def parse_rule_names(text: str) -> list[str]:
+    """Split a comma-separated list of rule names, ignoring blanks."""
+    return [name.strip() for name in text.split(",") if name.strip()]
+
+
+__all__ = ["get_rules", "parse_rule_names"]
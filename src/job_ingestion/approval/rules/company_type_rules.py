@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..batch import BoolArray, JobColumns, vectorized
+from ..features import get_features, uses_features
+from ..staffing_detector import get_staffing_detector
 from .base import ApprovalRule
 
 # Company types that should be rejected
@@ -21,6 +24,16 @@ REJECTED_COMPANY_TYPES = {
 }
 
 
+def _is_not_rejected_company_type(company_type: Any) -> bool:
+    return company_type is None or str(company_type).strip() not in REJECTED_COMPANY_TYPES
+
+
+def _is_not_staffing_firm_batch(columns: JobColumns) -> BoolArray:
+    return columns.mask("company_type", _is_not_rejected_company_type)
+
+
+@vectorized(_is_not_staffing_firm_batch)
+@uses_features("company_type", config=lambda: frozenset(REJECTED_COMPANY_TYPES))
 def is_not_staffing_firm(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if the job is not from a staffing firm.
@@ -39,14 +52,13 @@ def is_not_staffing_firm(job: dict[str, Any]) -> tuple[bool, str | None]:
         >>> ok, reason
         (True, None)
     """
-    company_type = job.get("company_type")
+    company_type_str = get_features(job)["company_type"]
 
     # If no company_type is provided, we don't reject based on this rule
-    if company_type is None:
+    if company_type_str is None:
         return True, None
 
-    # Convert to string and check against rejected variants
-    company_type_str = str(company_type).strip()
+    # Check the stripped value against rejected variants
 
     if company_type_str in REJECTED_COMPANY_TYPES:
         return False, f"Job must not be from a staffing firm, got: {company_type_str}"
@@ -54,9 +66,38 @@ def is_not_staffing_firm(job: dict[str, Any]) -> tuple[bool, str | None]:
     return True, None
 
 
+def is_not_staffing_agency(job: dict[str, Any]) -> tuple[bool, str | None]:
+    """
+    Approve unless the company name or descriptions identify a staffing agency.
+
+    Complements `is_not_staffing_firm` for sources that do not provide a company
+    type: the company name is checked against known agencies and agency naming
+    patterns, and both descriptions are scanned for intermediary phrasing such as
+    "on behalf of our client".
+
+    Examples:
+        >>> is_not_staffing_agency({"company_name": "Acme Corp"})
+        (True, None)
+        >>> ok, reason = is_not_staffing_agency({"company_name": "Robert Half Inc."})
+        >>> ok
+        False
+    """
+    short_description = job.get("short_description")
+    full_description = job.get("full_description")
+    if short_description is None and full_description is None:
+        short_description = job.get("description")
+
+    assessment = get_staffing_detector().assess(
+        job.get("company_name"), short_description, full_description
+    )
+    if assessment.is_staffing:
+        return False, assessment.reason
+    return True, None
+
+
 def get_rules() -> list[ApprovalRule]:
     """Return a list of company type related approval rules.
 
     The returned callables conform to the `ApprovalRule` protocol.
     """
-    return [is_not_staffing_firm]
+    return [is_not_staffing_firm, is_not_staffing_agency]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..features import uses_features
 from .base import ApprovalRule
 
 # Simple, configurable content requirements
@@ -9,6 +10,9 @@ REQUIRE_TITLE: bool = True
 MIN_DESCRIPTION_LENGTH: int = 20
 
 
+# No features declared: the rule reads raw content, so its decisions are not cached;
+# the snapshot still identifies its configuration for stored rule outcomes
+@uses_features(config=lambda: (REQUIRE_TITLE, MIN_DESCRIPTION_LENGTH))
 def has_basic_content(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if basic content fields are present and sufficiently informative.
@@ -17,6 +21,9 @@ def has_basic_content(job: dict[str, Any]) -> tuple[bool, str | None]:
     - Non-empty "title" (if REQUIRE_TITLE is True)
     - "description" present and at least MIN_DESCRIPTION_LENGTH characters (after stripping)
 
+    When the job carries a precomputed "description_length" (plain text extracted at
+    ingest), that is used instead of measuring the description again.
+
     Examples:
         >>> has_basic_content({"title": "SWE", "description": "x" * 25})
         (True, None)
@@ -24,6 +31,8 @@ def has_basic_content(job: dict[str, Any]) -> tuple[bool, str | None]:
         (False, 'Missing or empty title')
         >>> has_basic_content({"title": "SWE", "description": "Too short"})
         (False, 'Description too short (< 20)')
+        >>> has_basic_content({"title": "SWE", "description": "x" * 25, "description_length": 4})
+        (False, 'Description too short (< 20)')
     """
     title = job.get("title")
     description = job.get("description", "")
@@ -31,8 +40,11 @@ def has_basic_content(job: dict[str, Any]) -> tuple[bool, str | None]:
     if REQUIRE_TITLE and not (isinstance(title, str) and title.strip() != ""):
         return False, "Missing or empty title"
 
-    desc_text = description if isinstance(description, str) else ""
-    if len(desc_text.strip()) < MIN_DESCRIPTION_LENGTH:
+    length = job.get("description_length")
+    if not isinstance(length, int):
+        desc_text = description if isinstance(description, str) else ""
+        length = len(desc_text.strip())
+    if length < MIN_DESCRIPTION_LENGTH:
         return False, f"Description too short (< {MIN_DESCRIPTION_LENGTH})"
 
     return True, None
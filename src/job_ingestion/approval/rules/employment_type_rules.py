@@ -2,12 +2,24 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..batch import BoolArray, JobColumns, vectorized
+from ..features import employment_type, get_features, uses_features
 from .base import ApprovalRule
 
 # Accepted employment types for approval
 ACCEPTED_EMPLOYMENT_TYPES = {"Full-Time", "full-time", "FULL-TIME", "Full Time", "full time"}
 
 
+def _is_accepted_employment_type(value: Any) -> bool:
+    return employment_type(value) in ACCEPTED_EMPLOYMENT_TYPES
+
+
+def _is_full_time_position_batch(columns: JobColumns) -> BoolArray:
+    return columns.mask("employment_type", _is_accepted_employment_type)
+
+
+@vectorized(_is_full_time_position_batch)
+@uses_features("employment_type", config=lambda: frozenset(ACCEPTED_EMPLOYMENT_TYPES))
 def is_full_time_position(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if the job is a full-time position.
@@ -26,13 +38,12 @@ def is_full_time_position(job: dict[str, Any]) -> tuple[bool, str | None]:
         >>> ok, reason
         (False, 'Job must be a full-time position, got: None')
     """
-    employment_type = job.get("employment_type")
+    employment_type_str = get_features(job)["employment_type"]
 
-    if employment_type is None:
+    if employment_type_str is None:
         return False, "Job must be a full-time position, got: None"
 
-    # Convert to string and check against accepted variants
-    employment_type_str = str(employment_type).strip()
+    # Check the stripped value against accepted variants
 
     if employment_type_str in ACCEPTED_EMPLOYMENT_TYPES:
         return True, None
@@ -2,6 +2,12 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
+from job_ingestion.transformation.language_id import get_language_identifier
+
+from ..batch import BoolArray, JobColumns, vectorized
+from ..features import detection_text, get_features, language, location_country, uses_features
 from .base import ApprovalRule
 
 # Accepted languages for job postings
@@ -9,6 +15,50 @@ ACCEPTED_LANGUAGES = {"English", "english", "ENGLISH", "en", "EN"}
 ACCEPTED_LANGUAGES_CANADA = ACCEPTED_LANGUAGES | {"French", "french", "FRENCH", "fr", "FR"}
 
 
+def _is_canada(location: Any) -> bool:
+    return location_country(location) == "CA"
+
+
+def _languages(columns: JobColumns) -> list[str | None]:
+    """Declared languages, with one batched detection pass for rows missing one."""
+    languages = list(columns.mapped("language", language))
+    missing = [i for i, lang in enumerate(languages) if lang is None]
+    if missing:
+        titles = columns.values("title")
+        descriptions = columns.values("description")
+        detected = get_language_identifier().detect_many(
+            [detection_text(titles[i], descriptions[i]) for i in missing]
+        )
+        for i, lang in zip(missing, detected, strict=True):
+            languages[i] = lang
+    return languages
+
+
+def _is_acceptable_language_batch(columns: JobColumns) -> BoolArray:
+    languages = _languages(columns)
+    anywhere = np.fromiter(
+        (lang in ACCEPTED_LANGUAGES for lang in languages), dtype=np.bool_, count=len(columns)
+    )
+    in_canada = np.fromiter(
+        (lang in ACCEPTED_LANGUAGES_CANADA for lang in languages),
+        dtype=np.bool_,
+        count=len(columns),
+    )
+    # Only resolve locations for rows whose outcome depends on them
+    if (in_canada & ~anywhere).any():
+        in_canada &= columns.mask("location", _is_canada)
+    else:
+        in_canada[:] = False
+    return anywhere | in_canada
+
+
+@vectorized(_is_acceptable_language_batch)
+@uses_features(
+    "language",
+    "location_country",
+    "location_label",
+    config=lambda: (frozenset(ACCEPTED_LANGUAGES), frozenset(ACCEPTED_LANGUAGES_CANADA)),
+)
 def is_acceptable_language(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if the job description is in an acceptable language.
@@ -16,7 +66,8 @@ def is_acceptable_language(job: dict[str, Any]) -> tuple[bool, str | None]:
     Language requirements:
     - English is always accepted
     - French is accepted only if the job is in Canada
-    - Empty/missing language field is rejected
+    - When the language field is empty or missing, the language detected from the
+      title and description is used; if none can be detected the job is rejected
 
     Examples:
         >>> ok, reason = is_acceptable_language({
@@ -44,30 +95,23 @@ def is_acceptable_language(job: dict[str, Any]) -> tuple[bool, str | None]:
         ... })
         >>> ok, reason
         (False, 'Job must specify a language')
+        >>> ok, reason = is_acceptable_language({
+        ...     "title": "Line cook",
+        ...     "description": "Prepare meals and keep the kitchen clean during busy shifts",
+        ...     "location": {"country": "USA"},
+        ... })
+        >>> ok, reason
+        (True, None)
     """
-    language = job.get("language")
+    features = get_features(job)
+    language_str = features["language"]
 
     # Handle missing or empty language
-    if not language or (isinstance(language, str) and not language.strip()):
+    if language_str is None:
         return False, "Job must specify a language"
 
-    language_str = str(language).strip()
-
-    # Get job location country
-    location = job.get("location", {})
-    if isinstance(location, str):
-        # Handle string location format like "Toronto, ON, Canada"
-        country = location.split(",")[-1].strip() if "," in location else location
-    else:
-        # Handle dict location format
-        country = location.get("country", "") if isinstance(location, dict) else ""
-
-    # Normalize country name
-    country = country.strip()
-    is_canada = country.lower() in {"canada", "ca"}
-
     # Check if language is acceptable
-    if is_canada:
+    if features["location_country"] == "CA":
         # In Canada, both English and French are acceptable
         if language_str in ACCEPTED_LANGUAGES_CANADA:
             return True, None
@@ -78,7 +122,8 @@ def is_acceptable_language(job: dict[str, Any]) -> tuple[bool, str | None]:
         elif language_str in {"French", "french", "FRENCH", "fr", "FR"}:
             return (
                 False,
-                f"French language is only accepted for jobs in Canada, job location: {country}",
+                "French language is only accepted for jobs in Canada, "
+                f"job location: {features['location_label']}",
             )
 
     return False, f"Job must be in English (or French if in Canada), got: {language_str}"
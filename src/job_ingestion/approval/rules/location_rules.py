@@ -2,6 +2,12 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
+from job_ingestion.transformation.reverse_geocoder import get_reverse_geocoder
+
+from ..batch import BoolArray, JobColumns, vectorized
+from ..features import get_features, location_country, uses_features
 from .base import ApprovalRule
 
 # Simple configuration knobs for later tuning
@@ -10,6 +16,18 @@ ALLOWED_COUNTRIES = {"USA", "US", "United States", "Canada", "CA"}
 ALLOWED_COUNTRY_CODES = {"US", "USA", "CA", "CAN"}
 
 
+def _has_location_text(location: Any) -> bool:
+    return isinstance(location, str) and location.strip() != ""
+
+
+def _has_location_info_batch(columns: JobColumns) -> BoolArray:
+    if not REQUIRE_LOCATION:
+        return np.ones(len(columns), dtype=np.bool_)
+    return columns.mask("location", _has_location_text) | columns.mask("is_remote", bool)
+
+
+@vectorized(_has_location_info_batch)
+@uses_features(config=lambda: REQUIRE_LOCATION)
 def has_location_info(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if job contains sufficient location information.
@@ -36,39 +54,57 @@ def has_location_info(job: dict[str, Any]) -> tuple[bool, str | None]:
     return (ok, None) if ok else (False, "Missing location information")
 
 
-def _extract_country_from_location(location: Any) -> str | None:
+def _is_geographical_location_approved_batch(columns: JobColumns) -> BoolArray:
     """
-    Extract country information from location data.
-
-    Args:
-        location: Can be a dict with country field or a string to parse
+    Vectorized `is_geographical_location_approved`.
 
-    Returns:
-        Country string if found, None otherwise
+    Location strings are resolved once per distinct value; rows that still lack a
+    country fall back to the precomputed geo country and, failing that, to a single
+    batched reverse-geocoding pass over their coordinates.
     """
-    if isinstance(location, dict):
-        return location.get("country")
-
-    if isinstance(location, str):
-        # Parse string location formats like "New York, NY, USA" or "Toronto, ON, Canada"
-        parts = [part.strip() for part in location.split(",")]
-        if len(parts) >= 3:
-            return parts[-1]  # Last part is usually the country
-        elif len(parts) == 2:
-            # Check if second part looks like a country
-            second_part = parts[-1].upper()
-            if second_part in ALLOWED_COUNTRY_CODES or second_part in ALLOWED_COUNTRIES:
-                return parts[-1]
-
-    return None
-
-
+    remote = columns.mask("remote", bool) | columns.mask("is_remote", bool)
+    countries = list(columns.mapped("location", location_country))
+    geo_codes = columns.values("geo_country_code")
+    pending: list[int] = []
+    for i, country in enumerate(countries):
+        if country or remote[i]:
+            continue
+        geo = geo_codes[i]
+        if isinstance(geo, str) and geo:
+            countries[i] = geo
+        else:
+            pending.append(i)
+    if pending:
+        latitudes = columns.values("latitude")
+        longitudes = columns.values("longitude")
+        matches = get_reverse_geocoder().lookup_many(
+            [latitudes[i] for i in pending], [longitudes[i] for i in pending]
+        )
+        for i, match in zip(pending, matches, strict=True):
+            countries[i] = match.country_code if match else None
+    allowed = {c.upper() for c in ALLOWED_COUNTRIES} | {c.upper() for c in ALLOWED_COUNTRY_CODES}
+    in_allowed = np.fromiter(
+        (bool(c) and str(c).strip().upper() in allowed for c in countries),
+        dtype=np.bool_,
+        count=len(columns),
+    )
+    return remote | in_allowed
+
+
+@vectorized(_is_geographical_location_approved_batch)
+@uses_features(
+    "is_remote",
+    "has_location",
+    "country_code",
+    config=lambda: (frozenset(ALLOWED_COUNTRIES), frozenset(ALLOWED_COUNTRY_CODES)),
+)
 def is_geographical_location_approved(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if job is either remote or located in US/Canada.
 
     Rule: Job must be either remote (anywhere) or in-person located within
-    the United States or Canada.
+    the United States or Canada. When the location text does not identify a
+    country (e.g., "Downtown"), the job's coordinates are reverse-geocoded.
 
     Args:
         job: Job data dictionary
@@ -84,19 +120,16 @@ def is_geographical_location_approved(job: dict[str, Any]) -> tuple[bool, str |
         >>> is_geographical_location_approved({"location": "Paris, France", "remote": False})
         (False, 'Job location must be in US/Canada or remote')
     """
+    features = get_features(job)
     # Check if job is remote - if so, approve regardless of location
-    is_remote = job.get("remote", False) or job.get("is_remote", False)
-    if is_remote:
+    if features["is_remote"]:
         return True, None
 
-    # Extract location information
-    location = job.get("location")
-    if not location:
-        return False, "Missing location information"
-
-    # Extract country from location data
-    country = _extract_country_from_location(location)
+    # Country from the location data, falling back to coordinates
+    country = features["country_code"]
     if not country:
+        if not features["has_location"]:
+            return False, "Missing location information"
         return False, "Unable to determine country from location"
 
     # Normalize country for comparison
@@ -2,6 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
+from job_ingestion.transformation.currency import get_currency_converter
+
+from ..batch import BoolArray, JobColumns, vectorized
+from ..features import currency_code, get_features, is_hourly_unit, uses_features
+from ..scoring import review_band
 from .base import ApprovalRule
 
 # Salary thresholds
@@ -11,22 +18,68 @@ MIN_HOURLY_RATE_USD: float = 45.0
 # Backward compatibility alias for tests
 MIN_SALARY_THRESHOLD = MIN_ANNUAL_SALARY_USD
 
-# Currency conversion rates (approximate, could be made dynamic)
-CURRENCY_TO_USD_RATES = {
-    "USD": 1.0,
-    "CAD": 0.74,  # 1 CAD = 0.74 USD (approximate)
-    "EUR": 1.08,  # 1 EUR = 1.08 USD (approximate)
-    "GBP": 1.27,  # 1 GBP = 1.27 USD (approximate)
-}
-
+# In SCORE mode, salaries this close below the threshold go to manual review
+REVIEW_MARGIN: float = 0.05
+
+
+def _salary_meets_requirements_batch(columns: JobColumns) -> BoolArray:
+    """Vectorized `salary_meets_requirements`: one comparison over USD amounts."""
+    amounts = columns.numeric("salary_min")
+    converter = get_currency_converter()
+    rate_by_code: dict[str, float] = {}
+    for code in set(columns.mapped("salary_currency", currency_code)):
+        rate = converter.rate(code)
+        rate_by_code[code] = np.nan if rate is None else rate
+    rates = np.fromiter(
+        (rate_by_code[c] for c in columns.mapped("salary_currency", currency_code)),
+        dtype=np.float64,
+        count=len(columns),
+    )
+    usd = amounts * rates
+    thresholds = np.where(
+        columns.mask("salary_unit", is_hourly_unit), MIN_HOURLY_RATE_USD, MIN_ANNUAL_SALARY_USD
+    )
+    with np.errstate(invalid="ignore"):
+        return (amounts > 0) & (usd >= thresholds)
+
+
+def _salary_near_threshold(job: dict[str, Any]) -> bool:
+    """
+    Whether a rejected salary is within `REVIEW_MARGIN` below its threshold.
 
+    Examples:
+        >>> _salary_near_threshold({"salary_min": 96000, "salary_currency": "USD"})
+        True
+        >>> _salary_near_threshold({"salary_min": 80000, "salary_currency": "USD"})
+        False
+    """
+    features = get_features(job)
+    salary_usd = features["salary_usd"]
+    if salary_usd is None or (features["salary_amount"] or 0) <= 0:
+        return False
+    hourly = features["salary_unit"] == "hourly"
+    threshold = MIN_HOURLY_RATE_USD if hourly else MIN_ANNUAL_SALARY_USD
+    return bool(threshold * (1 - REVIEW_MARGIN) <= salary_usd < threshold)
+
+
+@review_band(_salary_near_threshold)
+@vectorized(_salary_meets_requirements_batch)
+@uses_features(
+    "salary_amount",
+    "salary_currency",
+    "salary_unit",
+    "salary_usd",
+    config=lambda: (MIN_ANNUAL_SALARY_USD, MIN_HOURLY_RATE_USD),
+)
 def salary_meets_requirements(job: dict[str, Any]) -> tuple[bool, str | None]:
     """
     Approve if the job's salary meets minimum requirements:
     - Annual salary: $100,000+ USD
     - Hourly rate: $45+ USD per hour
 
-    Handles various salary formats and currencies with conversion to USD.
+    Handles various salary formats and currencies with conversion to USD through the
+    shared in-memory currency converter. Currencies without a known rate are rejected
+    rather than assumed to be at parity with USD.
 
     Examples:
         >>> ok, reason = salary_meets_requirements({"salary_min": 150000, "salary_currency": "USD"})
@@ -40,40 +93,24 @@ def salary_meets_requirements(job: dict[str, Any]) -> tuple[bool, str | None]:
         >>> ok, reason = salary_meets_requirements({"salary_min": 80000, "salary_currency": "USD"})
         >>> ok, reason
         (False, 'Annual salary below $100,000 USD (found: $80,000 USD)')
+        >>> ok, reason = salary_meets_requirements({"salary_min": 150000, "salary_currency": "XYZ"})
+        >>> ok, reason
+        (False, 'Unsupported currency: XYZ')
     """
-    # Extract salary information from various possible fields
-    salary_value = None
-    currency = "USD"  # Default to USD
-    unit = "annual"  # Default to annual
-
-    # Try to get salary from min_salary (mapped from job data)
-    if "salary_min" in job and job["salary_min"] is not None:
-        try:
-            salary_value = float(job["salary_min"])
-        except (TypeError, ValueError):
-            pass
-
-    # Get currency and unit information
-    if "salary_currency" in job and job["salary_currency"]:
-        currency = str(job["salary_currency"]).upper()
-
-    if "salary_unit" in job and job["salary_unit"]:
-        unit = str(job["salary_unit"]).lower()
-        if unit in ["hourly", "hour", "per hour"]:
-            unit = "hourly"
-        else:
-            unit = "annual"
+    features = get_features(job)
+    salary_value = features["salary_amount"]
 
     # If no salary found, reject
     if salary_value is None or salary_value <= 0:
         return False, "No valid salary information found"
 
-    # Convert to USD if needed
-    usd_rate = CURRENCY_TO_USD_RATES.get(currency, 1.0)
-    salary_usd = salary_value * usd_rate
+    # Convert to USD using the in-memory rates table
+    salary_usd = features["salary_usd"]
+    if salary_usd is None:
+        return False, f"Unsupported currency: {features['salary_currency']}"
 
     # Determine if salary meets requirements based on unit
-    if unit == "hourly":
+    if features["salary_unit"] == "hourly":
         # Check hourly rate requirement
         if salary_usd >= MIN_HOURLY_RATE_USD:
             return True, None
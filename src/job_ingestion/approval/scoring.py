@@ -0,0 +1,77 @@
+"""Weighted scoring and manual-review bands for approval rules.
+
+In SCORE mode (`EvaluationMode.SCORE`) a rejection is either hard or soft:
+
+- soft: the rule is optional (``required=False``, as JSON rules may declare), or the
+  job falls in the rule's review band, e.g. a salary just below the threshold;
+- hard: any other failure.
+
+A job with only soft failures goes to manual review instead of being rejected. Its
+score, ``1 - failed weight / total weight`` over the rule ``weight`` attributes
+(1.0 when absent), orders the review queue: jobs that are closest to approval
+come first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+
+from .batch import BoolArray, FloatArray
+
+__all__ = ["in_review_band", "review_band", "rule_required", "rule_weight", "scores"]
+
+_BAND_ATTR = "__approval_review_band__"
+
+R = TypeVar("R")
+
+
+def review_band(predicate: Callable[[dict[str, Any]], bool]) -> Callable[[R], R]:
+    """
+    Attach a review band to a rule: ``predicate(job)`` is True when a job the rule
+    rejects is close enough to passing to deserve manual review.
+
+    The predicate receives the same (featured) job as the rule.
+    """
+
+    def decorator(rule: R) -> R:
+        setattr(rule, _BAND_ATTR, predicate)
+        return rule
+
+    return decorator
+
+
+def in_review_band(rule: Any, job: dict[str, Any]) -> bool:
+    """Whether a job rejected by ``rule`` falls in the rule's review band."""
+    predicate = getattr(rule, _BAND_ATTR, None)
+    return bool(predicate(job)) if callable(predicate) else False
+
+
+def rule_weight(rule: Any) -> float:
+    """The rule's ``weight`` (1.0 when undeclared)."""
+    weight = float(getattr(rule, "weight", 1.0))
+    if weight < 0:
+        raise ValueError(f"rule weight must be >= 0, got {weight}")
+    return weight
+
+
+def rule_required(rule: Any) -> bool:
+    """Whether a failure of the rule is hard (True unless declared optional)."""
+    return bool(getattr(rule, "required", True))
+
+
+def scores(weights: Sequence[float], failures: BoolArray) -> FloatArray:
+    """
+    Score of each job given the rule weights and a ``(rules, jobs)`` failure matrix.
+
+    Example:
+        >>> scores([1.0, 3.0], np.array([[True, False], [False, False]])).tolist()
+        [0.75, 1.0]
+    """
+    w = np.asarray(weights, dtype=np.float64)
+    total = w.sum()
+    if total <= 0:
+        return np.ones(failures.shape[1], dtype=np.float64)
+    return np.asarray(1.0 - (w @ failures) / total, dtype=np.float64)
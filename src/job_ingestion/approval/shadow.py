@@ -0,0 +1,268 @@
+"""Shadow evaluation of a candidate rule set against live traffic.
+
+`ShadowEvaluator` runs a candidate `ApprovalEngine` on the same canonical jobs as the
+active engine, after the active decisions are made, and records where the two
+disagree. It never affects persistence: ingest only enqueues the evaluated chunk on
+a bounded queue and returns. A daemon worker thread evaluates queued chunks with the
+candidate (in AUDIT mode, so every candidate rule is checked) and aggregates:
+
+- decision divergences: jobs the candidate would approve or reject differently;
+- per-rule divergences: for every rule, how often the candidate's outcome differs
+  from the active one, with a few sample diffs each.
+
+When the queue is full the chunk is dropped and counted instead of blocking, so
+ingest latency does not depend on the candidate's speed.
+
+A rule is compared only where the active outcome is known: rules the active engine
+checked for the job (FAST mode stops at the first failure), rules the active set
+does not contain (they count as passing there) and active rules the candidate
+removed (they count as passing in the candidate).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from job_ingestion.utils import metrics
+from job_ingestion.utils.logging import get_logger
+
+from .engine import ApprovalDecision, ApprovalEngine, EvaluationMode
+
+__all__ = ["RuleDivergence", "ShadowDiff", "ShadowEvaluator", "ShadowReport"]
+
+logger = get_logger("approval.shadow")
+
+
+@dataclass(frozen=True)
+class ShadowDiff:
+    """One job on which the candidate and active outcomes differ."""
+
+    external_id: Any
+    schema: str | None
+    active_approved: bool
+    candidate_approved: bool
+    active_failed: tuple[str, ...]
+    candidate_failed: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RuleDivergence:
+    rule: str
+    # Jobs on which the rule's active and candidate outcomes were both known
+    compared: int
+    # The candidate rejects where the active rule passed
+    newly_failing: int
+    # The candidate passes where the active rule rejected
+    newly_passing: int
+    samples: tuple[ShadowDiff, ...]
+
+    @property
+    def divergence_rate(self) -> float:
+        changed = self.newly_failing + self.newly_passing
+        return changed / self.compared if self.compared else 0.0
+
+
+@dataclass(frozen=True)
+class ShadowReport:
+    submitted: int
+    evaluated: int
+    dropped: int
+    errors: int
+    newly_approved: int
+    newly_rejected: int
+    rules: tuple[RuleDivergence, ...]
+    samples: tuple[ShadowDiff, ...]
+
+
+class _RuleCounts:
+    __slots__ = ("compared", "newly_failing", "newly_passing", "samples")
+
+    def __init__(self, sample_size: int) -> None:
+        self.compared = 0
+        self.newly_failing = 0
+        self.newly_passing = 0
+        self.samples: deque[ShadowDiff] = deque(maxlen=sample_size)
+
+
+# (canonical jobs, active decisions, active rule names)
+_Chunk = tuple[list[dict[str, Any]], list[ApprovalDecision], tuple[str, ...]]
+
+
+class ShadowEvaluator:
+    """
+    Evaluate a candidate engine off the hot path and aggregate its divergences.
+
+    Example:
+        >>> def has_title(job):
+        ...     return (True, None) if job.get("title") else (False, "Missing title")
+        >>> def long_title(job):
+        ...     ok = len(job.get("title", "")) > 3
+        ...     return ok, None if ok else "Title too short"
+        >>> active = ApprovalEngine([has_title])
+        >>> shadow = ShadowEvaluator(ApprovalEngine([has_title, long_title]))
+        >>> jobs = [{"title": "SWE"}, {"title": "Engineer"}]
+        >>> shadow.submit(jobs, [active.evaluate_job(j) for j in jobs], ["has_title"])
+        True
+        >>> shadow.drain()
+        >>> report = shadow.report()
+        >>> report.evaluated, report.newly_rejected, report.rules[1].newly_failing
+        (2, 1, 1)
+        >>> shadow.close()
+    """
+
+    def __init__(
+        self, candidate: ApprovalEngine, queue_size: int = 64, sample_size: int = 10
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self.candidate = candidate
+        self.sample_size = sample_size
+        self._queue: queue.Queue[_Chunk | None] = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._rules: dict[str, _RuleCounts] = {}
+        self._samples: deque[ShadowDiff] = deque(maxlen=sample_size)
+        self._submitted = 0
+        self._evaluated = 0
+        self._dropped = 0
+        self._errors = 0
+        self._newly_approved = 0
+        self._newly_rejected = 0
+
+    def submit(
+        self,
+        jobs: Sequence[dict[str, Any]],
+        decisions: Sequence[ApprovalDecision],
+        active_rules: Sequence[str],
+    ) -> bool:
+        """
+        Queue a chunk of evaluated jobs for the candidate without blocking.
+
+        Returns False (and counts the jobs as dropped) when the queue is full.
+        """
+        if len(jobs) != len(decisions):
+            raise ValueError("jobs and decisions must have the same length")
+        if not jobs:
+            return True
+        self._ensure_worker()
+        with self._lock:
+            self._submitted += len(jobs)
+        try:
+            self._queue.put_nowait((list(jobs), list(decisions), tuple(active_rules)))
+        except queue.Full:
+            with self._lock:
+                self._dropped += len(jobs)
+            metrics.increment("approval.shadow.dropped", len(jobs))
+            return False
+        return True
+
+    def drain(self) -> None:
+        """Wait until every queued chunk has been evaluated (for tests and shutdown)."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Stop the worker once the queued chunks are evaluated."""
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+        self._worker = None
+
+    def report(self) -> ShadowReport:
+        with self._lock:
+            rules = tuple(
+                RuleDivergence(
+                    rule=name,
+                    compared=c.compared,
+                    newly_failing=c.newly_failing,
+                    newly_passing=c.newly_passing,
+                    samples=tuple(c.samples),
+                )
+                for name, c in self._rules.items()
+            )
+            return ShadowReport(
+                submitted=self._submitted,
+                evaluated=self._evaluated,
+                dropped=self._dropped,
+                errors=self._errors,
+                newly_approved=self._newly_approved,
+                newly_rejected=self._newly_rejected,
+                rules=rules,
+                samples=tuple(self._samples),
+            )
+
+    # --- Worker ---
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="approval-shadow", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is None:
+                    return
+                self._evaluate(*chunk)
+            except Exception:
+                with self._lock:
+                    self._errors += len(chunk[0]) if chunk else 0
+                metrics.increment("approval.shadow.errors")
+                logger.exception("shadow.evaluation_failed")
+            finally:
+                self._queue.task_done()
+
+    def _evaluate(
+        self,
+        jobs: list[dict[str, Any]],
+        decisions: list[ApprovalDecision],
+        active_rules: tuple[str, ...],
+    ) -> None:
+        batch = self.candidate.evaluate_batch(jobs, mode=EvaluationMode.AUDIT)
+        candidate_rules = batch.rule_names
+        removed = [name for name in active_rules if name not in candidate_rules]
+        active_set = set(active_rules)
+        with self._lock:
+            for i, (job, decision) in enumerate(zip(jobs, decisions, strict=True)):
+                candidate_failed = tuple(batch.reason_codes(i))
+                candidate_approved = bool(batch.approved[i])
+                diff = ShadowDiff(
+                    external_id=job.get("external_id"),
+                    schema=job.get("_schema"),
+                    active_approved=decision.approved,
+                    candidate_approved=candidate_approved,
+                    active_failed=tuple(decision.failed_rules),
+                    candidate_failed=candidate_failed,
+                )
+                if candidate_approved != decision.approved:
+                    if candidate_approved:
+                        self._newly_approved += 1
+                    else:
+                        self._newly_rejected += 1
+                    self._samples.append(diff)
+
+                checked = set(decision.checked_rules)
+                active_failed = set(decision.failed_rules)
+                for name in (*candidate_rules, *removed):
+                    if name in active_set and name not in checked:
+                        continue
+                    counts = self._rules.get(name)
+                    if counts is None:
+                        counts = self._rules[name] = _RuleCounts(self.sample_size)
+                    counts.compared += 1
+                    was_failing = name in active_failed
+                    is_failing = name in candidate_failed
+                    if is_failing == was_failing:
+                        continue
+                    if is_failing:
+                        counts.newly_failing += 1
+                    else:
+                        counts.newly_passing += 1
+                    counts.samples.append(diff)
+            self._evaluated += len(jobs)
+        metrics.increment("approval.shadow.evaluated", len(jobs))
@@ -0,0 +1,327 @@
+"""Staffing/recruiting-agency detection over company names and descriptions.
+
+A single Aho-Corasick automaton is compiled once over every signal phrase. The
+company name and both descriptions are casefolded and joined with a separator that no
+phrase contains, then scanned in one linear pass; each hit is attributed to the field
+it falls in and only counts if the phrase applies to that field and sits on word
+boundaries. Company names are additionally checked against an index of known
+agencies with a single set lookup.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from job_ingestion.transformation.normalizers import canonical_company_key
+
+__all__ = [
+    "StaffingSignal",
+    "StaffingAssessment",
+    "AhoCorasick",
+    "StaffingDetector",
+    "get_staffing_detector",
+]
+
+COMPANY = "company_name"
+SHORT = "short_description"
+FULL = "full_description"
+DESCRIPTIONS = (SHORT, FULL)
+
+# Score at which a posting is considered to come from a staffing/recruiting agency
+STAFFING_THRESHOLD: float = 1.0
+
+# Phrases that mark an agency when they appear in the company name
+_COMPANY_PHRASES: dict[str, float] = {
+    "staffing": 1.0,
+    "recruiting": 1.0,
+    "recruitment": 1.0,
+    "recruiters": 1.0,
+    "headhunters": 1.0,
+    "headhunting": 1.0,
+    "personnel": 1.0,
+    "manpower": 1.0,
+    "employment agency": 1.0,
+    "employment services": 1.0,
+    "employment solutions": 1.0,
+    "placement services": 1.0,
+    "placements": 0.6,
+    "talent acquisition": 1.0,
+    "talent solutions": 0.6,
+    "talent partners": 0.6,
+    "workforce solutions": 0.6,
+    "workforce group": 0.6,
+    "executive search": 1.0,
+    "search partners": 0.6,
+    "search group": 0.6,
+    "temps": 1.0,
+    "temporary services": 1.0,
+    "contract services": 0.5,
+    "it solutions": 0.3,
+    "consulting group": 0.3,
+}
+
+# Phrases that mark an agency when they appear in either description
+_DESCRIPTION_PHRASES: dict[str, float] = {
+    "staffing agency": 1.0,
+    "staffing firm": 1.0,
+    "staffing company": 1.0,
+    "staffing partner": 1.0,
+    "staffing services": 1.0,
+    "recruitment agency": 1.0,
+    "recruitment firm": 1.0,
+    "recruitment consultancy": 1.0,
+    "recruiting agency": 1.0,
+    "recruiting firm": 1.0,
+    "employment agency": 1.0,
+    "executive search firm": 1.0,
+    "on behalf of our client": 1.0,
+    "on behalf of a client": 1.0,
+    "our client is": 1.0,
+    "our client has": 1.0,
+    "our client, a": 1.0,
+    "our client seeks": 1.0,
+    "our client's": 1.0,
+    "my client is": 1.0,
+    "my client has": 1.0,
+    "for our client": 1.0,
+    "a client of ours": 1.0,
+    "one of our clients": 1.0,
+    "a leading client": 0.6,
+    "our valued client": 1.0,
+    "confidential client": 0.6,
+    "this position is with our client": 1.0,
+    "we are recruiting on behalf": 1.0,
+    "we are a staffing": 1.0,
+    "we are a recruitment": 1.0,
+    "temp to perm": 0.5,
+    "temp-to-perm": 0.5,
+    "temp to hire": 0.5,
+    "temp-to-hire": 0.5,
+    "contract to hire": 0.4,
+    "contract-to-hire": 0.4,
+    "corp to corp": 0.5,
+    "corp-to-corp": 0.5,
+    "c2c": 0.5,
+    "w2 only": 0.4,
+    "w2 contract": 0.4,
+    "placement fee": 0.6,
+    "submit your resume to our recruiters": 0.6,
+    "our recruiters": 0.4,
+    "our recruiting team will": 0.2,
+}
+
+# Well-known staffing and recruiting agencies, keyed by `canonical_company_key`
+KNOWN_AGENCIES: frozenset[str] = frozenset(
+    {
+        "adecco",
+        "aerotek",
+        "akkodis",
+        "allegis group",
+        "apex systems",
+        "aston carter",
+        "actalent",
+        "beacon hill staffing group",
+        "collabera",
+        "cybercoders",
+        "express employment professionals",
+        "hays",
+        "hudson",
+        "insight global",
+        "judge group",
+        "kelly services",
+        "kforce",
+        "korn ferry",
+        "lucas group",
+        "manpowergroup",
+        "michael page",
+        "modis",
+        "motion recruitment",
+        "page group",
+        "randstad",
+        "robert half",
+        "robert walters",
+        "signature consultants",
+        "spherion",
+        "teksystems",
+        "vaco",
+        "volt",
+        "yoh",
+    }
+)
+
+
+class AhoCorasick:
+    """
+    Minimal Aho-Corasick automaton over string patterns.
+
+    `iter_matches` yields ``(end_index, pattern_id)`` for every occurrence of every
+    pattern in one pass over the text, where ``end_index`` is exclusive.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        pid = len(self.patterns)
+        self.patterns.append(pattern)
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = (*self._out[state], pid)
+
+    def _link(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Merge outputs along the failure chain so matching never walks it
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterable[tuple[int, int]]:
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for idx, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pid in out[state]:
+                yield idx + 1, pid
+
+
+@dataclass(frozen=True, slots=True)
+class StaffingSignal:
+    field: str
+    phrase: str
+    weight: float
+
+
+@dataclass(frozen=True)
+class StaffingAssessment:
+    is_staffing: bool
+    score: float
+    signals: list[StaffingSignal] = field(default_factory=list)
+
+    @property
+    def reason(self) -> str:
+        found = ", ".join(f"'{s.phrase}' in {s.field}" for s in self.signals[:3])
+        return f"Job appears to be from a staffing/recruiting agency ({found})"
+
+
+class StaffingDetector:
+    """
+    Scores a posting's likelihood of coming from a staffing or recruiting agency.
+
+    Example:
+        >>> detector = StaffingDetector()
+        >>> detector.assess("Acme Corp", None, "Build great software.").is_staffing
+        False
+        >>> detector.assess("Robert Half", None, None).is_staffing
+        True
+        >>> detector.assess(None, "Our client is hiring a Python developer.", None).is_staffing
+        True
+    """
+
+    _SEPARATOR = "\x00"
+
+    def __init__(
+        self,
+        company_phrases: dict[str, float] | None = None,
+        description_phrases: dict[str, float] | None = None,
+        known_agencies: Iterable[str] | None = None,
+        threshold: float = STAFFING_THRESHOLD,
+    ) -> None:
+        self.threshold = threshold
+        self.known_agencies = frozenset(
+            canonical_company_key(a) or a
+            for a in (KNOWN_AGENCIES if known_agencies is None else known_agencies)
+        )
+        # pattern id -> (weight per field)
+        scoped: dict[str, dict[str, float]] = {}
+        for phrase, weight in (company_phrases or _COMPANY_PHRASES).items():
+            scoped.setdefault(phrase.casefold(), {})[COMPANY] = weight
+        for phrase, weight in (description_phrases or _DESCRIPTION_PHRASES).items():
+            for fld in DESCRIPTIONS:
+                scoped.setdefault(phrase.casefold(), {})[fld] = weight
+        self._automaton = AhoCorasick(scoped)
+        self._weights = [scoped[p] for p in self._automaton.patterns]
+
+    @staticmethod
+    def _on_word_boundary(text: str, start: int, end: int) -> bool:
+        before_ok = start == 0 or not text[start - 1].isalnum()
+        after_ok = end == len(text) or not text[end].isalnum()
+        return before_ok and after_ok
+
+    def assess(
+        self,
+        company_name: str | None,
+        short_description: str | None,
+        full_description: str | None,
+    ) -> StaffingAssessment:
+        """Scan all three fields in a single pass and return the combined assessment."""
+        signals: list[StaffingSignal] = []
+
+        if company_name and canonical_company_key(company_name) in self.known_agencies:
+            signals.append(StaffingSignal(COMPANY, company_name.strip(), STAFFING_THRESHOLD))
+
+        # Casefolded per field: casefolding can change lengths ("ß" -> "ss"), so the
+        # bounds must come from the casefolded values
+        fields = (
+            (COMPANY, (company_name or "").casefold()),
+            (SHORT, (short_description or "").casefold()),
+            (FULL, (full_description or "").casefold()),
+        )
+        text = self._SEPARATOR.join(value for _, value in fields)
+        bounds: list[tuple[int, str]] = []
+        offset = 0
+        for name, value in fields:
+            offset += len(value)
+            bounds.append((offset, name))
+            offset += 1  # separator
+
+        seen: set[tuple[str, int]] = set()
+        for end, pid in self._automaton.iter_matches(text):
+            phrase = self._automaton.patterns[pid]
+            start = end - len(phrase)
+            fld = next((name for limit, name in bounds if end <= limit), None)
+            if fld is None:
+                continue
+            weight = self._weights[pid].get(fld)
+            if not weight or (fld, pid) in seen:
+                continue
+            if not self._on_word_boundary(text, start, end):
+                continue
+            seen.add((fld, pid))
+            signals.append(StaffingSignal(fld, phrase, weight))
+
+        score = round(sum(s.weight for s in signals), 3)
+        signals.sort(key=lambda s: s.weight, reverse=True)
+        return StaffingAssessment(score >= self.threshold, score, signals)
+
+
+@lru_cache(maxsize=1)
+def get_staffing_detector() -> StaffingDetector:
+    """Return the shared detector, compiling its automaton on first use."""
+    return StaffingDetector()
@@ -5,6 +5,7 @@ This module handles the complex task of mapping incoming job data (which can var
 in structure) to the standardized database schema with comprehensive job properties.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -484,3 +485,27 @@ class JobDataMapper:
                             continue
 
         return salary_min, salary_max, base_salary, currency, unit
+
+
+class RenamingJobMapper(JobDataMapper):
+    """
+    Mapping plan for a source whose field names differ from the ones read by
+    `JobDataMapper`.
+
+    ``renames`` maps source keys to generic keys (e.g. ``{"posTitle": "title"}``); a
+    renamed value takes precedence over a key of the same name already in the record.
+
+    Example:
+        >>> RenamingJobMapper({"posTitle": "title"}).map_job_data({"posTitle": "SWE"})["title"]
+        'SWE'
+    """
+
+    def __init__(self, renames: Mapping[str, str]) -> None:
+        self._renames = dict(renames)
+
+    def map_job_data(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        renamed = dict(raw_data)
+        for source, target in self._renames.items():
+            if source in raw_data:
+                renamed[target] = raw_data[source]
+        return super().map_job_data(renamed)
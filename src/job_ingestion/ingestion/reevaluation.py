@@ -0,0 +1,352 @@
+"""Incremental re-evaluation of stored jobs after approval rules change.
+
+At ingest every job is stored with its per-rule outcome bitmasks and the version of
+the rule set that produced them (see `approval.outcomes`). When the active rules no
+longer match a stored version, only the rules whose fingerprint changed are re-run
+for the affected rows; every other bit is carried over, and the final decision is
+recomputed from the mask (a job is approved iff no bit of ``rule_failures`` is set).
+
+Versions whose rules are unchanged are moved to the current version with one
+set-based ``UPDATE`` per table. Rows whose decision flips move between ``jobs`` and
+``rejected_jobs``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, cast
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, sessionmaker
+
+from job_ingestion.approval.engine import ApprovalDecision, ApprovalEngine
+from job_ingestion.approval.outcomes import RuleSetSignature
+from job_ingestion.storage.models import ApprovalRuleSet, ApprovalStatus, Job, RejectedJob
+from job_ingestion.storage.repositories import get_session
+from job_ingestion.utils import metrics
+from job_ingestion.utils.logging import get_logger
+
+__all__ = [
+    "CONTEXT_FIELDS",
+    "ReevaluationReport",
+    "StoredJob",
+    "approval_context",
+    "canonical_job_from_row",
+    "decided_filter",
+    "record_rule_set",
+    "reevaluate_stored_jobs",
+    "rule_outcome",
+]
+
+logger = get_logger("ingestion.reevaluation")
+
+# Canonical job fields that have no column of their own
+CONTEXT_FIELDS = (
+    "employment_type",
+    "company_type",
+    "language",
+    "geo_country_code",
+    "geo_region_code",
+    "company_name",
+    "_schema",
+)
+
+DEFAULT_REJECTION_REASON = "Failed approval rules"
+
+StoredJob = Job | RejectedJob
+
+# Columns copied when a row moves between jobs and rejected_jobs
+_SHARED_COLUMNS = tuple(
+    sorted(
+        (set(Job.__table__.columns.keys()) & set(RejectedJob.__table__.columns.keys()))
+        - {"id", "created_at", "updated_at"}
+    )
+)
+
+
+def approval_context(canonical_job: dict[str, Any]) -> dict[str, Any]:
+    """Values of `CONTEXT_FIELDS` set on a canonical job."""
+    return {k: canonical_job[k] for k in CONTEXT_FIELDS if canonical_job.get(k) is not None}
+
+
+def rule_outcome(
+    signature: RuleSetSignature, decision: ApprovalDecision, canonical_job: dict[str, Any]
+) -> dict[str, Any]:
+    """Column values recording a decision's per-rule outcomes under ``signature``."""
+    return {
+        "rule_set_version": signature.version,
+        "rule_failures": signature.encode(decision.failed_rules),
+        "rule_checked": signature.encode(decision.checked_rules),
+        "approval_context": approval_context(canonical_job),
+    }
+
+
+def record_rule_set(session: Session, signature: RuleSetSignature) -> None:
+    """Store a rule set version so stored masks can be decoded later."""
+    session.merge(ApprovalRuleSet(version=signature.version, rules=signature.to_json()))
+
+
+def _number(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def canonical_job_from_row(row: StoredJob | Row[Any]) -> dict[str, Any]:
+    """
+    Rebuild the canonical job evaluated at ingest from a stored row.
+
+    Mirrors `IngestionService._build_canonical_job` using the stored columns and the
+    row's ``approval_context``. Accepts ORM rows or result rows selecting the same
+    column names.
+    """
+    job: dict[str, Any] = {
+        "title": row.title,
+        "description": row.description_text or "",
+        "description_length": row.description_length,
+        "description_word_count": row.description_word_count,
+        "short_description": row.short_description,
+        "full_description": row.description_text if row.full_description else None,
+        "company_name": row.company_name,
+        "salary_min": _number(row.salary_min),
+        "salary_currency": row.salary_currency,
+        "salary_unit": row.salary_unit,
+        "location": row.primary_location,
+        "latitude": row.latitude,
+        "longitude": row.longitude,
+        "external_id": row.external_id,
+    }
+    job.update(row.approval_context or {})
+    return job
+
+
+@dataclass
+class ReevaluationReport:
+    """Outcome of `reevaluate_stored_jobs`."""
+
+    version: str
+    rows_scanned: int = 0
+    # Rows moved to the current version by set-based updates, without running rules
+    rows_bumped: int = 0
+    rule_calls: int = 0
+    approved_to_rejected: int = 0
+    rejected_to_approved: int = 0
+    rules_rerun: dict[str, list[str]] = field(default_factory=dict)
+
+
+def _stale_versions(session: Session, current: str) -> list[str | None]:
+    versions: dict[str | None, None] = {}
+    for model in (Job, RejectedJob):
+        stmt = select(model.rule_set_version).distinct()
+        for (version,) in session.execute(stmt):
+            if version != current:
+                versions[version] = None
+    return list(versions)
+
+
+def _load_signature(session: Session, version: str | None) -> RuleSetSignature | None:
+    if version is None:
+        return None
+    stored = session.get(ApprovalRuleSet, version)
+    if stored is None:
+        return None
+    try:
+        return RuleSetSignature.from_json(stored.rules)
+    except (TypeError, ValueError, IndexError):
+        logger.warning("reevaluation.invalid_rule_set", version=version)
+        return None
+
+
+def _version_filter(model: type[StoredJob], version: str | None) -> Any:
+    column = model.rule_set_version
+    return column.is_(None) if version is None else column == version
+
+
+def decided_filter(model: type[StoredJob]) -> list[Any]:
+    """Conditions excluding jobs still waiting for manual review (they have no decision)."""
+    if model is Job:
+        return [Job.approval_status != ApprovalStatus.MANUAL_REVIEW]
+    return []
+
+
+def _reasons(
+    engine: ApprovalEngine, job: dict[str, Any], failing: Iterable[str], known: dict[str, Any]
+) -> str:
+    reasons: list[str] = []
+    pending = [name for name in failing if name not in known]
+    results = {**known, **(engine.run_rules(job, pending) if pending else {})}
+    for name in failing:
+        reason = results[name][1]
+        if reason:
+            reasons.append(reason)
+    return "; ".join(reasons) if reasons else DEFAULT_REJECTION_REASON
+
+
+def _moved(row: StoredJob, target: type[StoredJob], **values: Any) -> StoredJob:
+    data = {name: getattr(row, name) for name in _SHARED_COLUMNS}
+    data.update(values)
+    return target(**data)
+
+
+def reevaluate_stored_jobs(
+    session_maker: sessionmaker[Session],
+    engine: ApprovalEngine,
+    batch_size: int = 500,
+    include_unversioned: bool = False,
+) -> ReevaluationReport:
+    """
+    Bring every stored job's rule outcomes up to the engine's current rule set.
+
+    For each stale version, the rules that are new or whose fingerprint changed are
+    re-run on the affected rows; other bits are carried over. Rows evaluated in FAST
+    mode may have rules that never ran; if their re-run leaves no failure, those
+    rules are run too, so an approval always rests on every rule. Rows whose version
+    is unknown are fully re-evaluated. Rows without a stored version were ingested
+    before outcomes (and the ``approval_context`` their rules read) were recorded;
+    they are only re-evaluated with ``include_unversioned``.
+
+    Returns:
+        A `ReevaluationReport` with row and rule-call counts.
+
+    Raises:
+        ValueError: If ``batch_size`` is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    signature = engine.rule_set_signature()
+    report = ReevaluationReport(version=signature.version)
+
+    with get_session(session_maker) as s:
+        record_rule_set(s, signature)
+        stale = [
+            version
+            for version in _stale_versions(s, signature.version)
+            if version is not None or include_unversioned
+        ]
+        old_signatures = {version: _load_signature(s, version) for version in stale}
+
+    for version, old in old_signatures.items():
+        changed = signature.changed_since(old) if old is not None else signature.names
+        label = version or "none"
+        report.rules_rerun[label] = list(changed)
+        if old is not None and not changed and old.names == signature.names:
+            # Same rules in the same bit positions: only the version tag is stale
+            with get_session(session_maker) as s:
+                for model in (Job, RejectedJob):
+                    result = s.execute(
+                        update(model)
+                        .where(_version_filter(model, version))
+                        .values(rule_set_version=signature.version)
+                    )
+                    report.rows_bumped += int(getattr(result, "rowcount", 0) or 0)
+            continue
+        for model in (Job, RejectedJob):
+            _reevaluate_version(
+                session_maker, engine, model, version, old, signature, changed, batch_size, report
+            )
+
+    metrics.increment("approval.reevaluation.rows", report.rows_scanned)
+    metrics.increment("approval.reevaluation.rule_calls", report.rule_calls)
+    logger.info(
+        "reevaluation.finished",
+        version=signature.version,
+        rows_scanned=report.rows_scanned,
+        rows_bumped=report.rows_bumped,
+        rule_calls=report.rule_calls,
+        approved_to_rejected=report.approved_to_rejected,
+        rejected_to_approved=report.rejected_to_approved,
+    )
+    return report
+
+
+def _reevaluate_version(
+    session_maker: sessionmaker[Session],
+    engine: ApprovalEngine,
+    model: type[StoredJob],
+    version: str | None,
+    old: RuleSetSignature | None,
+    signature: RuleSetSignature,
+    changed: list[str],
+    batch_size: int,
+    report: ReevaluationReport,
+) -> None:
+    stale_bits = signature.encode(changed)
+    approved_table = model is Job
+    last_id = 0
+    while True:
+        with get_session(session_maker) as s:
+            rows: Sequence[StoredJob] = cast(
+                Sequence[StoredJob],
+                s.execute(
+                    select(model)
+                    .where(
+                        _version_filter(model, version), model.id > last_id, *decided_filter(model)
+                    )
+                    .order_by(model.id)
+                    .limit(batch_size)
+                )
+                .scalars()
+                .all(),
+            )
+            if not rows:
+                return
+            last_id = rows[-1].id
+
+            updates: list[dict[str, Any]] = []
+            moved: list[StoredJob] = []
+            moved_ids: list[int] = []
+            for row in rows:
+                report.rows_scanned += 1
+                previous: int | None = None
+                failures = checked = 0
+                if old is not None:
+                    previous = signature.remap(row.rule_failures or 0, old)
+                    failures = previous & ~stale_bits
+                    checked = signature.remap(row.rule_checked or 0, old) & ~stale_bits
+
+                job = canonical_job_from_row(row)
+                results: dict[str, Any] = {}
+                rerun = signature.decode(
+                    signature.all_bits & ~checked if old is None else stale_bits
+                )
+                while rerun:
+                    fresh = engine.run_rules(job, rerun)
+                    report.rule_calls += len(fresh)
+                    results.update(fresh)
+                    for name, (ok, _) in fresh.items():
+                        checked |= signature.bit(name)
+                        if not ok:
+                            failures |= signature.bit(name)
+                    # Rules never checked (FAST mode) matter once nothing else fails
+                    rerun = [] if failures else signature.decode(signature.all_bits & ~checked)
+
+                values: dict[str, Any] = {
+                    "rule_set_version": signature.version,
+                    "rule_failures": failures,
+                    "rule_checked": checked,
+                }
+                if failures and (approved_table or failures != previous):
+                    values["rejection_reasons"] = _reasons(
+                        engine, job, signature.decode(failures), results
+                    )
+                if approved_table and failures:
+                    moved.append(_moved(row, RejectedJob, **values))
+                    moved_ids.append(row.id)
+                    report.approved_to_rejected += 1
+                elif not approved_table and not failures:
+                    moved.append(
+                        _moved(row, Job, approval_status=ApprovalStatus.APPROVED, **values)
+                    )
+                    moved_ids.append(row.id)
+                    report.rejected_to_approved += 1
+                else:
+                    updates.append({"id": row.id, **values})
+
+            # Apply as bulk statements rather than through the loaded instances
+            s.expunge_all()
+            if updates:
+                s.execute(update(model), updates)
+            if moved_ids:
+                s.execute(delete(model).where(model.id.in_(moved_ids)))
+            s.add_all(moved)
@@ -1,24 +1,178 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, Literal
 
 SchemaName = Literal["unknown", "schema_a", "schema_b"]
 
+UNKNOWN_SCHEMA = "unknown"
+
+# Indicative keys for the built-in source schemas. A record matches a schema when it
+# contains every key of that schema's signature.
+DEFAULT_SCHEMA_SIGNATURES: dict[str, frozenset[str]] = {
+    "schema_a": frozenset({"company_name"}),
+    "schema_b": frozenset({"employer"}),
+}
+
+Fingerprint = frozenset[str]
+
+
+class SchemaDetector:
+    """
+    Per-record schema detector backed by a key-set fingerprint cache.
+
+    Each record is reduced to a fingerprint (the frozenset of its keys, whose hash is
+    computed once and cached by Python). The first time a fingerprint is seen it is
+    resolved against the registered schema signatures; the result is kept in a bounded
+    LRU so that subsequent records with the same shape cost one hash and one dict lookup.
+
+    Resolution rules for a fingerprint:
+    - Collect every registered schema whose signature keys are all present.
+    - No match -> "unknown".
+    - One match -> that schema.
+    - Several matches -> the most specific one (largest signature); ties -> "unknown".
+
+    Example:
+        >>> detector = SchemaDetector()
+        >>> detector.detect({"company_name": "Acme", "title": "SWE"})
+        'schema_a'
+        >>> detector.detect({"title": "SWE"})
+        'unknown'
+    """
+
+    def __init__(
+        self,
+        signatures: Mapping[str, Iterable[str]] | None = None,
+        cache_size: int = 1024,
+    ) -> None:
+        if cache_size <= 0:
+            raise ValueError("cache_size must be positive")
+        self._signatures: dict[str, frozenset[str]] = {}
+        self._cache: OrderedDict[Fingerprint, tuple[str, ...]] = OrderedDict()
+        self._cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        source = DEFAULT_SCHEMA_SIGNATURES if signatures is None else signatures
+        for name, keys in source.items():
+            self.register(name, keys)
+
+    @property
+    def schema_names(self) -> list[str]:
+        """Names of the registered schemas, in registration order."""
+        return list(self._signatures)
+
+    def register(self, name: str, keys: Iterable[str]) -> None:
+        """Register (or replace) a schema signature and invalidate cached resolutions."""
+        signature = frozenset(keys)
+        if not signature:
+            raise ValueError("schema signature must contain at least one key")
+        self._signatures[name] = signature
+        self._cache.clear()
+
+    @staticmethod
+    def fingerprint(record: Mapping[str, Any]) -> Fingerprint:
+        """Return the order-independent key-set fingerprint of a record."""
+        return frozenset(record)
+
+    def matches(self, record: Any) -> tuple[str, ...]:
+        """Return all registered schemas whose signature is satisfied by the record."""
+        if not isinstance(record, dict):
+            return ()
+        fp = self.fingerprint(record)
+        cached = self._cache.get(fp)
+        if cached is not None:
+            self._cache.move_to_end(fp)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        resolved = tuple(name for name, sig in self._signatures.items() if sig <= fp)
+        self._cache[fp] = resolved
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return resolved
+
+    def partial_matches(self, record: Any) -> tuple[str, ...]:
+        """
+        Return the schemas whose signature the record carries a strict majority of, but
+        not all: most likely records of that source with a key missing.
+
+        Sharing a key or two with a longer signature is not enough, since signatures
+        often include common keys such as "title".
+
+        Not cached; meant for the records that `detect` leaves "unknown".
+        """
+        if not isinstance(record, dict):
+            return ()
+        fp = self.fingerprint(record)
+        return tuple(
+            name
+            for name, sig in self._signatures.items()
+            if not sig <= fp and 2 * len(sig & fp) > len(sig)
+        )
+
+    def detect(self, record: Any) -> str:
+        """Return the schema name for a single record ("unknown" if ambiguous/absent)."""
+        found = self.matches(record)
+        if not found:
+            return UNKNOWN_SCHEMA
+        if len(found) == 1:
+            return found[0]
+        ranked = sorted(found, key=lambda n: len(self._signatures[n]), reverse=True)
+        if len(self._signatures[ranked[0]]) == len(self._signatures[ranked[1]]):
+            return UNKNOWN_SCHEMA
+        return ranked[0]
+
+    def iter_detect(self, records: Iterable[Any]) -> Iterator[tuple[str, Any]]:
+        """Lazily yield ``(schema_name, record)`` pairs; suitable for unbounded streams."""
+        for record in records:
+            yield self.detect(record), record
+
+    def group(self, records: Iterable[Any]) -> dict[str, list[tuple[int, Any]]]:
+        """Group records by detected schema, keeping each record's original index."""
+        groups: dict[str, list[tuple[int, Any]]] = {}
+        for idx, (name, record) in enumerate(self.iter_detect(records)):
+            groups.setdefault(name, []).append((idx, record))
+        return groups
+
+    def clear_cache(self) -> None:
+        """Drop all cached fingerprint resolutions and reset hit/miss counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_default_detector = SchemaDetector()
+
+
+def get_detector() -> SchemaDetector:
+    """Return the process-wide detector shared by the module-level helpers."""
+    return _default_detector
+
+
+def detect_record_schema(record: Any) -> str:
+    """Detect the schema of a single record using the shared fingerprint cache."""
+    return _default_detector.detect(record)
+
+
+def group_by_schema(records: Iterable[Any]) -> dict[str, list[tuple[int, Any]]]:
+    """Group records by per-record schema using the shared fingerprint cache."""
+    return _default_detector.group(records)
+
 
 def detect_schema(jobs_data: Sequence[dict[str, Any]]) -> SchemaName:
     """
-    Detect a simple source schema for a batch of job records using key presence.
+    Detect a single dominant source schema for a batch of job records.
 
-    Heuristic (placeholder):
-    - If any record contains "company_name" -> return "schema_a".
-    - Else if any record contains "employer" -> return "schema_b".
-    - If both key patterns appear in the batch, choose the one with higher count;
-      if tied, return "unknown".
+    Heuristic:
+    - Count the records matching each built-in schema signature ("company_name" for
+      "schema_a", "employer" for "schema_b"); a record may count for both.
+    - Return the schema with the higher count; if tied, return "unknown".
     - If no indicative keys are present or the input is empty -> "unknown".
 
-    This function is intentionally simple and deterministic. It will be replaced by
-    a more sophisticated detector in later tasks.
+    Matching goes through the shared fingerprint cache, so each record costs one
+    key-set hash. Prefer `group_by_schema` for mixed-source batches.
 
     Args:
         jobs_data: A sequence of raw job dicts.
@@ -33,23 +187,14 @@ def detect_schema(jobs_data: Sequence[dict[str, Any]]) -> SchemaName:
     count_b = 0
 
     for record in jobs_data:
-        # Guard: only dict[str, Any] are expected; ignore non-dicts defensively
-        if not isinstance(record, dict):
-            continue
-        if "company_name" in record:
+        found = _default_detector.matches(record)
+        if "schema_a" in found:
             count_a += 1
-        if "employer" in record:
+        if "schema_b" in found:
             count_b += 1
 
-    if count_a and not count_b:
+    if count_a > count_b:
         return "schema_a"
-    if count_b and not count_a:
+    if count_b > count_a:
         return "schema_b"
-    if count_a and count_b:
-        if count_a > count_b:
-            return "schema_a"
-        if count_b > count_a:
-            return "schema_b"
-        return "unknown"
-
     return "unknown"
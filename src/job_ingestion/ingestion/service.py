@@ -1,22 +1,51 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import math
+import sys
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
-from job_ingestion.approval.engine import ApprovalEngine
-from job_ingestion.approval.rules.company_type_rules import get_rules as company_type_rules
-from job_ingestion.approval.rules.content_rules import get_rules as content_rules
-from job_ingestion.approval.rules.employment_type_rules import get_rules as employment_type_rules
-from job_ingestion.approval.rules.language_rules import get_rules as language_rules
-from job_ingestion.approval.rules.location_rules import get_rules as location_rules
-from job_ingestion.approval.rules.salary_rules import get_rules as salary_rules
-from job_ingestion.ingestion import schema_detector
+from sqlalchemy.orm import Session, sessionmaker
+
+from job_ingestion.approval.engine import ApprovalDecision, ApprovalEngine, EvaluationMode
+from job_ingestion.approval.profiling import RuleProfileSnapshot
+from job_ingestion.approval.rule_dsl import get_rule_set_source
+from job_ingestion.approval.rules.builtin import get_rules as builtin_rules
+from job_ingestion.approval.rules.builtin import parse_rule_names
+from job_ingestion.approval.shadow import ShadowEvaluator, ShadowReport
+from job_ingestion.ingestion import schema_detector, validation
 from job_ingestion.ingestion.job_mapper import JobDataMapper
-from job_ingestion.storage.models import ApprovalStatus, Base, Job, RejectedJob
-from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
-from job_ingestion.transformation.normalizers import LocationNormalizer, SalaryNormalizer
+from job_ingestion.ingestion.reevaluation import record_rule_set, rule_outcome
+from job_ingestion.storage.job_queries import JobFilters, JobPage, list_jobs
+from job_ingestion.storage.models import ApprovalStatus, Job, RejectedJob
+from job_ingestion.storage.repositories import (
+    bulk_insert_jobs,
+    discard_stored_copies,
+    get_session,
+    get_shared_sessionmaker,
+)
+from job_ingestion.storage.review_queue import (
+    ReviewPage,
+    approve_reviewed,
+    enqueue_for_review,
+    list_review_queue,
+    reject_reviewed,
+)
+from job_ingestion.storage.search import SearchPage, search_jobs
+from job_ingestion.transformation.companies import get_company_index
+from job_ingestion.transformation.currency import get_currency_converter
+from job_ingestion.transformation.html_text import extract_text
+from job_ingestion.transformation.normalizers import (
+    LocationNormalizer,
+    SalaryNormalizer,
+    get_location_normalizer,
+)
+from job_ingestion.transformation.reverse_geocoder import (
+    ReverseGeocodeMatch,
+    get_reverse_geocoder,
+)
 from job_ingestion.utils import metrics
 from job_ingestion.utils.config import get_settings
 from job_ingestion.utils.logging import get_logger
@@ -39,6 +68,24 @@ class IngestionService:
     # Lightweight in-memory status store; to be moved to Redis/DB in later tasks
     _batches: dict[str, dict[str, Any]] = {}
 
+    # Schema-specialized mappers registered via register_mapping_plan, keyed by detected
+    # schema name; records of schemas without a plan fall back to the generic
+    # JobDataMapper.
+    _mapping_plans: dict[str, JobDataMapper] = {}
+
+    # Compiled validators for schemas registered via register_source_schema
+    _validators: dict[str, validation.Validator] = {}
+
+    # Shared across batches so adaptive rule ordering learns from all traffic
+    _approval_engine: ApprovalEngine | None = None
+    _approval_rules_path: str = ""
+
+    # Optional candidate rule set compared against the active one off the hot path
+    _shadow: ShadowEvaluator | None = None
+    _shadow_config: tuple[str, str, int] | None = None
+    # Set by set_shadow_evaluator: the installed evaluator ignores the settings
+    _shadow_pinned: bool = False
+
     def ingest_batch(self, jobs_data: Sequence[dict[str, Any]]) -> str:
         """
         Submit a batch of job records for ingestion.
@@ -60,6 +107,8 @@ class IngestionService:
             "processed": 0,
             "approved": 0,
             "rejected": 0,
+            "review": 0,
+            "invalid": 0,
             "errors": 0,
             "started_at": started_at,
             "finished_at": None,
@@ -68,98 +117,187 @@ class IngestionService:
         logger.info("ingest.batch_started", processing_id=processing_id, total=len(jobs_data))
         metrics.increment("ingest.batch_started")
 
-        # Detect schema (heuristic placeholder)
+        # Detect schema per record via the fingerprint cache and group by source shape
         try:
-            schema_name = schema_detector.detect_schema(jobs_data)
+            groups = schema_detector.group_by_schema(jobs_data)
         except Exception:  # pragma: no cover - defensive
             logger.exception("schema detection failed; defaulting to 'unknown'")
-            schema_name = "unknown"
+            groups = {"unknown": list(enumerate(jobs_data))}
+
+        logger.info(
+            "ingest.schema_groups",
+            processing_id=processing_id,
+            groups={name: len(records) for name, records in groups.items()},
+        )
 
         # Build dependencies
         settings = get_settings()
-        engine = get_engine(settings.database_url)
-        # Ensure tables exist (dev/test convenience)
-        Base.metadata.create_all(bind=engine)
-        session_maker = get_sessionmaker(engine)
-
-        rules = [
-            *content_rules(),
-            *location_rules(),
-            *salary_rules(),
-            *employment_type_rules(),
-            *company_type_rules(),
-            *language_rules(),
-        ]
-        approval_engine = ApprovalEngine(rules=rules)
-
-        job_mapper = JobDataMapper()
+        session_maker = self._get_session_maker(settings.database_url)
+        company_index = get_company_index(settings.database_url)
+
+        approval_engine = self._get_approval_engine(
+            settings.approval_evaluation_mode, settings.approval_rules_path
+        )
+        shadow = self._get_shadow(
+            settings.approval_shadow_rules_path,
+            settings.approval_shadow_exclude_rules,
+            settings.approval_shadow_queue_size,
+        )
+
+        default_mapper = JobDataMapper()
 
         status = self._batches[processing_id]
 
-        for idx, raw in enumerate(jobs_data):
+        for schema_name, records in groups.items():
+            job_mapper = self._mapping_plans.get(schema_name, default_mapper)
+            validator = self._validators.get(schema_name)
+
+            mapped_records: list[tuple[int, dict[str, Any], dict[str, Any]]] = []
+            for idx, raw in records:
+                # Reject malformed payloads before spending mapping or DB work on them
+                failure = self._validation_failure(schema_name, validator, raw)
+                if failure is not None:
+                    failed_schema, issue = failure
+                    status["invalid"] += 1
+                    status["processed"] += 1
+                    metrics.increment("ingest.item_invalid")
+                    logger.info(
+                        "ingest.item_invalid",
+                        processing_id=processing_id,
+                        index=idx,
+                        schema=failed_schema,
+                        reason=issue.reason,
+                        **issue.as_dict(),
+                    )
+                    continue
+                try:
+                    # Map all job data to database fields
+                    mapped_records.append((idx, raw, job_mapper.map_job_data(raw)))
+                except Exception as exc:  # keep processing on errors
+                    self._record_item_error(status, processing_id, idx, exc)
+
+            # Extract plain-text descriptions once; rules and storage use these instead
+            # of re-processing the HTML
+            for _, _, mapped in mapped_records:
+                extracted = extract_text(
+                    mapped.get("full_description") or mapped.get("short_description")
+                )
+                mapped["description_text"] = extracted.text if extracted else None
+                mapped["description_length"] = extracted.length if extracted else None
+                mapped["description_word_count"] = extracted.word_count if extracted else None
+
+            # Reverse-geocode the whole group in one vectorized pass
+            geo_matches = get_reverse_geocoder().lookup_many(
+                [mapped.get("latitude") for _, _, mapped in mapped_records],
+                [mapped.get("longitude") for _, _, mapped in mapped_records],
+            )
+            # Country for listings: the coordinates' country, else the location text's
+            location_normalizer = get_location_normalizer()
+            for (_, _, mapped), geo in zip(mapped_records, geo_matches, strict=True):
+                location = mapped.get("primary_location")
+                mapped["country_code"] = (
+                    geo.country_code
+                    if geo
+                    else location_normalizer.country_code(location) if location else None
+                )
+
+            # Annualized USD salary for the whole group in one vectorized conversion
+            annual_usd = get_currency_converter().to_annual_usd_many(
+                [mapped.get("salary_min") for _, _, mapped in mapped_records],
+                [mapped.get("salary_currency") for _, _, mapped in mapped_records],
+                [mapped.get("salary_unit") for _, _, mapped in mapped_records],
+            )
+            for (_, _, mapped), usd in zip(mapped_records, annual_usd.tolist(), strict=True):
+                mapped["salary_annual_usd"] = None if math.isnan(usd) else round(usd, 2)
+
+            # Intern company names and map them to company IDs; only unseen companies
+            # cost a database round trip
+            company_names = [mapped.get("company_name") for _, _, mapped in mapped_records]
             try:
-                # Map all job data to database fields
-                mapped_data = job_mapper.map_job_data(raw)
-
-                # Create canonical job for approval engine (backward compatibility)
-                canonical_job: dict[str, Any] = {
-                    "title": mapped_data.get("title", "(untitled)"),
-                    "description": mapped_data.get("short_description")
-                    or mapped_data.get("full_description", ""),
-                    "salary_min": mapped_data.get("salary_min"),
-                    "salary_currency": mapped_data.get("salary_currency"),
-                    "salary_unit": mapped_data.get("salary_unit"),
-                    "location": mapped_data.get("primary_location"),
-                    "employment_type": raw.get("employment_type"),
-                    "company_type": raw.get("company_type"),
-                    "language": raw.get("language"),
-                    "external_id": mapped_data.get("external_id"),
-                    "_schema": schema_name,
-                }
-
-                decision = approval_engine.evaluate_job(canonical_job)
-
-                # Persist with comprehensive fields
-                with get_session(session_maker) as s:
-                    if decision.approved:
-                        # Create approved job with all mapped fields
-                        job = Job(approval_status=ApprovalStatus.APPROVED, **mapped_data)
-                        s.add(job)
-                        status["approved"] += 1
-                        metrics.increment("ingest.item_approved")
+                company_ids = company_index.resolve(company_names)
+            except Exception:
+                logger.exception("ingest.company_resolution_failed", processing_id=processing_id)
+                company_ids = [None] * len(mapped_records)
+            for (_, _, mapped), name, company_id in zip(
+                mapped_records, company_names, company_ids, strict=True
+            ):
+                if isinstance(name, str):
+                    mapped["company_name"] = sys.intern(name)
+                mapped["company_id"] = company_id
+
+            # Evaluate the whole group at once so vectorized rules run over columns
+            evaluated: list[tuple[int, dict[str, Any], dict[str, Any]]] = []
+            for (idx, raw, mapped_data), geo in zip(mapped_records, geo_matches, strict=True):
+                try:
+                    canonical_job = self._build_canonical_job(raw, mapped_data, schema_name, geo)
+                except Exception as exc:  # keep processing on errors
+                    self._record_item_error(status, processing_id, idx, exc)
+                    continue
+                evaluated.append((idx, mapped_data, canonical_job))
+            decisions = self._evaluate_group(
+                approval_engine, [job for _, _, job in evaluated], processing_id
+            )
+            # Per-rule outcomes are stored against this rule set version so a later rule
+            # change only re-runs the changed rules (see ingestion.reevaluation)
+            signature = approval_engine.rule_set_signature()
+            if shadow is not None:
+                shadowed = [
+                    (job, decision)
+                    for (_, _, job), decision in zip(evaluated, decisions, strict=True)
+                    if isinstance(decision, ApprovalDecision)
+                ]
+                shadow.submit(
+                    [job for job, _ in shadowed],
+                    [decision for _, decision in shadowed],
+                    signature.names,
+                )
+            if evaluated:
+                try:
+                    with get_session(session_maker) as s:
+                        record_rule_set(s, signature)
+                except Exception:
+                    logger.exception("ingest.rule_set_record_failed", processing_id=processing_id)
+
+            # Approved and rejected rows are written per group with bulk statements;
+            # jobs sent to review need their id for the queue and are added one by one
+            approved_rows: list[tuple[int, dict[str, Any], ApprovalDecision]] = []
+            rejected_rows: list[tuple[int, dict[str, Any], ApprovalDecision]] = []
+            for (idx, mapped_data, canonical_job), decision in zip(
+                evaluated, decisions, strict=True
+            ):
+                if isinstance(decision, Exception):
+                    self._record_item_error(status, processing_id, idx, decision)
+                    continue
+                try:
+                    row = {**mapped_data, **rule_outcome(signature, decision, canonical_job)}
+                    if decision.review:
+                        # Borderline: stored as a job, decided later by a reviewer
+                        with get_session(session_maker) as s:
+                            discard_stored_copies(s, [row.get("external_id")])
+                            job = Job(approval_status=ApprovalStatus.MANUAL_REVIEW, **row)
+                            s.add(job)
+                            enqueue_for_review(
+                                s, job, decision.score or 0.0, decision.reasons, schema_name
+                            )
+                        self._record_item_stored(status, processing_id, idx, row, decision)
+                    elif decision.approved:
+                        row["approval_status"] = ApprovalStatus.APPROVED
+                        approved_rows.append((idx, row, decision))
                     else:
-                        # Create rejected job with rejection reasons
-                        rejection_reasons = (
+                        row["rejection_reasons"] = (
                             "; ".join(decision.reasons)
                             if decision.reasons
                             else "Failed approval rules"
                         )
-                        rejected_job = RejectedJob(
-                            rejection_reasons=rejection_reasons, **mapped_data
-                        )
-                        s.add(rejected_job)
-                        status["rejected"] += 1
-                        metrics.increment("ingest.item_rejected")
-
-                # Update counters
-                status["processed"] += 1
-
-                logger.info(
-                    "ingest.item",
-                    processing_id=processing_id,
-                    index=idx,
-                    external_id=mapped_data.get("external_id"),
-                    approved=decision.approved,
-                    reasons=decision.reasons,
-                )
-            except Exception as exc:  # keep processing on errors
-                status["errors"] += 1
-                metrics.increment("ingest.item_error")
-                logger.exception(
-                    "ingest.item_error", processing_id=processing_id, index=idx, error=str(exc)
-                )
+                        rejected_rows.append((idx, row, decision))
+                except Exception as exc:  # keep processing on errors
+                    self._record_item_error(status, processing_id, idx, exc)
+
+            for model, items in ((Job, approved_rows), (RejectedJob, rejected_rows)):
+                self._persist_rows(session_maker, model, items, status, processing_id)
 
         status["finished_at"] = datetime.utcnow()
+        approval_engine.profiler.publish()
         metrics.increment("ingest.batch_finished")
         logger.info(
             "ingest.batch_finished",
@@ -167,6 +305,8 @@ class IngestionService:
             processed=status["processed"],
             approved=status["approved"],
             rejected=status["rejected"],
+            review=status["review"],
+            invalid=status["invalid"],
             errors=status["errors"],
         )
 
@@ -180,7 +320,280 @@ class IngestionService:
         """
         return dict(self._batches.get(batch_id, {}))
 
+    @classmethod
+    def get_rule_profile(cls, schema: str | None = None) -> tuple[int, list[RuleProfileSnapshot]]:
+        """
+        Return the approval engine's sampling interval and per-rule profile snapshots.
+
+        Empty until the first batch has been evaluated.
+        """
+        engine = cls._approval_engine
+        if not isinstance(engine, ApprovalEngine):
+            return 0, []
+        return engine.profiler.sample_every, engine.profiler.snapshot(schema)
+
+    @classmethod
+    def get_shadow_report(cls) -> ShadowReport | None:
+        """Return the shadow evaluation report, or None when shadow mode is off."""
+        shadow = cls._shadow
+        return shadow.report() if shadow is not None else None
+
+    @classmethod
+    def set_shadow_evaluator(cls, shadow: ShadowEvaluator | None) -> None:
+        """
+        Install (or with None, remove) the shadow evaluator used by later batches.
+
+        Overrides the ``APPROVAL_SHADOW_*`` settings until they change.
+        """
+        previous = cls._shadow
+        if previous is not None and previous is not shadow:
+            previous.close()
+        cls._shadow = shadow
+        cls._shadow_config = None
+        cls._shadow_pinned = shadow is not None
+
+    def get_review_queue(
+        self, limit: int = 100, cursor: str | None = None, schema_name: str | None = None
+    ) -> ReviewPage:
+        """Return one keyset-paginated page of jobs waiting for manual review."""
+        session_maker = self._get_session_maker(get_settings().database_url)
+        with get_session(session_maker) as s:
+            return list_review_queue(s, limit=limit, cursor=cursor, schema_name=schema_name)
+
+    def list_jobs(
+        self,
+        rejected: bool = False,
+        filters: JobFilters | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> JobPage:
+        """Return one keyset-paginated page of stored (or rejected) jobs."""
+        session_maker = self._get_session_maker(get_settings().database_url)
+        model: type[Job] | type[RejectedJob] = RejectedJob if rejected else Job
+        with get_session(session_maker) as s:
+            return list_jobs(s, model, filters, limit=limit, cursor=cursor)
+
+    def search_jobs(self, query: str, limit: int = 20, cursor: str | None = None) -> SearchPage:
+        """Return one page of active approved jobs matching ``query``, best first."""
+        session_maker = self._get_session_maker(get_settings().database_url)
+        with get_session(session_maker) as s:
+            return search_jobs(s, query, limit=limit, cursor=cursor)
+
+    def approve_reviewed(self, job_ids: Sequence[int]) -> int:
+        """Approve jobs in manual review; returns how many were approved."""
+        session_maker = self._get_session_maker(get_settings().database_url)
+        with get_session(session_maker) as s:
+            count = approve_reviewed(s, job_ids)
+        metrics.increment("review.approved", count)
+        logger.info("review.approved", requested=len(job_ids), approved=count)
+        return count
+
+    def reject_reviewed(self, job_ids: Sequence[int], reason: str | None = None) -> int:
+        """Reject jobs in manual review; returns how many were rejected."""
+        session_maker = self._get_session_maker(get_settings().database_url)
+        with get_session(session_maker) as s:
+            count = reject_reviewed(s, job_ids, reason)
+        metrics.increment("review.rejected", count)
+        logger.info("review.rejected", requested=len(job_ids), rejected=count)
+        return count
+
     # --- Helpers ---
+    @staticmethod
+    def _get_session_maker(database_url: str) -> sessionmaker[Session]:
+        # Cached per URL: one pool per database, tables created on first use only
+        return get_shared_sessionmaker(database_url)
+
+    @classmethod
+    def _get_approval_engine(cls, mode: str, rules_path: str = "") -> ApprovalEngine:
+        """
+        Return the shared approval engine, rebuilding it if its configuration changed.
+
+        Built-in rules are always registered; when ``rules_path`` is set, the JSON rules
+        in that file are added as a hot-reloaded rule source.
+        """
+        engine = cls._approval_engine
+        if (
+            not isinstance(engine, ApprovalEngine)
+            or engine.mode != EvaluationMode(mode)
+            or cls._approval_rules_path != rules_path
+        ):
+            engine = ApprovalEngine(rules=builtin_rules(), mode=mode)
+            if rules_path:
+                engine.register_rule_source(get_rule_set_source(rules_path))
+            cls._approval_rules_path = rules_path
+            cls._approval_engine = engine
+        return engine
+
+    @classmethod
+    def _get_shadow(
+        cls, rules_path: str, exclude_rules: str, queue_size: int
+    ) -> ShadowEvaluator | None:
+        """
+        Return the shadow evaluator for the configured candidate rule set, if any.
+
+        The candidate is the built-in rule set minus ``exclude_rules`` (comma-separated
+        names) plus the hot-reloaded JSON rules in ``rules_path``.
+        """
+        config = (rules_path, exclude_rules, queue_size)
+        if cls._shadow_pinned or cls._shadow_config == config:
+            return cls._shadow
+        if cls._shadow is not None:
+            cls._shadow.close()
+        shadow = None
+        if rules_path:
+            candidate = ApprovalEngine(
+                rules=builtin_rules(parse_rule_names(exclude_rules)), mode=EvaluationMode.AUDIT
+            )
+            candidate.register_rule_source(get_rule_set_source(rules_path))
+            shadow = ShadowEvaluator(candidate, queue_size=queue_size)
+        cls._shadow = shadow
+        cls._shadow_config = config
+        return shadow
+
+    @staticmethod
+    def _evaluate_group(
+        approval_engine: ApprovalEngine, jobs: list[dict[str, Any]], processing_id: str
+    ) -> list[ApprovalDecision | Exception]:
+        """
+        Evaluate canonical jobs with one batch call.
+
+        If batch evaluation fails, jobs are evaluated one by one so a single bad record
+        only fails itself; its exception is returned in place of a decision.
+        """
+        if not jobs:
+            return []
+        try:
+            batch = approval_engine.evaluate_batch(jobs, with_reasons=True)
+            reasons = batch.reasons or [[] for _ in jobs]
+            review, scores = batch.review, batch.scores
+            return [
+                ApprovalDecision(
+                    approved=bool(ok),
+                    reasons=job_reasons,
+                    failed_rules=tuple(batch.reason_codes(i)),
+                    checked_rules=tuple(batch.checked_codes(i)),
+                    review=bool(review[i]) if review is not None else False,
+                    score=float(scores[i]) if scores is not None else None,
+                )
+                for i, (ok, job_reasons) in enumerate(zip(batch.approved, reasons, strict=True))
+            ]
+        except Exception:
+            logger.exception("ingest.batch_evaluation_failed", processing_id=processing_id)
+
+        decisions: list[ApprovalDecision | Exception] = []
+        for job in jobs:
+            try:
+                decisions.append(approval_engine.evaluate_job(job))
+            except Exception as exc:  # keep processing on errors
+                decisions.append(exc)
+        return decisions
+
+    @staticmethod
+    def _build_canonical_job(
+        raw: dict[str, Any],
+        mapped_data: dict[str, Any],
+        schema_name: str,
+        geo: ReverseGeocodeMatch | None,
+    ) -> dict[str, Any]:
+        """Create the canonical job evaluated by the approval engine."""
+        return {
+            "title": mapped_data.get("title", "(untitled)"),
+            "description": mapped_data.get("description_text") or "",
+            "description_length": mapped_data.get("description_length"),
+            "description_word_count": mapped_data.get("description_word_count"),
+            "short_description": mapped_data.get("short_description"),
+            "full_description": (
+                mapped_data.get("description_text") if mapped_data.get("full_description") else None
+            ),
+            "company_name": mapped_data.get("company_name") or raw.get("company_name"),
+            "salary_min": mapped_data.get("salary_min"),
+            "salary_currency": mapped_data.get("salary_currency"),
+            "salary_unit": mapped_data.get("salary_unit"),
+            "location": mapped_data.get("primary_location"),
+            "latitude": mapped_data.get("latitude"),
+            "longitude": mapped_data.get("longitude"),
+            "geo_country_code": geo.country_code if geo else None,
+            "geo_region_code": geo.region_code if geo else None,
+            "employment_type": raw.get("employment_type"),
+            "company_type": raw.get("company_type"),
+            "language": raw.get("language"),
+            "external_id": mapped_data.get("external_id"),
+            "_schema": schema_name,
+        }
+
+    @classmethod
+    def _persist_rows(
+        cls,
+        session_maker: sessionmaker[Session],
+        model: type[Job] | type[RejectedJob],
+        items: list[tuple[int, dict[str, Any], ApprovalDecision]],
+        status: dict[str, Any],
+        processing_id: str,
+    ) -> None:
+        """
+        Write a group's rows with one bulk insert (COPY on PostgreSQL).
+
+        If the bulk write fails, rows are retried one per transaction so a bad row
+        only fails itself. Either way re-ingested jobs replace their stored copies (see
+        `bulk_insert_jobs`).
+        """
+        if not items:
+            return
+        try:
+            with get_session(session_maker) as s:
+                bulk_insert_jobs(s, model, [row for _, row, _ in items])
+        except Exception:
+            logger.exception(
+                "ingest.bulk_write_failed",
+                processing_id=processing_id,
+                table=model.__tablename__,
+                rows=len(items),
+            )
+        else:
+            for idx, row, decision in items:
+                cls._record_item_stored(status, processing_id, idx, row, decision)
+            return
+        for idx, row, decision in items:
+            try:
+                with get_session(session_maker) as s:
+                    bulk_insert_jobs(s, model, [row])
+            except Exception as exc:  # keep processing on errors
+                cls._record_item_error(status, processing_id, idx, exc)
+            else:
+                cls._record_item_stored(status, processing_id, idx, row, decision)
+
+    @staticmethod
+    def _record_item_stored(
+        status: dict[str, Any],
+        processing_id: str,
+        idx: int,
+        row: dict[str, Any],
+        decision: ApprovalDecision,
+    ) -> None:
+        outcome = "review" if decision.review else "approved" if decision.approved else "rejected"
+        status[outcome] += 1
+        status["processed"] += 1
+        metrics.increment(f"ingest.item_{outcome}")
+        logger.info(
+            "ingest.item",
+            processing_id=processing_id,
+            index=idx,
+            external_id=row.get("external_id"),
+            approved=decision.approved,
+            review=decision.review,
+            reasons=decision.reasons,
+        )
+
+    @staticmethod
+    def _record_item_error(
+        status: dict[str, Any], processing_id: str, idx: int, exc: Exception
+    ) -> None:
+        status["errors"] += 1
+        metrics.increment("ingest.item_error")
+        logger.exception(
+            "ingest.item_error", processing_id=processing_id, index=idx, error=str(exc)
+        )
+
     @staticmethod
     def _get_title(raw: dict[str, Any]) -> str:
         title = raw.get("title") or raw.get("job_title") or raw.get("position")
@@ -205,7 +618,8 @@ class IngestionService:
     def _extract_location(raw: dict[str, Any], loc_norm: LocationNormalizer) -> str | None:
         loc = raw.get("location") or raw.get("city") or raw.get("region")
         if isinstance(loc, str):
-            return loc_norm.normalize(loc)
+            normalized = loc_norm.normalize(loc)
+            return normalized.text if normalized else None
         return None
 
     @staticmethod
@@ -219,6 +633,58 @@ class IngestionService:
             return low
         return None
 
-    # Placeholder for future schema registration API
-    def register_source_schema(self, name: str, schema: dict[str, Any]) -> None:  # pragma: no cover
-        raise NotImplementedError("register_source_schema is not yet implemented")
+    def register_source_schema(
+        self,
+        name: str,
+        schema: dict[str, Any],
+        signature: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Register a JSON Schema describing the records of a named source.
+
+        ``signature`` lists the keys that identify the source's records (by default the
+        schema's top-level ``required`` keys). The schema is compiled once (cached per
+        schema version) into a validator that runs before mapping for every record
+        detected as ``name``, and for undetected records carrying a strict majority of the
+        signature, so a record of the source missing one signature key is still rejected
+        as invalid. Records that only share a common key (e.g. "title") are left alone.
+
+        Raises:
+            ValueError: If neither ``signature`` nor the schema's ``required`` gives
+                detection keys, or the schema uses an unsupported ``type``.
+        """
+        keys = list(signature if signature is not None else schema.get("required") or [])
+        if not keys:
+            raise ValueError(
+                "source schema needs a detection signature or 'required' keys to detect it by"
+            )
+        validator = validation.get_validator(schema)
+        schema_detector.get_detector().register(name, keys)
+        self._validators[name] = validator
+        logger.info("ingest.schema_registered", schema=name, signature=keys)
+
+    def register_mapping_plan(self, name: str, mapper: JobDataMapper) -> None:
+        """
+        Map the records detected as schema ``name`` with ``mapper`` instead of the
+        generic `JobDataMapper` (e.g. a `RenamingJobMapper` for the source's field names).
+
+        Detection is registered separately, e.g. with `register_source_schema`.
+        """
+        self._mapping_plans[name] = mapper
+        logger.info("ingest.mapping_plan_registered", schema=name, mapper=type(mapper).__name__)
+
+    def _validation_failure(
+        self, schema_name: str, validator: validation.Validator | None, raw: Any
+    ) -> tuple[str, validation.ValidationIssue] | None:
+        """Return the schema a record fails to validate against and the issue, if any."""
+        if validator is not None:
+            issue = validator(raw)
+            return None if issue is None else (schema_name, issue)
+        if schema_name != schema_detector.UNKNOWN_SCHEMA:
+            return None
+        # Most of a registered signature: most likely that source with a key missing
+        for name in schema_detector.get_detector().partial_matches(raw):
+            candidate = self._validators.get(name)
+            if candidate is not None and (issue := candidate(raw)) is not None:
+                return name, issue
+        return None
@@ -0,0 +1,357 @@
+"""Offline what-if simulation of a candidate rule set over stored jobs.
+
+`simulate_rule_set` replays a candidate rule set over every row of ``jobs`` and
+``rejected_jobs`` and reports how many stored decisions would flip and which rules
+cause it. Nothing is written.
+
+The id space of each table is split into ranges that are scanned independently, by a
+pool of worker processes when ``workers > 0``. Each range is read in its own short,
+read-only transaction through a server-side cursor (``stream_results``) and evaluated
+``batch_size`` rows at a time, so memory is bounded by the batch size and no scan
+holds a snapshot for the whole run. Only the columns the rules read are selected (the
+raw HTML description is reduced to whether it is present). Plain ``SELECT``
+statements take no row locks, so ingest and re-evaluation keep running alongside.
+
+Run from the command line::
+
+    python -m job_ingestion.ingestion.simulation --rules-path candidate.json \\
+        --exclude salary_meets_requirements --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.orm import Session
+
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.outcomes import RuleSetSignature
+from job_ingestion.approval.rule_dsl import load_rule_set
+from job_ingestion.approval.rules.builtin import get_rules as builtin_rules
+from job_ingestion.approval.rules.builtin import parse_rule_names
+from job_ingestion.ingestion.reevaluation import (
+    StoredJob,
+    canonical_job_from_row,
+    decided_filter,
+)
+from job_ingestion.storage.models import ApprovalRuleSet, Job, RejectedJob
+from job_ingestion.storage.repositories import get_engine
+from job_ingestion.utils import metrics
+from job_ingestion.utils.config import get_settings
+from job_ingestion.utils.logging import get_logger
+
+__all__ = [
+    "CandidateRules",
+    "SimulatedFlip",
+    "SimulationReport",
+    "main",
+    "simulate_rule_set",
+]
+
+logger = get_logger("ingestion.simulation")
+
+_TABLES: dict[str, type[StoredJob]] = {"jobs": Job, "rejected_jobs": RejectedJob}
+
+
+@dataclass(frozen=True)
+class CandidateRules:
+    """
+    A candidate rule set: the built-in rules minus ``exclude`` plus a JSON rule file.
+
+    Picklable, so every worker process builds its own engine from it.
+    """
+
+    rules_path: str = ""
+    exclude: tuple[str, ...] = ()
+
+    def build_engine(self) -> ApprovalEngine:
+        rules = builtin_rules(self.exclude)
+        if self.rules_path:
+            rules.extend(load_rule_set(self.rules_path).rules)
+        return ApprovalEngine(rules=rules, mode=EvaluationMode.AUDIT)
+
+
+@dataclass(frozen=True)
+class SimulatedFlip:
+    """A stored job whose decision the candidate would change."""
+
+    table: str
+    id: int
+    external_id: str | None
+    candidate_approved: bool
+    # Candidate rules that now reject it, or stored failures the candidate clears
+    rules: tuple[str, ...]
+
+
+@dataclass
+class SimulationReport:
+    """Outcome of `simulate_rule_set`; partial reports of each range are merged."""
+
+    rows_scanned: int = 0
+    approved_to_rejected: int = 0
+    rejected_to_approved: int = 0
+    errors: int = 0
+    # Candidate rules failing on jobs that are currently approved
+    newly_failing: Counter[str] = field(default_factory=Counter)
+    # Stored failures (rule names, or reasons for rows without outcomes) on jobs the
+    # candidate would approve
+    cleared: Counter[str] = field(default_factory=Counter)
+    samples: list[SimulatedFlip] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def unchanged(self) -> int:
+        return self.rows_scanned - self.errors - self.flipped
+
+    @property
+    def flipped(self) -> int:
+        return self.approved_to_rejected + self.rejected_to_approved
+
+    def merge(self, other: SimulationReport, sample_size: int) -> None:
+        self.rows_scanned += other.rows_scanned
+        self.approved_to_rejected += other.approved_to_rejected
+        self.rejected_to_approved += other.rejected_to_approved
+        self.errors += other.errors
+        self.newly_failing.update(other.newly_failing)
+        self.cleared.update(other.cleared)
+        self.samples.extend(other.samples[: max(sample_size - len(self.samples), 0)])
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.update(unchanged=self.unchanged, flipped=self.flipped)
+        data["newly_failing"] = dict(self.newly_failing.most_common())
+        data["cleared"] = dict(self.cleared.most_common())
+        return data
+
+
+def _columns(model: type[StoredJob]) -> list[Any]:
+    columns: list[Any] = [
+        model.id,
+        model.rule_set_version,
+        model.rule_failures,
+        model.title,
+        model.description_text,
+        model.description_length,
+        model.description_word_count,
+        model.short_description,
+        # Only its presence is needed; avoids shipping the raw HTML
+        (func.length(model.full_description) > 0).label("full_description"),
+        model.company_name,
+        model.salary_min,
+        model.salary_currency,
+        model.salary_unit,
+        model.primary_location,
+        model.latitude,
+        model.longitude,
+        model.external_id,
+        model.approval_context,
+    ]
+    if model is RejectedJob:
+        columns.append(RejectedJob.rejection_reasons)
+    return columns
+
+
+def _id_ranges(engine: Engine, model: type[StoredJob], chunk_size: int) -> list[tuple[int, int]]:
+    with engine.connect() as conn:
+        low, high = conn.execute(select(func.min(model.id), func.max(model.id))).one()
+    if low is None:
+        return []
+    return [(start, start + chunk_size) for start in range(low, high + 1, chunk_size)]
+
+
+def _load_signatures(engine: Engine) -> dict[str, tuple[str, ...]]:
+    names: dict[str, tuple[str, ...]] = {}
+    with Session(engine) as s:
+        for rule_set in s.execute(select(ApprovalRuleSet)).scalars():
+            try:
+                names[rule_set.version] = tuple(RuleSetSignature.from_json(rule_set.rules).names)
+            except (TypeError, ValueError, IndexError):
+                logger.warning("simulation.invalid_rule_set", version=rule_set.version)
+    return names
+
+
+def _stored_failures(row: Row[Any], signatures: dict[str, tuple[str, ...]]) -> tuple[str, ...]:
+    names = signatures.get(row.rule_set_version or "")
+    if names is not None and row.rule_failures:
+        return tuple(name for bit, name in enumerate(names) if row.rule_failures >> bit & 1)
+    reasons = row.rejection_reasons or ""
+    return tuple(reason for reason in reasons.split("; ") if reason)
+
+
+class _RangeScanner:
+    """Evaluates id ranges of one table; one instance per process."""
+
+    def __init__(
+        self,
+        database_url: str,
+        candidate: CandidateRules,
+        signatures: dict[str, tuple[str, ...]],
+        batch_size: int,
+        sample_size: int,
+    ) -> None:
+        self.db = get_engine(database_url)
+        self.engine = candidate.build_engine()
+        self.signatures = signatures
+        self.batch_size = batch_size
+        self.sample_size = sample_size
+
+    def _batches(self, model: type[StoredJob], low: int, high: int) -> Iterator[Sequence[Row[Any]]]:
+        stmt = (
+            select(*_columns(model))
+            .where(model.id >= low, model.id < high, *decided_filter(model))
+            .order_by(model.id)
+        )
+        with self.db.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=self.batch_size).execute(
+                stmt
+            )
+            yield from result.partitions(self.batch_size)
+
+    def scan(self, table: str, low: int, high: int) -> SimulationReport:
+        model = _TABLES[table]
+        stored_approved = model is Job
+        report = SimulationReport()
+        for rows in self._batches(model, low, high):
+            report.rows_scanned += len(rows)
+            try:
+                batch = self.engine.evaluate_batch([canonical_job_from_row(r) for r in rows])
+            except Exception:
+                logger.exception("simulation.batch_failed", table=table, first_id=rows[0].id)
+                report.errors += len(rows)
+                continue
+            for i, row in enumerate(rows):
+                approved = bool(batch.approved[i])
+                if approved == stored_approved:
+                    continue
+                if stored_approved:
+                    report.approved_to_rejected += 1
+                    rules = tuple(batch.reason_codes(i))
+                    report.newly_failing.update(rules)
+                else:
+                    report.rejected_to_approved += 1
+                    rules = _stored_failures(row, self.signatures)
+                    report.cleared.update(rules)
+                if len(report.samples) < self.sample_size:
+                    report.samples.append(
+                        SimulatedFlip(table, row.id, row.external_id, approved, rules)
+                    )
+        return report
+
+
+# Per-process scanner installed by the pool initializer
+_scanner: _RangeScanner | None = None
+
+
+def _init_worker(*args: Any) -> None:
+    global _scanner
+    _scanner = _RangeScanner(*args)
+
+
+def _scan_in_worker(table: str, low: int, high: int) -> SimulationReport:
+    if _scanner is None:  # pragma: no cover - initializer always runs first
+        raise RuntimeError("worker not initialised")
+    return _scanner.scan(table, low, high)
+
+
+def simulate_rule_set(
+    candidate: CandidateRules,
+    database_url: str | None = None,
+    workers: int = 0,
+    chunk_size: int = 50_000,
+    batch_size: int = 1_000,
+    sample_size: int = 20,
+) -> SimulationReport:
+    """
+    Replay ``candidate`` over all stored jobs and report the decisions it would flip.
+
+    Args:
+        candidate: The candidate rule set.
+        database_url: Database to read; defaults to the configured ``DATABASE_URL``.
+        workers: Worker processes scanning id ranges in parallel; 0 scans in-process.
+        chunk_size: Width of the id range handed to a worker at a time.
+        batch_size: Rows fetched and evaluated together.
+        sample_size: Flipped jobs kept as examples.
+
+    Raises:
+        ValueError: If a size or the worker count is out of range.
+    """
+    if chunk_size < 1 or batch_size < 1:
+        raise ValueError("chunk_size and batch_size must be >= 1")
+    if workers < 0:
+        raise ValueError("workers must be >= 0")
+    url = database_url or get_settings().database_url
+    started = time.perf_counter()
+    db = get_engine(url)
+    signatures = _load_signatures(db)
+    tasks = [
+        (table, low, high)
+        for table, model in _TABLES.items()
+        for low, high in _id_ranges(db, model, chunk_size)
+    ]
+    db.dispose()
+    init_args = (url, candidate, signatures, batch_size, sample_size)
+
+    report = SimulationReport()
+    if workers == 0:
+        scanner = _RangeScanner(*init_args)
+        for task in tasks:
+            report.merge(scanner.scan(*task), sample_size)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=init_args
+        ) as pool:
+            futures = [pool.submit(_scan_in_worker, *task) for task in tasks]
+            for future in as_completed(futures):
+                report.merge(future.result(), sample_size)
+    report.seconds = time.perf_counter() - started
+
+    metrics.increment("approval.simulation.rows", report.rows_scanned)
+    logger.info(
+        "simulation.finished",
+        rows_scanned=report.rows_scanned,
+        approved_to_rejected=report.approved_to_rejected,
+        rejected_to_approved=report.rejected_to_approved,
+        errors=report.errors,
+        ranges=len(tasks),
+        workers=workers,
+        seconds=round(report.seconds, 2),
+    )
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point; prints the report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--rules-path", default="", help="JSON rule file added to the rules")
+    parser.add_argument("--exclude", default="", help="Comma-separated built-in rules to leave out")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    candidate = CandidateRules(args.rules_path, tuple(parse_rule_names(args.exclude)))
+    report = simulate_rule_set(
+        candidate,
+        database_url=args.database_url,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        batch_size=args.batch_size,
+        sample_size=args.samples,
+    )
+    print(json.dumps(report.to_dict(), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""Compiled validation for registered source schemas.
+
+A JSON Schema (the commonly used subset of draft 7) is compiled once into a tree of
+closures. Each closure checks one keyword and returns a `ValidationIssue` on the first
+failure or ``None`` when the value is valid, so validating a typical job record costs a
+handful of dict lookups and ``isinstance`` checks.
+
+Compiled validators are cached per schema version, keyed by a digest of the canonical
+schema JSON (prefixed with the ``$id``/``version`` pair when declared, for readability),
+so two schemas only share a validator when their contents are identical.
+
+Supported keywords: type, enum, const, required, properties, additionalProperties,
+minimum, maximum, exclusiveMinimum, exclusiveMaximum, minLength, maxLength, pattern,
+items, minItems, maxItems, allOf, anyOf, oneOf, not. Other keywords are ignored, as
+the JSON Schema specification prescribes for unknown keywords.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = [
+    "ValidationIssue",
+    "Validator",
+    "compile_schema",
+    "get_validator",
+    "schema_version",
+]
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """
+    Structured description of the first validation failure of a record.
+
+    Attributes:
+        path: Location of the offending value (keys and list indices from the root).
+        keyword: JSON Schema keyword that failed (e.g., "required", "type").
+        message: Human readable explanation.
+    """
+
+    path: tuple[str | int, ...]
+    keyword: str
+    message: str
+
+    @property
+    def reason(self) -> str:
+        """Single-line reason suitable for logs and rejection records."""
+        where = ".".join(str(p) for p in self.path) or "<root>"
+        return f"{where}: {self.message}"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"path": list(self.path), "keyword": self.keyword, "message": self.message}
+
+    def prefixed(self, step: str | int) -> ValidationIssue:
+        return ValidationIssue((step, *self.path), self.keyword, self.message)
+
+
+Validator = Callable[[Any], ValidationIssue | None]
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "number": lambda v: isinstance(v, int | float) and not isinstance(v, bool),
+    "integer": lambda v: (isinstance(v, int) and not isinstance(v, bool))
+    or (isinstance(v, float) and v.is_integer()),
+}
+
+_cache: dict[str, Validator] = {}
+
+
+def _valid(_value: Any) -> ValidationIssue | None:
+    return None
+
+
+def _issue(keyword: str, message: str) -> ValidationIssue:
+    return ValidationIssue((), keyword, message)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _compile_type(spec: Any) -> Validator:
+    names = [spec] if isinstance(spec, str) else list(spec)
+    unknown = [n for n in names if n not in _TYPE_CHECKS]
+    if unknown:
+        raise ValueError(f"unsupported JSON Schema type(s): {unknown}")
+    checks = tuple(_TYPE_CHECKS[n] for n in names)
+    expected = " or ".join(names)
+
+    def check_type(value: Any) -> ValidationIssue | None:
+        for ok in checks:
+            if ok(value):
+                return None
+        return _issue("type", f"expected {expected}, got {type(value).__name__}")
+
+    return check_type
+
+
+def _compile_object(schema: Mapping[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    required = tuple(schema.get("required", ()))
+    if required:
+
+        def check_required(value: Any) -> ValidationIssue | None:
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        return _issue("required", f"missing required property '{key}'")
+            return None
+
+        checks.append(check_required)
+
+    properties: dict[str, Validator] = {
+        key: compile_schema(sub) for key, sub in schema.get("properties", {}).items()
+    }
+    prop_items = tuple(properties.items())
+    if prop_items:
+
+        def check_properties(value: Any) -> ValidationIssue | None:
+            if isinstance(value, dict):
+                for key, validate in prop_items:
+                    if key in value:
+                        issue = validate(value[key])
+                        if issue is not None:
+                            return issue.prefixed(key)
+            return None
+
+        checks.append(check_properties)
+
+    additional = schema.get("additionalProperties", True)
+    if additional is not True:
+        allowed = frozenset(properties)
+        extra_validator = None if additional is False else compile_schema(additional)
+
+        def check_additional(value: Any) -> ValidationIssue | None:
+            if isinstance(value, dict):
+                for key in value.keys() - allowed:
+                    if extra_validator is None:
+                        return _issue(
+                            "additionalProperties", f"unexpected property '{key}'"
+                        ).prefixed(key)
+                    issue = extra_validator(value[key])
+                    if issue is not None:
+                        return issue.prefixed(key)
+            return None
+
+        checks.append(check_additional)
+
+    return checks
+
+
+def _compile_array(schema: Mapping[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    if "items" in schema and isinstance(schema["items"], Mapping):
+        validate_item = compile_schema(schema["items"])
+
+        def check_items(value: Any) -> ValidationIssue | None:
+            if isinstance(value, list):
+                for idx, item in enumerate(value):
+                    issue = validate_item(item)
+                    if issue is not None:
+                        return issue.prefixed(idx)
+            return None
+
+        checks.append(check_items)
+
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    if min_items is not None or max_items is not None:
+
+        def check_item_count(value: Any) -> ValidationIssue | None:
+            if isinstance(value, list):
+                if min_items is not None and len(value) < min_items:
+                    return _issue("minItems", f"expected at least {min_items} items")
+                if max_items is not None and len(value) > max_items:
+                    return _issue("maxItems", f"expected at most {max_items} items")
+            return None
+
+        checks.append(check_item_count)
+
+    return checks
+
+
+def _compile_scalar(schema: Mapping[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    bounds: list[tuple[str, Callable[[Any, Any], bool], Any]] = [
+        (kw, op, schema[kw])
+        for kw, op in (
+            ("minimum", lambda v, b: v >= b),
+            ("maximum", lambda v, b: v <= b),
+            ("exclusiveMinimum", lambda v, b: v > b),
+            ("exclusiveMaximum", lambda v, b: v < b),
+        )
+        if _is_number(schema.get(kw))
+    ]
+    if bounds:
+        bound_specs = tuple(bounds)
+
+        def check_bounds(value: Any) -> ValidationIssue | None:
+            if _is_number(value):
+                for kw, op, bound in bound_specs:
+                    if not op(value, bound):
+                        return _issue(kw, f"{value!r} violates {kw} {bound!r}")
+            return None
+
+        checks.append(check_bounds)
+
+    min_len = schema.get("minLength")
+    max_len = schema.get("maxLength")
+    if min_len is not None or max_len is not None:
+
+        def check_length(value: Any) -> ValidationIssue | None:
+            if isinstance(value, str):
+                if min_len is not None and len(value) < min_len:
+                    return _issue("minLength", f"shorter than {min_len} characters")
+                if max_len is not None and len(value) > max_len:
+                    return _issue("maxLength", f"longer than {max_len} characters")
+            return None
+
+        checks.append(check_length)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any) -> ValidationIssue | None:
+            if isinstance(value, str) and pattern.search(value) is None:
+                return _issue("pattern", f"does not match pattern {pattern.pattern!r}")
+            return None
+
+        checks.append(check_pattern)
+
+    return checks
+
+
+def _compile_combinators(schema: Mapping[str, Any]) -> list[Validator]:
+    checks: list[Validator] = []
+
+    if "allOf" in schema:
+        all_of = tuple(compile_schema(sub) for sub in schema["allOf"])
+
+        def check_all_of(value: Any) -> ValidationIssue | None:
+            for validate in all_of:
+                issue = validate(value)
+                if issue is not None:
+                    return issue
+            return None
+
+        checks.append(check_all_of)
+
+    if "anyOf" in schema:
+        any_of = tuple(compile_schema(sub) for sub in schema["anyOf"])
+
+        def check_any_of(value: Any) -> ValidationIssue | None:
+            for validate in any_of:
+                if validate(value) is None:
+                    return None
+            return _issue("anyOf", "does not match any allowed schema")
+
+        checks.append(check_any_of)
+
+    if "oneOf" in schema:
+        one_of = tuple(compile_schema(sub) for sub in schema["oneOf"])
+
+        def check_one_of(value: Any) -> ValidationIssue | None:
+            matched = sum(1 for validate in one_of if validate(value) is None)
+            if matched != 1:
+                return _issue("oneOf", f"matches {matched} schemas, expected exactly one")
+            return None
+
+        checks.append(check_one_of)
+
+    if "not" in schema:
+        negated = compile_schema(schema["not"])
+
+        def check_not(value: Any) -> ValidationIssue | None:
+            if negated(value) is None:
+                return _issue("not", "matches a disallowed schema")
+            return None
+
+        checks.append(check_not)
+
+    return checks
+
+
+def compile_schema(schema: Mapping[str, Any] | bool) -> Validator:
+    """
+    Compile a JSON Schema into a fail-fast validator function.
+
+    The returned callable accepts a decoded JSON value and returns ``None`` if it is
+    valid, or the first `ValidationIssue` found.
+
+    Raises:
+        ValueError: If the schema uses an unsupported ``type`` name.
+
+    Example:
+        >>> validate = compile_schema({"type": "object", "required": ["title"]})
+        >>> validate({"title": "SWE"}) is None
+        True
+        >>> validate({}).reason
+        "<root>: missing required property 'title'"
+    """
+    if schema is True:
+        return _valid
+    if schema is False:
+        return lambda _value: _issue("false", "no value is allowed")
+
+    checks: list[Validator] = []
+    if "type" in schema:
+        checks.append(_compile_type(schema["type"]))
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any) -> ValidationIssue | None:
+            return None if value in allowed else _issue("enum", f"{value!r} is not allowed")
+
+        checks.append(check_enum)
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value: Any) -> ValidationIssue | None:
+            return None if value == const else _issue("const", f"expected {const!r}")
+
+        checks.append(check_const)
+
+    checks.extend(_compile_object(schema))
+    checks.extend(_compile_array(schema))
+    checks.extend(_compile_scalar(schema))
+    checks.extend(_compile_combinators(schema))
+
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+
+    compiled = tuple(checks)
+
+    def check_schema(value: Any) -> ValidationIssue | None:
+        for validate in compiled:
+            issue = validate(value)
+            if issue is not None:
+                return issue
+        return None
+
+    return check_schema
+
+
+def schema_version(schema: Mapping[str, Any]) -> str:
+    """
+    Return the cache key identifying a schema version.
+
+    Always a SHA-256 digest of the canonical (sorted-key) JSON encoding, prefixed with
+    ``$id@version`` when the schema declares a version. A declared version alone is not
+    trusted to identify the contents: schemas that reuse one still get distinct keys.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    if "version" in schema:
+        return f"{schema.get('$id', '')}@{schema['version']}#{digest}"
+    return digest
+
+
+def get_validator(schema: Mapping[str, Any]) -> Validator:
+    """Return the compiled validator for a schema, compiling at most once per version."""
+    key = schema_version(schema)
+    validator = _cache.get(key)
+    if validator is None:
+        validator = compile_schema(schema)
+        _cache[key] = validator
+    return validator
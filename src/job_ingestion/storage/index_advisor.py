@@ -0,0 +1,186 @@
+"""Index advisor: EXPLAIN the canonical read queries and flag sequential scans.
+
+`advise` runs ``EXPLAIN`` (PostgreSQL) or ``EXPLAIN QUERY PLAN`` (SQLite) on the
+queries in `canonical_queries`, the read paths the schema's indexes are meant to
+serve, and reports every full scan of a table holding at least ``min_rows`` rows. A
+full scan of a small table is often the cheapest plan and is not flagged. Table
+sizes come from the planner statistics on PostgreSQL (run ``ANALYZE`` first) and
+from ``count(*)`` on SQLite.
+
+Run from the command line::
+
+    python -m job_ingestion.storage.index_advisor --min-rows 10000 --fail-on-findings
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import text
+
+from job_ingestion.utils.config import get_settings
+from job_ingestion.utils.logging import get_logger
+
+from .models import ACTIVE_APPROVED, ApprovalStatus, Job, RejectedJob, ReviewQueueItem
+from .repositories import get_engine
+
+__all__ = ["PlanFinding", "QueryPlan", "advise", "canonical_queries", "main"]
+
+logger = get_logger("storage.index_advisor")
+
+
+@dataclass(frozen=True)
+class PlanFinding:
+    """A sequential scan of a large table in a canonical query's plan."""
+
+    query: str
+    table: str
+    rows: int
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    query: str
+    # One line per plan node
+    plan: tuple[str, ...]
+    findings: tuple[PlanFinding, ...]
+
+
+def canonical_queries() -> dict[str, Select[Any]]:
+    """The read paths the indexes must serve, with representative parameters."""
+    page = 50
+    newest = (Job.posting_date.desc(), Job.id.desc())
+    return {
+        "active_jobs_by_date": select(Job.id).where(ACTIVE_APPROVED).order_by(*newest).limit(page),
+        "active_jobs_by_company": select(Job.id)
+        .where(ACTIVE_APPROVED, Job.company_id == 1)
+        .order_by(*newest)
+        .limit(page),
+        "active_jobs_by_country": select(Job.id)
+        .where(ACTIVE_APPROVED, Job.country_code == "US")
+        .order_by(*newest)
+        .limit(page),
+        "active_jobs_by_collapse_key": select(Job.id)
+        .where(ACTIVE_APPROVED, Job.collapse_key.is_not(None), Job.collapse_key == "key")
+        .order_by(Job.posting_date.desc())
+        .limit(page),
+        "job_by_external_id": select(Job.id).where(Job.external_id == "ext-1"),
+        "jobs_by_status": select(Job.id)
+        .where(Job.approval_status == ApprovalStatus.PENDING)
+        .order_by(Job.created_at)
+        .limit(page),
+        "review_queue_page": select(ReviewQueueItem.job_id)
+        .order_by(ReviewQueueItem.score.desc(), ReviewQueueItem.job_id.desc())
+        .limit(page),
+        "rejected_jobs_by_date": select(RejectedJob.id)
+        .where(RejectedJob.posting_date.is_not(None))
+        .order_by(RejectedJob.posting_date.desc(), RejectedJob.id.desc())
+        .limit(page),
+        "expired_rejected_jobs": select(RejectedJob.id)
+        .where(RejectedJob.created_at < func.current_date())
+        .limit(page),
+    }
+
+
+def _compile(conn: Connection, stmt: Select[Any]) -> str:
+    # Literal values, as psycopg2 sends them, so partial index predicates can match
+    return str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def _pg_nodes(node: Mapping[str, Any], depth: int = 0) -> Iterator[tuple[int, Mapping[str, Any]]]:
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from _pg_nodes(child, depth + 1)
+
+
+def _explain_postgresql(conn: Connection, name: str, sql: str, min_rows: int) -> QueryPlan:
+    raw: Any = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    root = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    lines: list[str] = []
+    findings: list[PlanFinding] = []
+    for depth, node in _pg_nodes(root):
+        relation = node.get("Relation Name")
+        lines.append(
+            "  " * depth
+            + node["Node Type"]
+            + (f" on {relation}" if relation else "")
+            + (f" using {node['Index Name']}" if "Index Name" in node else "")
+        )
+        if node["Node Type"] == "Seq Scan" and relation:
+            rows = conn.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"),
+                {"name": relation},
+            ).scalar()
+            if rows is not None and rows >= min_rows:
+                findings.append(PlanFinding(name, relation, int(rows)))
+    return QueryPlan(name, tuple(lines), tuple(findings))
+
+
+def _explain_sqlite(conn: Connection, name: str, sql: str, min_rows: int) -> QueryPlan:
+    lines: list[str] = []
+    findings: list[PlanFinding] = []
+    for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")):
+        detail = str(row[-1])
+        lines.append(detail)
+        # "SCAN jobs" is a full scan; "SCAN jobs USING INDEX ..." walks an index
+        words = detail.split()
+        if len(words) >= 2 and words[0] == "SCAN" and "USING" not in words:
+            table = words[1]
+            rows = int(conn.execute(text(f'SELECT count(*) FROM "{table}"')).scalar_one())
+            if rows >= min_rows:
+                findings.append(PlanFinding(name, table, rows))
+    return QueryPlan(name, tuple(lines), tuple(findings))
+
+
+def advise(
+    engine: Engine, min_rows: int = 10_000, queries: Mapping[str, Select[Any]] | None = None
+) -> list[QueryPlan]:
+    """
+    Plans of the canonical (or given) queries, with their large-table sequential scans.
+
+    Raises:
+        ValueError: If the database dialect is neither PostgreSQL nor SQLite.
+    """
+    if engine.dialect.name == "postgresql":
+        explain = _explain_postgresql
+    elif engine.dialect.name == "sqlite":
+        explain = _explain_sqlite
+    else:
+        raise ValueError(f"unsupported dialect: {engine.dialect.name}")
+    plans: list[QueryPlan] = []
+    with engine.connect() as conn:
+        for name, stmt in (queries or canonical_queries()).items():
+            plan = explain(conn, name, _compile(conn, stmt), min_rows)
+            for finding in plan.findings:
+                logger.warning("index_advisor.seq_scan", **asdict(finding))
+            plans.append(plan)
+    return plans
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point; prints the plans and findings as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument(
+        "--min-rows", type=int, default=10_000, help="Only flag scans of tables this large"
+    )
+    parser.add_argument(
+        "--fail-on-findings", action="store_true", help="Exit with status 1 if any scan is flagged"
+    )
+    args = parser.parse_args(argv)
+
+    plans = advise(get_engine(args.database_url), min_rows=args.min_rows)
+    print(json.dumps([asdict(p) for p in plans], indent=2))
+    if args.fail_on_findings and any(p.findings for p in plans):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
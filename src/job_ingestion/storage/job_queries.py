@@ -0,0 +1,196 @@
+"""Filtered, keyset-paginated listings of stored jobs and rejected jobs.
+
+Listings are ordered newest first on ``(posting_date, id)`` and select only the
+listing columns (`LISTING_COLUMNS`), never the descriptions. A page is read in at
+most two index range scans: rows with a posting date, then, once those are
+exhausted, rows without one (ordered by id). Each scan is a plain
+``(posting_date, id) < cursor`` or ``id < cursor`` range, so the cost of a page does
+not depend on its depth.
+
+With the default filters (approved, active jobs), the conditions include
+``ACTIVE_APPROVED`` verbatim, so the partial indexes ``ix_jobs_active_*`` serve the
+listing and its company or country filters.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from job_ingestion.transformation.normalizers import company_storage_key
+
+from .models import ACTIVE_APPROVED, ApprovalStatus, Company, Job, RejectedJob
+
+__all__ = [
+    "LISTING_COLUMNS",
+    "JobFilters",
+    "JobPage",
+    "decode_cursor",
+    "encode_cursor",
+    "list_jobs",
+]
+
+# Columns returned by listings (both tables have them)
+LISTING_COLUMNS = (
+    "id",
+    "external_id",
+    "title",
+    "company_id",
+    "company_name",
+    "primary_location",
+    "country_code",
+    "remote_flag",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "salary_unit",
+    "salary_annual_usd",
+    "posting_date",
+    "created_at",
+)
+
+
+@dataclass(frozen=True)
+class JobFilters:
+    """Listing filters; ``None`` leaves a field unfiltered."""
+
+    # jobs only: approval status and active flag (rejected_jobs ignores both)
+    status: ApprovalStatus | None = ApprovalStatus.APPROVED
+    active: bool | None = True
+    company_id: int | None = None
+    # Company name, matched through its canonical key (see companies)
+    company: str | None = None
+    country_code: str | None = None
+    remote_flag: str | None = None
+    posted_from: datetime | None = None
+    posted_to: datetime | None = None
+    # Annualized USD salary (salary_annual_usd) bounds
+    salary_min: float | None = None
+    salary_max: float | None = None
+
+
+@dataclass(frozen=True)
+class JobPage:
+    rows: list[Row[Any]]
+    # Pass as ``cursor`` to get the next page; None on the last page
+    next_cursor: str | None
+
+
+def encode_cursor(posting_date: datetime | None, job_id: int) -> str:
+    """
+    Opaque keyset cursor for the position after ``(posting_date, job_id)``.
+
+    Example:
+        >>> decode_cursor(encode_cursor(datetime(2024, 5, 1, 9, 30), 42))
+        (datetime.datetime(2024, 5, 1, 9, 30), 42)
+        >>> decode_cursor(encode_cursor(None, 7))
+        (None, 7)
+    """
+    return f"{posting_date.isoformat() if posting_date else ''}:{job_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, int]:
+    """
+    Parse a cursor made by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    posted, sep, job_id = cursor.rpartition(":")
+    if not sep:
+        raise ValueError(f"invalid jobs cursor: {cursor!r}")
+    try:
+        return (datetime.fromisoformat(posted) if posted else None), int(job_id)
+    except ValueError as exc:
+        raise ValueError(f"invalid jobs cursor: {cursor!r}") from exc
+
+
+def _conditions(model: type[Job] | type[RejectedJob], filters: JobFilters) -> list[Any]:
+    conditions: list[Any] = []
+    if model is Job:
+        if filters.status == ApprovalStatus.APPROVED and filters.active is True:
+            # Verbatim, so the partial indexes apply
+            conditions.append(ACTIVE_APPROVED)
+        else:
+            if filters.status is not None:
+                conditions.append(Job.approval_status == filters.status)
+            if filters.active is not None:
+                conditions.append(Job.is_active.is_(filters.active))
+    if filters.company_id is not None:
+        conditions.append(model.company_id == filters.company_id)
+    if filters.company is not None:
+        key = company_storage_key(filters.company)
+        company_id = select(Company.id).where(Company.canonical_key == key).scalar_subquery()
+        conditions.append(model.company_id == company_id)
+    if filters.country_code is not None:
+        conditions.append(model.country_code == filters.country_code.upper())
+    if filters.remote_flag is not None:
+        conditions.append(model.remote_flag == filters.remote_flag)
+    if filters.posted_from is not None:
+        conditions.append(model.posting_date >= filters.posted_from)
+    if filters.posted_to is not None:
+        conditions.append(model.posting_date < filters.posted_to)
+    if filters.salary_min is not None:
+        conditions.append(model.salary_annual_usd >= filters.salary_min)
+    if filters.salary_max is not None:
+        conditions.append(model.salary_annual_usd <= filters.salary_max)
+    return conditions
+
+
+def _page(
+    session: Session, stmt: Select[Any], key: ColumnElement[Any] | None, limit: int
+) -> list[Row[Any]]:
+    if key is not None:
+        stmt = stmt.where(key)
+    return list(session.execute(stmt.limit(limit)).all())
+
+
+def list_jobs(
+    session: Session,
+    model: type[Job] | type[RejectedJob] = Job,
+    filters: JobFilters | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> JobPage:
+    """
+    One page of ``model`` rows matching ``filters``, newest posting date first.
+
+    Rows carry `LISTING_COLUMNS`, plus ``approval_status`` (jobs) or
+    ``rejection_reasons`` (rejected jobs).
+
+    Raises:
+        ValueError: If ``limit`` is not positive or ``cursor`` is malformed.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    extra = Job.approval_status if model is Job else RejectedJob.rejection_reasons
+    columns = [model.__table__.c[name] for name in LISTING_COLUMNS]
+    base = select(*columns, extra).where(*_conditions(model, filters or JobFilters()))
+    dated = base.where(model.posting_date.is_not(None)).order_by(
+        model.posting_date.desc(), model.id.desc()
+    )
+    undated = base.where(model.posting_date.is_(None)).order_by(model.id.desc())
+
+    # One extra row tells whether another page follows
+    wanted = limit + 1
+    rows: list[Row[Any]] = []
+    after_date, after_id = decode_cursor(cursor) if cursor else (None, None)
+    if after_id is None or after_date is not None:
+        key = None
+        if after_id is not None:
+            key = tuple_(model.posting_date, model.id) < (after_date, after_id)
+        rows = _page(session, dated, key, wanted)
+    if len(rows) < wanted:
+        key = model.id < after_id if after_id is not None and after_date is None else None
+        rows += _page(session, undated, key, wanted - len(rows))
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].posting_date, rows[-1].id)
+    return JobPage(rows=rows, next_cursor=next_cursor)
@@ -1,10 +1,27 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, Numeric, String, Text, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    and_,
+    event,
+    func,
+)
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -12,19 +29,51 @@ class ApprovalStatus(str, Enum):
     PENDING = "PENDING"
     APPROVED = "APPROVED"
     REJECTED = "REJECTED"
+    # Borderline jobs waiting in review_queue (SCORE evaluation mode)
+    MANUAL_REVIEW = "MANUAL_REVIEW"
+
+
+# JSON documents: binary, indexable JSONB on PostgreSQL and JSON text elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _gin_index(table: str, column: str) -> Index:
+    """GIN index for ``@>`` containment queries on a JSONB column (PostgreSQL only)."""
+    return Index(
+        f"ix_{table}_{column}_gin",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"},
+    ).ddl_if(dialect="postgresql")
 
 
 class Base(DeclarativeBase):  # type: ignore[misc,unused-ignore]
     type_annotation_map = {
-        dict[str, Any]: SQLiteJSON,
-        dict[str, Any]: SQLiteJSON,
-        list[Any]: SQLiteJSON,
-        list[Any]: SQLiteJSON,
+        dict[str, Any]: JSONDocument,
+        list[Any]: JSONDocument,
     }
 
 
+class Company(Base):
+    __tablename__ = "companies"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    # Output of `company_storage_key`; one row per distinct company
+    canonical_key: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # Display name as first seen
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # JSON fields that listings filter on
+        _gin_index("jobs", "classifications_data"),
+        _gin_index("jobs", "locations_data"),
+    )
 
     # Primary fields
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -49,14 +98,22 @@ class Job(Base):
     salary_unit: Mapped[str | None] = mapped_column(String(20), nullable=True)
     is_salary_estimate: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
     is_salary_confidential: Mapped[bool] = mapped_column(Boolean, default=False)
+    salary_annual_usd: Mapped[float | None] = mapped_column(Numeric(12, 2), nullable=True)
 
     # Company information
+    company_id: Mapped[int | None] = mapped_column(
+        ForeignKey("companies.id"), nullable=True, index=True
+    )
     company_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_company_confidential: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Job descriptions
     short_description: Mapped[str | None] = mapped_column(Text, nullable=True)
     full_description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Plain text extracted from the (HTML) description at ingest, with its statistics
+    description_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description_length: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    description_word_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Location information
     primary_location: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -64,6 +121,8 @@ class Job(Base):
     county: Mapped[str | None] = mapped_column(String(100), nullable=True)
     latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # ISO alpha-2 country, reverse-geocoded or resolved from primary_location at ingest
+    country_code: Mapped[str | None] = mapped_column(String(2), nullable=True)
 
     # Experience requirements
     years_experience: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -95,13 +154,21 @@ class Job(Base):
     score: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     # Complex data stored as JSON
-    locations_data: Mapped[dict[str, Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    classifications_data: Mapped[dict[str, Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    posted_dates: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    candidate_residency: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    questions: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    featured_data: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    additional_metadata: Mapped[dict[str, Any] | None] = mapped_column(SQLiteJSON, nullable=True)
+    locations_data: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
+    classifications_data: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
+    posted_dates: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    candidate_residency: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    questions: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    featured_data: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    additional_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
+
+    # Per-rule approval outcomes (see approval.outcomes): bit i of each mask is the
+    # i-th rule of the rule set version
+    rule_set_version: Mapped[str | None] = mapped_column(String(32), nullable=True, index=True)
+    rule_failures: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    rule_checked: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # Evaluated fields that have no column of their own, kept for re-evaluation
+    approval_context: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
 
     # Internal tracking
     collapse_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -110,8 +177,69 @@ class Job(Base):
     )
 
 
+# Jobs served to readers. The partial indexes below hold only these rows; a query
+# can use them only when its WHERE clause contains this exact condition.
+ACTIVE_APPROVED = and_(Job.approval_status == ApprovalStatus.APPROVED, Job.is_active.is_(True))
+
+# Read paths over active approved jobs: newest first, per company, per country, per
+# collapse key
+Index(
+    "ix_jobs_active_posting_date",
+    Job.posting_date,
+    Job.id,
+    postgresql_where=ACTIVE_APPROVED,
+    sqlite_where=ACTIVE_APPROVED,
+)
+Index(
+    "ix_jobs_active_company_posting_date",
+    Job.company_id,
+    Job.posting_date,
+    Job.id,
+    postgresql_where=ACTIVE_APPROVED,
+    sqlite_where=ACTIVE_APPROVED,
+)
+Index(
+    "ix_jobs_active_country_posting_date",
+    Job.country_code,
+    Job.posting_date,
+    Job.id,
+    postgresql_where=ACTIVE_APPROVED,
+    sqlite_where=ACTIVE_APPROVED,
+)
+Index(
+    "ix_jobs_active_collapse_key",
+    Job.collapse_key,
+    Job.posting_date,
+    postgresql_where=and_(ACTIVE_APPROVED, Job.collapse_key.is_not(None)),
+    sqlite_where=and_(ACTIVE_APPROVED, Job.collapse_key.is_not(None)),
+)
+# Operational listings by status (e.g. pending or in-review jobs, oldest first)
+Index("ix_jobs_approval_status_created_at", Job.approval_status, Job.created_at)
+
+
+# Full-text search structures live outside the mapped schema (storage.search)
+@event.listens_for(Job.__table__, "after_create")
+def _create_search_index(target: Any, connection: Connection, **_: Any) -> None:
+    from .search import install_search_index
+
+    install_search_index(connection)
+
+
+@event.listens_for(Job.__table__, "before_drop")
+def _drop_search_index(target: Any, connection: Connection, **_: Any) -> None:
+    from .search import drop_search_index
+
+    drop_search_index(connection)
+
+
 class RejectedJob(Base):
     __tablename__ = "rejected_jobs"
+    __table_args__ = (
+        # Retention on unpartitioned tables deletes by age (storage.partitions)
+        Index("ix_rejected_jobs_created_at", "created_at"),
+        # Rejected jobs listing, newest first (storage.job_queries)
+        Index("ix_rejected_jobs_posting_date", "posting_date", "id"),
+    )
 
     # Primary fields
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -129,18 +257,26 @@ class RejectedJob(Base):
     salary_unit: Mapped[str | None] = mapped_column(String(20), nullable=True)
     is_salary_estimate: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
     is_salary_confidential: Mapped[bool] = mapped_column(Boolean, default=False)
+    salary_annual_usd: Mapped[float | None] = mapped_column(Numeric(12, 2), nullable=True)
 
+    company_id: Mapped[int | None] = mapped_column(
+        ForeignKey("companies.id"), nullable=True, index=True
+    )
     company_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_company_confidential: Mapped[bool] = mapped_column(Boolean, default=False)
 
     short_description: Mapped[str | None] = mapped_column(Text, nullable=True)
     full_description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    description_length: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    description_word_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     primary_location: Mapped[str | None] = mapped_column(String(255), nullable=True)
     zipcode: Mapped[str | None] = mapped_column(String(20), nullable=True)
     county: Mapped[str | None] = mapped_column(String(100), nullable=True)
     latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    country_code: Mapped[str | None] = mapped_column(String(2), nullable=True)
 
     years_experience: Mapped[str | None] = mapped_column(String(50), nullable=True)
     years_experience_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -166,13 +302,18 @@ class RejectedJob(Base):
     recruiter_anonymous: Mapped[bool] = mapped_column(Boolean, default=False)
     score: Mapped[float | None] = mapped_column(Float, nullable=True)
 
-    locations_data: Mapped[dict[str, Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    classifications_data: Mapped[dict[str, Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    posted_dates: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    candidate_residency: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    questions: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    featured_data: Mapped[list[Any] | None] = mapped_column(SQLiteJSON, nullable=True)
-    additional_metadata: Mapped[dict[str, Any] | None] = mapped_column(SQLiteJSON, nullable=True)
+    locations_data: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
+    classifications_data: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
+    posted_dates: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    candidate_residency: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    questions: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    featured_data: Mapped[list[Any] | None] = mapped_column(JSONDocument, nullable=True)
+    additional_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
+
+    rule_set_version: Mapped[str | None] = mapped_column(String(32), nullable=True, index=True)
+    rule_failures: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    rule_checked: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    approval_context: Mapped[dict[str, Any] | None] = mapped_column(JSONDocument, nullable=True)
 
     collapse_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -181,3 +322,62 @@ class RejectedJob(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
+
+
+class ApprovalRuleSet(Base):
+    __tablename__ = "approval_rule_sets"
+
+    # `RuleSetSignature.version`; stored job outcomes reference it
+    version: Mapped[str] = mapped_column(String(32), primary_key=True)
+    # Ordered [rule name, fingerprint] pairs; position i is bit i of the outcome masks
+    rules: Mapped[list[Any]] = mapped_column(JSONDocument, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class ReviewQueueItem(Base):
+    """A job in manual review; removed once a reviewer approves or rejects it."""
+
+    __tablename__ = "review_queue"
+    __table_args__ = (
+        # Reviewer listings page by (score, job_id); INCLUDE makes them index-only on
+        # PostgreSQL
+        Index(
+            "ix_review_queue_score_job",
+            "score",
+            "job_id",
+            postgresql_include=["external_id", "title", "schema_name"],
+        ),
+        Index(
+            "ix_review_queue_schema_score_job",
+            "schema_name",
+            "score",
+            "job_id",
+            postgresql_include=["external_id", "title"],
+        ),
+    )
+
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, autoincrement=False
+    )
+    # Weighted approval score (approval.scoring); lower scores are further from approval
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    external_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    schema_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Reasons of the soft failures that sent the job to review
+    review_reasons: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class CurrencyRate(Base):
+    __tablename__ = "currency_rates"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    currency: Mapped[str] = mapped_column(String(3), nullable=False, index=True)
+    # USD value of one unit of `currency`, effective from `effective_date` onwards
+    rate_to_usd: Mapped[float] = mapped_column(Numeric(18, 8), nullable=False)
+    effective_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -0,0 +1,265 @@
+"""Monthly partitions of ``rejected_jobs`` and partition-based retention.
+
+On PostgreSQL, ``rejected_jobs`` can be range-partitioned by ``created_at`` month
+(``migrations/010_partition_rejected_jobs.py``). Partitions are named
+``rejected_jobs_pYYYY_MM``, plus a ``rejected_jobs_default`` partition that catches
+rows outside every month partition. `maintain_partitions` pre-creates the partitions
+of the coming months and applies retention by detaching (and by default dropping)
+whole partitions older than the retention window: a catalog change instead of a
+``DELETE`` that rewrites and bloats the table.
+
+Tables that are not partitioned (SQLite, or PostgreSQL before the migration) get
+the same retention as ``DELETE`` statements in batches of ``batch_size`` rows, each
+in its own short transaction, so writers are never blocked for long.
+
+Run from the command line (e.g. daily)::
+
+    python -m job_ingestion.storage.partitions --retention-months 12 --months-ahead 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import text
+
+from job_ingestion.utils import metrics
+from job_ingestion.utils.config import get_settings
+from job_ingestion.utils.logging import get_logger
+
+from .models import RejectedJob
+from .repositories import get_engine
+
+__all__ = [
+    "PartitionReport",
+    "add_months",
+    "ensure_partitions",
+    "enforce_retention",
+    "is_partitioned",
+    "list_partitions",
+    "main",
+    "maintain_partitions",
+    "month_start",
+    "partition_name",
+]
+
+logger = get_logger("storage.partitions")
+
+TABLE = RejectedJob.__tablename__
+
+_PARTITION_RE = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    """
+    First day of ``day``'s month.
+
+    Example:
+        >>> month_start(date(2024, 2, 29))
+        datetime.date(2024, 2, 1)
+    """
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    The first day of the month ``months`` after ``month``'s (negative goes back).
+
+    Example:
+        >>> add_months(date(2024, 11, 1), 3), add_months(date(2024, 1, 1), -1)
+        (datetime.date(2025, 2, 1), datetime.date(2023, 12, 1))
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """
+    Name of the partition of ``table`` holding ``month``'s rows.
+
+    Example:
+        >>> partition_name("rejected_jobs", date(2024, 3, 17))
+        'rejected_jobs_p2024_03'
+    """
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+@dataclass
+class PartitionReport:
+    """What `maintain_partitions` did."""
+
+    partitioned: bool
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    # Rows deleted by the batched fallback on tables that are not partitioned
+    deleted_rows: int = 0
+
+
+def is_partitioned(conn: Connection, table: str = TABLE) -> bool:
+    """Whether ``table`` is a partitioned table (always False off PostgreSQL)."""
+    if conn.dialect.name != "postgresql":
+        return False
+    result = conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :table"
+        ),
+        {"table": table},
+    )
+    return result.first() is not None
+
+
+def list_partitions(conn: Connection, table: str = TABLE) -> dict[date, str]:
+    """Month partitions attached to ``table``, by month (the default partition excluded)."""
+    result = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table"
+        ),
+        {"table": table},
+    )
+    partitions: dict[date, str] = {}
+    for (name,) in result.tuples():
+        match = _PARTITION_RE.search(name)
+        if match and name == partition_name(table, date(int(match[1]), int(match[2]), 1)):
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+def ensure_partitions(
+    conn: Connection, months_ahead: int, today: date, first_month: date | None = None
+) -> list[str]:
+    """
+    Create the missing month partitions from ``first_month`` (default: this month)
+    through ``months_ahead`` months from now; returns the names created.
+    """
+    month = month_start(first_month or today)
+    last = add_months(month_start(today), months_ahead)
+    existing = list_partitions(conn)
+    created: list[str] = []
+    while month <= last:
+        if month not in existing:
+            name = partition_name(TABLE, month)
+            conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {TABLE} "
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{add_months(month, 1).isoformat()}')"
+                )
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def enforce_retention(
+    engine: Engine,
+    retention_months: int,
+    today: date,
+    drop: bool = True,
+    batch_size: int = 5_000,
+) -> PartitionReport:
+    """
+    Remove rows created before the first day of the month ``retention_months`` ago.
+
+    Partitioned tables lose whole partitions (detached, then dropped unless ``drop``
+    is False); other tables are purged with batched ``DELETE`` statements.
+    """
+    cutoff = add_months(month_start(today), -retention_months)
+    with engine.connect() as conn:
+        partitioned = is_partitioned(conn)
+    report = PartitionReport(partitioned=partitioned)
+    if partitioned:
+        with engine.connect() as conn:
+            expired = sorted((m, n) for m, n in list_partitions(conn).items() if m < cutoff)
+        for _, name in expired:
+            # Each partition in its own transaction: locks are held only for the
+            # catalog change
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {TABLE} DETACH PARTITION {name}"))
+                report.detached.append(name)
+                if drop:
+                    conn.execute(text(f"DROP TABLE {name}"))
+                    report.dropped.append(name)
+        return report
+
+    boundary = datetime(cutoff.year, cutoff.month, 1, tzinfo=timezone.utc)
+    while True:
+        with engine.begin() as conn:
+            ids = select(RejectedJob.id).where(RejectedJob.created_at < boundary).limit(batch_size)
+            result = conn.execute(delete(RejectedJob).where(RejectedJob.id.in_(ids)))
+            deleted = int(result.rowcount or 0)
+        report.deleted_rows += deleted
+        if deleted < batch_size:
+            return report
+
+
+def maintain_partitions(
+    engine: Engine,
+    months_ahead: int = 3,
+    retention_months: int = 0,
+    drop: bool = True,
+    today: date | None = None,
+) -> PartitionReport:
+    """
+    Pre-create upcoming partitions and apply retention; retention_months=0 keeps all.
+
+    Raises:
+        ValueError: If ``months_ahead`` or ``retention_months`` is negative.
+    """
+    if months_ahead < 0 or retention_months < 0:
+        raise ValueError("months_ahead and retention_months must be >= 0")
+    today = today or datetime.now(timezone.utc).date()
+    with engine.begin() as conn:
+        partitioned = is_partitioned(conn)
+        created = ensure_partitions(conn, months_ahead, today) if partitioned else []
+    report = PartitionReport(partitioned=partitioned, created=created)
+    if retention_months:
+        retained = enforce_retention(engine, retention_months, today, drop=drop)
+        report.detached = retained.detached
+        report.dropped = retained.dropped
+        report.deleted_rows = retained.deleted_rows
+
+    metrics.increment("storage.partitions.dropped", len(report.dropped))
+    metrics.increment("storage.retention.deleted_rows", report.deleted_rows)
+    logger.info("partitions.maintained", table=TABLE, **asdict(report))
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point; prints the report as JSON."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--months-ahead", type=int, default=settings.partition_months_ahead)
+    parser.add_argument(
+        "--retention-months", type=int, default=settings.rejected_jobs_retention_months
+    )
+    parser.add_argument(
+        "--detach-only",
+        action="store_true",
+        help="Detach expired partitions but keep them as standalone tables",
+    )
+    args = parser.parse_args(argv)
+
+    report = maintain_partitions(
+        get_engine(args.database_url),
+        months_ahead=args.months_ahead,
+        retention_months=args.retention_months,
+        drop=not args.detach_only,
+    )
+    print(json.dumps(asdict(report), indent=2))
+
+
+if __name__ == "__main__":
+    main()
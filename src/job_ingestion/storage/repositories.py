@@ -1,10 +1,37 @@
-from collections.abc import Generator
+import io
+import json
+from collections.abc import Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, cast
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Select,
+    Table,
+    create_engine,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    type_coerce,
+)
+from sqlalchemy import table as table_clause
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from .models import Base, Job, RejectedJob, ReviewQueueItem
+
+# Bytes handed to the database per read while streaming COPY input
+COPY_CHUNK_BYTES = 1 << 20
+
 
 def get_engine(url: str, echo: bool = False) -> Engine:
     """Create a SQLAlchemy Engine for the given URL.
@@ -24,6 +51,18 @@ def get_sessionmaker(engine: Engine) -> sessionmaker[Session]:
     return sessionmaker(bind=engine, class_=Session, expire_on_commit=False, future=True)
 
 
+@lru_cache(maxsize=8)
+def get_shared_sessionmaker(database_url: str) -> sessionmaker[Session]:
+    """Return the process-wide sessionmaker for a database (one engine and pool per URL).
+
+    Tables are created the first time a URL is seen (dev/test convenience), so
+    callers on the request path pay neither for a new pool nor for ``create_all``.
+    """
+    engine = get_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    return get_sessionmaker(engine)
+
+
 @contextmanager
 def get_session(session_maker: sessionmaker[Session]) -> Generator[Session, None, None]:
     """Context manager that yields a Session and handles commit/rollback."""
@@ -36,3 +75,268 @@ def get_session(session_maker: sessionmaker[Session]) -> Generator[Session, None
         raise
     finally:
         session.close()
+
+
+def json_contains(column: Any, document: Mapping[str, Any] | Sequence[Any]) -> ColumnElement[bool]:
+    """
+    ``column @> document``: the JSON column contains ``document`` (PostgreSQL only).
+
+    Served by the ``jsonb_path_ops`` GIN indexes on ``jobs.classifications_data`` and
+    ``jobs.locations_data``, e.g.
+    ``select(Job).where(json_contains(Job.classifications_data, {"id": 42}))``.
+    """
+    return type_coerce(column, JSONB).contains(document)
+
+
+# --- Re-ingest rule ---
+#
+# The latest ingest of an external id decides where the job lives. Storing it (in
+# ``jobs`` as approved or in review, or in ``rejected_jobs``) first removes every
+# copy an earlier ingest left elsewhere: its review queue entry, its rejected copies
+# and, unless the ``jobs`` row is upserted in place, its ``jobs`` row.
+
+
+def _discard_stored_copies(
+    connection: Connection, external_ids: Sequence[str] | Select[Any], keep_jobs: bool
+) -> None:
+    in_review = select(Job.id).where(Job.external_id.in_(external_ids))
+    connection.execute(delete(ReviewQueueItem).where(ReviewQueueItem.job_id.in_(in_review)))
+    connection.execute(delete(RejectedJob).where(RejectedJob.external_id.in_(external_ids)))
+    if not keep_jobs:
+        connection.execute(delete(Job).where(Job.external_id.in_(external_ids)))
+
+
+def discard_stored_copies(
+    session: Session, external_ids: Iterable[str | None], keep_jobs: bool = False
+) -> None:
+    """
+    Delete what earlier ingests stored for ``external_ids`` before they are stored again.
+
+    Removes their review queue entries and rejected copies, and their ``jobs`` rows
+    unless ``keep_jobs`` (the caller upserts those in place). `bulk_insert_jobs` applies
+    this itself; call it before adding a re-ingested job one by one.
+    """
+    ids = sorted({i for i in external_ids if i is not None})
+    if ids:
+        _discard_stored_copies(session.connection(), ids, keep_jobs)
+
+
+# --- Bulk loading ---
+
+# Columns filled by the database rather than the loader
+_GENERATED_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+
+# Text written for NULL in COPY input; quoted values never match it
+_COPY_NULL = "\\N"
+
+
+def _loadable_columns(table: Table) -> list[Column[Any]]:
+    return [c for c in table.columns if c.name not in _GENERATED_COLUMNS]
+
+
+def _conflict_columns(table: Table) -> list[str]:
+    return [c.name for c in table.columns if c.unique]
+
+
+def _key_columns(table: Table) -> list[str]:
+    # external_id identifies a job in rejected_jobs too, where it is not unique
+    keys = _conflict_columns(table)
+    return (
+        keys
+        if "external_id" in keys or "external_id" not in table.columns
+        else [*keys, "external_id"]
+    )
+
+
+def _normalize_rows(
+    table: Table, rows: Iterable[Mapping[str, Any]]
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """
+    Give every row a value for every loadable column, applying Python-side column
+    defaults to missing and None values, and keep only the last row per value of a
+    unique column or external id.
+
+    Raises:
+        ValueError: If a row has a key that is not a column of ``table``.
+    """
+    columns = _loadable_columns(table)
+    names = [c.name for c in columns]
+    known = set(names)
+    defaults = {
+        c.name: cast(Any, c.default).arg
+        for c in columns
+        if c.default is not None and getattr(c.default, "is_scalar", False)
+    }
+    unique = _key_columns(table)
+    normalized: list[dict[str, Any]] = []
+    last_by_key: dict[tuple[str, Any], int] = {}
+    for row in rows:
+        unknown = row.keys() - known
+        if unknown:
+            raise ValueError(f"unknown columns for {table.name}: {sorted(unknown)}")
+        # None takes the column default, as it does for ORM inserts
+        values = {
+            name: defaults.get(name) if row.get(name) is None else row[name] for name in names
+        }
+        # Later rows win, as they would with one upsert per row
+        previous = None
+        for name in unique:
+            if values[name] is not None:
+                previous = last_by_key.get((name, values[name]), previous)
+        if previous is not None:
+            normalized[previous] = values
+        else:
+            position = len(normalized)
+            normalized.append(values)
+            for name in unique:
+                if values[name] is not None:
+                    last_by_key[(name, values[name])] = position
+    return names, normalized
+
+
+def _copy_value(value: Any) -> str:
+    """
+    Encode one value as a CSV field for ``COPY ... (FORMAT csv, NULL '\\N')``.
+
+    Examples:
+        >>> _copy_value(None), _copy_value('a "b" c'), _copy_value(True)
+        ('\\\\N', '"a ""b"" c"', '"true"')
+        >>> _copy_value({"a": 1})
+        '"{""a"": 1}"'
+    """
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, Enum):
+        # SQLAlchemy ``Enum`` columns store member names
+        value = value.name
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, datetime | date):
+        text = value.isoformat()
+    elif isinstance(value, dict | list):
+        text = json.dumps(value, default=str)
+    else:
+        text = str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+class _CopyStream(io.RawIOBase):
+    """Readable stream of CSV lines produced lazily from rows, for ``copy_expert``."""
+
+    def __init__(self, names: Sequence[str], rows: Iterable[Mapping[str, Any]]) -> None:
+        self._lines = (
+            (",".join(_copy_value(row[name]) for name in names) + "\n").encode("utf-8")
+            for row in rows
+        )
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            if 0 <= size <= length:
+                break
+        data = b"".join(chunks)
+        if size < 0:
+            self._buffer = b""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def _merge_sql(table: Table, names: Sequence[str], stage: str) -> str:
+    """``INSERT ... SELECT`` from the staging table, upserting on unique columns."""
+    column_list = ", ".join(names)
+    sql = f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {stage}"
+    conflict = _conflict_columns(table)
+    if conflict:
+        updates = ", ".join(f"{n} = EXCLUDED.{n}" for n in names if n not in conflict)
+        sql += f" ON CONFLICT ({', '.join(conflict)}) DO UPDATE SET {updates}"
+        if "updated_at" in table.columns:
+            sql += ", updated_at = now()"
+    return sql
+
+
+def _copy_into(connection: Connection, table: Table, names: Sequence[str], rows: Any) -> int:
+    stage = f"_stage_{table.name}"
+    column_list = ", ".join(names)
+    connection.exec_driver_sql(
+        f"CREATE TEMP TABLE IF NOT EXISTS {stage} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table.name} WITH NO DATA"
+    )
+    cursor = cast(Any, connection.connection).cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {stage} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            _CopyStream(names, rows),
+            size=COPY_CHUNK_BYTES,
+        )
+    finally:
+        cursor.close()
+    staged_ids: Select[Any] = select(literal_column("external_id")).select_from(table_clause(stage))
+    _discard_stored_copies(connection, staged_ids, keep_jobs=table.name == Job.__tablename__)
+    result = connection.exec_driver_sql(_merge_sql(table, names, stage))
+    connection.exec_driver_sql(f"TRUNCATE {stage}")
+    return int(result.rowcount or 0)
+
+
+def _insert_many(connection: Connection, table: Table, rows: list[dict[str, Any]]) -> int:
+    conflict = _conflict_columns(table)
+    names = [n for n in rows[0] if n not in conflict]
+    touched = {"updated_at": func.now()} if "updated_at" in table.columns else {}
+    if conflict and connection.dialect.name == "sqlite":
+        sqlite_stmt = sqlite_insert(table)
+        connection.execute(
+            sqlite_stmt.on_conflict_do_update(
+                index_elements=conflict,
+                set_={**{n: sqlite_stmt.excluded[n] for n in names}, **touched},
+            ),
+            rows,
+        )
+    elif conflict and connection.dialect.name == "postgresql":
+        pg_stmt = pg_insert(table)
+        connection.execute(
+            pg_stmt.on_conflict_do_update(
+                index_elements=conflict, set_={**{n: pg_stmt.excluded[n] for n in names}, **touched}
+            ),
+            rows,
+        )
+    else:
+        connection.execute(insert(table), rows)
+    return len(rows)
+
+
+def bulk_insert_jobs(
+    session: Session, model: type[Job] | type[RejectedJob], rows: Iterable[Mapping[str, Any]]
+) -> int:
+    """
+    Insert mapped job rows into ``model``'s table in one round of bulk statements.
+
+    On PostgreSQL the rows are streamed as CSV with ``COPY FROM STDIN`` into a
+    temporary staging table, then merged with one ``INSERT ... SELECT``. Other
+    dialects use a single executemany ``INSERT``. Re-ingested jobs follow the
+    re-ingest rule: ``jobs`` rows are upserted on ``external_id`` (a row whose key
+    already exists replaces the stored values, status included), and every other
+    stored copy of the job is discarded first (see `discard_stored_copies`). Within
+    one call the last row per external id wins.
+
+    Runs in the session's transaction; the caller commits. Returns the number of rows
+    written.
+
+    Raises:
+        ValueError: If a row has a key that is not a column of the table.
+    """
+    table = cast(Table, model.__table__)
+    names, normalized = _normalize_rows(table, rows)
+    if not normalized:
+        return 0
+    connection = session.connection()
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        return _copy_into(connection, table, names, normalized)
+    discard_stored_copies(session, (row["external_id"] for row in normalized), model is Job)
+    return _insert_many(connection, table, normalized)
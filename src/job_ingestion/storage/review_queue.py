@@ -0,0 +1,177 @@
+"""Manual-review queue: borderline jobs waiting for a reviewer.
+
+A job sent to review is stored in ``jobs`` with status ``MANUAL_REVIEW`` and gets a
+``review_queue`` row carrying what reviewers list and sort by. Listings use keyset
+pagination over ``(score, job_id)``, served by the covering index
+``ix_review_queue_score_job`` (or ``ix_review_queue_schema_score_job`` when filtering by
+schema), so the cost of a page does not grow with its depth. Approving or rejecting
+a set of jobs runs a fixed number of set-based statements, whatever the number of
+jobs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import delete, insert, literal, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from .models import ApprovalStatus, Job, RejectedJob, ReviewQueueItem
+
+__all__ = [
+    "MAX_BULK_IDS",
+    "ReviewPage",
+    "approve_reviewed",
+    "decode_cursor",
+    "encode_cursor",
+    "enqueue_for_review",
+    "list_review_queue",
+    "reject_reviewed",
+]
+
+# Upper bound on the job IDs accepted by one bulk approve/reject call
+MAX_BULK_IDS = 5000
+
+# Columns copied when a reviewed job moves to rejected_jobs
+_COPIED_COLUMNS = tuple(
+    sorted(
+        (set(Job.__table__.columns.keys()) & set(RejectedJob.__table__.columns.keys()))
+        - {"id", "created_at", "updated_at"}
+    )
+)
+
+
+@dataclass(frozen=True)
+class ReviewPage:
+    items: list[ReviewQueueItem]
+    # Pass as ``cursor`` to get the next page; None on the last page
+    next_cursor: str | None
+
+
+def encode_cursor(score: float, job_id: int) -> str:
+    """
+    Opaque keyset cursor for the position after ``(score, job_id)``.
+
+    Example:
+        >>> decode_cursor(encode_cursor(0.75, 42))
+        (0.75, 42)
+    """
+    return f"{score!r}:{job_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Parse a cursor made by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    score, sep, job_id = cursor.rpartition(":")
+    if not sep:
+        raise ValueError(f"invalid review cursor: {cursor!r}")
+    try:
+        return float(score), int(job_id)
+    except ValueError as exc:
+        raise ValueError(f"invalid review cursor: {cursor!r}") from exc
+
+
+def enqueue_for_review(
+    session: Session, job: Job, score: float, reasons: Sequence[str], schema_name: str | None
+) -> ReviewQueueItem:
+    """Queue a job stored with status ``MANUAL_REVIEW``; flushes to assign its id."""
+    if job.id is None:
+        session.flush()
+    item = ReviewQueueItem(
+        job_id=job.id,
+        score=score,
+        external_id=job.external_id,
+        title=job.title,
+        schema_name=schema_name,
+        review_reasons="; ".join(reasons) or "Borderline approval decision",
+    )
+    session.add(item)
+    return item
+
+
+def list_review_queue(
+    session: Session, limit: int = 100, cursor: str | None = None, schema_name: str | None = None
+) -> ReviewPage:
+    """
+    One page of queued jobs, closest to approval (highest score) first.
+
+    Raises:
+        ValueError: If ``limit`` is not positive or ``cursor`` is malformed.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    stmt = select(ReviewQueueItem)
+    if schema_name is not None:
+        stmt = stmt.where(ReviewQueueItem.schema_name == schema_name)
+    if cursor:
+        stmt = stmt.where(
+            tuple_(ReviewQueueItem.score, ReviewQueueItem.job_id) < decode_cursor(cursor)
+        )
+    stmt = stmt.order_by(ReviewQueueItem.score.desc(), ReviewQueueItem.job_id.desc())
+    # One extra row tells whether another page follows
+    items = list(session.execute(stmt.limit(limit + 1)).scalars())
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].score, items[-1].job_id)
+    return ReviewPage(items=items, next_cursor=next_cursor)
+
+
+def _check_ids(job_ids: Sequence[int]) -> list[int]:
+    if len(job_ids) > MAX_BULK_IDS:
+        raise ValueError(f"at most {MAX_BULK_IDS} job ids per call")
+    return list(dict.fromkeys(job_ids))
+
+
+def approve_reviewed(session: Session, job_ids: Sequence[int]) -> int:
+    """
+    Approve queued jobs and remove them from the queue; returns the number approved.
+
+    IDs that are not in review are ignored.
+
+    Raises:
+        ValueError: If more than `MAX_BULK_IDS` IDs are given.
+    """
+    ids = _check_ids(job_ids)
+    if not ids:
+        return 0
+    result = session.execute(
+        update(Job)
+        .where(Job.id.in_(ids), Job.approval_status == ApprovalStatus.MANUAL_REVIEW)
+        .values(approval_status=ApprovalStatus.APPROVED)
+    )
+    session.execute(delete(ReviewQueueItem).where(ReviewQueueItem.job_id.in_(ids)))
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+def reject_reviewed(session: Session, job_ids: Sequence[int], reason: str | None = None) -> int:
+    """
+    Move queued jobs to ``rejected_jobs``; returns the number rejected.
+
+    The rejection reason is ``reason`` if given, else the reasons that sent the job to
+    review. IDs that are not in review are ignored.
+
+    Raises:
+        ValueError: If more than `MAX_BULK_IDS` IDs are given.
+    """
+    ids = _check_ids(job_ids)
+    if not ids:
+        return 0
+    in_review = (Job.id.in_(ids), Job.approval_status == ApprovalStatus.MANUAL_REVIEW)
+    reasons = literal(reason) if reason else ReviewQueueItem.review_reasons
+    session.execute(
+        insert(RejectedJob).from_select(
+            [*_COPIED_COLUMNS, "rejection_reasons"],
+            select(*[Job.__table__.c[name] for name in _COPIED_COLUMNS], reasons)
+            .join(ReviewQueueItem, ReviewQueueItem.job_id == Job.id)
+            .where(*in_review),
+        )
+    )
+    session.execute(delete(ReviewQueueItem).where(ReviewQueueItem.job_id.in_(ids)))
+    result = session.execute(delete(Job).where(*in_review))
+    return int(getattr(result, "rowcount", 0) or 0)
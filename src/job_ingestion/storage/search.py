@@ -0,0 +1,279 @@
+"""Full-text search over active approved jobs.
+
+Title, company name and plain-text description are indexed, weighted in that order,
+with a dialect-specific structure:
+
+- PostgreSQL: a ``jobs.search_vector`` ``tsvector`` column kept up to date by a
+  ``BEFORE INSERT OR UPDATE`` trigger, with a GIN index restricted to active
+  approved jobs (``ix_jobs_search_vector``). Ranking uses ``ts_rank_cd``.
+- SQLite: an external-content FTS5 table ``jobs_fts`` (porter stemming) that
+  triggers on ``jobs`` fill with active approved jobs only. Ranking uses ``bm25``.
+
+Either way the index is maintained by the database in the statement, and so the
+transaction, that writes the job: bulk loads, upserts, review decisions and
+re-evaluation moves included. Neither structure is mapped on `Job`. They are created
+along with the ``jobs`` table, or by ``migrations/013_add_job_search.py`` for
+existing databases.
+
+Results are ordered by score (higher is better), then id, and paginated with a
+``(score, id)`` keyset cursor. Scores depend on corpus statistics, so jobs written
+between two page requests can shift the order slightly.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    cast,
+    func,
+    literal_column,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import text
+
+from job_ingestion.utils.logging import get_logger
+
+from .job_queries import LISTING_COLUMNS
+from .models import ACTIVE_APPROVED, Job
+
+__all__ = [
+    "FTS_TABLE",
+    "TEXT_SEARCH_CONFIG",
+    "SearchPage",
+    "backfill_statements",
+    "decode_cursor",
+    "drop_search_index",
+    "encode_cursor",
+    "install_search_index",
+    "search_jobs",
+]
+
+logger = get_logger("storage.search")
+
+# PostgreSQL text search configuration (stemming and stop words)
+TEXT_SEARCH_CONFIG = "english"
+FTS_TABLE = "jobs_fts"
+
+# Same condition as models.ACTIVE_APPROVED, as the partial index predicate
+_PG_ACTIVE_APPROVED = "approval_status = 'APPROVED' AND is_active IS true"
+_SQLITE_ACTIVE_APPROVED = "{row}.approval_status = 'APPROVED' AND {row}.is_active"
+_FTS_COLUMNS = "title, company_name, description_text"
+_EVENTS = ("insert", "delete", "update")
+
+
+def _pg_vector(row: str = "") -> str:
+    prefix = f"{row}." if row else ""
+    return " || ".join(
+        f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({prefix}{name}, '')), '{w}')"
+        for name, w in (("title", "A"), ("company_name", "B"), ("description_text", "C"))
+    )
+
+
+def _fts_values(row: str) -> str:
+    return f"{row}.id, {row}.title, {row}.company_name, {row}.description_text"
+
+
+def _postgresql_ddl(concurrently: bool) -> list[str]:
+    return [
+        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector",
+        "CREATE OR REPLACE FUNCTION jobs_search_vector_update() RETURNS trigger AS $$ "
+        f"BEGIN NEW.search_vector := {_pg_vector('NEW')}; RETURN NEW; END "
+        "$$ LANGUAGE plpgsql",
+        "DROP TRIGGER IF EXISTS jobs_search_vector_trigger ON jobs",
+        "CREATE TRIGGER jobs_search_vector_trigger "
+        "BEFORE INSERT OR UPDATE OF title, company_name, description_text ON jobs "
+        "FOR EACH ROW EXECUTE FUNCTION jobs_search_vector_update()",
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        "ix_jobs_search_vector ON jobs USING gin (search_vector) "
+        f"WHERE {_PG_ACTIVE_APPROVED}",
+    ]
+
+
+def _sqlite_ddl() -> list[str]:
+    old = _SQLITE_ACTIVE_APPROVED.format(row="old")
+    new = _SQLITE_ACTIVE_APPROVED.format(row="new")
+    delete_old = (
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, {_FTS_COLUMNS}) "
+        f"SELECT 'delete', {_fts_values('old')} WHERE {old};"
+    )
+    insert_new = (
+        f"INSERT INTO {FTS_TABLE} (rowid, {_FTS_COLUMNS}) "
+        f"SELECT {_fts_values('new')} WHERE {new};"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{_FTS_COLUMNS}, content='jobs', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON jobs "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON jobs "
+        f"BEGIN {delete_old} END",
+        # One trigger, so the old entry is always removed before the new one is added
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE ON jobs "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def _fts5_available(conn: Connection) -> bool:
+    return bool(conn.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+
+def install_search_index(conn: Connection, concurrently: bool = False) -> bool:
+    """
+    Create the search structures for ``conn``'s dialect; returns False if unsupported.
+
+    Idempotent. ``concurrently`` builds the PostgreSQL index without blocking writes
+    (the connection must then be in autocommit mode).
+    """
+    if conn.dialect.name == "postgresql":
+        statements = _postgresql_ddl(concurrently)
+    elif conn.dialect.name == "sqlite" and _fts5_available(conn):
+        statements = _sqlite_ddl()
+    else:
+        logger.warning("search.unsupported", dialect=conn.dialect.name)
+        return False
+    for statement in statements:
+        conn.execute(text(statement))
+    return True
+
+
+def backfill_statements(dialect: str) -> list[str]:
+    """
+    SQL indexing the jobs already stored (ids in ``[:low, :high)`` on PostgreSQL).
+
+    Raises:
+        ValueError: If ``dialect`` has no search index.
+    """
+    if dialect == "postgresql":
+        return [f"UPDATE jobs SET search_vector = {_pg_vector()} WHERE id >= :low AND id < :high"]
+    if dialect == "sqlite":
+        # Drop whatever is indexed, then add every active approved job
+        return [
+            f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('delete-all')",
+            f"INSERT INTO {FTS_TABLE} (rowid, {_FTS_COLUMNS}) SELECT {_fts_values('jobs')} "
+            f"FROM jobs WHERE {_SQLITE_ACTIVE_APPROVED.format(row='jobs')}",
+        ]
+    raise ValueError(f"full-text search is not supported on {dialect}")
+
+
+def drop_search_index(conn: Connection) -> None:
+    """Drop the search structures (the PostgreSQL column is kept, see the migration)."""
+    if conn.dialect.name == "postgresql":
+        statements = [
+            "DROP INDEX IF EXISTS ix_jobs_search_vector",
+            "DROP TRIGGER IF EXISTS jobs_search_vector_trigger ON jobs",
+            "DROP FUNCTION IF EXISTS jobs_search_vector_update()",
+        ]
+    elif conn.dialect.name == "sqlite":
+        statements = [f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{event}" for event in _EVENTS]
+        statements.append(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    else:
+        return
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    # `LISTING_COLUMNS` plus ``score``
+    rows: list[Row[Any]]
+    # Pass as ``cursor`` to get the next page; None on the last page
+    next_cursor: str | None
+
+
+def encode_cursor(score: float, job_id: int) -> str:
+    """
+    Opaque keyset cursor for the position after ``(score, job_id)``.
+
+    Example:
+        >>> decode_cursor(encode_cursor(0.1 + 0.2, 42))
+        (0.30000000000000004, 42)
+    """
+    return f"{score!r}:{job_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Parse a cursor made by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    score, sep, job_id = cursor.rpartition(":")
+    if not sep:
+        raise ValueError(f"invalid search cursor: {cursor!r}")
+    try:
+        return float(score), int(job_id)
+    except ValueError as exc:
+        raise ValueError(f"invalid search cursor: {cursor!r}") from exc
+
+
+def _fts5_query(terms: list[str]) -> str:
+    """
+    FTS5 query matching every term; quoting keeps user input out of the query syntax.
+
+    Example:
+        >>> _fts5_query(["data", "engineer"])
+        '"data" "engineer"'
+    """
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def _matches(dialect: str, query: str, terms: list[str]) -> Select[Any]:
+    columns = [Job.__table__.c[name] for name in LISTING_COLUMNS]
+    if dialect == "postgresql":
+        vector: ColumnElement[Any] = literal_column("jobs.search_vector")
+        tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+        # ts_rank_cd returns real; as double precision, cursors round-trip exactly
+        score: ColumnElement[Any] = cast(func.ts_rank_cd(vector, tsquery), Float)
+        return select(*columns, score.label("score")).where(
+            ACTIVE_APPROVED, vector.op("@@")(tsquery)
+        )
+    if dialect == "sqlite":
+        fts = table(FTS_TABLE)
+        fts_column: ColumnElement[Any] = literal_column(FTS_TABLE)
+        # bm25 is lower for better matches; negated so higher is better everywhere
+        score = -func.bm25(fts_column, 10.0, 5.0, 1.0)
+        return (
+            select(*columns, score.label("score"))
+            .select_from(Job.__table__.join(fts, literal_column(f"{FTS_TABLE}.rowid") == Job.id))
+            .where(ACTIVE_APPROVED, fts_column.op("MATCH")(_fts5_query(terms)))
+        )
+    raise ValueError(f"full-text search is not supported on {dialect}")
+
+
+def search_jobs(
+    session: Session, query: str, limit: int = 20, cursor: str | None = None
+) -> SearchPage:
+    """
+    One page of active approved jobs matching every word of ``query``, best first.
+
+    Raises:
+        ValueError: If ``query`` has no words, ``limit`` is not positive, ``cursor``
+            is malformed or the dialect has no search index.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        raise ValueError("search query must contain at least one word")
+    ranked = _matches(session.get_bind().dialect.name, query, terms).subquery()
+    stmt = select(ranked).order_by(ranked.c.score.desc(), ranked.c.id.desc())
+    if cursor:
+        stmt = stmt.where(tuple_(ranked.c.score, ranked.c.id) < decode_cursor(cursor))
+    # One extra row tells whether another page follows
+    rows = list(session.execute(stmt.limit(limit + 1)).all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].score, rows[-1].id)
+    return SearchPage(rows=rows, next_cursor=next_cursor)
@@ -0,0 +1,393 @@
+"""Simplified country boundary polygons for offline reverse geocoding.
+
+Covers the United States (contiguous states, Alaska, Hawaii, Puerto Rico, the U.S.
+Virgin Islands and Guam) and Canada: the countries the approval rules accept, whose
+borders decide whether a job is approved. Rings are (latitude, longitude) vertices,
+accurate to a few kilometres along land borders (the US-Canada and US-Mexico lines
+around border cities are traced more closely) and drawn a little offshore along
+coasts, so coastal points stay inside while neighbouring islands (Cuba, the Bahamas,
+the British Virgin Islands, Greenland) stay outside. Both countries' rings share the
+same `_US_CA_BORDER` vertices, so no point lies in both.
+
+Point-in-polygon tests use ray casting on plain latitude/longitude, which is exact
+for these rings: none of them crosses the antimeridian (the western Aleutians are a
+separate ring).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = ["Boundary", "BOUNDARIES", "BOUNDED_COUNTRIES", "country_at", "countries_at"]
+
+_Ring = tuple[tuple[float, float], ...]
+
+
+@dataclass(frozen=True)
+class Boundary:
+    country_code: str
+    name: str
+    ring: _Ring
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        """(min latitude, min longitude, max latitude, max longitude)."""
+        lats = [lat for lat, _ in self.ring]
+        lons = [lon for _, lon in self.ring]
+        return min(lats), min(lons), max(lats), max(lons)
+
+
+def _box(south: float, west: float, north: float, east: float) -> _Ring:
+    return ((south, west), (south, east), (north, east), (north, west))
+
+
+# US-Canada border, Pacific to Atlantic: Juan de Fuca and Haro straits, the 49th
+# parallel, Lake of the Woods, the Great Lakes and their connecting rivers, the
+# 45th parallel, and the Maine border to Passamaquoddy Bay.
+_US_CA_BORDER: _Ring = (
+    (48.49, -124.75),
+    (48.25, -123.50),
+    (48.25, -123.20),
+    (48.65, -123.25),
+    (48.78, -123.05),
+    (49.00, -123.32),
+    (49.00, -95.15),
+    (49.38, -95.15),
+    (49.32, -94.95),
+    (48.85, -94.68),
+    (48.70, -94.60),
+    (48.60, -93.40),
+    (48.45, -92.50),
+    (48.20, -91.00),
+    (48.05, -90.00),
+    (48.00, -89.55),
+    (48.30, -89.00),
+    (48.30, -88.40),
+    (47.80, -86.50),
+    (46.95, -84.85),
+    (46.51, -84.50),
+    (46.505, -84.35),
+    (46.47, -84.10),
+    (46.25, -83.95),
+    (46.00, -83.45),
+    (45.35, -82.50),
+    (44.00, -82.20),
+    (43.00, -82.42),
+    (42.60, -82.55),
+    (42.45, -82.65),
+    (42.37, -82.88),
+    (42.335, -82.97),
+    (42.32, -83.04),
+    (42.29, -83.09),
+    (42.20, -83.13),
+    (42.03, -83.13),
+    (41.67, -82.70),
+    (41.80, -82.40),
+    (42.00, -81.50),
+    (42.35, -80.50),
+    (42.60, -79.60),
+    (42.88, -78.905),
+    (43.00, -79.03),
+    (43.08, -79.06),
+    (43.17, -79.05),
+    (43.26, -79.07),
+    (43.55, -78.50),
+    (43.60, -77.00),
+    (43.65, -76.50),
+    (44.10, -76.45),
+    (44.20, -76.20),
+    (44.35, -75.95),
+    (44.55, -75.65),
+    (44.73, -75.45),
+    (44.99, -74.75),
+    (45.00, -71.50),
+    (45.30, -71.08),
+    (45.45, -70.65),
+    (45.93, -70.25),
+    (46.40, -70.05),
+    (47.45, -69.22),
+    (47.18, -68.90),
+    (47.25, -68.60),
+    (47.36, -68.33),
+    (47.25, -68.00),
+    (47.07, -67.79),
+    (45.94, -67.78),
+    (45.60, -67.43),
+    (45.19, -67.28),
+    (44.90, -66.98),
+    (44.75, -66.90),
+)
+
+# Alaska-Canada border, north to south: the 141st meridian, then the panhandle to
+# Portland Canal and out through Dixon Entrance.
+_AK_CA_BORDER: _Ring = (
+    (69.65, -141.00),
+    (60.30, -141.00),
+    (60.30, -139.10),
+    (59.50, -137.50),
+    (59.00, -136.50),
+    (59.50, -135.50),
+    (58.50, -133.50),
+    (57.00, -131.90),
+    (56.00, -130.00),
+    (55.90, -130.00),
+    (54.70, -130.60),
+    (54.55, -131.50),
+    (54.50, -133.50),
+)
+
+# US-Mexico border, Gulf of Mexico to Pacific: the Rio Grande to El Paso, then the
+# land line to Tijuana.
+_US_MX_BORDER: _Ring = (
+    (25.96, -97.15),
+    (25.95, -97.40),
+    (25.89, -97.50),
+    (26.05, -97.80),
+    (26.095, -98.27),
+    (26.23, -98.60),
+    (26.37, -99.00),
+    (26.58, -99.17),
+    (27.00, -99.45),
+    (27.497, -99.50),
+    (28.00, -99.95),
+    (28.705, -100.51),
+    (29.34, -100.92),
+    (29.80, -101.40),
+    (29.77, -102.40),
+    (29.20, -103.00),
+    (28.97, -103.25),
+    (29.20, -103.70),
+    (29.555, -104.39),
+    (30.60, -105.00),
+    (31.10, -105.60),
+    (31.50, -106.20),
+    (31.74, -106.45),
+    (31.752, -106.49),
+    (31.784, -106.528),
+    (31.784, -108.208),
+    (31.332, -108.208),
+    (31.332, -111.075),
+    (32.49, -114.81),
+    (32.72, -114.72),
+    (32.534, -117.124),
+)
+
+_CONTIGUOUS_US: _Ring = (
+    *_US_CA_BORDER,
+    # Atlantic coast, offshore
+    (44.55, -67.20),
+    (43.50, -68.50),
+    (42.50, -69.80),
+    (41.30, -69.70),
+    (40.90, -71.70),
+    (40.40, -73.50),
+    (39.30, -74.00),
+    (38.40, -74.90),
+    (37.00, -75.60),
+    (35.20, -75.30),
+    (34.50, -76.40),
+    (33.70, -78.30),
+    (32.50, -80.20),
+    (31.00, -81.20),
+    (30.00, -81.20),
+    (28.50, -80.45),
+    (27.50, -80.10),
+    # Florida Straits: west of the Bahamas, north of Cuba
+    (26.50, -79.95),
+    (25.70, -80.00),
+    (25.00, -80.30),
+    (24.70, -80.70),
+    (24.45, -81.50),
+    (24.45, -82.20),
+    (24.60, -83.00),
+    # Gulf of Mexico coast, offshore
+    (25.80, -81.90),
+    (26.50, -82.30),
+    (27.50, -82.95),
+    (28.80, -82.85),
+    (29.50, -84.20),
+    (29.40, -85.50),
+    (30.00, -86.50),
+    (30.10, -88.50),
+    (28.80, -88.90),
+    (28.80, -89.60),
+    (28.90, -90.50),
+    (29.20, -92.50),
+    (29.40, -93.80),
+    (29.00, -94.80),
+    (28.00, -96.60),
+    (27.00, -97.05),
+    (26.00, -97.05),
+    *_US_MX_BORDER,
+    # Pacific coast, offshore (Channel Islands included)
+    (32.55, -117.60),
+    (32.70, -118.70),
+    (33.80, -120.70),
+    (34.50, -120.80),
+    (35.50, -121.30),
+    (37.00, -122.60),
+    (38.00, -123.20),
+    (39.00, -123.95),
+    (40.40, -124.60),
+    (42.00, -124.50),
+    (42.80, -124.80),
+    (46.00, -124.20),
+    (47.90, -124.80),
+    (48.40, -124.85),
+)
+
+_ALASKA: _Ring = (
+    *_AK_CA_BORDER[::-1],
+    # Arctic coast, offshore, then the Bering Strait east of Big Diomede and the
+    # Bering Sea maritime boundary
+    (70.20, -141.00),
+    (70.80, -150.00),
+    (71.60, -156.80),
+    (70.50, -161.50),
+    (68.50, -167.20),
+    (66.00, -168.98),
+    (65.50, -168.98),
+    (60.00, -177.50),
+    (51.00, -180.00),
+    # Aleutians and the Gulf of Alaska coast, offshore
+    (51.00, -172.00),
+    (53.50, -165.00),
+    (54.00, -162.00),
+    (55.30, -157.00),
+    (56.20, -154.00),
+    (58.50, -150.00),
+    (59.50, -146.00),
+    (59.20, -141.00),
+    (57.50, -137.00),
+    (56.00, -135.00),
+)
+
+_CANADA: _Ring = (
+    *_US_CA_BORDER[::-1],
+    # Pacific coast, offshore
+    (48.50, -125.00),
+    (49.00, -126.30),
+    (50.70, -128.60),
+    (51.50, -131.00),
+    (53.00, -133.30),
+    *_AK_CA_BORDER[::-1],
+    # Arctic: around the islands, then down Nares Strait and Baffin Bay, keeping
+    # Greenland outside
+    (70.20, -141.00),
+    (84.00, -141.00),
+    (84.00, -61.50),
+    (82.20, -61.50),
+    (81.30, -64.00),
+    (80.50, -67.50),
+    (79.50, -70.00),
+    (78.00, -73.80),
+    (76.00, -74.00),
+    (73.50, -70.00),
+    (70.00, -66.50),
+    (68.00, -63.50),
+    (66.50, -61.00),
+    (64.00, -63.00),
+    (61.50, -63.50),
+    # Labrador and Newfoundland, offshore; St. Pierre and Miquelon stays outside
+    (58.50, -62.50),
+    (56.50, -61.00),
+    (54.50, -57.20),
+    (52.30, -55.50),
+    (51.60, -55.40),
+    (49.50, -53.30),
+    (47.50, -52.50),
+    (46.55, -52.95),
+    (46.60, -55.50),
+    (46.85, -55.95),
+    (47.30, -56.45),
+    (47.50, -58.00),
+    (47.45, -59.40),
+    # Cabot Strait, Nova Scotia
+    (47.15, -60.20),
+    (46.50, -59.70),
+    (45.60, -60.00),
+    (45.00, -61.00),
+    (44.30, -63.50),
+    (43.30, -65.50),
+    (43.30, -66.50),
+)
+
+BOUNDARIES: tuple[Boundary, ...] = (
+    Boundary("US", "Contiguous United States", _CONTIGUOUS_US),
+    Boundary("US", "Alaska", _ALASKA),
+    Boundary("US", "Western Aleutians", _box(51.30, 172.40, 53.20, 180.00)),
+    Boundary("US", "Hawaii", _box(18.50, -161.00, 22.60, -154.50)),
+    Boundary("US", "Puerto Rico", _box(17.80, -67.40, 18.60, -65.20)),
+    Boundary("US", "St. Thomas", _box(18.27, -65.09, 18.40, -64.83)),
+    Boundary("US", "St. John", _box(18.30, -64.80, 18.37, -64.66)),
+    Boundary("US", "St. Croix", _box(17.67, -64.90, 17.80, -64.56)),
+    Boundary("US", "Guam", _box(13.20, 144.60, 13.70, 145.00)),
+    Boundary("CA", "Canada", _CANADA),
+)
+
+# Countries resolved by polygon; other countries are matched to nearby cities only
+BOUNDED_COUNTRIES = frozenset(b.country_code for b in BOUNDARIES)
+
+
+def _ring_contains(ring: _Ring, latitude: float, longitude: float) -> bool:
+    inside = False
+    lat_j, lon_j = ring[-1]
+    for lat_i, lon_i in ring:
+        if (lat_i > latitude) != (lat_j > latitude):
+            crossing = lon_i + (lon_j - lon_i) * (latitude - lat_i) / (lat_j - lat_i)
+            if longitude < crossing:
+                inside = not inside
+        lat_j, lon_j = lat_i, lon_i
+    return inside
+
+
+def country_at(latitude: float, longitude: float) -> str | None:
+    """
+    Country whose boundary contains the point, if it is one of `BOUNDED_COUNTRIES`.
+
+    Example:
+        >>> country_at(32.72, -117.16), country_at(32.51, -117.04)  # San Diego, Tijuana
+        ('US', None)
+    """
+    for boundary, (south, west, north, east) in _BBOXES:
+        if south <= latitude <= north and west <= longitude <= east:
+            if _ring_contains(boundary.ring, latitude, longitude):
+                return boundary.country_code
+    return None
+
+
+def countries_at(
+    latitudes: Sequence[float] | npt.NDArray[np.float64],
+    longitudes: Sequence[float] | npt.NDArray[np.float64],
+) -> list[str | None]:
+    """Vectorized `country_at` for a chunk of points."""
+    lats = np.asarray(latitudes, dtype=np.float64)
+    lons = np.asarray(longitudes, dtype=np.float64)
+    result: list[str | None] = [None] * len(lats)
+    unresolved = np.ones(len(lats), dtype=np.bool_)
+    for boundary, (south, west, north, east) in _BBOXES:
+        candidates = np.flatnonzero(
+            unresolved & (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+        )
+        if not len(candidates):
+            continue
+        ring = np.asarray(boundary.ring, dtype=np.float64)
+        lat_i, lon_i = ring[:, 0], ring[:, 1]
+        lat_j, lon_j = np.roll(lat_i, 1), np.roll(lon_i, 1)
+        y = lats[candidates, None]
+        x = lons[candidates, None]
+        spans = (lat_i > y) != (lat_j > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = lon_i + (lon_j - lon_i) * (y - lat_i) / (lat_j - lat_i)
+        inside = np.count_nonzero(spans & (x < crossing), axis=1) % 2 == 1
+        for pos in candidates[inside].tolist():
+            result[pos] = boundary.country_code
+        unresolved[candidates[inside]] = False
+    return result
+
+
+_BBOXES = tuple((b, b.bbox) for b in BOUNDARIES)
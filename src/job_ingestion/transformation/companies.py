@@ -0,0 +1,119 @@
+"""Company interning against the ``companies`` table.
+
+`CompanyIndex` keeps an in-memory map from canonical company key to ``companies.id``.
+It is warmed with a single query (at application startup, or lazily on first use) and
+afterwards resolves a whole batch of names with dictionary lookups; only keys never
+seen before cost a round trip, where they are looked up and inserted together.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from job_ingestion.storage.models import Company
+from job_ingestion.storage.repositories import get_session, get_shared_sessionmaker
+from job_ingestion.transformation.normalizers import company_storage_key
+from job_ingestion.utils.logging import get_logger
+
+__all__ = ["CompanyIndex", "get_company_index"]
+
+logger = get_logger("transformation.companies")
+
+_NAME_MAX_LENGTH = 255
+
+
+class CompanyIndex:
+    """
+    Canonical-key → company ID index backed by the ``companies`` table.
+
+    Example:
+        >>> index = get_company_index("sqlite:///./db.sqlite3")  # doctest: +SKIP
+        >>> index.resolve(["ACME, Inc.", "Acme Incorporated", None])  # doctest: +SKIP
+        [1, 1, None]
+    """
+
+    def __init__(self, session_maker: sessionmaker[Session]) -> None:
+        self._session_maker = session_maker
+        self._ids: dict[str, int] = {}
+        self._warmed = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def warm(self) -> int:
+        """Load every known company key into memory; returns the number loaded."""
+        with self._session_maker() as session:
+            rows = session.execute(select(Company.canonical_key, Company.id)).all()
+        with self._lock:
+            self._ids.update({key: company_id for key, company_id in rows})
+            self._warmed = True
+        logger.info("companies.index_warmed", companies=len(rows))
+        return len(rows)
+
+    def get(self, name: str) -> int | None:
+        """Return the ID of an already known company, without touching the database."""
+        key = company_storage_key(name)
+        return None if key is None else self._ids.get(key)
+
+    def resolve(self, names: Sequence[str | None]) -> list[int | None]:
+        """
+        Return the company ID for each name, creating companies that do not exist yet.
+
+        Names without a canonical key (missing, blank, no letters) resolve to None.
+        Each distinct name is canonicalized once per call.
+        """
+        if not self._warmed:
+            self.warm()
+
+        keys: list[str | None] = []
+        display: dict[str, str] = {}
+        for name in names:
+            key = company_storage_key(name) if name else None
+            keys.append(key)
+            if key is not None and key not in self._ids and key not in display:
+                display[key] = name.strip()[:_NAME_MAX_LENGTH] if name else key
+
+        if display:
+            self._create(display)
+        return [None if key is None else self._ids.get(key) for key in keys]
+
+    def _create(self, display: dict[str, str]) -> None:
+        with self._lock:
+            missing = {k: v for k, v in display.items() if k not in self._ids}
+            if not missing:
+                return
+            lookup = select(Company.canonical_key, Company.id).where(
+                Company.canonical_key.in_(missing)
+            )
+            with get_session(self._session_maker) as session:
+                # Another process may have created some of them since the index was warmed
+                found = {key: company_id for key, company_id in session.execute(lookup).all()}
+                created = [
+                    Company(canonical_key=key, name=name)
+                    for key, name in missing.items()
+                    if key not in found
+                ]
+                try:
+                    with session.begin_nested():
+                        session.add_all(created)
+                except IntegrityError:
+                    # Lost an insert race; the rows exist now, so read them back
+                    logger.info("companies.insert_conflict", companies=len(created))
+                    found = {key: company_id for key, company_id in session.execute(lookup).all()}
+                else:
+                    found.update({c.canonical_key: c.id for c in created})
+            # Only publish IDs once the transaction has committed
+            self._ids.update(found)
+
+
+@lru_cache(maxsize=8)
+def get_company_index(database_url: str) -> CompanyIndex:
+    """Return the shared index for a database (one per URL)."""
+    return CompanyIndex(get_shared_sessionmaker(database_url))
@@ -0,0 +1,336 @@
+"""Currency conversion backed by an in-memory, periodically refreshed rates table.
+
+Rates (USD per unit of currency) come from a pluggable `RatesSource`: the bundled
+table, a local CSV file, or the ``currency_rates`` database table. Each rate has an
+effective date, so conversions can be made as of a given day. The table is loaded
+once and reloaded at most every ``refresh_interval`` seconds; individual conversions
+never touch the source.
+
+Unknown currencies, and ISO 4217 currencies without a rate, convert to None (NaN in
+batch mode) instead of silently assuming parity with USD.
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from job_ingestion.storage.models import CurrencyRate
+from job_ingestion.storage.repositories import get_engine, get_sessionmaker
+from job_ingestion.utils.config import get_settings
+from job_ingestion.utils.logging import get_logger
+
+__all__ = [
+    "ISO_4217_CODES",
+    "ANNUALIZATION_FACTORS",
+    "RateRow",
+    "RatesSource",
+    "StaticRatesSource",
+    "CsvRatesSource",
+    "DatabaseRatesSource",
+    "CurrencyConverter",
+    "get_currency_converter",
+]
+
+logger = get_logger("transformation.currency")
+
+# Active ISO 4217 currency codes
+ISO_4217_CODES: frozenset[str] = frozenset(
+    """
+    AED AFN ALL AMD ANG AOA ARS AUD AWG AZN BAM BBD BDT BGN BHD BIF BMD BND BOB BRL BSD
+    BTN BWP BYN BZD CAD CDF CHF CLP CNY COP CRC CUP CVE CZK DJF DKK DOP DZD EGP ERN ETB
+    EUR FJD FKP GBP GEL GHS GIP GMD GNF GTQ GYD HKD HNL HTG HUF IDR ILS INR IQD IRR ISK
+    JMD JOD JPY KES KGS KHR KMF KPW KRW KWD KYD KZT LAK LBP LKR LRD LSL LYD MAD MDL MGA
+    MKD MMK MNT MOP MRU MUR MVR MWK MXN MYR MZN NAD NGN NIO NOK NPR NZD OMR PAB PEN PGK
+    PHP PKR PLN PYG QAR RON RSD RUB RWF SAR SBD SCR SDG SEK SGD SHP SLE SLL SOS SRD SSP
+    STN SVC SYP SZL THB TJS TMT TND TOP TRY TTD TWD TZS UAH UGX USD UYU UZS VES VND VUV
+    WST XAF XCD XCG XOF XPF YER ZAR ZMW ZWL
+    """.split()
+)
+
+# Multipliers that turn a pay amount in the given unit into an annual amount
+ANNUALIZATION_FACTORS: dict[str, float] = {
+    "annual": 1.0,
+    "yearly": 1.0,
+    "year": 1.0,
+    "monthly": 12.0,
+    "month": 12.0,
+    "biweekly": 26.0,
+    "weekly": 52.0,
+    "week": 52.0,
+    "daily": 260.0,
+    "day": 260.0,
+    "hourly": 2080.0,
+    "hour": 2080.0,
+    "per hour": 2080.0,
+}
+
+_BUNDLED_EFFECTIVE = date(2024, 1, 1)
+
+# Approximate USD value of one unit of each currency as of _BUNDLED_EFFECTIVE
+_BUNDLED_RATES: dict[str, float] = {
+    "USD": 1.0,
+    "CAD": 0.74,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "AUD": 0.66,
+    "NZD": 0.61,
+    "CHF": 1.13,
+    "JPY": 0.0067,
+    "CNY": 0.139,
+    "HKD": 0.128,
+    "TWD": 0.032,
+    "SGD": 0.74,
+    "INR": 0.012,
+    "PKR": 0.0036,
+    "KRW": 0.00075,
+    "PHP": 0.018,
+    "IDR": 0.000064,
+    "THB": 0.028,
+    "MYR": 0.213,
+    "VND": 0.000041,
+    "MXN": 0.058,
+    "BRL": 0.20,
+    "ARS": 0.0012,
+    "CLP": 0.00108,
+    "COP": 0.000255,
+    "SEK": 0.095,
+    "NOK": 0.094,
+    "DKK": 0.145,
+    "PLN": 0.25,
+    "CZK": 0.044,
+    "HUF": 0.0028,
+    "RON": 0.217,
+    "ILS": 0.27,
+    "AED": 0.2723,
+    "SAR": 0.2667,
+    "TRY": 0.033,
+    "EGP": 0.032,
+    "ZAR": 0.053,
+    "NGN": 0.0011,
+    "KES": 0.0065,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RateRow:
+    currency: str
+    rate_to_usd: float
+    effective_date: date
+
+
+class RatesSource(Protocol):
+    """Anything that can produce the full rates table in one call."""
+
+    def load(self) -> list[RateRow]:  # pragma: no cover - signature only
+        ...
+
+
+class StaticRatesSource:
+    """Rates from an in-memory mapping; defaults to the bundled table."""
+
+    def __init__(
+        self, rates: dict[str, float] | None = None, effective_date: date = _BUNDLED_EFFECTIVE
+    ) -> None:
+        self._rates = dict(_BUNDLED_RATES if rates is None else rates)
+        self._effective_date = effective_date
+
+    def load(self) -> list[RateRow]:
+        return [RateRow(c, r, self._effective_date) for c, r in self._rates.items()]
+
+
+class CsvRatesSource:
+    """Rates from a local CSV file with ``currency,rate_to_usd,effective_date`` columns."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def load(self) -> list[RateRow]:
+        with self.path.open(newline="", encoding="utf-8") as fh:
+            return [
+                RateRow(
+                    currency=row["currency"].strip().upper(),
+                    rate_to_usd=float(row["rate_to_usd"]),
+                    effective_date=date.fromisoformat(row["effective_date"].strip()),
+                )
+                for row in csv.DictReader(fh)
+            ]
+
+
+class DatabaseRatesSource:
+    """Rates from the ``currency_rates`` table."""
+
+    def __init__(self, session_maker: sessionmaker[Session]) -> None:
+        self._session_maker = session_maker
+
+    def load(self) -> list[RateRow]:
+        with self._session_maker() as session:
+            rows = session.execute(select(CurrencyRate)).scalars().all()
+            return [
+                RateRow(r.currency.upper(), float(r.rate_to_usd), r.effective_date) for r in rows
+            ]
+
+
+class CurrencyConverter:
+    """
+    Converts amounts to USD using an in-memory rates table with effective dates.
+
+    Example:
+        >>> conv = CurrencyConverter(StaticRatesSource({"CAD": 0.75}))
+        >>> conv.convert(100_000, "cad")
+        75000.0
+        >>> conv.convert(100_000, "XYZ") is None
+        True
+    """
+
+    def __init__(
+        self,
+        source: RatesSource,
+        refresh_interval: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._source = source
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._loaded_at: float | None = None
+        # currency -> (sorted effective dates, rates aligned with the dates)
+        self._table: dict[str, tuple[list[date], list[float]]] = {}
+
+    def refresh(self) -> None:
+        """Reload the full rates table from the source."""
+        table: dict[str, list[tuple[date, float]]] = {}
+        skipped = 0
+        for row in self._source.load():
+            code = row.currency.strip().upper()
+            if code not in ISO_4217_CODES or row.rate_to_usd <= 0:
+                skipped += 1
+                continue
+            table.setdefault(code, []).append((row.effective_date, row.rate_to_usd))
+        self._table = {
+            code: ([d for d, _ in sorted(rows)], [r for _, r in sorted(rows)])
+            for code, rows in table.items()
+        }
+        self._loaded_at = self._clock()
+        logger.info("currency.rates_loaded", currencies=len(self._table), skipped=skipped)
+
+    def _ensure_fresh(self) -> None:
+        now = self._clock()
+        if self._loaded_at is None or now - self._loaded_at >= self._refresh_interval:
+            try:
+                self.refresh()
+            except Exception:
+                if self._loaded_at is None:
+                    raise
+                # Keep serving the last good table; retry after another interval
+                logger.exception("currency.rates_refresh_failed")
+                self._loaded_at = now
+
+    @staticmethod
+    def is_iso_code(currency: str) -> bool:
+        return currency.strip().upper() in ISO_4217_CODES
+
+    def rate(self, currency: str, on: date | None = None) -> float | None:
+        """Return USD per unit of ``currency`` effective on ``on`` (default: today).
+
+        Rates dated after ``on`` are not in effect yet, so a published future rate is
+        never used for today's conversions.
+        """
+        self._ensure_fresh()
+        entry = self._table.get(currency.strip().upper())
+        if entry is None:
+            return None
+        dates, rates = entry
+        pos = bisect.bisect_right(dates, on or date.today()) - 1
+        return rates[pos] if pos >= 0 else None
+
+    def convert(self, amount: float, currency: str, on: date | None = None) -> float | None:
+        """Convert ``amount`` to USD, or None if no rate is known for ``currency``."""
+        rate = self.rate(currency, on)
+        return None if rate is None else float(amount) * rate
+
+    def convert_many(
+        self,
+        amounts: Sequence[Any],
+        currencies: Sequence[Any],
+        on: date | None = None,
+        default_currency: str = "USD",
+    ) -> np.ndarray[Any, np.dtype[np.float64]]:
+        """
+        Vectorized conversion of ``(amount, currency)`` pairs to USD.
+
+        Amounts are read like the salary rule reads them (anything ``float()`` accepts,
+        numeric strings included) and currencies as their string form. Rates are looked
+        up once per distinct currency. Missing or non-numeric amounts, unknown
+        currencies, and currencies without a rate yield NaN.
+        """
+        if len(amounts) != len(currencies):
+            raise ValueError("amounts and currencies must have the same length")
+        values = np.fromiter((_to_amount(a) for a in amounts), dtype=np.float64, count=len(amounts))
+        codes = [(str(c) if c else default_currency).strip().upper() for c in currencies]
+        rate_by_code = {code: self.rate(code, on) for code in set(codes)}
+        rates = np.array(
+            [np.nan if rate_by_code[c] is None else rate_by_code[c] for c in codes],
+            dtype=np.float64,
+        )
+        return values * rates
+
+    def to_annual_usd_many(
+        self,
+        amounts: Sequence[Any],
+        currencies: Sequence[Any],
+        units: Sequence[Any],
+        on: date | None = None,
+    ) -> np.ndarray[Any, np.dtype[np.float64]]:
+        """Vectorized annualized USD amounts; unknown pay units are treated as annual."""
+        factors = np.array(
+            [ANNUALIZATION_FACTORS.get(str(u or "annual").strip().lower(), 1.0) for u in units],
+            dtype=np.float64,
+        )
+        return self.convert_many(amounts, currencies, on) * factors
+
+
+def _to_amount(value: Any) -> float:
+    """
+    ``float(value)``, or NaN when the value is missing or not numeric.
+
+    Examples:
+        >>> _to_amount("120000"), _to_amount(None), _to_amount("n/a")
+        (120000.0, nan, nan)
+    """
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+@lru_cache(maxsize=1)
+def get_currency_converter() -> CurrencyConverter:
+    """
+    Return the shared converter configured from settings.
+
+    ``CURRENCY_RATES_SOURCE`` selects the table: "bundled" (default), "db" for the
+    ``currency_rates`` table, or a path to a CSV file.
+    """
+    settings = get_settings()
+    source_name = settings.currency_rates_source
+    source: RatesSource
+    if source_name == "bundled":
+        source = StaticRatesSource()
+    elif source_name == "db":
+        source = DatabaseRatesSource(get_sessionmaker(get_engine(settings.database_url)))
+    else:
+        source = CsvRatesSource(source_name)
+    return CurrencyConverter(source, refresh_interval=settings.currency_rates_refresh_seconds)
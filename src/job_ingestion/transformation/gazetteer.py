@@ -0,0 +1,527 @@
+"""Bundled offline gazetteer for location normalization.
+
+The dataset covers countries (ISO 3166-1 alpha-2/alpha-3 codes plus common aliases),
+US states and territories, Canadian provinces and territories, and the cities that
+dominate job postings. Cities and regions carry approximate centroid coordinates,
+which also back the reverse geocoder.
+
+The tables are indexed on first use into plain dicts keyed by a normalized lookup key
+(casefolded, dots removed, whitespace collapsed), so resolving a name costs one hash
+lookup. No network access is ever performed.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+__all__ = [
+    "Country",
+    "Region",
+    "City",
+    "Gazetteer",
+    "get_gazetteer",
+    "lookup_key",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class Country:
+    code: str
+    code3: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class Region:
+    code: str
+    name: str
+    country_code: str
+    latitude: float | None = None
+    longitude: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class City:
+    name: str
+    region_code: str | None
+    country_code: str
+    latitude: float
+    longitude: float
+
+
+# (alpha-2, alpha-3, name, extra aliases)
+_COUNTRIES: tuple[tuple[str, str, str, tuple[str, ...]], ...] = (
+    ("US", "USA", "United States", ("United States of America", "U.S.", "U.S.A.", "America")),
+    ("CA", "CAN", "Canada", ()),
+    ("MX", "MEX", "Mexico", ("México",)),
+    (
+        "GB",
+        "GBR",
+        "United Kingdom",
+        (
+            "UK",
+            "U.K.",
+            "Great Britain",
+            "Britain",
+            "England",
+            "Scotland",
+            "Wales",
+            "Northern Ireland",
+        ),
+    ),
+    ("IE", "IRL", "Ireland", ("Republic of Ireland",)),
+    ("FR", "FRA", "France", ()),
+    ("DE", "DEU", "Germany", ("Deutschland",)),
+    ("NL", "NLD", "Netherlands", ("The Netherlands", "Holland")),
+    ("BE", "BEL", "Belgium", ()),
+    ("LU", "LUX", "Luxembourg", ()),
+    ("CH", "CHE", "Switzerland", ()),
+    ("AT", "AUT", "Austria", ()),
+    ("ES", "ESP", "Spain", ("España",)),
+    ("PT", "PRT", "Portugal", ()),
+    ("IT", "ITA", "Italy", ("Italia",)),
+    ("GR", "GRC", "Greece", ()),
+    ("DK", "DNK", "Denmark", ()),
+    ("SE", "SWE", "Sweden", ()),
+    ("NO", "NOR", "Norway", ()),
+    ("FI", "FIN", "Finland", ()),
+    ("IS", "ISL", "Iceland", ()),
+    ("PL", "POL", "Poland", ()),
+    ("CZ", "CZE", "Czech Republic", ("Czechia",)),
+    ("SK", "SVK", "Slovakia", ()),
+    ("HU", "HUN", "Hungary", ()),
+    ("RO", "ROU", "Romania", ()),
+    ("BG", "BGR", "Bulgaria", ()),
+    ("HR", "HRV", "Croatia", ()),
+    ("SI", "SVN", "Slovenia", ()),
+    ("RS", "SRB", "Serbia", ()),
+    ("UA", "UKR", "Ukraine", ()),
+    ("EE", "EST", "Estonia", ()),
+    ("LV", "LVA", "Latvia", ()),
+    ("LT", "LTU", "Lithuania", ()),
+    ("RU", "RUS", "Russia", ("Russian Federation",)),
+    ("TR", "TUR", "Turkey", ("Türkiye", "Turkiye")),
+    ("IL", "ISR", "Israel", ()),
+    ("AE", "ARE", "United Arab Emirates", ("UAE",)),
+    ("SA", "SAU", "Saudi Arabia", ()),
+    ("QA", "QAT", "Qatar", ()),
+    ("EG", "EGY", "Egypt", ()),
+    ("MA", "MAR", "Morocco", ()),
+    ("NG", "NGA", "Nigeria", ()),
+    ("KE", "KEN", "Kenya", ()),
+    ("ZA", "ZAF", "South Africa", ()),
+    ("IN", "IND", "India", ()),
+    ("PK", "PAK", "Pakistan", ()),
+    ("BD", "BGD", "Bangladesh", ()),
+    ("LK", "LKA", "Sri Lanka", ()),
+    ("CN", "CHN", "China", ("People's Republic of China", "PRC")),
+    ("HK", "HKG", "Hong Kong", ()),
+    ("TW", "TWN", "Taiwan", ()),
+    ("JP", "JPN", "Japan", ()),
+    ("KR", "KOR", "South Korea", ("Korea", "Republic of Korea")),
+    ("SG", "SGP", "Singapore", ()),
+    ("MY", "MYS", "Malaysia", ()),
+    ("TH", "THA", "Thailand", ()),
+    ("VN", "VNM", "Vietnam", ("Viet Nam",)),
+    ("PH", "PHL", "Philippines", ()),
+    ("ID", "IDN", "Indonesia", ()),
+    ("AU", "AUS", "Australia", ()),
+    ("NZ", "NZL", "New Zealand", ()),
+    ("BR", "BRA", "Brazil", ("Brasil",)),
+    ("AR", "ARG", "Argentina", ()),
+    ("CL", "CHL", "Chile", ()),
+    ("CO", "COL", "Colombia", ()),
+    ("PE", "PER", "Peru", ()),
+    ("UY", "URY", "Uruguay", ()),
+    ("CR", "CRI", "Costa Rica", ()),
+    ("PA", "PAN", "Panama", ()),
+    ("DO", "DOM", "Dominican Republic", ()),
+    ("JM", "JAM", "Jamaica", ()),
+)
+
+# (code, name, country alpha-2)
+_REGIONS: tuple[tuple[str, str, str], ...] = (
+    ("AL", "Alabama", "US"),
+    ("AK", "Alaska", "US"),
+    ("AZ", "Arizona", "US"),
+    ("AR", "Arkansas", "US"),
+    ("CA", "California", "US"),
+    ("CO", "Colorado", "US"),
+    ("CT", "Connecticut", "US"),
+    ("DE", "Delaware", "US"),
+    ("DC", "District of Columbia", "US"),
+    ("FL", "Florida", "US"),
+    ("GA", "Georgia", "US"),
+    ("HI", "Hawaii", "US"),
+    ("ID", "Idaho", "US"),
+    ("IL", "Illinois", "US"),
+    ("IN", "Indiana", "US"),
+    ("IA", "Iowa", "US"),
+    ("KS", "Kansas", "US"),
+    ("KY", "Kentucky", "US"),
+    ("LA", "Louisiana", "US"),
+    ("ME", "Maine", "US"),
+    ("MD", "Maryland", "US"),
+    ("MA", "Massachusetts", "US"),
+    ("MI", "Michigan", "US"),
+    ("MN", "Minnesota", "US"),
+    ("MS", "Mississippi", "US"),
+    ("MO", "Missouri", "US"),
+    ("MT", "Montana", "US"),
+    ("NE", "Nebraska", "US"),
+    ("NV", "Nevada", "US"),
+    ("NH", "New Hampshire", "US"),
+    ("NJ", "New Jersey", "US"),
+    ("NM", "New Mexico", "US"),
+    ("NY", "New York", "US"),
+    ("NC", "North Carolina", "US"),
+    ("ND", "North Dakota", "US"),
+    ("OH", "Ohio", "US"),
+    ("OK", "Oklahoma", "US"),
+    ("OR", "Oregon", "US"),
+    ("PA", "Pennsylvania", "US"),
+    ("RI", "Rhode Island", "US"),
+    ("SC", "South Carolina", "US"),
+    ("SD", "South Dakota", "US"),
+    ("TN", "Tennessee", "US"),
+    ("TX", "Texas", "US"),
+    ("UT", "Utah", "US"),
+    ("VT", "Vermont", "US"),
+    ("VA", "Virginia", "US"),
+    ("WA", "Washington", "US"),
+    ("WV", "West Virginia", "US"),
+    ("WI", "Wisconsin", "US"),
+    ("WY", "Wyoming", "US"),
+    ("PR", "Puerto Rico", "US"),
+    ("GU", "Guam", "US"),
+    ("VI", "U.S. Virgin Islands", "US"),
+    ("AB", "Alberta", "CA"),
+    ("BC", "British Columbia", "CA"),
+    ("MB", "Manitoba", "CA"),
+    ("NB", "New Brunswick", "CA"),
+    ("NL", "Newfoundland and Labrador", "CA"),
+    ("NS", "Nova Scotia", "CA"),
+    ("NT", "Northwest Territories", "CA"),
+    ("NU", "Nunavut", "CA"),
+    ("ON", "Ontario", "CA"),
+    ("PE", "Prince Edward Island", "CA"),
+    ("QC", "Quebec", "CA"),
+    ("SK", "Saskatchewan", "CA"),
+    ("YT", "Yukon", "CA"),
+)
+
+# Approximate geographic centroids (latitude, longitude) per region
+_REGION_CENTROIDS: dict[tuple[str, str], tuple[float, float]] = {
+    ("US", "AL"): (32.80, -86.79),
+    ("US", "AK"): (61.37, -152.40),
+    ("US", "AZ"): (34.29, -111.66),
+    ("US", "AR"): (34.90, -92.44),
+    ("US", "CA"): (37.18, -119.47),
+    ("US", "CO"): (38.99, -105.55),
+    ("US", "CT"): (41.62, -72.73),
+    ("US", "DE"): (38.99, -75.51),
+    ("US", "DC"): (38.90, -77.02),
+    ("US", "FL"): (28.63, -82.45),
+    ("US", "GA"): (32.64, -83.44),
+    ("US", "HI"): (20.29, -156.37),
+    ("US", "ID"): (44.35, -114.61),
+    ("US", "IL"): (40.04, -89.20),
+    ("US", "IN"): (39.89, -86.28),
+    ("US", "IA"): (42.08, -93.50),
+    ("US", "KS"): (38.49, -98.38),
+    ("US", "KY"): (37.53, -85.30),
+    ("US", "LA"): (31.07, -92.00),
+    ("US", "ME"): (45.37, -69.24),
+    ("US", "MD"): (39.06, -76.80),
+    ("US", "MA"): (42.26, -71.81),
+    ("US", "MI"): (44.35, -85.41),
+    ("US", "MN"): (46.28, -94.31),
+    ("US", "MS"): (32.74, -89.67),
+    ("US", "MO"): (38.36, -92.46),
+    ("US", "MT"): (47.05, -109.63),
+    ("US", "NE"): (41.54, -99.80),
+    ("US", "NV"): (39.33, -116.63),
+    ("US", "NH"): (43.68, -71.58),
+    ("US", "NJ"): (40.19, -74.67),
+    ("US", "NM"): (34.41, -106.11),
+    ("US", "NY"): (42.95, -75.53),
+    ("US", "NC"): (35.56, -79.39),
+    ("US", "ND"): (47.45, -100.47),
+    ("US", "OH"): (40.29, -82.79),
+    ("US", "OK"): (35.59, -97.49),
+    ("US", "OR"): (43.93, -120.56),
+    ("US", "PA"): (40.88, -77.80),
+    ("US", "RI"): (41.68, -71.56),
+    ("US", "SC"): (33.92, -80.90),
+    ("US", "SD"): (44.44, -100.23),
+    ("US", "TN"): (35.86, -86.35),
+    ("US", "TX"): (31.48, -99.33),
+    ("US", "UT"): (39.31, -111.67),
+    ("US", "VT"): (44.07, -72.67),
+    ("US", "VA"): (37.52, -78.85),
+    ("US", "WA"): (47.38, -120.45),
+    ("US", "WV"): (38.64, -80.62),
+    ("US", "WI"): (44.62, -89.99),
+    ("US", "WY"): (42.99, -107.55),
+    ("US", "PR"): (18.22, -66.59),
+    ("US", "GU"): (13.44, 144.79),
+    ("US", "VI"): (18.34, -64.90),
+    ("CA", "AB"): (55.00, -115.00),
+    ("CA", "BC"): (53.73, -127.65),
+    ("CA", "MB"): (55.00, -97.00),
+    ("CA", "NB"): (46.50, -66.16),
+    ("CA", "NL"): (53.14, -57.66),
+    ("CA", "NS"): (45.00, -63.00),
+    ("CA", "NT"): (64.83, -119.18),
+    ("CA", "NU"): (70.30, -83.11),
+    ("CA", "ON"): (50.00, -85.00),
+    ("CA", "PE"): (46.39, -63.20),
+    ("CA", "QC"): (52.94, -73.55),
+    ("CA", "SK"): (54.00, -106.00),
+    ("CA", "YT"): (64.28, -135.00),
+}
+
+_REGION_ALIASES: dict[tuple[str, str], tuple[str, ...]] = {
+    ("US", "DC"): ("Washington DC", "Washington D.C.", "D.C."),
+    ("CA", "QC"): ("Québec", "PQ"),
+    ("CA", "NL"): ("Newfoundland", "NF"),
+    ("CA", "PE"): ("PEI",),
+}
+
+# (name, region code, country alpha-2, latitude, longitude); the first entry for a
+# shared name is the default when a location gives the city alone.
+_CITIES: tuple[tuple[str, str | None, str, float, float], ...] = (
+    ("New York", "NY", "US", 40.7128, -74.0060),
+    ("Los Angeles", "CA", "US", 34.0522, -118.2437),
+    ("Chicago", "IL", "US", 41.8781, -87.6298),
+    ("Houston", "TX", "US", 29.7604, -95.3698),
+    ("Phoenix", "AZ", "US", 33.4484, -112.0740),
+    ("Philadelphia", "PA", "US", 39.9526, -75.1652),
+    ("San Antonio", "TX", "US", 29.4241, -98.4936),
+    ("San Diego", "CA", "US", 32.7157, -117.1611),
+    ("Dallas", "TX", "US", 32.7767, -96.7970),
+    ("San Jose", "CA", "US", 37.3382, -121.8863),
+    ("Austin", "TX", "US", 30.2672, -97.7431),
+    ("Jacksonville", "FL", "US", 30.3322, -81.6557),
+    ("Fort Worth", "TX", "US", 32.7555, -97.3308),
+    ("Columbus", "OH", "US", 39.9612, -82.9988),
+    ("Charlotte", "NC", "US", 35.2271, -80.8431),
+    ("San Francisco", "CA", "US", 37.7749, -122.4194),
+    ("Indianapolis", "IN", "US", 39.7684, -86.1581),
+    ("Seattle", "WA", "US", 47.6062, -122.3321),
+    ("Denver", "CO", "US", 39.7392, -104.9903),
+    ("Washington", "DC", "US", 38.9072, -77.0369),
+    ("Boston", "MA", "US", 42.3601, -71.0589),
+    ("Nashville", "TN", "US", 36.1627, -86.7816),
+    ("Detroit", "MI", "US", 42.3314, -83.0458),
+    ("Portland", "OR", "US", 45.5152, -122.6784),
+    ("Portland", "ME", "US", 43.6591, -70.2568),
+    ("Las Vegas", "NV", "US", 36.1699, -115.1398),
+    ("Memphis", "TN", "US", 35.1495, -90.0490),
+    ("Louisville", "KY", "US", 38.2527, -85.7585),
+    ("Baltimore", "MD", "US", 39.2904, -76.6122),
+    ("Milwaukee", "WI", "US", 43.0389, -87.9065),
+    ("Albuquerque", "NM", "US", 35.0844, -106.6504),
+    ("Tucson", "AZ", "US", 32.2226, -110.9747),
+    ("Sacramento", "CA", "US", 38.5816, -121.4944),
+    ("Kansas City", "MO", "US", 39.0997, -94.5786),
+    ("Atlanta", "GA", "US", 33.7490, -84.3880),
+    ("Miami", "FL", "US", 25.7617, -80.1918),
+    ("Raleigh", "NC", "US", 35.7796, -78.6382),
+    ("Omaha", "NE", "US", 41.2565, -95.9345),
+    ("Minneapolis", "MN", "US", 44.9778, -93.2650),
+    ("Saint Paul", "MN", "US", 44.9537, -93.0900),
+    ("Tampa", "FL", "US", 27.9506, -82.4572),
+    ("Orlando", "FL", "US", 28.5383, -81.3792),
+    ("New Orleans", "LA", "US", 29.9511, -90.0715),
+    ("Cleveland", "OH", "US", 41.4993, -81.6944),
+    ("Cincinnati", "OH", "US", 39.1031, -84.5120),
+    ("Pittsburgh", "PA", "US", 40.4406, -79.9959),
+    ("St. Louis", "MO", "US", 38.6270, -90.1994),
+    ("Salt Lake City", "UT", "US", 40.7608, -111.8910),
+    ("Oakland", "CA", "US", 37.8044, -122.2712),
+    ("Palo Alto", "CA", "US", 37.4419, -122.1430),
+    ("Mountain View", "CA", "US", 37.3861, -122.0839),
+    ("Sunnyvale", "CA", "US", 37.3688, -122.0363),
+    ("Santa Clara", "CA", "US", 37.3541, -121.9552),
+    ("Menlo Park", "CA", "US", 37.4530, -122.1817),
+    ("Irvine", "CA", "US", 33.6846, -117.8265),
+    ("Bellevue", "WA", "US", 47.6101, -122.2015),
+    ("Redmond", "WA", "US", 47.6740, -122.1215),
+    ("Cambridge", "MA", "US", 42.3736, -71.1097),
+    ("Arlington", "VA", "US", 38.8816, -77.0910),
+    ("Richmond", "VA", "US", 37.5407, -77.4360),
+    ("Jersey City", "NJ", "US", 40.7178, -74.0431),
+    ("Newark", "NJ", "US", 40.7357, -74.1724),
+    ("Brooklyn", "NY", "US", 40.6782, -73.9442),
+    ("Boulder", "CO", "US", 40.0150, -105.2705),
+    ("Durham", "NC", "US", 35.9940, -78.8986),
+    ("Buffalo", "NY", "US", 42.8864, -78.8784),
+    ("El Paso", "TX", "US", 31.7619, -106.4850),
+    ("Honolulu", "HI", "US", 21.3069, -157.8583),
+    ("Anchorage", "AK", "US", 61.2181, -149.9003),
+    ("San Juan", "PR", "US", 18.4655, -66.1057),
+    ("Toronto", "ON", "CA", 43.6532, -79.3832),
+    ("Montreal", "QC", "CA", 45.5017, -73.5673),
+    ("Vancouver", "BC", "CA", 49.2827, -123.1207),
+    ("Calgary", "AB", "CA", 51.0447, -114.0719),
+    ("Edmonton", "AB", "CA", 53.5461, -113.4938),
+    ("Ottawa", "ON", "CA", 45.4215, -75.6972),
+    ("Winnipeg", "MB", "CA", 49.8951, -97.1384),
+    ("Quebec City", "QC", "CA", 46.8139, -71.2080),
+    ("Hamilton", "ON", "CA", 43.2557, -79.8711),
+    ("Mississauga", "ON", "CA", 43.5890, -79.6441),
+    ("Kitchener", "ON", "CA", 43.4516, -80.4925),
+    ("Waterloo", "ON", "CA", 43.4643, -80.5204),
+    ("Halifax", "NS", "CA", 44.6488, -63.5752),
+    ("Victoria", "BC", "CA", 48.4284, -123.3656),
+    ("Saskatoon", "SK", "CA", 52.1332, -106.6700),
+    ("Regina", "SK", "CA", 50.4452, -104.6189),
+    ("Windsor", "ON", "CA", 42.3149, -83.0364),
+    ("St. John's", "NL", "CA", 47.5615, -52.7126),
+    ("London", None, "GB", 51.5074, -0.1278),
+    ("London", "ON", "CA", 42.9849, -81.2453),
+    ("Manchester", None, "GB", 53.4808, -2.2426),
+    ("Edinburgh", None, "GB", 55.9533, -3.1883),
+    ("Dublin", None, "IE", 53.3498, -6.2603),
+    ("Paris", None, "FR", 48.8566, 2.3522),
+    ("Berlin", None, "DE", 52.5200, 13.4050),
+    ("Munich", None, "DE", 48.1351, 11.5820),
+    ("Amsterdam", None, "NL", 52.3676, 4.9041),
+    ("Zurich", None, "CH", 47.3769, 8.5417),
+    ("Madrid", None, "ES", 40.4168, -3.7038),
+    ("Barcelona", None, "ES", 41.3851, 2.1734),
+    ("Lisbon", None, "PT", 38.7223, -9.1393),
+    ("Milan", None, "IT", 45.4642, 9.1900),
+    ("Rome", None, "IT", 41.9028, 12.4964),
+    ("Stockholm", None, "SE", 59.3293, 18.0686),
+    ("Copenhagen", None, "DK", 55.6761, 12.5683),
+    ("Warsaw", None, "PL", 52.2297, 21.0122),
+    ("Tel Aviv", None, "IL", 32.0853, 34.7818),
+    ("Dubai", None, "AE", 25.2048, 55.2708),
+    ("Bangalore", None, "IN", 12.9716, 77.5946),
+    ("Bengaluru", None, "IN", 12.9716, 77.5946),
+    ("Mumbai", None, "IN", 19.0760, 72.8777),
+    ("Hyderabad", None, "IN", 17.3850, 78.4867),
+    ("Singapore", None, "SG", 1.3521, 103.8198),
+    ("Tokyo", None, "JP", 35.6762, 139.6503),
+    ("Seoul", None, "KR", 37.5665, 126.9780),
+    ("Shanghai", None, "CN", 31.2304, 121.4737),
+    ("Beijing", None, "CN", 39.9042, 116.4074),
+    ("Hong Kong", None, "HK", 22.3193, 114.1694),
+    ("Sydney", None, "AU", -33.8688, 151.2093),
+    ("Melbourne", None, "AU", -37.8136, 144.9631),
+    ("Auckland", None, "NZ", -36.8485, 174.7633),
+    ("Mexico City", None, "MX", 19.4326, -99.1332),
+    ("Guadalajara", None, "MX", 20.6597, -103.3496),
+    ("Tijuana", None, "MX", 32.5149, -117.0382),
+    ("Ciudad Juarez", None, "MX", 31.6904, -106.4245),
+    ("Sao Paulo", None, "BR", -23.5505, -46.6333),
+    ("Buenos Aires", None, "AR", -34.6037, -58.3816),
+    ("Bogota", None, "CO", 4.7110, -74.0721),
+    ("Lagos", None, "NG", 6.5244, 3.3792),
+    ("Nairobi", None, "KE", -1.2921, 36.8219),
+    ("Cape Town", None, "ZA", -33.9249, 18.4241),
+    ("Johannesburg", None, "ZA", -26.2041, 28.0473),
+)
+
+_CITY_ALIASES: dict[str, tuple[str, ...]] = {
+    "New York": ("NYC", "New York City", "Manhattan"),
+    "Los Angeles": ("LA",),
+    "San Francisco": ("SF",),
+    "Washington": ("Washington DC", "Washington D.C."),
+    "Saint Paul": ("St. Paul", "St Paul"),
+    "St. Louis": ("Saint Louis",),
+    "Montreal": ("Montréal",),
+    "Ciudad Juarez": ("Ciudad Juárez", "Juarez", "Juárez"),
+    "Quebec City": ("Québec City", "Ville de Québec"),
+    "Zurich": ("Zürich",),
+    "Munich": ("München",),
+    "Sao Paulo": ("São Paulo",),
+    "Bogota": ("Bogotá",),
+}
+
+_KEY_DOTS_RE = re.compile(r"\.")
+_KEY_WS_RE = re.compile(r"\s+")
+
+
+def lookup_key(text: str) -> str:
+    """Return the normalized key used for every gazetteer index."""
+    return _KEY_WS_RE.sub(" ", _KEY_DOTS_RE.sub("", text)).strip().casefold()
+
+
+class Gazetteer:
+    """
+    Hash indexes over the bundled country, region, and city tables.
+
+    Each index maps a `lookup_key` to the matching entries, so name and alias
+    resolution is a single dict lookup. Region and city indexes hold lists because
+    names and codes are shared across countries (e.g., "London", "CA").
+    """
+
+    def __init__(self) -> None:
+        self.countries_by_code: dict[str, Country] = {}
+        self._countries: dict[str, Country] = {}
+        self._regions: dict[str, list[Region]] = {}
+        self._regions_by_code: dict[tuple[str, str], Region] = {}
+        self._cities: dict[str, list[City]] = {}
+        self.cities: list[City] = []
+
+        for code, code3, name, aliases in _COUNTRIES:
+            country = Country(code=code, code3=code3, name=name)
+            self.countries_by_code[code] = country
+            for alias in (code, code3, name, *aliases):
+                self._countries.setdefault(lookup_key(alias), country)
+
+        for code, name, country_code in _REGIONS:
+            lat_lon = _REGION_CENTROIDS.get((country_code, code))
+            region = Region(
+                code=code,
+                name=name,
+                country_code=country_code,
+                latitude=lat_lon[0] if lat_lon else None,
+                longitude=lat_lon[1] if lat_lon else None,
+            )
+            self._regions_by_code[(country_code, code)] = region
+            for alias in (code, name, *_REGION_ALIASES.get((country_code, code), ())):
+                self._regions.setdefault(lookup_key(alias), []).append(region)
+
+        for name, region_code, country_code, lat, lon in _CITIES:
+            city = City(
+                name=name,
+                region_code=region_code,
+                country_code=country_code,
+                latitude=lat,
+                longitude=lon,
+            )
+            self.cities.append(city)
+            for alias in (name, *_CITY_ALIASES.get(name, ())):
+                self._cities.setdefault(lookup_key(alias), []).append(city)
+
+    @property
+    def regions_all(self) -> list[Region]:
+        """Every region in the dataset, in table order."""
+        return list(self._regions_by_code.values())
+
+    def country(self, text: str) -> Country | None:
+        """Resolve a country name, alias, or ISO alpha-2/alpha-3 code."""
+        return self._countries.get(lookup_key(text))
+
+    def regions(self, text: str) -> list[Region]:
+        """Return every region whose code, name, or alias matches ``text``."""
+        return self._regions.get(lookup_key(text), [])
+
+    def region(self, country_code: str, region_code: str) -> Region | None:
+        return self._regions_by_code.get((country_code, region_code))
+
+    def cities_named(self, text: str) -> list[City]:
+        """Return every city whose name or alias matches ``text`` (default first)."""
+        return self._cities.get(lookup_key(text), [])
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    """Return the process-wide gazetteer, building its indexes on first use."""
+    return Gazetteer()
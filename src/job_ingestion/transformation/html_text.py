@@ -0,0 +1,150 @@
+"""Streaming HTML-to-text extraction for job descriptions.
+
+Descriptions such as ``fullDescription`` arrive as HTML. `HtmlTextExtractor` is an
+incremental `html.parser.HTMLParser` that keeps only text content: markup is dropped,
+entities are decoded, ``script``/``style``-like elements are skipped entirely, and
+block-level elements become line breaks. Text fragments are appended to a list and
+joined once at the end, so cost stays linear in the input size.
+
+`extract_text` returns the plain text together with its length and word count, which
+are computed once at ingest and stored alongside the job.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+
+__all__ = ["ExtractedText", "HtmlTextExtractor", "extract_text"]
+
+# Elements whose content is never visible text
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template", "head", "svg", "iframe"})
+
+# Elements that start a new line in rendered text
+_BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "br",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    }
+)
+
+_INLINE_WS_RE = re.compile(r"[^\S\n]+")
+_LINE_EDGE_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+_WORD_RE = re.compile(r"\w[\w'’-]*")
+_MARKUP_HINT_RE = re.compile(r"[<&]")
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractedText:
+    text: str
+    length: int
+    word_count: int
+
+
+class HtmlTextExtractor(HTMLParser):
+    """
+    Incremental HTML text extractor.
+
+    Feed markup in one or more chunks with `feed`, then call `text` once.
+
+    Example:
+        >>> parser = HtmlTextExtractor()
+        >>> parser.feed("<p>Hello&nbsp;<b>world</b></p><script>x()</script><p>Bye")
+        >>> parser.text()
+        'Hello world\\nBye'
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+            if tag == "li":
+                self._parts.append("- ")
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        # Self-closing tags never open a skipped region
+        if tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            # Line breaks in markup source are ordinary whitespace
+            self._parts.append(data.replace("\r", " ").replace("\n", " "))
+
+    def text(self) -> str:
+        """Flush pending input and return normalized plain text."""
+        self.close()
+        return _normalize_whitespace("".join(self._parts))
+
+
+def _normalize_whitespace(raw: str) -> str:
+    text = _INLINE_WS_RE.sub(" ", raw.replace("\xa0", " "))
+    text = _LINE_EDGE_RE.sub("\n", text)
+    return _BLANK_LINES_RE.sub("\n", text).strip()
+
+
+def extract_text(value: str | None) -> ExtractedText | None:
+    """
+    Convert an HTML (or plain text) description to plain text with its statistics.
+
+    Returns None for missing values. Input without ``<`` or ``&`` skips the parser.
+
+    Example:
+        >>> extract_text("<ul><li>Python</li><li>SQL &amp; ETL</li></ul>")
+        ExtractedText(text='- Python\\n- SQL & ETL', length=20, word_count=3)
+    """
+    if value is None:
+        return None
+    if _MARKUP_HINT_RE.search(value) is None:
+        text = _normalize_whitespace(value)
+    else:
+        parser = HtmlTextExtractor()
+        parser.feed(value)
+        text = parser.text()
+    return ExtractedText(text=text, length=len(text), word_count=len(_WORD_RE.findall(text)))
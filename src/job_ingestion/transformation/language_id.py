@@ -0,0 +1,318 @@
+"""Offline character-trigram language identification.
+
+Each bundled language profile is the ranked list of its most frequent character
+trigrams, stored compactly as one string of fixed-width 3-character entries (word
+boundaries written as ``_``). On first use the profiles are indexed into a trigram
+vocabulary and a ``(languages, vocabulary + 1)`` matrix of log-probabilities, where a
+trigram's probability falls off with its rank (Zipf) and the last column scores
+trigrams outside a language's profile.
+
+Classifying a text sums those log-probabilities over its trigrams and picks the best
+language. Only the first ``max_chars`` characters are read, which keeps a title plus
+description well under a millisecond; results are cached by a hash of that content.
+`LanguageIdentifier.detect_many` scores a whole chunk with a handful of NumPy
+``bincount`` passes.
+
+The profiles distinguish English and French from the other bundled languages
+(Spanish, German, Italian, Portuguese, Dutch); a text too short to judge, or whose
+best and second-best languages score too close, is not classified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = [
+    "LanguageGuess",
+    "LanguageIdentifier",
+    "build_profile",
+    "get_language_identifier",
+    "trigrams",
+]
+
+PROFILE_SIZE = 300
+
+# Ranked trigram profiles, 3 characters per entry, most frequent first; built with
+# `build_profile` from job-posting style sample text in each language
+_PROFILES: dict[str, str] = {
+    "en": (
+        "_an_thandnd_the_rehe_ng_ing_wiention_coer_on_th_atill_or_tio_ofin_ithts_wit_a_al_ce_"
+        "ed_our_in_st_yoarecomforicaof_re_ur_you_pr_teateerses_le_ly_menrs__fo_ou_to_woan_at_"
+        "blecalieniveleancenicnt_orkou_perprorecterty_ve__ca_de_di_fi_is_or_pa_se_weancassill"
+        "ireis_ityomponsresstastetatto_wor_ar_as_cl_he_whallequerihatistitilitme_ms_ntantsoun"
+        "rierk_te_tinualuniwil_ac_ap_be_en_ha_le_ma_me_ne_op_pl_po_qu_sa_sh_ti_waablaccainany"
+        "appbilcancatccochnclecolcoudayde_derds_ducealeameareatechecoecteloelyemseraestet_eve"
+        "finhelhnihouiceidaideiftiliimeld_lifmpamplns_nsintiny_oduomeoripanpatplaplipplprequi"
+        "ratrd_redregreqrodssist_stostrteatectemtesthatietimuctuesuntus_ust_al_at_ba_bu_ch_cu"
+        "_do_em_ex_ho_id_jo_li_lo_no_pe_sc_so_syabiad_aidakealaaltam_ansantardartas_atuaysbut"
+        "ceiciacluconct_ctscusdatdesdevdiddirdiseaneaseceeetehoeivelielpemeempen_encendervesi"
+        "espetieviexpginhapheaherhipho_holiblid_igiignildinainciorip_"
+    ),
+    "fr": (
+        "es_ent_dede__lelesnt__etet__core_ionle__prmenns_ts__la_re_unla_on_oustious__noatier_"
+        "_en_à_ce_desiennceproqui_au_l_comemeonsrs_un__d__quancen_ez_irelletre_pa_po_se_tr_vo"
+        "airiténtsposrestraté_voués__av_di_ma_pl_réaveec_eraestipelitne_nounteompraivec_éqait"
+        "ansau_bilblecipconduiellespeuricail_iliit_mesoinourparponprequera_rerrodsertesui_uit"
+        "ursvelèmeéqu_ai_ap_cl_dé_ex_fa_il_mo_syabiablailal_alaandantavacatcoldendredévectelo"
+        "encersiciillimeinsistiteitsitulenlopmptncinotnsantroduommoncoppossotrpatpe_pleppepré"
+        "ravrenreproirépsabsenspossitatte_temueruipuneuniur_ux_vaiveréve_an_bi_ce_da_do_du_es"
+        "_fi_ga_in_jo_pe_sa_so_te_ve_éc_ét_évaboaieainaliappardartassat_ateautauxbieblèborcan"
+        "ceschachecieclicricurdandiedirdisdu_einel_emaempereerveveexpficforfrogarglegneiceiel"
+        "ierifiignin_incineioripaiquissiséièrjoijoulablaileilerlexliellalèmmaimanmatme_mmumpl"
+        "munnanndengénisnnanosntantioblodiollondonnoproraoreormos_ost"
+    ),
+    "es": (
+        "os__dede_es__y_as_entar_en__coientra_reres_es_la_lo_seacidesestlosntastr_en_pr_trado"
+        "an_blenteor_ra_to__a__di_ma_pa_unconespiciidaio_iónlasncirecuesón__al_ca_nu_poabaabl"
+        "bilcamciaciociódaddisdosel_ia_iliistla_le_mannueparponpreprorá_spotesun__el_ha_plade"
+        "al_antaráatabajcomdoreguemaeneeraesaescimpinalidmenna_nsantoon_onsplapo_porquirabrar"
+        "ro_sabsarse_sertieuni_do_eq_ex_in_ju_li_me_of_or_qu_so_tiabiacaadaajaalaalmamianaanc"
+        "anearaariarrcaccalciecinco_ctocuedicduceceeciencequer_eroerveñagurhacibiicaierilainc"
+        "ioriosipoisejarlablanlarleslimllalmamacmasmieminmosmpinanndenernesniooduollompontora"
+        "orepacperqueranratrenreprgaribrieriorobrodrolrosrrorviscasegseñstasteta_tadtantartas"
+        "tentostrouaructue_ueluipvicños_ad_am_ap_as_at_añ_bi_br_bu_ci_cl_cr_cu_có_dí_ev_fi_fl"
+        "_fr_ge_gu_ho_id_im_mo_mé_ne_ni_op_pu_sa_si_su_sé_us_va_ár_únaboaceacéacíad_admadrafo"
+        "agaajoallaluamaambameamoandanianqaprardareargartaseasiasoate"
+    ),
+    "de": (
+        "en__unie_und_dier_nd_dieichteneit_dederng_ungver_si_veereberch_denersnde_be_zuste_vo"
+        "altarbbeicheenternes_hreiteliclt_ltensentwon_rbereirensersiete__an_ar_ei_mi_te_waach"
+        "ageahreileinem_etegenin_it_itsle_menmitrn_schsenteiunsvonwar_au_er_fü_ge_ha_ko_la_sa"
+        "_wian_antareaubausbenckleicenseraerfgerhalhenhigickienindinelernennteorgranre_reurun"
+        "se_sicssetertwiuchwiczeizu__da_en_es_fr_in_ja_ka_na_pr_ru_sc_st_we_übaftam_amsandass"
+        "atibetchkchsdasde_deseameibellenderberuestetrfahflefreft_fähfürge_gehhe_hmehseibeige"
+        "ikailtionir_jahkalkeiklekonkrakunlagms_nacngeortprorderemresrfargeriero_rsersorstrte"
+        "rtlsamsausfäsorteateltemtiotlitretwoubeur_werwirworzurähiübeür__ab_al_am_bi_bu_bü_co"
+        "_du_fe_fl_gi_gu_id_ih_im_is_ki_kr_ku_le_me_mo_mö_ne_pa_pf_pl_sk_so_su_sy_ta_um_ur_wo"
+        "_wü_zw_änab_abeabrabsagtahlahmalealiameammanaangankar_artas_at_attaufbarbedbeubewbez"
+        "biebleblibrebscbsfbucbürce_chachhchlchnchrchtchuchwcoddatdea"
+    ),
+    "it": (
+        "no__e__dila__deiondi_re_ne_onestr_co_la_rebildelellle_to_zioareazientlla_al_i__ma_un"
+        "anoconettiliistlitmenni_resssita_tratti_in_le_no_prabiai_atter_espinaitàmannosonoost"
+        "perro_ti_ttatà__ca_fa_l__pa_pe_pi_sc_se_si_st_teassatoavoenzereeriibiienimeioritalav"
+        "li_na_ndinisnsantaon_onsponproretri_ribsabsiospostete_tentriunivor_a__ai_as_ch_da_il"
+        "_or_po_pu_ri_sa_so_sv_traciagaal_amoanaariazzbuica_cevchechicitcomda_deidisei_endeno"
+        "essestfarferficgazgnehe_iamibuicaiceil_ileiluiniio_iscitiizilupmagminmmimo_nernionqu"
+        "ntentonzaodior_oraoreoroottparpenpiapo_posprepulquerairarrazriaricriermarnirodscasi_"
+        "sibsisso_spestisvitattaztemtimtortrottoue_uituliun_uppvervilza_zinzzi_ad_ag_an_ap_ar"
+        "_ba_be_bi_ce_ci_cr_du_es_fe_fl_fr_gi_ha_id_im_ju_lo_me_mi_mo_of_ot_qu_sp_tu_uf_va_ve"
+        "_è_aceaddadeafoageaglalaalealiallalmaluam_ambameammandaniannanqantanuapaapparaarmart"
+        "ataavabambenbinbiscalcamcancapcazce_cerci_cinciocipcluco_cod"
+    ),
+    "pt": (
+        "_deas_de_os__e_ar_es_entem_res_es_rentetra_co_no_pa_pr_sedesidamennosão__a__po_tram_"
+        "comdadescestor_oss_di_em_en_pladeer_iliio_manparplaporprora_riariose_statartes_as_ma"
+        "_pe_teabaalhameanoantavaaçãbalbildoseceel_elaenvespiasis_istla_lanlidlimno_ntaom_ons"
+        "ponprequerabrevrmaspostrtamtemto_tosveláveção_al_ar_ca_cr_do_el_ex_fé_in_ju_li_me_or"
+        "_qu_sa_um_à_abiadaadoagaal_alialáaraarearmatabemcamciacolcrecridasdiddisdo_dutedieir"
+        "eleemaemoeraereeseeviferférharia_iamiaricaienimeimpincioripajunlaslhalialo_lvema_maz"
+        "minmosmpomunncinconernionsántonvooduoisolaolvorepa_pelpo_quirarraçrecremrenrodrá_sa_"
+        "scrsenserssassissosávta_te_teruasue_uniutovagvamvervoláriériênc_ad_an_ao_ap_au_av_be"
+        "_ci_cu_có_da_eq_fl_fr_ge_ha_ho_id_na_ne_o__of_os_ru_si_so_su_sã_sé_va_vo_ár_é_aboaci"
+        "admafoaixaltamiamoanaandanhanianqançaosapraquariartaráatoaulauxazeazéaúdborbuícalcan"
+        "caçcebcelcemcesciecimcincipcluco_concuicurcê_códda_datdeadep"
+    ),
+    "nl": (
+        "en_de_et__en_de_he_onan_hetoordensteverwer_be_ee_va_veaareenerkntwor_tenvan_sc_wedie"
+        "endkenndeontrensch_di_me_voaaneliensereersie_ieningns_rders_te__aa_co_je_om_te_wi_zo"
+        "am_antar_arechodeledeedieidekeeleerpgelgenijkis_je_laalijmenmetng_nstom_onsordoudpen"
+        "rketwevoowij_er_ge_ka_na_op_pa_pe_pr_sa_toaalaatageandangariat_atictederdigducegeek_"
+        "elaemeeraerderverzge_heihoohouideigeij_ijdijnijvikkjk_jvekankelkerkkele_mednd_ndinen"
+        "ngeoduoedop_orgperpleproranrijrinrktrodrpervarzestrtertietijtwitwouctudeunivarvenwee"
+        "wikwoozor_am_bi_bo_da_do_fl_fu_ga_go_gr_ho_id_in_is_ja_ju_ki_ko_la_le_li_ma_mi_mo_oc"
+        "_pl_ru_sl_so_st_sy_ta_th_tw_ui_vi_waaamagaakealaalbaldaleameamsanaardarharsas_assate"
+        "atfauwazibaabarbegbehbelbenbeoberbetbieboubuecatchachrchtcijcodcomconctictmcurdaadag"
+        "damdeadeedewdicdiddirdisdoodridsddseealeamected_ee_eefeegeekeeleereftegkehoeieeikeln"
+        "eneenrenteoneooepeer_erherierlestetaeteeveeweexifleforft_ftw"
+    ),
+}
+
+_NON_LETTERS = re.compile(r"[^\w]+|[\d_]+")
+
+
+@dataclass(frozen=True, slots=True)
+class LanguageGuess:
+    code: str
+    # Mean per-trigram log-probability margin over the runner-up language
+    margin: float
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NON_LETTERS.sub(" ", text.casefold()).split())
+
+
+def trigrams(text: str) -> list[str]:
+    """
+    Character trigrams of ``text``: casefolded letters only, each word padded with ``_``.
+
+    Example:
+        >>> trigrams("Le poste")
+        ['_le', 'le_', '_po', 'pos', 'ost', 'ste', 'te_']
+    """
+    grams: list[str] = []
+    for word in _normalize(text).split(" "):
+        if not word:
+            continue
+        padded = f"_{word}_"
+        grams.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def build_profile(texts: Iterable[str], size: int = PROFILE_SIZE) -> str:
+    """Ranked profile string (3 characters per trigram) of the most frequent trigrams."""
+    counts: Counter[str] = Counter()
+    for text in texts:
+        counts.update(trigrams(text))
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:size]
+    return "".join(gram for gram, _ in ranked)
+
+
+class LanguageIdentifier:
+    """
+    Naive-Bayes style classifier over ranked trigram profiles.
+
+    Example:
+        >>> identifier = LanguageIdentifier()
+        >>> identifier.detect("Nous recherchons un conseiller pour notre équipe de Québec")
+        'fr'
+        >>> identifier.detect("We are hiring a friendly barista for our downtown store")
+        'en'
+        >>> identifier.detect("OK") is None
+        True
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, str] | None = None,
+        max_chars: int = 600,
+        min_trigrams: int = 12,
+        min_margin: float = 0.05,
+        cache_size: int = 8192,
+    ) -> None:
+        profiles = _PROFILES if profiles is None else profiles
+        if not profiles:
+            raise ValueError("at least one language profile is required")
+        self.languages: tuple[str, ...] = tuple(profiles)
+        self.max_chars = max_chars
+        self.min_trigrams = min_trigrams
+        self.min_margin = min_margin
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, LanguageGuess | None] = OrderedDict()
+
+        ranked = {
+            code: [profile[i : i + 3] for i in range(0, len(profile) - 2, 3)]
+            for code, profile in profiles.items()
+        }
+        vocabulary: dict[str, int] = {}
+        for grams in ranked.values():
+            for gram in grams:
+                vocabulary.setdefault(gram, len(vocabulary))
+        self._vocabulary = vocabulary
+        # Column len(vocabulary) is shared by trigrams unknown to every profile
+        scores = np.empty((len(self.languages), len(vocabulary) + 1), dtype=np.float64)
+        for row, code in enumerate(self.languages):
+            grams = ranked[code]
+            weights = 1.0 / (np.arange(len(grams), dtype=np.float64) + 10.0)
+            floor = 1.0 / (len(grams) + 10.0) / 4.0
+            total = weights.sum() + floor * (len(vocabulary) + 1 - len(grams))
+            scores[row, :] = np.log(floor / total)
+            scores[row, [vocabulary[g] for g in grams]] = np.log(weights / total)
+        self._scores: npt.NDArray[np.float64] = scores
+
+    def _ids(self, text: str) -> list[int]:
+        unknown = len(self._vocabulary)
+        get = self._vocabulary.get
+        return [get(gram, unknown) for gram in trigrams(text[: self.max_chars])]
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(text[: self.max_chars].encode("utf-8"), digest_size=12).digest()
+
+    def _decide(self, totals: npt.NDArray[np.float64], count: int) -> LanguageGuess | None:
+        if count < self.min_trigrams:
+            return None
+        if len(totals) == 1:
+            return LanguageGuess(self.languages[0], float("inf"))
+        second, best = np.argsort(totals)[-2:].tolist()
+        margin = float(totals[best] - totals[second]) / count
+        if margin < self.min_margin:
+            return None
+        return LanguageGuess(self.languages[best], margin)
+
+    def _remember(self, key: bytes, guess: LanguageGuess | None) -> None:
+        self._cache[key] = guess
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def classify(self, text: str | None) -> LanguageGuess | None:
+        """Best language for ``text`` with its margin, or None if it cannot be judged."""
+        if not text:
+            return None
+        key = self._key(text)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        ids = self._ids(text)
+        guess = self._decide(self._scores[:, ids].sum(axis=1), len(ids)) if ids else None
+        self._remember(key, guess)
+        return guess
+
+    def detect(self, text: str | None) -> str | None:
+        """Language code for ``text``, or None."""
+        guess = self.classify(text)
+        return guess.code if guess else None
+
+    def classify_many(self, texts: Sequence[str | None]) -> list[LanguageGuess | None]:
+        """`classify` for a chunk of texts, scoring all uncached texts together."""
+        results: list[LanguageGuess | None] = [None] * len(texts)
+        pending: dict[bytes, list[int]] = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._key(text)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                results[i] = self._cache[key]
+            else:
+                pending.setdefault(key, []).append(i)
+        if not pending:
+            return results
+
+        keys = list(pending)
+        id_lists = [self._ids(texts[pending[key][0]] or "") for key in keys]
+        counts = np.fromiter((len(ids) for ids in id_lists), dtype=np.int64, count=len(keys))
+        flat = np.fromiter(
+            (i for ids in id_lists for i in ids), dtype=np.int64, count=int(counts.sum())
+        )
+        docs = np.repeat(np.arange(len(keys)), counts)
+        totals = np.stack(
+            [
+                np.bincount(docs, weights=self._scores[row, flat], minlength=len(keys))
+                for row in range(len(self.languages))
+            ],
+            axis=1,
+        )
+        for doc, key in enumerate(keys):
+            guess = self._decide(totals[doc], int(counts[doc]))
+            self._remember(key, guess)
+            for i in pending[key]:
+                results[i] = guess
+        return results
+
+    def detect_many(self, texts: Sequence[str | None]) -> list[str | None]:
+        """`detect` for a chunk of texts."""
+        return [guess.code if guess else None for guess in self.classify_many(texts)]
+
+
+@lru_cache(maxsize=1)
+def get_language_identifier() -> LanguageIdentifier:
+    """Return the process-wide identifier over the bundled profiles."""
+    return LanguageIdentifier()
@@ -1,49 +1,199 @@
-"""Normalizers and validators for basic transformation layer.
+"""Normalizers and validators for the transformation layer.
 
-This module provides minimal, well-typed stubs for:
-- LocationNormalizer.normalize: trims and collapses whitespace; returns None for blank strings
+- LocationNormalizer.normalize: resolves free-text locations against the bundled
+  offline gazetteer (`job_ingestion.transformation.gazetteer`) into a
+  `NormalizedLocation` with city, region and country names and ISO codes; results
+  are memoized, and `get_location_normalizer` returns the shared instance
 - SalaryNormalizer.parse_range: parses numeric ranges; supports optional k/m suffixes
 - CompanyValidator.validate: checks basic plausibility of a company name
-
-Note: Detailed normalization rules will be implemented in task T10.
+- canonical_company_key: case/punctuation/legal-suffix insensitive company identity
+- company_storage_key: that identity as stored in ``companies.canonical_key``
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from job_ingestion.transformation.gazetteer import Gazetteer, Region, get_gazetteer
 
 __all__ = [
+    "NormalizedLocation",
     "LocationNormalizer",
     "SalaryNormalizer",
     "CompanyValidator",
+    "canonical_company_key",
+    "company_storage_key",
+    "get_location_normalizer",
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class NormalizedLocation:
+    """Structured location resolved from free text.
+
+    ``text`` is always the whitespace-cleaned input; the remaining fields are None when
+    the gazetteer could not resolve them. ``city`` keeps the caller's spelling when the
+    city is not in the gazetteer but the string's structure identifies it as a city.
+    """
+
+    text: str
+    city: str | None = None
+    region: str | None = None
+    region_code: str | None = None
+    country: str | None = None
+    country_code: str | None = None
+
+
 class LocationNormalizer:
-    """Basic location normalizer.
+    """Gazetteer-backed location normalizer.
 
-    Placeholder behavior:
-    - Strip leading/trailing spaces
-    - Collapse internal whitespace to single spaces
-    - Return None if the input is empty/whitespace-only
+    Behavior:
+    - Strip and collapse whitespace; return None if the input is empty/whitespace-only
+    - Drop US ZIP and Canadian postal codes
+    - Split on commas and resolve parts right to left against the country, region and
+      city indexes, preferring the interpretation with the most consistent matches
+      (so "San Francisco, CA" is California while "Vancouver, CA" is Canada)
+
+    Results are memoized in an LRU because the same location strings repeat heavily.
     """
 
     _ws_re = re.compile(r"\s+")
+    _postal_re = re.compile(r"\b(?:\d{5}(?:-\d{4})?|[A-Z]\d[A-Z] ?\d[A-Z]\d)\b", re.IGNORECASE)
 
-    def normalize(self, raw: str) -> str | None:
+    def __init__(self, gazetteer: Gazetteer | None = None, cache_size: int = 4096) -> None:
+        self._gazetteer = gazetteer or get_gazetteer()
+        self._cached_resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def normalize(self, raw: str) -> NormalizedLocation | None:
         """Normalize a location string.
 
         Args:
             raw: The raw location text.
 
         Returns:
-            A cleaned string or None if input is blank.
+            A `NormalizedLocation`, or None if input is blank.
+
+        Examples:
+            >>> LocationNormalizer().normalize("Austin, TX").country_code
+            'US'
         """
-        s = raw.strip()
+        s = self._ws_re.sub(" ", raw).strip()
         if not s:
             return None
-        s = self._ws_re.sub(" ", s)
-        return s
+        return self._cached_resolve(s)
+
+    def country_code(self, raw: str) -> str | None:
+        """Return the ISO alpha-2 country code of a location string, if resolvable."""
+        loc = self.normalize(raw)
+        return loc.country_code if loc else None
+
+    def resolve_country(self, location: Any) -> str | None:
+        """Return the ISO alpha-2 country code for a string or dict location.
+
+        Dict locations use their explicit "country" field when present (unrecognized
+        values are returned unchanged so callers can report them), otherwise the
+        joined city/state/region/province fields.
+        """
+        if isinstance(location, dict):
+            country = location.get("country")
+            if isinstance(country, str) and country.strip():
+                known = self._gazetteer.country(country)
+                return known.code if known else country.strip()
+            text = ", ".join(
+                str(location[k]) for k in ("city", "state", "region", "province") if location.get(k)
+            )
+            return self.country_code(text) if text else None
+        if isinstance(location, str):
+            return self.country_code(location)
+        return None
+
+    def _resolve(self, text: str) -> NormalizedLocation:
+        parts = [p.strip() for p in self._postal_re.sub("", text).split(",")]
+        parts = [p for p in parts if p]
+        if not parts:
+            return NormalizedLocation(text=text)
+
+        best: NormalizedLocation | None = None
+        best_score = 0
+        for candidate, score in self._interpretations(text, parts):
+            if score > best_score:
+                best, best_score = candidate, score
+        return best or NormalizedLocation(text=text)
+
+    def _interpretations(self, text: str, parts: list[str]) -> list[tuple[NormalizedLocation, int]]:
+        gz = self._gazetteer
+        found: list[tuple[NormalizedLocation, int]] = []
+        last = parts[-1]
+
+        # A: trailing country, then an optional region, then a city
+        country = gz.country(last)
+        if country is not None:
+            rest = parts[:-1]
+            region = None
+            if rest:
+                region = next(
+                    (r for r in gz.regions(rest[-1]) if r.country_code == country.code), None
+                )
+                if region is not None:
+                    rest = rest[:-1]
+            found.append(self._with_city(text, rest, country.code, region, 1 + bool(region)))
+
+        # B: trailing region (country implied), then a city
+        for region in gz.regions(last):
+            found.append(self._with_city(text, parts[:-1], region.country_code, region, 2))
+
+        # C: the whole string is a known city
+        if len(parts) == 1:
+            for city in gz.cities_named(last)[:1]:
+                found.append(self._with_city(text, parts, city.country_code, None, 1))
+
+        return found
+
+    def _with_city(
+        self,
+        text: str,
+        rest: list[str],
+        country_code: str,
+        region: Region | None,
+        score: int,
+    ) -> tuple[NormalizedLocation, int]:
+        gz = self._gazetteer
+        region_code = region.code if region is not None else None
+        city_name: str | None = None
+        if rest:
+            city_name = rest[-1]
+            for city in gz.cities_named(city_name):
+                if city.country_code == country_code and (
+                    region_code is None or city.region_code == region_code
+                ):
+                    city_name = city.name
+                    region_code = region_code or city.region_code
+                    score += 2
+                    break
+        resolved_region = gz.region(country_code, region_code) if region_code else None
+        country = gz.countries_by_code.get(country_code)
+        return (
+            NormalizedLocation(
+                text=text,
+                city=city_name,
+                region=resolved_region.name if resolved_region else None,
+                region_code=region_code,
+                country=country.name if country else None,
+                country_code=country_code,
+            ),
+            score,
+        )
+
+
+@lru_cache
+def get_location_normalizer() -> LocationNormalizer:
+    """Return the shared, cache-backed location normalizer."""
+    return LocationNormalizer()
 
 
 class SalaryNormalizer:
@@ -94,18 +244,119 @@ class SalaryNormalizer:
         return (low, high)
 
 
+# Legal-form designators dropped from the end of company names
+LEGAL_SUFFIXES: frozenset[str] = frozenset(
+    {
+        "ab",
+        "ag",
+        "as",
+        "bv",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "inc",
+        "incorporated",
+        "kg",
+        "kk",
+        "limited",
+        "llc",
+        "llp",
+        "lp",
+        "ltd",
+        "nv",
+        "oy",
+        "pc",
+        "plc",
+        "pllc",
+        "pty",
+        "sa",
+        "sarl",
+        "sas",
+        "spa",
+        "srl",
+    }
+)
+
+# Suffixes that take a preceding "and" ("&") with them: "Acme & Co" is Acme
+_PARTNERSHIP_SUFFIXES = frozenset({"co", "company"})
+
+_COMPANY_DROP_RE = re.compile(r"[.'’]")
+_COMPANY_SPLIT_RE = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=65536)
+def canonical_company_key(raw: str) -> str | None:
+    """
+    Return the canonical identity of a company name, or None if it is implausible.
+
+    Case, accents and punctuation are ignored, "&" reads as "and", a leading "The" and
+    trailing legal-form suffixes (with the "&" of "& Co") are dropped. A name consisting
+    only of suffixes keeps them, so "The Company" still has a key.
+
+    Examples:
+        >>> canonical_company_key("ACME, Inc.")
+        'acme'
+        >>> canonical_company_key("Acme Incorporated") == canonical_company_key("acme inc")
+        True
+        >>> canonical_company_key("Procter & Gamble Co.")
+        'procter and gamble'
+        >>> canonical_company_key("Acme & Co.")
+        'acme'
+        >>> canonical_company_key("12345") is None
+        True
+    """
+    text = unicodedata.normalize("NFKD", raw.casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = _COMPANY_DROP_RE.sub("", text.replace("&", " and "))
+    tokens = [t for t in _COMPANY_SPLIT_RE.split(text) if t]
+    if not any(ch.isalpha() for t in tokens for ch in t):
+        return None
+
+    core = tokens[1:] if len(tokens) > 1 and tokens[0] == "the" else tokens
+    end = len(core)
+    while end > 0 and core[end - 1] in LEGAL_SUFFIXES:
+        end -= 1
+        if core[end] in _PARTNERSHIP_SUFFIXES and end > 1 and core[end - 1] == "and":
+            end -= 1
+    return " ".join(core[:end] or core)
+
+
+# Length of ``companies.canonical_key``
+COMPANY_KEY_MAX_LENGTH = 255
+# Hex digits of the digest that replaces the tail of an overlong key
+_COMPANY_KEY_DIGEST_LENGTH = 16
+
+
+def company_storage_key(raw: str) -> str | None:
+    """
+    `canonical_company_key` as stored in ``companies.canonical_key``.
+
+    Keys longer than the column are cut and end with a digest of the full key, so they
+    fit and stay distinct. Every reader and writer of the column uses this function.
+
+    Example:
+        >>> key = company_storage_key("Acme " * 100)
+        >>> len(key), key.startswith("acme acme")
+        (255, True)
+        >>> company_storage_key("ACME, Inc.")
+        'acme'
+    """
+    key = canonical_company_key(raw)
+    if key is None or len(key) <= COMPANY_KEY_MAX_LENGTH:
+        return key
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:_COMPANY_KEY_DIGEST_LENGTH]
+    return f"{key[: COMPANY_KEY_MAX_LENGTH - _COMPANY_KEY_DIGEST_LENGTH - 1]}#{digest}"
+
+
 class CompanyValidator:
     """Basic company name validator.
 
     Placeholder behavior:
     - Must not be blank after trimming
-    - Must contain at least one alphabetic character
+    - Must contain at least one alphabetic character (i.e., have a canonical key)
     """
 
     def validate(self, raw: str) -> bool:
-        s = raw.strip()
-        if not s:
-            return False
-        if not any(ch.isalpha() for ch in s):
-            return False
-        return True
+        return canonical_company_key(raw) is not None
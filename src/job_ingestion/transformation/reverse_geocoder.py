@@ -0,0 +1,232 @@
+"""Offline reverse geocoding from latitude/longitude.
+
+The country comes from the bundled boundary polygons (`boundaries`) for the United
+States and Canada. Within them, the region is the one of the nearest gazetteer place
+of that country (a city, or a state/province centroid for areas far from any listed
+city), and the city is reported only when one lies within ``city_radius_km``. Points
+outside those polygons resolve only when a listed city of another country lies
+within ``city_radius_km``; anywhere else (oceans, unlisted places) they resolve to
+None rather than to a distant centroid.
+
+Places are stored as 3D unit vectors, so nearest-neighbour search on chord length is
+exact on the sphere and unaffected by the antimeridian.
+
+- `ReverseGeocoder.lookup` answers a single point from k-d trees in microseconds.
+- `ReverseGeocoder.lookup_many` resolves whole chunks with NumPy matrix products.
+
+Regions are an approximation: points near a state or province line may get the
+neighbouring region.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from job_ingestion.transformation.boundaries import BOUNDED_COUNTRIES, countries_at, country_at
+from job_ingestion.transformation.gazetteer import Gazetteer, get_gazetteer
+
+__all__ = ["ReverseGeocodeMatch", "ReverseGeocoder", "get_reverse_geocoder"]
+
+EARTH_RADIUS_KM = 6371.0088
+_BATCH_CHUNK = 4096
+
+
+@dataclass(frozen=True, slots=True)
+class ReverseGeocodeMatch:
+    country_code: str
+    region_code: str | None
+    city: str | None
+    # Distance to the nearest listed place of the country
+    distance_km: float
+
+
+# k-d tree node: (point index, split axis, left subtree, right subtree)
+_Node = tuple[int, int, Any, Any]
+# (country, region, city name; None for region centroids)
+_Label = tuple[str, str | None, str | None]
+
+
+def _unit_vector(latitude: float, longitude: float) -> tuple[float, float, float]:
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat))
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2.0 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2.0))
+
+
+def _valid_coordinate(latitude: Any, longitude: Any) -> bool:
+    """Reject missing, non-numeric, out-of-range, and (0, 0) "null island" coordinates."""
+    if isinstance(latitude, bool) or isinstance(longitude, bool):
+        return False
+    if not isinstance(latitude, int | float) or not isinstance(longitude, int | float):
+        return False
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        return False
+    return not (latitude == 0 and longitude == 0)
+
+
+class _PlaceIndex:
+    """Nearest-place search over a set of labelled points."""
+
+    def __init__(self, labels: list[_Label], vectors: list[tuple[float, float, float]]):
+        self.labels = labels
+        self._vectors = vectors
+        self._matrix = np.asarray(vectors, dtype=np.float64).reshape(-1, 3)
+        self._tree = self._build(list(range(len(vectors))), depth=0)
+
+    def _build(self, indices: list[int], depth: int) -> _Node | None:
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: self._vectors[i][axis])
+        mid = len(indices) // 2
+        return (
+            indices[mid],
+            axis,
+            self._build(indices[:mid], depth + 1),
+            self._build(indices[mid + 1 :], depth + 1),
+        )
+
+    def nearest(self, target: tuple[float, float, float]) -> tuple[int, float]:
+        """Index of and chord distance to the nearest point; (-1, inf) if empty."""
+        best_idx = -1
+        best_sq = math.inf
+        # Stack entries carry the squared distance to the splitting plane that separates
+        # the subtree from the target; subtrees are skipped once that bound is beaten.
+        stack: list[tuple[_Node | None, float]] = [(self._tree, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if node is None or bound >= best_sq:
+                continue
+            idx, axis, left, right = node
+            vec = self._vectors[idx]
+            sq = (vec[0] - target[0]) ** 2 + (vec[1] - target[1]) ** 2 + (vec[2] - target[2]) ** 2
+            if sq < best_sq:
+                best_idx, best_sq = idx, sq
+            diff = target[axis] - vec[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((far, diff * diff))
+            stack.append((near, 0.0))
+        return best_idx, math.sqrt(best_sq)
+
+    def nearest_many(self, points: npt.NDArray[np.float64]) -> tuple[list[int], list[float]]:
+        """Vectorized `nearest` for an (n, 3) array of unit vectors."""
+        if not len(self.labels):
+            return [-1] * len(points), [math.inf] * len(points)
+        # Max cosine similarity == min chord distance for unit vectors
+        sims = points @ self._matrix.T
+        best = np.argmax(sims, axis=1)
+        best_cos = np.clip(sims[np.arange(len(points)), best], -1.0, 1.0)
+        chords = np.sqrt(np.maximum(0.0, 2.0 - 2.0 * best_cos))
+        return best.tolist(), chords.tolist()
+
+
+class ReverseGeocoder:
+    """
+    Boundary-aware reverse geocoder over the bundled gazetteer.
+
+    Example:
+        >>> match = ReverseGeocoder().lookup(30.27, -97.74)
+        >>> (match.country_code, match.region_code, match.city)
+        ('US', 'TX', 'Austin')
+        >>> ReverseGeocoder().lookup(23.11, -82.37) is None  # Havana
+        True
+    """
+
+    def __init__(self, gazetteer: Gazetteer | None = None, city_radius_km: float = 25.0):
+        gz = gazetteer or get_gazetteer()
+        self.city_radius_km = city_radius_km
+
+        # Per bounded country: its cities and region centroids. Elsewhere: cities only,
+        # and never those of a bounded country, so a point just across a border cannot
+        # match a city on the other side.
+        places: dict[str | None, tuple[list[_Label], list[tuple[float, float, float]]]] = {
+            code: ([], []) for code in (*sorted(BOUNDED_COUNTRIES), None)
+        }
+        for city in gz.cities:
+            key = city.country_code if city.country_code in BOUNDED_COUNTRIES else None
+            places[key][0].append((city.country_code, city.region_code, city.name))
+            places[key][1].append(_unit_vector(city.latitude, city.longitude))
+        for region in gz.regions_all:
+            if region.country_code not in BOUNDED_COUNTRIES:
+                continue
+            if region.latitude is not None and region.longitude is not None:
+                places[region.country_code][0].append((region.country_code, region.code, None))
+                places[region.country_code][1].append(
+                    _unit_vector(region.latitude, region.longitude)
+                )
+        self._indexes = {key: _PlaceIndex(*value) for key, value in places.items()}
+
+    def _match(self, country: str | None, idx: int, chord: float) -> ReverseGeocodeMatch | None:
+        distance_km = _chord_to_km(chord) if idx >= 0 else math.inf
+        near = distance_km <= self.city_radius_km
+        if country is None:
+            if not near:
+                return None
+            country_code, region_code, city = self._indexes[None].labels[idx]
+            return ReverseGeocodeMatch(country_code, region_code, city, round(distance_km, 1))
+        if idx < 0:
+            return ReverseGeocodeMatch(country, None, None, distance_km)
+        _, region_code, city = self._indexes[country].labels[idx]
+        return ReverseGeocodeMatch(
+            country, region_code, city if near else None, round(distance_km, 1)
+        )
+
+    def lookup(self, latitude: Any, longitude: Any) -> ReverseGeocodeMatch | None:
+        """Return the country, region and nearby city of a point, or None."""
+        if not _valid_coordinate(latitude, longitude):
+            return None
+        country = country_at(float(latitude), float(longitude))
+        idx, chord = self._indexes[country].nearest(_unit_vector(float(latitude), float(longitude)))
+        return self._match(country, idx, chord)
+
+    def lookup_many(
+        self, latitudes: Sequence[Any], longitudes: Sequence[Any]
+    ) -> list[ReverseGeocodeMatch | None]:
+        """
+        Vectorized reverse geocoding for a chunk of points.
+
+        Invalid coordinates yield None at their position. Work is done in fixed-size
+        chunks so memory stays bounded for arbitrarily large inputs.
+        """
+        if len(latitudes) != len(longitudes):
+            raise ValueError("latitudes and longitudes must have the same length")
+
+        results: list[ReverseGeocodeMatch | None] = [None] * len(latitudes)
+        valid = [
+            i
+            for i, (lat, lon) in enumerate(zip(latitudes, longitudes, strict=True))
+            if _valid_coordinate(lat, lon)
+        ]
+        for start in range(0, len(valid), _BATCH_CHUNK):
+            positions = valid[start : start + _BATCH_CHUNK]
+            lat_deg = np.asarray([latitudes[i] for i in positions], dtype=np.float64)
+            lon_deg = np.asarray([longitudes[i] for i in positions], dtype=np.float64)
+            lat, lon = np.radians(lat_deg), np.radians(lon_deg)
+            cos_lat = np.cos(lat)
+            points = np.stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)), axis=1)
+
+            groups: dict[str | None, list[int]] = {}
+            for row, country in enumerate(countries_at(lat_deg, lon_deg)):
+                groups.setdefault(country, []).append(row)
+            for country, rows in groups.items():
+                idxs, chords = self._indexes[country].nearest_many(points[rows])
+                for row, idx, chord in zip(rows, idxs, chords, strict=True):
+                    results[positions[row]] = self._match(country, int(idx), float(chord))
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_reverse_geocoder() -> ReverseGeocoder:
+    """Return the shared reverse geocoder, building its index on first use."""
+    return ReverseGeocoder()
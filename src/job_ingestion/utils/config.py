@@ -8,6 +8,26 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./db.sqlite3"
     redis_url: str = "redis://localhost:6379"
     environment: str = "development"
+    # "bundled", "db" (currency_rates table), or a path to a rates CSV file
+    currency_rates_source: str = "bundled"
+    currency_rates_refresh_seconds: int = 3600
+    # "audit" runs every approval rule and records all reasons; "fast" stops at the
+    # first failing rule (only that reason is stored); "score" is "audit" plus a
+    # manual-review tier for borderline jobs (see approval.scoring)
+    approval_evaluation_mode: str = "audit"
+    # Optional JSON rule file evaluated alongside the built-in rules; reloaded on change
+    approval_rules_path: str = ""
+    # Optional JSON rule file for a candidate rule set evaluated in shadow mode: the
+    # built-in rules minus approval_shadow_exclude_rules (comma-separated rule names),
+    # plus the file's rules. Shadow results never affect persistence.
+    approval_shadow_rules_path: str = ""
+    approval_shadow_exclude_rules: str = ""
+    # Chunks waiting for shadow evaluation; further chunks are dropped, not queued
+    approval_shadow_queue_size: int = 64
+    # Partition maintenance (storage.partitions): monthly rejected_jobs partitions
+    # created ahead of time, and months of rejected jobs kept (0 keeps everything)
+    partition_months_ahead: int = 3
+    rejected_jobs_retention_months: int = 0
 
     class Config:
         env_file = ".env"
@@ -16,6 +36,15 @@ class Settings(BaseSettings):
             "database_url": {"env": "DATABASE_URL"},
             "redis_url": {"env": "REDIS_URL"},
             "environment": {"env": "ENVIRONMENT"},
+            "currency_rates_source": {"env": "CURRENCY_RATES_SOURCE"},
+            "currency_rates_refresh_seconds": {"env": "CURRENCY_RATES_REFRESH_SECONDS"},
+            "approval_evaluation_mode": {"env": "APPROVAL_EVALUATION_MODE"},
+            "approval_rules_path": {"env": "APPROVAL_RULES_PATH"},
+            "approval_shadow_rules_path": {"env": "APPROVAL_SHADOW_RULES_PATH"},
+            "approval_shadow_exclude_rules": {"env": "APPROVAL_SHADOW_EXCLUDE_RULES"},
+            "approval_shadow_queue_size": {"env": "APPROVAL_SHADOW_QUEUE_SIZE"},
+            "partition_months_ahead": {"env": "PARTITION_MONTHS_AHEAD"},
+            "rejected_jobs_retention_months": {"env": "REJECTED_JOBS_RETENTION_MONTHS"},
         }
 
 
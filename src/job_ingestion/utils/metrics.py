@@ -8,11 +8,21 @@ from __future__ import annotations
 
 from collections import defaultdict
 
-__all__ = ["increment", "get_counters", "reset_counters"]
+__all__ = [
+    "increment",
+    "get_counters",
+    "reset_counters",
+    "set_gauge",
+    "get_gauges",
+    "reset_gauges",
+]
 
 # Simple in-memory counters for observability in tests/dev
 _counters: defaultdict[str, int] = defaultdict(int)
 
+# Last-value gauges (e.g. per-rule profiling snapshots)
+_gauges: dict[str, float] = {}
+
 
 def increment(name: str, value: int = 1) -> None:
     """Increment a named counter by value (default 1)."""
@@ -31,3 +41,22 @@ def get_counters() -> dict[str, int]:
 def reset_counters() -> None:
     """Reset all counters to zero (for tests/dev)."""
     _counters.clear()
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Set a named gauge to value."""
+    try:
+        _gauges[name] = float(value)
+    except Exception:
+        # Defensive no-op on unexpected input
+        pass
+
+
+def get_gauges() -> dict[str, float]:
+    """Return a snapshot of current gauges (for tests/dev)."""
+    return dict(_gauges)
+
+
+def reset_gauges() -> None:
+    """Remove all gauges (for tests/dev)."""
+    _gauges.clear()
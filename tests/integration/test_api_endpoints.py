@@ -10,3 +10,19 @@ def test_health_endpoint_integration(client: Any) -> None:
 def test_docs_available(client: Any) -> None:
     resp = client.get("/docs")
     assert resp.status_code == 200
+
+
+def test_rule_profile_endpoint(client: Any) -> None:
+    resp = client.get("/api/v1/approval/rules/profile")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert isinstance(body["rules"], list)
+    assert isinstance(body["sample_every"], int)
+
+
+def test_shadow_report_endpoint_when_disabled(client: Any) -> None:
+    resp = client.get("/api/v1/approval/shadow")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["enabled"] is False
+    assert body["rules"] == [] and body["samples"] == []
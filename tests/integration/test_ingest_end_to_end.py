@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from typing import Any
 
+from job_ingestion.ingestion.service import IngestionService
 from job_ingestion.storage.models import ApprovalStatus, Base, Job
 from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
 from job_ingestion.utils.config import get_settings
@@ -52,3 +53,35 @@ def test_ingest_persists_jobs_and_statuses(client: Any) -> None:
         by_title = {j.title: j for j in rows}
         assert by_title["Senior Python Developer"].approval_status == ApprovalStatus.APPROVED
         assert by_title["Junior Data Analyst"].approval_status == ApprovalStatus.APPROVED
+
+
+def _cache_hits(rule_name: str) -> int:
+    engine = IngestionService._approval_engine
+    if engine is None:
+        return 0
+    return sum(s.cache_hits for s in engine.rule_stats() if s.name == rule_name)
+
+
+def test_ingest_serves_repeated_rejection_reasons_from_the_decision_cache(client: Any) -> None:
+    os.environ["DATABASE_URL"] = "sqlite:///./db_integration_e2e.sqlite3"
+    get_settings.cache_clear()
+    jobs = [
+        {
+            "title": f"Part-time Python Developer {i}",
+            "description": "Part-time role on our platform team, working with Python and SQL.",
+            "location": "New York, NY, USA",
+            "min_salary": 120000,
+            "employment_type": "Part-Time",
+            "language": "English",
+        }
+        for i in range(5)
+    ]
+    before = _cache_hits("is_full_time_position")
+
+    resp = client.post("/api/v1/jobs/ingest", json={"jobs": jobs})
+    assert resp.status_code == 202
+    status = client.get(f"/api/v1/jobs/status/{resp.json()['processing_id']}").json()
+    assert status["rejected"] == 5
+
+    # One call per distinct feature value; the other rejection reasons are cache hits
+    assert _cache_hits("is_full_time_position") - before >= 4
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from job_ingestion.utils.config import get_settings
+
+
+@pytest.fixture()  # type: ignore[misc]
+def fresh_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'jobs.sqlite3'}")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def _job(title: str, salary: int, location: str, day: int) -> dict[str, Any]:
+    return {
+        "title": title,
+        "description": "We are looking for an engineer to join our platform team. "
+        "This is a full-time position with Python and SQL.",
+        "location": location,
+        "min_salary": salary,
+        "employment_type": "Full-Time",
+        "language": "English",
+        "date_posted": f"2024-03-{day:02d}T00:00:00Z",
+    }
+
+
+@pytest.mark.usefixtures("fresh_db")  # type: ignore[misc]
+def test_jobs_are_listed_and_filtered(client: Any) -> None:
+    jobs = [_job(f"Engineer {i}", 150_000, "New York, NY, USA", i + 1) for i in range(3)]
+    jobs += [_job("Toronto Engineer", 150_000, "Toronto, ON, Canada", 10)]
+    jobs += [_job("Underpaid Engineer", 20_000, "New York, NY, USA", 11)]
+    resp = client.post("/api/v1/jobs/ingest", json={"jobs": jobs})
+    assert resp.status_code == 202
+
+    first = client.get("/api/v1/jobs", params={"limit": 3}).json()
+    second = client.get("/api/v1/jobs", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    titles = [item["title"] for item in first["items"] + second["items"]]
+    assert titles == ["Toronto Engineer", "Engineer 2", "Engineer 1", "Engineer 0"]
+    assert second["next_cursor"] is None
+    assert first["items"][0]["approval_status"] == "APPROVED"
+
+    canada = client.get("/api/v1/jobs", params={"country": "CA"}).json()["items"]
+    assert [item["country_code"] for item in canada] == ["CA"]
+
+    [rejected] = client.get("/api/v1/jobs/rejected").json()["items"]
+    assert rejected["title"] == "Underpaid Engineer" and rejected["rejection_reasons"]
+
+
+def test_invalid_listing_parameters_are_bad_requests(client: Any) -> None:
+    assert client.get("/api/v1/jobs", params={"cursor": "nope"}).status_code == 400
+    assert client.get("/api/v1/jobs", params={"status": "unknown"}).status_code == 400
+
+
+@pytest.mark.usefixtures("fresh_db")  # type: ignore[misc]
+def test_jobs_are_searchable(client: Any) -> None:
+    jobs = [_job(f"Platform Engineer {i}", 150_000, "New York, NY, USA", i + 1) for i in range(3)]
+    jobs += [_job("Underpaid Platform Engineer", 20_000, "New York, NY, USA", 11)]
+    resp = client.post("/api/v1/jobs/ingest", json={"jobs": jobs})
+    assert resp.status_code == 202
+
+    first = client.get("/api/v1/jobs/search", params={"q": "platform", "limit": 2}).json()
+    second = client.get(
+        "/api/v1/jobs/search", params={"q": "platform", "limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    titles = sorted(item["title"] for item in first["items"] + second["items"])
+    assert titles == [f"Platform Engineer {i}" for i in range(3)]
+    assert second["next_cursor"] is None
+    assert all(item["score"] > 0 for item in first["items"])
+
+    assert client.get("/api/v1/jobs/search", params={"q": "cobol"}).json()["items"] == []
+    assert client.get("/api/v1/jobs/search", params={"q": "?!"}).status_code == 400
+    assert client.get("/api/v1/jobs/search").status_code == 422
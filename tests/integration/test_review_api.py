@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from job_ingestion.storage.models import Job, RejectedJob, ReviewQueueItem
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from job_ingestion.utils.config import get_settings
+from sqlalchemy import select
+
+
+@pytest.fixture()  # type: ignore[misc]
+def score_mode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'review.sqlite3'}")
+    monkeypatch.setenv("APPROVAL_EVALUATION_MODE", "score")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def _job(title: str, salary: int, external_id: str | None = None) -> dict[str, Any]:
+    return {
+        "id": external_id,
+        "title": title,
+        "description": "We are looking for an engineer to join our platform team. "
+        "This is a full-time position with Python and SQL.",
+        "location": "New York, NY, USA",
+        "min_salary": salary,
+        "employment_type": "Full-Time",
+        "language": "English",
+    }
+
+
+@pytest.mark.usefixtures("score_mode")  # type: ignore[misc]
+def test_borderline_jobs_are_queued_and_decided(client: Any) -> None:
+    jobs = [_job(f"Borderline Engineer {i}", 97_000) for i in range(3)]
+    resp = client.post("/api/v1/jobs/ingest", json={"jobs": [_job("Engineer", 150_000), *jobs]})
+    assert resp.status_code == 202
+    status = client.get(f"/api/v1/jobs/status/{resp.json()['processing_id']}").json()
+    assert status["approved"] == 1 and status["review"] == 3
+
+    first = client.get("/api/v1/review/queue", params={"limit": 2}).json()
+    second = client.get("/api/v1/review/queue", params={"cursor": first["next_cursor"]}).json()
+    items = first["items"] + second["items"]
+    assert len(items) == 3 and second["next_cursor"] is None
+    assert "Annual salary below" in items[0]["review_reasons"]
+
+    ids = [item["job_id"] for item in items]
+    approved = client.post("/api/v1/review/approve", json={"job_ids": ids[:2]}).json()
+    rejected = client.post("/api/v1/review/reject", json={"job_ids": ids, "reason": "No"}).json()
+    assert approved == {"requested": 2, "updated": 2}
+    assert rejected == {"requested": 3, "updated": 1}
+    assert client.get("/api/v1/review/queue").json()["items"] == []
+
+
+def _stored() -> tuple[dict[str, str], list[str], list[str]]:
+    sm = get_sessionmaker(get_engine(get_settings().database_url))
+    with get_session(sm) as s:
+        jobs = {j.external_id: j.approval_status.value for j in s.scalars(select(Job))}
+        rejected = sorted(s.scalars(select(RejectedJob.external_id)))
+        queued = sorted(s.scalars(select(ReviewQueueItem.external_id)))
+    return jobs, rejected, queued
+
+
+@pytest.mark.usefixtures("score_mode")  # type: ignore[misc]
+def test_reingested_jobs_keep_one_copy_where_the_latest_ingest_put_them(client: Any) -> None:
+    def ingest(*jobs: dict[str, Any]) -> None:
+        assert client.post("/api/v1/jobs/ingest", json={"jobs": jobs}).status_code == 202
+
+    ingest(_job("A", 150_000, "a"), _job("R", 97_000, "r"), _job("X", 50_000, "x"))
+    assert _stored() == ({"a": "APPROVED", "r": "MANUAL_REVIEW"}, ["x"], ["r"])
+
+    # Approved -> review, review -> approved, rejected -> approved
+    ingest(_job("A", 97_000, "a"), _job("R", 150_000, "r"), _job("X", 150_000, "x"))
+    jobs, rejected, queued = _stored()
+    assert jobs == {"a": "MANUAL_REVIEW", "r": "APPROVED", "x": "APPROVED"}
+    assert rejected == [] and queued == ["a"]
+
+    # Review -> rejected, approved -> rejected, then rejected again
+    ingest(_job("A", 50_000, "a"), _job("R", 50_000, "r"))
+    ingest(_job("A", 40_000, "a"), _job("R", 97_000, "r"))
+    assert _stored() == ({"r": "MANUAL_REVIEW", "x": "APPROVED"}, ["a"], ["r"])
+
+
+def test_invalid_cursor_is_a_bad_request(client: Any) -> None:
+    resp = client.get("/api/v1/review/queue", params={"cursor": "nope"})
+    assert resp.status_code == 400
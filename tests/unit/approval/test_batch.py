@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+from job_ingestion.approval.batch import BoolArray, JobColumns, batch_form, vectorized
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.rules.company_type_rules import get_rules as company_type_rules
+from job_ingestion.approval.rules.content_rules import get_rules as content_rules
+from job_ingestion.approval.rules.employment_type_rules import get_rules as employment_type_rules
+from job_ingestion.approval.rules.language_rules import get_rules as language_rules
+from job_ingestion.approval.rules.location_rules import get_rules as location_rules
+from job_ingestion.approval.rules.salary_rules import get_rules as salary_rules
+
+JOBS: list[dict[str, Any]] = [
+    {
+        "title": "Senior Engineer",
+        "description": "Build systems. " * 20,
+        "salary_min": 150000,
+        "salary_currency": "USD",
+        "location": "Austin, TX, USA",
+        "employment_type": "Full-Time",
+        "language": "English",
+    },
+    {
+        "salary_min": "65",
+        "salary_unit": "hourly",
+        "location": {"country": "Canada"},
+        "employment_type": " full time ",
+        "language": "fr",
+    },
+    {
+        "salary_min": 150000,
+        "salary_currency": "XYZ",
+        "location": "Paris, France",
+        "employment_type": "Contract",
+        "language": "French",
+    },
+    {"salary_min": None, "is_remote": True, "language": "  ", "company_type": "Staffing Firm"},
+    {"salary_min": "n/a", "salary_currency": "eur", "location": "", "remote": True},
+    {"salary_min": 0, "location": "Downtown", "latitude": 45.5, "longitude": -73.57},
+    {"salary_min": 90000, "salary_currency": "CAD", "location": "   ", "geo_country_code": "CA"},
+    {"salary_min": True, "employment_type": 1, "language": ["en"], "location": ["x"]},
+    {"salary_min": 50, "salary_unit": "Per Hour", "location": "Toronto, ON", "language": "FR"},
+    {},
+]
+
+
+def _all_rules() -> list[Any]:
+    return [
+        *content_rules(),
+        *location_rules(),
+        *salary_rules(),
+        *employment_type_rules(),
+        *company_type_rules(),
+        *language_rules(),
+    ]
+
+
+def test_job_columns_cache_and_coerce_values() -> None:
+    columns = JobColumns([{"a": "1.5"}, {"a": None}, {"a": "x"}, {}])
+    assert len(columns) == 4
+    assert columns.values("a") is columns.values("a")
+    assert np.allclose(columns.numeric("a")[:1], [1.5])
+    assert np.isnan(columns.numeric("a")[1:]).all()
+
+
+def test_job_columns_evaluate_once_per_distinct_value() -> None:
+    calls: list[Any] = []
+
+    def is_us(value: Any) -> bool:
+        calls.append(value)
+        return value == "US"
+
+    columns = JobColumns([{"c": "US"}, {"c": "CA"}, {"c": "US"}, {"c": {"x": 1}}, {"c": True}])
+    assert columns.mask("c", is_us).tolist() == [True, False, True, False, False]
+    assert calls == ["US", "CA", {"x": 1}, True]
+
+
+@pytest.mark.parametrize("rule", _all_rules())  # type: ignore[misc]
+def test_vectorized_forms_match_per_row_rules(rule: Any) -> None:
+    form = batch_form(rule)
+    if form is None:
+        pytest.skip("rule has no vectorized form")
+    expected = [rule(job)[0] for job in JOBS]
+    assert form(JobColumns(JOBS)).tolist() == expected
+
+
+@pytest.mark.parametrize("mode", [EvaluationMode.AUDIT, EvaluationMode.FAST])  # type: ignore[misc]
+def test_evaluate_batch_matches_evaluate_job(mode: EvaluationMode) -> None:
+    engine = ApprovalEngine(rules=_all_rules(), mode=mode)
+    batch = engine.evaluate_batch(JOBS, with_reasons=True)
+    assert batch.reasons is not None
+    per_row = [engine.evaluate_job(job) for job in JOBS]
+    assert batch.approved.tolist() == [d.approved for d in per_row]
+    if mode is EvaluationMode.AUDIT:
+        assert batch.reasons == [d.reasons for d in per_row]
+    else:
+        assert all(
+            len(r) == (0 if ok else 1) for ok, r in zip(batch.approved, batch.reasons, strict=True)
+        )
+
+
+def test_rules_without_batch_form_fall_back_to_per_row() -> None:
+    calls: list[dict[str, Any]] = []
+
+    def has_title(job: dict[str, Any]) -> tuple[bool, str | None]:
+        calls.append(job)
+        return (True, None) if job.get("title") else (False, "Missing title")
+
+    def _positive_batch(columns: JobColumns) -> BoolArray:
+        return columns.numeric("n") > 0
+
+    @vectorized(_positive_batch)
+    def positive(job: dict[str, Any]) -> tuple[bool, str | None]:
+        return (True, None) if (job.get("n") or 0) > 0 else (False, "Not positive")
+
+    jobs = [{"n": 1, "title": "a"}, {"n": -1, "title": "b"}, {"n": 2}]
+    engine = ApprovalEngine(rules=[positive, has_title], mode=EvaluationMode.FAST)
+    engine.evaluate_batch(jobs)
+    # The per-row rule only ran for jobs the vectorized rule approved
+    assert [job["n"] for job in calls] == [1, 2]
+
+    decision = engine.evaluate_batch(jobs, with_reasons=True)
+
+    assert decision.approved.tolist() == [True, False, False]
+    assert decision.reasons == [[], ["Not positive"], ["Missing title"]]
+    assert decision.reason_codes(1) == ["positive"]
+    assert decision.reason_codes(2) == ["has_title"]
+    assert len(decision) == 3
+
+
+def test_evaluate_batch_rejects_misshaped_batch_form() -> None:
+    @vectorized(lambda columns: np.ones(1, dtype=np.bool_))
+    def broken(job: dict[str, Any]) -> tuple[bool, str | None]:
+        return True, None
+
+    with pytest.raises(ValueError):
+        ApprovalEngine(rules=[broken]).evaluate_batch([{}, {}])
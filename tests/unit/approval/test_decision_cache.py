@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+import job_ingestion.approval.rules.salary_rules as salary_module
+import pytest
+from job_ingestion.approval.decision_cache import RuleDecisionCache
+from job_ingestion.approval.engine import ApprovalEngine
+from job_ingestion.approval.features import uses_features
+from job_ingestion.approval.rules.company_type_rules import is_not_staffing_firm
+from job_ingestion.approval.rules.employment_type_rules import get_rules as employment_type_rules
+from job_ingestion.approval.rules.language_rules import get_rules as language_rules
+from job_ingestion.approval.rules.location_rules import is_geographical_location_approved
+from job_ingestion.approval.rules.salary_rules import get_rules as salary_rules
+
+
+def _counting_rule(calls: list[dict[str, Any]]) -> Any:  # noqa: ANN401
+    @uses_features("employment_type")
+    def full_time(job: dict[str, Any]) -> tuple[bool, str | None]:
+        calls.append(job)
+        ok = job.get("employment_type", "").strip() == "Full-Time"
+        return (ok, None) if ok else (False, "Not full-time")
+
+    return full_time
+
+
+def test_identical_feature_values_skip_reevaluation() -> None:
+    calls: list[dict[str, Any]] = []
+    engine = ApprovalEngine(rules=[_counting_rule(calls)])
+
+    first = engine.evaluate_job({"employment_type": "Full-Time", "title": "A"})
+    second = engine.evaluate_job({"employment_type": " Full-Time ", "title": "B"})
+    third = engine.evaluate_job({"employment_type": "Contract"})
+
+    assert (first.approved, second.approved, third.approved) == (True, True, False)
+    assert third.reasons == ["Not full-time"]
+    assert len(calls) == 2
+    assert engine.rule_stats()[0].cache_hits == 1
+    assert engine.decision_cache_hit_rate() == pytest.approx(1 / 3)
+
+
+def test_batch_reason_collection_goes_through_the_cache() -> None:
+    calls: list[dict[str, Any]] = []
+    engine = ApprovalEngine(rules=[_counting_rule(calls)])
+    jobs = [{"employment_type": t} for t in ["Contract", "Full-Time", "Contract", " Contract"]]
+
+    batch = engine.evaluate_batch(jobs, with_reasons=True)
+
+    assert batch.reasons == [["Not full-time"], [], ["Not full-time"], ["Not full-time"]]
+    # No vectorized form: one call per distinct value decides, the reasons are all hits
+    assert len(calls) == 2
+    assert engine.rule_stats()[0].cache_hits == 5
+
+
+def test_cache_disabled_with_zero_size() -> None:
+    calls: list[dict[str, Any]] = []
+    engine = ApprovalEngine(rules=[_counting_rule(calls)], decision_cache_size=0)
+    for _ in range(3):
+        engine.evaluate_job({"employment_type": "Full-Time"})
+    assert len(calls) == 3
+    with pytest.raises(ValueError):
+        ApprovalEngine(decision_cache_size=-1)
+
+
+def test_threshold_change_invalidates_cached_decisions(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = ApprovalEngine(rules=salary_rules())
+    job = {"salary_min": 90000, "salary_currency": "USD"}
+    assert engine.evaluate_job(job).approved is False
+    assert engine.evaluate_job(job).approved is False
+
+    monkeypatch.setattr(salary_module, "MIN_ANNUAL_SALARY_USD", 80_000.0)
+    assert engine.evaluate_job(job).approved is True
+
+
+def test_rule_set_change_resets_caches() -> None:
+    calls: list[dict[str, Any]] = []
+    engine = ApprovalEngine(rules=[_counting_rule(calls)])
+    engine.evaluate_job({"employment_type": "Full-Time"})
+    engine.register_rule(lambda job: (True, None))
+    engine.evaluate_job({"employment_type": "Full-Time"})
+    assert len(calls) == 2
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = RuleDecisionCache(("employment_type",), maxsize=2)
+    keys = [cache.key({"employment_type": t}) for t in ("a", "b", "c")]
+    cache.put(keys[0], (True, None))
+    cache.put(keys[1], (True, None))
+    assert cache.get(keys[0]) == (True, None)
+    cache.put(keys[2], (False, "x"))
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == (True, None)
+
+
+def test_non_content_rules_reach_high_hit_rate_on_repetitive_feed() -> None:
+    rules = [
+        *salary_rules(),
+        *employment_type_rules(),
+        *language_rules(),
+        is_geographical_location_approved,
+        is_not_staffing_firm,
+    ]
+    engine = ApprovalEngine(rules=rules)
+    variants = itertools.product(
+        ["Austin, TX", "Toronto, ON", "Paris, France"],
+        ["Full-Time", "Contract"],
+        ["English", "French"],
+        [120000, 90000],
+    )
+    jobs = [
+        {
+            "location": loc,
+            "employment_type": emp,
+            "language": lang,
+            "salary_min": salary,
+            "title": f"Job {i}",
+        }
+        for i, (loc, emp, lang, salary) in enumerate(variants)
+    ]
+    uncached = ApprovalEngine(rules=rules, decision_cache_size=0)
+    for _ in range(10):
+        for job in jobs:
+            assert engine.evaluate_job(job) == uncached.evaluate_job(job)
+    assert engine.decision_cache_hit_rate() > 0.8
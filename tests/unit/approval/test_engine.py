@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from job_ingestion.approval.engine import ApprovalEngine
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
 from job_ingestion.approval.rules.base import ApprovalRule
 
 
@@ -68,3 +69,92 @@ def test_init_with_rules_sequence() -> None:
     decision = engine.evaluate_job({})
     assert decision.approved is False
     assert decision.reasons == ["nope"]
+
+
+def _counting_rule(name: str, fails: bool, calls: list[str]) -> ApprovalRule:
+    def rule(job: dict[str, Any]) -> tuple[bool, str | None]:
+        calls.append(name)
+        return (False, f"{name} failed") if fails else (True, None)
+
+    rule.__name__ = name
+    return rule
+
+
+def test_fast_mode_stops_at_first_failure() -> None:
+    calls: list[str] = []
+    engine = ApprovalEngine(
+        [
+            _counting_rule("a", False, calls),
+            _counting_rule("b", True, calls),
+            _counting_rule("c", True, calls),
+        ],
+        mode=EvaluationMode.FAST,
+    )
+
+    decision = engine.evaluate_job({})
+    assert decision.approved is False
+    assert decision.reasons == ["b failed"]
+    assert calls == ["a", "b"]
+
+
+def test_audit_mode_override_returns_all_reasons() -> None:
+    calls: list[str] = []
+    engine = ApprovalEngine(
+        [_counting_rule("a", True, calls), _counting_rule("b", True, calls)], mode="fast"
+    )
+
+    decision = engine.evaluate_job({}, mode=EvaluationMode.AUDIT)
+    assert decision.reasons == ["a failed", "b failed"]
+    assert calls == ["a", "b"]
+
+
+def test_fast_mode_reorders_selective_rules_first() -> None:
+    calls: list[str] = []
+    engine = ApprovalEngine(
+        [
+            _counting_rule("passes", False, calls),
+            _counting_rule("also_passes", False, calls),
+            _counting_rule("rejects", True, calls),
+        ],
+        mode=EvaluationMode.FAST,
+        reorder_interval=4,
+    )
+    for _ in range(4):
+        engine.evaluate_job({})
+
+    calls.clear()
+    decision = engine.evaluate_job({})
+    assert calls == ["rejects"]
+    assert decision.reasons == ["rejects failed"]
+    assert engine.rule_stats()[0].name == "rejects"
+
+    # Audit mode still runs everything in registration order
+    calls.clear()
+    assert engine.evaluate_job({}, mode="audit").reasons == ["rejects failed"]
+    assert calls == ["passes", "also_passes", "rejects"]
+
+
+def test_fast_and_audit_modes_agree_on_approval() -> None:
+    calls: list[str] = []
+    rules = [_counting_rule("a", False, calls), _counting_rule("b", False, calls)]
+    fast = ApprovalEngine(rules, mode="fast", reorder_interval=1)
+    audit = ApprovalEngine(rules)
+    assert fast.evaluate_job({}).approved is audit.evaluate_job({}).approved is True
+
+
+def test_rule_stats_track_calls_and_rejections() -> None:
+    calls: list[str] = []
+    engine = ApprovalEngine([_counting_rule("a", True, calls)])
+    engine.evaluate_job({})
+    engine.evaluate_job({})
+
+    [stats] = engine.rule_stats()
+    assert (stats.name, stats.calls, stats.rejections) == ("a", 2, 2)
+    assert stats.rejection_rate == 0.75
+
+
+def test_invalid_mode_and_interval_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        ApprovalEngine(mode="sometimes")
+    with pytest.raises(ValueError):
+        ApprovalEngine(reorder_interval=0)
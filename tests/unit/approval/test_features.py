@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine
+from job_ingestion.approval.features import (
+    FEATURES,
+    FeaturedJob,
+    JobFeatures,
+    get_features,
+    uses_features,
+)
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    ("job", "name", "expected"),
+    [
+        ({"location": "Toronto, ON"}, "location_country", "CA"),
+        ({"location": {"country": "USA"}}, "country_code", "US"),
+        ({"location": "Downtown", "geo_country_code": "CA"}, "country_code", "CA"),
+        ({"latitude": 40.71, "longitude": -74.0}, "country_code", "US"),
+        ({"remote": "yes"}, "is_remote", True),
+        ({}, "is_remote", False),
+        ({"salary_min": "100000", "salary_currency": "cad"}, "salary_currency", "CAD"),
+        ({"salary_min": "n/a"}, "salary_amount", None),
+        ({"salary_min": 100, "salary_currency": "XYZ"}, "salary_usd", None),
+        ({"salary_min": 50, "salary_unit": "per hour"}, "salary_unit", "hourly"),
+        ({"salary_min": 5000, "salary_unit": "monthly"}, "annualized_usd", 60000.0),
+        ({"employment_type": " Full-Time "}, "employment_type", "Full-Time"),
+        ({"language": "  "}, "language", None),
+        ({"language": "ENGLISH"}, "language_code", "en"),
+        ({"language": "Klingon"}, "language_code", None),
+    ],
+)
+def test_feature_values(job: dict[str, Any], name: str, expected: Any) -> None:
+    assert JobFeatures(job)[name] == expected
+
+
+def test_features_are_memoized_per_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def title_upper(f: JobFeatures) -> str:
+        calls.append("x")
+        return str(f.job.get("title", "")).upper()
+
+    monkeypatch.setitem(FEATURES, "title_upper", title_upper)
+    features = JobFeatures({"title": "dev"})
+    assert "title_upper" not in features
+    assert features["title_upper"] == "DEV"
+    assert features["title_upper"] == "DEV"
+    assert "title_upper" in features
+    assert calls == ["x"]
+
+
+def test_unknown_feature_raises_key_error() -> None:
+    with pytest.raises(KeyError):
+        JobFeatures({})["no_such_feature"]
+
+
+def test_engine_computes_shared_features_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def title_upper(f: JobFeatures) -> str:
+        calls.append(f.job)
+        return str(f.job.get("title", "")).upper()
+
+    monkeypatch.setitem(FEATURES, "title_upper", title_upper)
+
+    @uses_features("title_upper")
+    def not_intern(job: dict[str, Any]) -> tuple[bool, str | None]:
+        ok = "INTERN" not in get_features(job)["title_upper"]
+        return (ok, None) if ok else (False, "Internship")
+
+    @uses_features("title_upper")
+    def has_title(job: dict[str, Any]) -> tuple[bool, str | None]:
+        ok = bool(get_features(job)["title_upper"])
+        return (ok, None) if ok else (False, "Missing title")
+
+    engine = ApprovalEngine(rules=[not_intern, has_title])
+    assert engine.required_features() == ["title_upper"]
+
+    assert engine.evaluate_job({"title": "Engineer"}).approved is True
+    assert len(calls) == 1
+
+    engine.evaluate_batch([{"title": "Intern"}, {"title": ""}])
+    assert len(calls) == 3
+    assert all(isinstance(job, FeaturedJob) for job in calls)
+
+
+def test_rule_called_directly_gets_fresh_features() -> None:
+    job = {"language": "en"}
+    assert get_features(job) is not get_features(job)
+    featured = FeaturedJob(job)
+    assert get_features(featured) is get_features(featured)
+    assert featured == job
+
+
+def test_register_rule_rejects_unknown_features() -> None:
+    @uses_features("country_code", "no_such_feature")
+    def rule(job: dict[str, Any]) -> tuple[bool, str | None]:
+        return True, None
+
+    with pytest.raises(ValueError, match="no_such_feature"):
+        ApprovalEngine(rules=[rule])
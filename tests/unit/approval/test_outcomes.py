@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Any
+
+import job_ingestion.approval.rules.salary_rules as salary_module
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.outcomes import MAX_RULES, RuleSetSignature, rule_fingerprint
+from job_ingestion.approval.rule_dsl import compile_rule
+from job_ingestion.approval.rules.content_rules import get_rules as content_rules
+from job_ingestion.approval.rules.salary_rules import get_rules as salary_rules
+
+
+def _title(job: dict[str, Any]) -> tuple[bool, str | None]:
+    ok = bool(job.get("title"))
+    return (ok, None) if ok else (False, "Missing title")
+
+
+def _salary(job: dict[str, Any]) -> tuple[bool, str | None]:
+    ok = (job.get("salary_min") or 0) >= 100
+    return (ok, None) if ok else (False, "Salary too low")
+
+
+def test_signature_encodes_and_decodes_masks() -> None:
+    sig = RuleSetSignature.from_pairs([("a", ""), ("b", "x"), ("c", "")])
+    assert sig.encode(["a", "c"]) == 0b101
+    assert sig.decode(0b110) == ["b", "c"]
+    assert sig.all_bits == 0b111
+    assert RuleSetSignature.from_json(sig.to_json()) == sig
+
+
+def test_signature_rejects_duplicates_and_too_many_rules() -> None:
+    with pytest.raises(ValueError):
+        RuleSetSignature.from_pairs([("a", ""), ("a", "")])
+    with pytest.raises(ValueError):
+        RuleSetSignature.from_pairs((f"r{i}", "") for i in range(MAX_RULES + 1))
+
+
+def test_remap_follows_rules_across_versions() -> None:
+    old = RuleSetSignature.from_pairs([("a", ""), ("b", ""), ("c", "")])
+    new = RuleSetSignature.from_pairs([("c", ""), ("a", ""), ("d", "")])
+    assert new.remap(old.encode(["a", "b", "c"]), old) == new.encode(["a", "c"])
+    assert new.changed_since(old) == ["d"]
+
+
+def test_fingerprint_tracks_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    [salary_rule] = salary_rules()
+    before = rule_fingerprint(salary_rule)
+    monkeypatch.setattr(salary_module, "MIN_ANNUAL_SALARY_USD", 1.0)
+    assert rule_fingerprint(salary_rule) != before
+    assert rule_fingerprint(content_rules()[0]) != ""
+    assert rule_fingerprint(_title) == ""
+
+
+def test_fingerprint_of_json_rules_follows_definition() -> None:
+    condition = {"field": "employment_type", "operator": "equals", "value": "FT"}
+    spec = {"id": "r", "condition": condition}
+    assert rule_fingerprint(compile_rule(spec)) == rule_fingerprint(compile_rule(dict(spec)))
+    changed = compile_rule({**spec, "condition": {**condition, "value": "PT"}})
+    assert rule_fingerprint(changed) != rule_fingerprint(compile_rule(spec))
+
+
+@pytest.mark.parametrize("mode", [EvaluationMode.AUDIT, EvaluationMode.FAST])  # type: ignore[misc]
+def test_decisions_report_failed_and_checked_rules(mode: EvaluationMode) -> None:
+    engine = ApprovalEngine(rules=[_title, _salary], mode=mode)
+    jobs = [{"title": "", "salary_min": 10}, {"title": "ok", "salary_min": 500}]
+
+    decision = engine.evaluate_job(jobs[0])
+    batch = engine.evaluate_batch(jobs)
+    assert decision.failed_rules[0] == "_title"
+    assert batch.reason_codes(0)[0] == "_title"
+    if mode is EvaluationMode.AUDIT:
+        assert decision.failed_rules == ("_title", "_salary")
+        assert batch.checked_codes(0) == ["_title", "_salary"]
+    else:
+        assert decision.checked_rules == ("_title",)
+        assert batch.checked_codes(0) == ["_title"]
+    assert batch.checked_codes(1) == ["_title", "_salary"]
+
+
+def test_run_rules_runs_only_named_rules() -> None:
+    engine = ApprovalEngine(rules=[_title, _salary])
+    assert engine.run_rules({"title": "", "salary_min": 500}, ["_salary"]) == {
+        "_salary": (True, None)
+    }
+    assert engine.rule_stats()[0].calls == 0
+    with pytest.raises(KeyError):
+        engine.run_rules({}, ["missing"])
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine
+from job_ingestion.approval.profiling import LatencyReservoir, RuleProfiler
+from job_ingestion.utils import metrics
+
+
+def _reject_if(field: str) -> Any:  # noqa: ANN401
+    def rule(job: dict[str, Any]) -> tuple[bool, str | None]:
+        return (False, f"{field} set") if job.get(field) else (True, None)
+
+    rule.__name__ = f"reject_{field}"
+    return rule
+
+
+def test_counts_are_broken_down_by_schema() -> None:
+    engine = ApprovalEngine([_reject_if("a"), _reject_if("b")], profile_sample_every=4)
+    jobs = [
+        {"_schema": "linkedin", "a": True},
+        {"_schema": "linkedin"},
+        {"_schema": "indeed", "b": True},
+        {"a": True},
+    ]
+    for job in jobs:
+        engine.evaluate_job(job)
+
+    snaps = {(s.schema, s.rule): s for s in engine.profiler.snapshot()}
+    assert snaps[("linkedin", "reject_a")].calls == 2
+    assert snaps[("linkedin", "reject_a")].rejections == 1
+    assert snaps[("indeed", "reject_b")].rejection_rate == 1.0
+    assert snaps[("unknown", "reject_a")].rejections == 1
+    assert [s.schema for s in engine.profiler.snapshot("indeed")] == ["indeed", "indeed"]
+
+
+def test_only_sampled_evaluations_are_timed() -> None:
+    engine = ApprovalEngine([_reject_if("a")], profile_sample_every=4)
+    for _ in range(20):
+        engine.evaluate_job({"_schema": "s"})
+
+    [snap] = engine.profiler.snapshot()
+    assert snap.calls == 20
+    # Warm-up (first 4) plus every 4th evaluation afterwards: 8, 12, 16, 20
+    assert snap.timed_calls == 8
+    assert snap.p50_ns <= snap.p99_ns
+    assert snap.total_ns == pytest.approx(snap.mean_ns * 20)
+    [stats] = engine.rule_stats()
+    assert (stats.calls, stats.timed_calls) == (20, 8)
+
+
+def test_batch_evaluation_records_profiles_per_schema() -> None:
+    engine = ApprovalEngine([_reject_if("a")])
+    engine.evaluate_batch(
+        [{"_schema": "x", "a": 1}, {"_schema": "y"}, {"_schema": "x"}, {"_schema": "y"}]
+    )
+    snaps = {s.schema: s for s in engine.profiler.snapshot()}
+    assert (snaps["x"].calls, snaps["x"].rejections, snaps["x"].timed_calls) == (2, 1, 2)
+    assert (snaps["y"].calls, snaps["y"].rejections) == (2, 0)
+
+
+def test_batch_evaluation_times_per_row_rules_on_sampled_jobs_only() -> None:
+    engine = ApprovalEngine([_reject_if("a")], profile_sample_every=4)
+    engine.evaluate_batch([{"_schema": "s"} for _ in range(20)])
+
+    [snap] = engine.profiler.snapshot()
+    assert snap.calls == 20
+    # One latency sample per timed job, as in `evaluate_job`: 4 warm-up plus 8, 12, 16, 20
+    assert snap.timed_calls == 8
+    assert snap.p50_ns <= snap.p99_ns
+
+
+def test_publish_sets_metrics_gauges() -> None:
+    metrics.reset_gauges()
+    engine = ApprovalEngine([_reject_if("a")])
+    engine.evaluate_job({"_schema": "greenhouse", "a": True})
+    engine.profiler.publish()
+
+    gauges = metrics.get_gauges()
+    assert gauges["approval.rule.greenhouse.reject_a.calls"] == 1.0
+    assert gauges["approval.rule.greenhouse.reject_a.rejections"] == 1.0
+    assert "approval.rule.greenhouse.reject_a.p95_ns" in gauges
+    metrics.reset_gauges()
+
+
+def test_reservoir_keeps_most_recent_samples() -> None:
+    reservoir = LatencyReservoir(capacity=3)
+    assert reservoir.percentiles([50]) == [0.0]
+    for value in (100, 1, 2, 3):
+        reservoir.add(value)
+    assert len(reservoir) == 3
+    assert reservoir.percentiles([0, 100]) == [1.0, 3.0]
+
+
+def test_invalid_profiler_settings_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        RuleProfiler(sample_every=0)
+    with pytest.raises(ValueError):
+        LatencyReservoir(capacity=0)
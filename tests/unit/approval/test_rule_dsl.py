@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine
+from job_ingestion.approval.rule_dsl import (
+    ReloadableRuleSet,
+    RuleDefinitionError,
+    compile_condition,
+    compile_rule,
+    compile_rule_set,
+)
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "condition, job, expected",
+    [
+        (
+            {"field": "employment_type", "operator": "equals", "value": "Full-Time"},
+            {"employment_type": "Full-Time"},
+            True,
+        ),
+        (
+            {
+                "field": "employment_type",
+                "operator": "equals",
+                "value": "full-time",
+                "ignore_case": True,
+            },
+            {"employment_type": " FULL-TIME "},
+            True,
+        ),
+        ({"field": "employment_type", "operator": "equals", "value": "full-time"}, {}, False),
+        ({"field": "company_type", "operator": "not_equals", "value": "staffing"}, {}, True),
+        ({"field": "language", "operator": "in", "value": ["en", "fr"]}, {"language": "fr"}, True),
+        (
+            {"field": "language", "operator": "in", "value": ["en", "fr"]},
+            {"language": ["en"]},
+            False,
+        ),
+        ({"field": "language", "operator": "not_in", "value": ["de"]}, {"language": "en"}, True),
+        (
+            {"field": "salary.min", "operator": ">=", "value": 100000},
+            {"salary": {"min": 100000}},
+            True,
+        ),
+        (
+            {"field": "salary.min", "operator": ">=", "value": 100000},
+            {"salary": {"min": "100000"}},
+            False,
+        ),
+        ({"field": "salary.min", "operator": "<", "value": 10}, {"salary": None}, False),
+        (
+            {"field": "locations.0.country", "operator": "equals", "value": "US"},
+            {"locations": [{"country": "US"}]},
+            True,
+        ),
+        (
+            {"field": "locations.1.country", "operator": "exists"},
+            {"locations": [{"country": "US"}]},
+            False,
+        ),
+        ({"field": "title", "operator": "not_exists"}, {"title": None}, True),
+        (
+            {"field": "title", "operator": "contains", "value": "engineer", "ignore_case": True},
+            {"title": "Senior Engineer"},
+            True,
+        ),
+        (
+            {"field": "tags", "operator": "contains", "value": "python"},
+            {"tags": ["go", "python"]},
+            True,
+        ),
+        (
+            {"field": "title", "operator": "matches", "value": "^senior\\b", "ignore_case": True},
+            {"title": "Senior SWE"},
+            True,
+        ),
+    ],
+)
+def test_leaf_operators(condition: dict[str, Any], job: dict[str, Any], expected: bool) -> None:
+    assert compile_condition(condition)(job) is expected
+
+
+def test_combinators_nest() -> None:
+    check = compile_condition(
+        {
+            "or": [
+                {
+                    "and": [
+                        {"field": "currency", "operator": "equals", "value": "USD"},
+                        {"field": "min", "operator": ">=", "value": 100000},
+                        {"field": "unit", "operator": "equals", "value": "YEAR"},
+                    ]
+                },
+                {"not": {"field": "remote", "operator": "not_equals", "value": True}},
+            ]
+        }
+    )
+    assert check({"currency": "USD", "min": 120000, "unit": "YEAR"}) is True
+    assert check({"currency": "USD", "min": 90000, "unit": "YEAR"}) is False
+    assert check({"remote": True}) is True
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "condition",
+    [
+        {"field": "x", "operator": "approximately", "value": 1},
+        {"field": "", "operator": "equals", "value": 1},
+        {"field": "x", "operator": ">=", "value": "100"},
+        {"field": "x", "operator": "in", "value": "US"},
+        {"field": "x", "operator": "matches", "value": "("},
+        {"and": []},
+    ],
+)
+def test_invalid_conditions_are_rejected(condition: dict[str, Any]) -> None:
+    with pytest.raises(RuleDefinitionError):
+        compile_condition(condition)
+
+
+def test_compiled_rule_is_an_approval_rule() -> None:
+    rule = compile_rule(
+        {
+            "id": "full_time",
+            "name": "Full-time Employment Filter",
+            "condition": {"field": "employment_type", "operator": "equals", "value": "FT"},
+        }
+    )
+    assert rule({"employment_type": "FT"}) == (True, None)
+    assert rule({}) == (False, "Failed rule: Full-time Employment Filter")
+
+    engine = ApprovalEngine([rule])
+    assert engine.evaluate_job({}).reasons == ["Failed rule: Full-time Employment Filter"]
+    assert engine.rule_stats()[0].name == "full_time"
+
+
+def test_rule_set_accepts_prd_wrapper_and_rejects_duplicates() -> None:
+    leaf = {"field": "a", "operator": "exists"}
+    rule_set = compile_rule_set(
+        {"approvalRules": {"version": "1.0", "rules": [{"id": "a", "condition": leaf}]}}
+    )
+    assert rule_set.version == "1.0"
+    assert [r.id for r in rule_set.rules] == ["a"]
+
+    with pytest.raises(RuleDefinitionError, match="duplicate"):
+        compile_rule_set({"rules": [{"id": "a", "condition": leaf}] * 2})
+
+
+def _write_rules(path: Path, version: str, min_salary: int, mtime_ns: int) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "version": version,
+                "rules": [
+                    {
+                        "id": "min_salary",
+                        "condition": {"field": "salary_min", "operator": ">=", "value": min_salary},
+                        "reason": f"Salary below {min_salary}",
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_reloadable_rule_set_swaps_versions_in_engine(tmp_path: Path) -> None:
+    path = tmp_path / "rules.json"
+    _write_rules(path, "v1", 100_000, mtime_ns=1_000_000_000)
+    now = [0.0]
+    source = ReloadableRuleSet(path, check_interval=10.0, clock=lambda: now[0])
+    engine = ApprovalEngine()
+    engine.register_rule_source(source)
+
+    job = {"salary_min": 90_000}
+    assert engine.evaluate_job(job).reasons == ["Salary below 100000"]
+
+    _write_rules(path, "v2", 80_000, mtime_ns=2_000_000_000)
+    # Not re-checked until the interval elapses
+    assert engine.evaluate_job(job).approved is False
+
+    now[0] = 10.0
+    assert engine.evaluate_job(job).approved is True
+    assert source.version == "v2" and source.generation == 2
+
+
+def test_invalid_reload_keeps_previous_version(tmp_path: Path) -> None:
+    path = tmp_path / "rules.json"
+    _write_rules(path, "v1", 100_000, mtime_ns=1_000_000_000)
+    source = ReloadableRuleSet(path, check_interval=0.0)
+
+    path.write_text('{"rules": [{"id": "broken", "condition": {"operator": "??"}}]}')
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+
+    assert source.reload_if_changed() is False
+    assert source.version == "v1"
+    assert [r.id for r in source.rules()] == ["min_salary"]
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "document",
+    [
+        [{"id": "a", "condition": {"field": "a", "operator": "exists"}}],
+        {"rules": ["oops"]},
+        {"rules": [{"id": "a", "condition": {"field": "a", "operator": "exists"}, "weight": "x"}]},
+        {"rules": [{"id": "a", "condition": {"field": "a", "operator": "exists"}, "weight": None}]},
+        {"rules": [{"id": "a", "condition": {"field": "a", "operator": "exists"}, "weight": -1}]},
+        {"rules": [{"id": "a", "condition": {"field": "a", "operator": "exists"}, "name": 3}]},
+        {"rules": [{"id": "a", "condition": {"field": "a", "operator": "exists"}, "required": 1}]},
+    ],
+)
+def test_malformed_documents_raise_rule_definition_errors(document: Any) -> None:
+    with pytest.raises(RuleDefinitionError):
+        compile_rule_set(document)
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "content",
+    [
+        '{"rules": [{"id": "a", "condition": {"field": "a", "operator": "exists"},'
+        ' "weight": "heavy"}]}',
+        '{"rules": ["oops"]}',
+        '[{"id": "a"}]',
+        "null",
+        "\xff",  # not UTF-8
+    ],
+)
+def test_malformed_reload_keeps_previous_version_in_engine(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "rules.json"
+    _write_rules(path, "v1", 100_000, mtime_ns=1_000_000_000)
+    source = ReloadableRuleSet(path, check_interval=0.0)
+    engine = ApprovalEngine()
+    engine.register_rule_source(source)
+
+    path.write_text(content, encoding="latin-1")
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+
+    # The engine re-checks the file on every evaluation and keeps the old rules
+    assert engine.evaluate_job({"salary_min": 90_000}).reasons == ["Salary below 100000"]
+    assert source.version == "v1" and source.generation == 1
@@ -31,6 +31,13 @@ def test_salary_rules_pass_fail() -> None:
     ok, reason = min_rule({"salary_min": "not-a-number"})
     assert ok is False and "No valid salary information found" in (reason or "")
 
+    # Currencies are converted through the rates table, never assumed to be USD
+    ok, reason = min_rule({"salary_min": 150_000, "salary_currency": "JPY"})
+    assert ok is False and "Annual salary below" in (reason or "")
+
+    ok, reason = min_rule({"salary_min": 150_000, "salary_currency": "XYZ"})
+    assert ok is False and reason == "Unsupported currency: XYZ"
+
 
 def test_location_rules_pass_fail() -> None:
     rules = location_rules.get_rules()
@@ -94,7 +101,17 @@ def test_geographical_location_rule() -> None:
     assert ok is False and "Job location must be in US/Canada or remote" in (reason or "")
 
     ok, reason = geo_rule({"location": "London, UK", "remote": False})
-    assert ok is False and "Unable to determine country from location" in (reason or "")
+    assert ok is False and "Job location must be in US/Canada or remote" in (reason or "")
+
+    # City/region strings without a country resolve through the gazetteer
+    ok, reason = geo_rule({"location": "Austin, TX", "remote": False})
+    assert ok is True and reason is None
+
+    ok, reason = geo_rule({"location": "Vancouver, BC", "remote": False})
+    assert ok is True and reason is None
+
+    ok, reason = geo_rule({"location": {"city": "Denver", "state": "CO"}, "remote": False})
+    assert ok is True and reason is None
 
     ok, reason = geo_rule({"location": {"city": "Manchester", "country": "UK"}, "remote": False})
     assert ok is False and "Job location must be in US/Canada or remote" in (reason or "")
@@ -107,6 +124,16 @@ def test_geographical_location_rule() -> None:
     ok, reason = geo_rule({"location": "Unknown Format", "remote": False})
     assert ok is False and "Unable to determine country from location" in (reason or "")
 
+    # Vague text falls back to coordinates (reverse geocoded or precomputed)
+    ok, reason = geo_rule({"location": "Downtown", "latitude": 30.27, "longitude": -97.74})
+    assert ok is True and reason is None
+
+    ok, reason = geo_rule({"location": "Downtown", "latitude": 48.86, "longitude": 2.35})
+    assert ok is False and "Job location must be in US/Canada or remote" in (reason or "")
+
+    ok, reason = geo_rule({"location": "Downtown", "geo_country_code": "CA"})
+    assert ok is True and reason is None
+
 
 def test_content_rules_pass_fail() -> None:
     rules = content_rules.get_rules()
@@ -219,6 +246,35 @@ def test_company_type_rules_pass_fail() -> None:
     )
 
 
+def test_staffing_agency_rule_scans_name_and_descriptions() -> None:
+    """Agency detection from company name and description phrasing."""
+    agency_rule: ApprovalRule = company_type_rules.get_rules()[1]
+
+    ok, reason = agency_rule(
+        {
+            "company_name": "Acme Corp",
+            "short_description": "Build data pipelines.",
+            "full_description": "Join our client-facing platform team.",
+        }
+    )
+    assert ok is True and reason is None
+
+    ok, reason = agency_rule({"company_name": "Robert Half, Inc."})
+    assert ok is False and "staffing/recruiting agency" in (reason or "")
+
+    ok, reason = agency_rule({"company_name": "Bright Path Staffing LLC"})
+    assert ok is False
+
+    ok, reason = agency_rule(
+        {"company_name": "Acme", "full_description": "On behalf of our client, we seek a dev."}
+    )
+    assert ok is False and "'on behalf of our client' in full_description" in (reason or "")
+
+    # Falls back to the combined description when the split fields are absent
+    ok, reason = agency_rule({"description": "Our client is hiring engineers."})
+    assert ok is False
+
+
 def test_language_rules_pass_fail() -> None:
     """Test language approval rules."""
     rules = language_rules.get_rules()
@@ -281,6 +337,35 @@ def test_language_rules_pass_fail() -> None:
     assert ok is False and "Job must specify a language" in (reason or "")
 
 
+def test_language_rule_falls_back_to_detected_language() -> None:
+    [language_rule] = language_rules.get_rules()
+    english = {
+        "title": "Warehouse associate",
+        "description": "Receive and ship orders, keep the loading dock organized and safe",
+    }
+    french = {
+        "title": "Préposé à l'entrepôt",
+        "description": "Recevoir et expédier les commandes et garder le quai de chargement propre",
+    }
+    assert language_rule({**english, "location": {"country": "USA"}}) == (True, None)
+    assert language_rule({**french, "location": {"country": "Canada"}}) == (True, None)
+    ok, reason = language_rule({**french, "location": {"country": "USA"}})
+    assert ok is False and "only accepted for jobs in Canada" in (reason or "")
+    # A declared language wins over the detected one
+    ok, _ = language_rule({**english, "language": "Spanish", "location": {"country": "USA"}})
+    assert ok is False
+
+    jobs = [
+        {**english, "location": "Austin, TX"},
+        {**french, "location": "Montreal, QC, Canada"},
+        {**french, "location": "Austin, TX"},
+        {"title": "Cook", "location": "Austin, TX"},
+    ]
+    batch = ApprovalEngine([language_rule]).evaluate_batch(jobs)
+    assert batch.approved.tolist() == [language_rule(job)[0] for job in jobs]
+    assert batch.approved.tolist() == [True, True, False, False]
+
+
 def test_engine_with_all_rules() -> None:
     engine = ApprovalEngine(
         [
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.rule_dsl import compile_rule
+from job_ingestion.approval.rules.salary_rules import get_rules as salary_rules
+from job_ingestion.approval.scoring import review_band, rule_weight
+
+
+def _near_limit(job: dict[str, Any]) -> bool:
+    return 95 <= (job.get("salary_min") or 0) < 100
+
+
+@review_band(_near_limit)
+def salary_floor(job: dict[str, Any]) -> tuple[bool, str | None]:
+    ok = (job.get("salary_min") or 0) >= 100
+    return (ok, None) if ok else (False, "Salary too low")
+
+
+def has_title(job: dict[str, Any]) -> tuple[bool, str | None]:
+    return (True, None) if job.get("title") else (False, "Missing title")
+
+
+nice_to_have = compile_rule(
+    {
+        "id": "has_remote_flag",
+        "condition": {"field": "remote", "operator": "exists"},
+        "required": False,
+        "weight": 0.5,
+    }
+)
+
+JOBS = [
+    {"title": "A", "salary_min": 150, "remote": True},  # approved
+    {"title": "B", "salary_min": 97, "remote": True},  # salary in review band
+    {"title": "C", "salary_min": 50, "remote": True},  # hard salary failure
+    {"title": "D", "salary_min": 150},  # only an optional rule fails
+    {"title": "", "salary_min": 97, "remote": True},  # band, but title fails hard
+]
+
+
+def _engine() -> ApprovalEngine:
+    return ApprovalEngine([has_title, salary_floor, nice_to_have], mode=EvaluationMode.SCORE)
+
+
+def test_soft_failures_go_to_review() -> None:
+    decisions = [_engine().evaluate_job(job) for job in JOBS]
+
+    assert [d.approved for d in decisions] == [True, False, False, False, False]
+    assert [d.review for d in decisions] == [False, True, False, True, False]
+    assert [d.score for d in decisions] == pytest.approx([1.0, 0.6, 0.6, 0.8, 0.2])
+
+
+def test_batch_matches_per_job_decisions() -> None:
+    engine = _engine()
+    batch = engine.evaluate_batch(JOBS)
+    decisions = [engine.evaluate_job(job) for job in JOBS]
+
+    assert batch.review is not None and batch.scores is not None
+    assert batch.review.tolist() == [d.review for d in decisions]
+    assert batch.scores.tolist() == pytest.approx([d.score for d in decisions])
+
+
+@pytest.mark.parametrize("mode", [EvaluationMode.AUDIT, EvaluationMode.FAST])  # type: ignore[misc]
+def test_other_modes_never_review(mode: EvaluationMode) -> None:
+    engine = ApprovalEngine([has_title, salary_floor, nice_to_have], mode=mode)
+    decision = engine.evaluate_job(JOBS[1])
+    assert not decision.approved and not decision.review and decision.score is None
+    assert engine.evaluate_batch(JOBS).review is None
+
+
+def test_salary_within_margin_below_threshold_is_reviewed() -> None:
+    engine = ApprovalEngine(salary_rules(), mode=EvaluationMode.SCORE)
+    near = engine.evaluate_job({"salary_min": 96_000, "salary_currency": "USD"})
+    far = engine.evaluate_job({"salary_min": 90_000, "salary_currency": "USD"})
+    hourly = engine.evaluate_job({"salary_min": 44, "salary_unit": "hourly"})
+
+    assert near.review and not far.review and hourly.review
+    assert near.reasons == ["Annual salary below $100,000 USD (found: $96,000 USD)"]
+
+
+def test_negative_weights_are_rejected() -> None:
+    bad = compile_rule({"id": "r", "condition": {"field": "x", "operator": "exists"}, "weight": -1})
+    with pytest.raises(ValueError):
+        rule_weight(bad)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.shadow import ShadowEvaluator
+
+
+def has_title(job: dict[str, Any]) -> tuple[bool, str | None]:
+    return (True, None) if job.get("title") else (False, "Missing title")
+
+
+def salary_floor(job: dict[str, Any]) -> tuple[bool, str | None]:
+    ok = (job.get("salary_min") or 0) >= 100
+    return (ok, None) if ok else (False, "Salary too low")
+
+
+def lower_salary_floor(job: dict[str, Any]) -> tuple[bool, str | None]:
+    ok = (job.get("salary_min") or 0) >= 50
+    return (ok, None) if ok else (False, "Salary too low")
+
+
+JOBS = [
+    {"external_id": "a", "title": "Engineer", "salary_min": 150},
+    {"external_id": "b", "title": "Analyst", "salary_min": 70},
+    {"external_id": "c", "title": "", "salary_min": 70},
+    {"external_id": "d", "title": "Clerk", "salary_min": 10},
+]
+
+
+def _shadow_run(
+    active: ApprovalEngine, candidate: ApprovalEngine, jobs: list[dict[str, Any]]
+) -> ShadowEvaluator:
+    shadow = ShadowEvaluator(candidate)
+    decisions = [active.evaluate_job(job) for job in jobs]
+    assert shadow.submit(jobs, decisions, active.rule_set_signature().names)
+    shadow.drain()
+    shadow.close()
+    return shadow
+
+
+def test_divergences_are_aggregated_per_rule() -> None:
+    active = ApprovalEngine([has_title, salary_floor])
+    candidate = ApprovalEngine([has_title, lower_salary_floor])
+
+    report = _shadow_run(active, candidate, JOBS).report()
+
+    assert report.submitted == report.evaluated == 4
+    # "b" is approved by the candidate; "c" still fails on its title
+    assert report.newly_approved == 1 and report.newly_rejected == 0
+    assert [d.external_id for d in report.samples] == ["b"]
+    rules = {r.rule: r for r in report.rules}
+    assert rules["has_title"].compared == 4
+    assert rules["has_title"].newly_failing == rules["has_title"].newly_passing == 0
+    # The replaced rule passes in the candidate where it used to fail
+    assert rules["salary_floor"].newly_passing == 3
+    assert rules["lower_salary_floor"].newly_failing == 1
+    assert rules["lower_salary_floor"].divergence_rate == pytest.approx(0.25)
+
+
+def test_rules_the_active_engine_skipped_are_not_compared() -> None:
+    active = ApprovalEngine([has_title, salary_floor], mode=EvaluationMode.FAST)
+    candidate = ApprovalEngine([has_title, salary_floor])
+
+    report = _shadow_run(active, candidate, JOBS).report()
+
+    # Salary was never checked for "c" (title failed first) so it is not a divergence
+    rules = {r.rule: r for r in report.rules}
+    assert rules["salary_floor"].compared == 3
+    assert rules["salary_floor"].newly_failing == 0
+    assert report.newly_approved == report.newly_rejected == 0
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    release = threading.Event()
+
+    def slow_rule(job: dict[str, Any]) -> tuple[bool, str | None]:
+        release.wait(timeout=5)
+        return True, None
+
+    active = ApprovalEngine([has_title])
+    shadow = ShadowEvaluator(ApprovalEngine([slow_rule]), queue_size=1)
+    jobs = JOBS[:1]
+    decisions = [active.evaluate_job(jobs[0])]
+
+    results = [shadow.submit(jobs, decisions, ["has_title"]) for _ in range(5)]
+    release.set()
+    shadow.drain()
+    shadow.close()
+
+    report = shadow.report()
+    assert results[0] is True and results.count(False) >= 3
+    assert report.dropped == results.count(False)
+    assert report.evaluated + report.dropped == report.submitted == 5
+
+
+def test_candidate_errors_are_counted() -> None:
+    def broken(job: dict[str, Any]) -> tuple[bool, str | None]:
+        raise RuntimeError("boom")
+
+    active = ApprovalEngine([has_title])
+    report = _shadow_run(active, ApprovalEngine([broken]), JOBS[:2]).report()
+    assert report.errors == 2 and report.evaluated == 0
+
+
+def test_submit_validates_lengths() -> None:
+    shadow = ShadowEvaluator(ApprovalEngine([has_title]))
+    with pytest.raises(ValueError):
+        shadow.submit(JOBS, [], [])
+    with pytest.raises(ValueError):
+        ShadowEvaluator(ApprovalEngine([has_title]), queue_size=0)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from job_ingestion.approval.staffing_detector import AhoCorasick, StaffingDetector
+
+
+def test_aho_corasick_finds_overlapping_patterns() -> None:
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    found = sorted((end, automaton.patterns[pid]) for end, pid in automaton.iter_matches("ushers"))
+    assert found == [(4, "he"), (4, "she"), (6, "hers")]
+
+
+def test_detector_ignores_direct_employers() -> None:
+    detector = StaffingDetector()
+    result = detector.assess(
+        "Acme Software",
+        "We build tools for recruiters.",
+        "You will work closely with clients and our client success team.",
+    )
+    assert result.is_staffing is False
+    assert result.score < 1.0
+
+
+def test_detector_requires_word_boundaries() -> None:
+    detector = StaffingDetector()
+    # "personnel" only counts as a whole word in the company name
+    assert detector.assess("Personnelle Labs", None, None).is_staffing is False
+    assert detector.assess("Acme Personnel", None, None).is_staffing is True
+
+
+def test_detector_scopes_phrases_to_fields() -> None:
+    detector = StaffingDetector()
+    # Company-name patterns do not apply to descriptions and vice versa
+    assert detector.assess("Acme", "Our staffing needs are growing.", None).is_staffing is False
+    assert detector.assess("Our client is", None, None).is_staffing is False
+    result = detector.assess("Acme", None, "A recruiting firm working for a bank.")
+    assert result.is_staffing is True
+    assert result.signals[0].field == "full_description"
+
+
+def test_detector_matches_do_not_span_fields() -> None:
+    detector = StaffingDetector()
+    result = detector.assess("Acme on behalf of", "our client", None)
+    assert result.is_staffing is False
+
+
+def test_detector_handles_names_that_grow_when_casefolded() -> None:
+    detector = StaffingDetector()
+    # "ß" casefolds to "ss": matches must still land in the right field
+    result = detector.assess("Großmann GmbH", None, "Great place. Apply to our staffing agency")
+    assert result.is_staffing is True
+    assert result.signals[0].field == "full_description"
+    assert detector.assess("Straße Staffing", "x", None).is_staffing is True
+
+
+def test_detector_accumulates_weak_signals() -> None:
+    detector = StaffingDetector()
+    assert detector.assess("Acme", "Contract-to-hire role.", None).is_staffing is False
+    result = detector.assess("Acme", "Contract-to-hire role.", "C2C or W2 only, temp to perm.")
+    assert result.is_staffing is True
+
+
+def test_detector_known_agency_index_is_configurable() -> None:
+    detector = StaffingDetector(known_agencies=["Initech Talent"])
+    assert detector.assess("INITECH TALENT, LLC", None, None).is_staffing is True
+    assert detector.assess("Robert Half", None, None).is_staffing is False
+
+
+def test_detector_scans_large_descriptions() -> None:
+    detector = StaffingDetector()
+    body = "Build reliable distributed systems. " * 3000 + "Our client is a bank."
+    result = detector.assess("Acme", None, body)
+    assert result.is_staffing is True
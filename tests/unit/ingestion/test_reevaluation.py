@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.features import uses_features
+from job_ingestion.ingestion.reevaluation import (
+    canonical_job_from_row,
+    record_rule_set,
+    reevaluate_stored_jobs,
+    rule_outcome,
+)
+from job_ingestion.storage.models import (
+    ApprovalRuleSet,
+    ApprovalStatus,
+    Base,
+    Job,
+    RejectedJob,
+)
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+_settings: dict[str, Any] = {"min_salary": 100, "require_title": True}
+_calls: dict[str, int] = {"title": 0, "salary": 0}
+
+
+@uses_features(config=lambda: _settings["require_title"])
+def has_title(job: dict[str, Any]) -> tuple[bool, str | None]:
+    _calls["title"] += 1
+    ok = bool(job.get("title")) or not _settings["require_title"]
+    return (ok, None) if ok else (False, "Missing title")
+
+
+@uses_features(config=lambda: _settings["min_salary"])
+def salary_floor(job: dict[str, Any]) -> tuple[bool, str | None]:
+    _calls["salary"] += 1
+    ok = (job.get("salary_min") or 0) >= _settings["min_salary"]
+    return (ok, None) if ok else (False, "Salary too low")
+
+
+@pytest.fixture(autouse=True)  # type: ignore[misc]
+def reset_settings() -> None:
+    _settings.update(min_salary=100, require_title=True)
+    _calls.update(title=0, salary=0)
+
+
+@pytest.fixture()  # type: ignore[misc]
+def session_maker() -> sessionmaker[Session]:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    return get_sessionmaker(eng)
+
+
+def _ingest(
+    session_maker: sessionmaker[Session], engine: ApprovalEngine, jobs: list[dict[str, Any]]
+) -> None:
+    signature = engine.rule_set_signature()
+    with get_session(session_maker) as s:
+        record_rule_set(s, signature)
+        for job in jobs:
+            decision = engine.evaluate_job(job)
+            columns = {
+                "title": job["title"],
+                "external_id": job["external_id"],
+                "salary_min": job["salary_min"],
+                **rule_outcome(signature, decision, job),
+            }
+            if decision.approved:
+                s.add(Job(approval_status=ApprovalStatus.APPROVED, **columns))
+            else:
+                s.add(RejectedJob(rejection_reasons="; ".join(decision.reasons), **columns))
+
+
+def _stored(session_maker: sessionmaker[Session]) -> tuple[set[str], dict[str, str]]:
+    with get_session(session_maker) as s:
+        approved = {j.external_id or "" for j in s.execute(select(Job)).scalars()}
+        rejected = {
+            j.external_id or "": j.rejection_reasons
+            for j in s.execute(select(RejectedJob)).scalars()
+        }
+    return approved, rejected
+
+
+JOBS = [
+    {"external_id": "a", "title": "Engineer", "salary_min": 150, "_schema": "feed"},
+    {"external_id": "b", "title": "Analyst", "salary_min": 50, "_schema": "feed"},
+    {"external_id": "c", "title": "", "salary_min": 150, "_schema": "feed"},
+    {"external_id": "d", "title": "", "salary_min": 50, "_schema": "feed"},
+]
+
+
+def test_only_changed_rule_is_rerun(session_maker: sessionmaker[Session]) -> None:
+    engine = ApprovalEngine(rules=[has_title, salary_floor], decision_cache_size=0)
+    _ingest(session_maker, engine, JOBS)
+    assert _stored(session_maker)[0] == {"a"}
+    _calls.update(title=0, salary=0)
+
+    _settings["min_salary"] = 40
+    report = reevaluate_stored_jobs(session_maker, engine)
+
+    assert report.rows_scanned == 4
+    # Salary is re-run everywhere; title only to rebuild the reason text of "d"
+    assert _calls == {"title": 1, "salary": 4}
+    assert report.rejected_to_approved == 1
+    approved, rejected = _stored(session_maker)
+    assert approved == {"a", "b"}
+    # Reasons are rebuilt from the failing rules that remain
+    assert rejected == {"c": "Missing title", "d": "Missing title"}
+
+    # Nothing is stale any more
+    again = reevaluate_stored_jobs(session_maker, engine)
+    assert again.rows_scanned == 0 and again.rows_bumped == 0
+
+
+def test_tightened_rule_moves_approved_jobs(session_maker: sessionmaker[Session]) -> None:
+    engine = ApprovalEngine(rules=[has_title, salary_floor], decision_cache_size=0)
+    _ingest(session_maker, engine, JOBS)
+
+    _settings["min_salary"] = 200
+    report = reevaluate_stored_jobs(session_maker, engine)
+
+    assert report.approved_to_rejected == 1
+    approved, rejected = _stored(session_maker)
+    assert approved == set()
+    assert rejected["a"] == "Salary too low"
+    assert rejected["d"] == "Missing title; Salary too low"
+
+
+def test_unchanged_rules_are_bumped_with_a_set_based_update(
+    session_maker: sessionmaker[Session],
+) -> None:
+    engine = ApprovalEngine(rules=[has_title, salary_floor], decision_cache_size=0)
+    _ingest(session_maker, engine, JOBS)
+    old_version = engine.rule_set_signature().version
+
+    # Change and revert: the stored version matches again, nothing to do
+    _settings["min_salary"] = 40
+    _settings["min_salary"] = 100
+    assert engine.rule_set_signature().version == old_version
+    assert reevaluate_stored_jobs(session_maker, engine).rows_scanned == 0
+
+    # A rule set with the same rules under an unknown version tag is just re-tagged
+    with get_session(session_maker) as s:
+        for j in s.execute(select(Job)).scalars():
+            j.rule_set_version = "legacy"
+        s.add(ApprovalRuleSet(version="legacy", rules=engine.rule_set_signature().to_json()))
+    _calls.update(title=0, salary=0)
+    report = reevaluate_stored_jobs(session_maker, engine)
+    assert report.rows_bumped == 1 and report.rows_scanned == 0
+    assert _calls == {"title": 0, "salary": 0}
+
+
+def test_fast_mode_rows_run_unchecked_rules_before_approval(
+    session_maker: sessionmaker[Session],
+) -> None:
+    engine = ApprovalEngine(
+        rules=[has_title, salary_floor], mode=EvaluationMode.FAST, decision_cache_size=0
+    )
+    # Title fails first, so salary is never checked for this job
+    _ingest(session_maker, engine, [JOBS[3]])
+    _calls.update(title=0, salary=0)
+
+    _settings["require_title"] = False
+    reevaluate_stored_jobs(session_maker, engine)
+
+    assert _calls == {"title": 1, "salary": 1}
+    approved, rejected = _stored(session_maker)
+    assert approved == set()
+    assert rejected == {"d": "Salary too low"}
+
+
+def test_rows_without_outcomes_are_reevaluated_on_request(
+    session_maker: sessionmaker[Session],
+) -> None:
+    with get_session(session_maker) as s:
+        s.add(Job(external_id="x", title="", approval_status=ApprovalStatus.APPROVED))
+    engine = ApprovalEngine(rules=[has_title, salary_floor], decision_cache_size=0)
+
+    assert reevaluate_stored_jobs(session_maker, engine).rows_scanned == 0
+    report = reevaluate_stored_jobs(session_maker, engine, include_unversioned=True)
+
+    assert report.approved_to_rejected == 1
+    assert _stored(session_maker)[1] == {"x": "Missing title; Salary too low"}
+
+
+def test_canonical_job_is_rebuilt_from_columns_and_context() -> None:
+    row = Job(
+        title="T",
+        description_text="plain",
+        full_description="<p>plain</p>",
+        primary_location="Austin, TX",
+        salary_min=10,
+        approval_context={"employment_type": "Full-Time", "_schema": "feed"},
+    )
+    job = canonical_job_from_row(row)
+    assert job["description"] == "plain" and job["full_description"] == "plain"
+    assert job["location"] == "Austin, TX"
+    assert job["employment_type"] == "Full-Time" and job["_schema"] == "feed"
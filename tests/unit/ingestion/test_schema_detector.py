@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from job_ingestion.ingestion.schema_detector import detect_schema
+import pytest
+from job_ingestion.ingestion.schema_detector import SchemaDetector, detect_schema
 
 
 def test_detect_schema_returns_unknown_on_empty_input() -> None:
@@ -45,3 +46,73 @@ def test_detect_schema_prefers_schema_with_higher_count() -> None:
         {"employer": "B2"},
     ]
     assert detect_schema(data_more_b) == "schema_b"
+
+
+def test_detector_labels_each_record_in_mixed_batch() -> None:
+    detector = SchemaDetector()
+    data = [
+        {"company_name": "A", "title": "x"},
+        {"employer": "B", "title": "y"},
+        {"title": "z"},
+        {"company_name": "A", "employer": "B"},
+    ]
+    assert [detector.detect(r) for r in data] == ["schema_a", "schema_b", "unknown", "unknown"]
+
+
+def test_detector_caches_fingerprints_independent_of_key_order() -> None:
+    detector = SchemaDetector()
+    detector.detect({"company_name": "A", "title": "x"})
+    detector.detect({"title": "y", "company_name": "B"})
+    detector.detect({"employer": "C"})
+    assert detector.misses == 2
+    assert detector.hits == 1
+
+
+def test_detector_cache_is_bounded_lru() -> None:
+    detector = SchemaDetector(cache_size=2)
+    detector.detect({"a": 1})
+    detector.detect({"b": 1})
+    detector.detect({"a": 1})  # refresh "a"
+    detector.detect({"c": 1})  # evicts "b"
+    detector.detect({"a": 1})
+    detector.detect({"b": 1})
+    assert detector.hits == 2
+    assert detector.misses == 4
+
+
+def test_detector_prefers_most_specific_registered_schema() -> None:
+    detector = SchemaDetector()
+    detector.register("ladders", ["jobId", "companyName"])
+    detector.register("ladders_v2", ["jobId", "companyName", "postedDates"])
+    assert detector.detect({"jobId": 1, "companyName": "A"}) == "ladders"
+    assert detector.detect({"jobId": 1, "companyName": "A", "postedDates": []}) == "ladders_v2"
+
+
+def test_register_invalidates_cached_resolutions() -> None:
+    detector = SchemaDetector(signatures={})
+    record = {"jobId": 1}
+    assert detector.detect(record) == "unknown"
+    detector.register("ladders", ["jobId"])
+    assert detector.detect(record) == "ladders"
+
+
+def test_register_rejects_empty_signature() -> None:
+    with pytest.raises(ValueError):
+        SchemaDetector().register("empty", [])
+
+
+def test_partial_matches_needs_a_majority_of_the_signature() -> None:
+    detector = SchemaDetector({"ladders": ["jobId", "companyName", "title"]})
+    assert detector.partial_matches({"jobId": 1, "companyName": "Acme"}) == ("ladders",)
+    assert detector.partial_matches({"jobId": 1, "companyName": "Acme", "title": "SWE"}) == ()
+    # One shared key, however common, is not a match
+    assert detector.partial_matches({"title": "SWE"}) == ()
+
+
+def test_group_preserves_indices_and_works_on_streams() -> None:
+    detector = SchemaDetector()
+    stream = iter([{"employer": "B"}, {"company_name": "A"}, "not-a-dict", {"employer": "C"}])
+    groups = detector.group(stream)
+    assert [i for i, _ in groups["schema_b"]] == [0, 3]
+    assert [i for i, _ in groups["schema_a"]] == [1]
+    assert [i for i, _ in groups["unknown"]] == [2]
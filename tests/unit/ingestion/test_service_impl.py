@@ -7,8 +7,15 @@ from typing import Any
 
 import job_ingestion.ingestion.service as service_module
 import pytest
+from job_ingestion.approval.engine import ApprovalEngine, EvaluationMode
+from job_ingestion.approval.outcomes import RuleSetSignature
+from job_ingestion.approval.profiling import RuleProfiler
+from job_ingestion.approval.shadow import ShadowEvaluator
+from job_ingestion.ingestion import schema_detector
+from job_ingestion.ingestion.job_mapper import RenamingJobMapper
 from job_ingestion.ingestion.service import IngestionService
 from job_ingestion.storage.models import ApprovalStatus, Job, RejectedJob
+from job_ingestion.transformation.normalizers import canonical_company_key
 
 
 @dataclass
@@ -34,19 +41,55 @@ def patch_dependencies(monkeypatch: pytest.MonkeyPatch, recorded: _Recorded) ->
 
     # Fake ApprovalEngine that records evaluated jobs and alternates decisions
     class FakeApprovalEngine:
-        def __init__(self, rules: list[Any] | None = None) -> None:  # noqa: ANN401
+        def __init__(
+            self, rules: list[Any] | None = None, mode: str = "audit"
+        ) -> None:  # noqa: ANN401
             self.rules = rules or []
+            self.mode = EvaluationMode(mode)
+            self.profiler = RuleProfiler()
 
         @dataclass
         class _Decision:
             approved: bool
             reasons: list[str]
+            failed_rules: tuple[str, ...] = ()
+            checked_rules: tuple[str, ...] = ("title_rule",)
+            review: bool = False
+            score: float | None = None
 
         def evaluate_job(self, job: dict[str, Any]) -> Any:  # noqa: ANN401
             recorded.evaluated.append(job)
             # Approve jobs with title not containing 'reject'
             ok = "reject" not in str(job.get("title", "")).lower()
-            return self._Decision(approved=ok, reasons=[] if ok else ["rule failed"])
+            return self._Decision(
+                approved=ok,
+                reasons=[] if ok else ["rule failed"],
+                failed_rules=() if ok else ("title_rule",),
+            )
+
+        def rule_set_signature(self) -> RuleSetSignature:
+            return RuleSetSignature.from_pairs([("title_rule", "")])
+
+        @dataclass
+        class _BatchDecision:
+            approved: list[bool]
+            reasons: list[list[str]]
+            review: list[bool] | None = None
+            scores: list[float] | None = None
+
+            def reason_codes(self, index: int) -> list[str]:
+                return [] if self.approved[index] else ["title_rule"]
+
+            def checked_codes(self, index: int) -> list[str]:
+                return ["title_rule"]
+
+        def evaluate_batch(
+            self, jobs: list[dict[str, Any]], with_reasons: bool = False
+        ) -> Any:  # noqa: ANN401
+            decisions = [self.evaluate_job(job) for job in jobs]
+            return self._BatchDecision(
+                approved=[d.approved for d in decisions], reasons=[d.reasons for d in decisions]
+            )
 
     monkeypatch.setattr(service_module, "ApprovalEngine", FakeApprovalEngine)
 
@@ -58,22 +101,34 @@ def patch_dependencies(monkeypatch: pytest.MonkeyPatch, recorded: _Recorded) ->
                 assert isinstance(obj, Job | RejectedJob)
                 recorded.added.append(obj)
 
+            def merge(self, obj: Any) -> Any:  # noqa: ANN401
+                return obj
+
         yield _S()
 
-    def fake_get_engine(_url: str) -> Any:  # noqa: ANN401
+    def fake_get_shared_sessionmaker(_url: str) -> Any:  # noqa: ANN401
         return object()
 
-    def fake_get_sessionmaker(_engine: Any) -> Any:  # noqa: ANN401
-        return object()
+    # In-memory company index assigning IDs by canonical key
+    class FakeCompanyIndex:
+        def __init__(self) -> None:
+            self.ids: dict[str, int] = {}
 
-    def fake_create_all(**_: Any) -> None:  # noqa: ANN401
-        return None
+        def resolve(self, names: list[str | None]) -> list[int | None]:
+            keys = [canonical_company_key(n) if n else None for n in names]
+            return [None if k is None else self.ids.setdefault(k, len(self.ids) + 1) for k in keys]
+
+    fake_index = FakeCompanyIndex()
+    monkeypatch.setattr(service_module, "get_company_index", lambda _url: fake_index)
+
+    def fake_bulk_insert_jobs(_session: Any, model: Any, rows: list[dict[str, Any]]) -> int:
+        recorded.added.extend(model(**row) for row in rows)
+        return len(rows)
 
     monkeypatch.setattr(service_module, "get_session", fake_get_session)
-    monkeypatch.setattr(service_module, "get_engine", fake_get_engine)
-    monkeypatch.setattr(service_module, "get_sessionmaker", fake_get_sessionmaker)
-    # Use string target to avoid mypy attr-defined when accessing module attributes
-    monkeypatch.setattr("job_ingestion.storage.models.Base.metadata.create_all", fake_create_all)
+    monkeypatch.setattr(service_module, "bulk_insert_jobs", fake_bulk_insert_jobs)
+    monkeypatch.setattr(service_module, "discard_stored_copies", lambda *_args: None)
+    monkeypatch.setattr(service_module, "get_shared_sessionmaker", fake_get_shared_sessionmaker)
 
 
 def test_orchestration_counts_and_persistence(recorded: _Recorded) -> None:
@@ -109,3 +164,202 @@ def test_orchestration_counts_and_persistence(recorded: _Recorded) -> None:
     # Approval engine saw canonical jobs
     assert len(recorded.evaluated) == 2
     assert all("external_id" in j for j in recorded.evaluated)
+
+    # Per-rule outcomes are stored as bitmasks against the rule set version
+    version = RuleSetSignature.from_pairs([("title_rule", "")]).version
+    outcomes = {
+        j.title: (j.rule_set_version, j.rule_failures, j.rule_checked) for j in recorded.added
+    }
+    assert outcomes == {"Approve me": (version, 0, 1), "Please reject": (version, 1, 1)}
+    assert recorded.added[0].approval_context == {"_schema": "unknown"}
+
+
+def test_registered_schema_rejects_invalid_records_before_mapping(
+    monkeypatch: pytest.MonkeyPatch, recorded: _Recorded
+) -> None:
+    monkeypatch.setattr(schema_detector, "_default_detector", schema_detector.SchemaDetector())
+    monkeypatch.setattr(IngestionService, "_validators", {})
+
+    svc = IngestionService()
+    svc.register_source_schema(
+        "ladders",
+        {
+            "type": "object",
+            "required": ["jobId"],
+            "properties": {"jobId": {"type": "integer"}, "title": {"type": "string"}},
+        },
+    )
+
+    pid = svc.ingest_batch(
+        [
+            {"jobId": 1, "title": "Approve me", "description": "d" * 25},
+            {"jobId": "oops", "title": "Malformed", "description": "d" * 25},
+        ]
+    )
+
+    status = svc.get_processing_status(pid)
+    assert status["processed"] == 2
+    assert status["invalid"] == 1
+    assert status["approved"] == 1
+    assert status["errors"] == 0
+    assert [j["title"] for j in recorded.evaluated] == ["Approve me"]
+    assert [j["_schema"] for j in recorded.evaluated] == ["ladders"]
+
+
+def test_records_missing_signature_keys_are_still_validated(
+    monkeypatch: pytest.MonkeyPatch, recorded: _Recorded
+) -> None:
+    monkeypatch.setattr(schema_detector, "_default_detector", schema_detector.SchemaDetector())
+    monkeypatch.setattr(IngestionService, "_validators", {})
+
+    svc = IngestionService()
+    schema = {"type": "object", "required": ["jobId", "jobTitle", "title"]}
+    svc.register_source_schema("ladders", schema)
+    svc.register_source_schema("dice", {**schema, "required": ["diceId", "jobTitle"]}, ["diceId"])
+
+    pid = svc.ingest_batch(
+        [
+            {"jobId": 1, "title": "Missing jobTitle", "description": "d" * 25},
+            {"diceId": 2, "title": "Missing jobTitle too", "description": "d" * 25},
+            {"title": "Other source", "description": "d" * 25},
+        ]
+    )
+
+    status = svc.get_processing_status(pid)
+    assert status["invalid"] == 2
+    assert status["processed"] == 3
+    assert [j["title"] for j in recorded.evaluated] == ["Other source"]
+
+
+def test_generic_records_still_ingest_after_a_schema_is_registered(
+    monkeypatch: pytest.MonkeyPatch, recorded: _Recorded
+) -> None:
+    monkeypatch.setattr(schema_detector, "_default_detector", schema_detector.SchemaDetector())
+    monkeypatch.setattr(IngestionService, "_validators", {})
+
+    svc = IngestionService()
+    svc.register_source_schema(
+        "ladders",
+        {
+            "type": "object",
+            "required": ["jobId", "title"],
+            "properties": {"jobId": {"type": "integer"}, "title": {"type": "string"}},
+        },
+    )
+
+    # Shares "title" with the ladders signature, but is not a ladders record
+    pid = svc.ingest_batch([{"id": 5, "title": "Approve me", "description": "d" * 25}])
+
+    status = svc.get_processing_status(pid)
+    assert status["invalid"] == 0
+    assert status["approved"] == 1
+    assert [j["_schema"] for j in recorded.evaluated] == ["unknown"]
+
+
+def test_registered_mapping_plan_maps_its_schema_group(
+    monkeypatch: pytest.MonkeyPatch, recorded: _Recorded
+) -> None:
+    monkeypatch.setattr(schema_detector, "_default_detector", schema_detector.SchemaDetector())
+    monkeypatch.setattr(IngestionService, "_validators", {})
+    monkeypatch.setattr(IngestionService, "_mapping_plans", {})
+
+    svc = IngestionService()
+    svc.register_source_schema("positions", {"type": "object", "required": ["posId"]})
+    svc.register_mapping_plan(
+        "positions", RenamingJobMapper({"posId": "jobId", "posTitle": "title"})
+    )
+
+    svc.ingest_batch(
+        [
+            {"posId": 7, "posTitle": "Approve me", "description": "d" * 25},
+            {"jobId": 8, "posTitle": "Generic", "description": "d" * 25},
+        ]
+    )
+
+    by_id = {j.external_id: j.title for j in recorded.added}
+    # Only the detected group goes through the plan; the other keeps the generic mapper
+    assert by_id == {"7": "Approve me", "8": "(untitled)"}
+
+
+def test_annualized_usd_salary_is_computed_at_ingest(recorded: _Recorded) -> None:
+    svc = IngestionService()
+    svc.ingest_batch(
+        [
+            {"title": "Hourly", "salary": {"value": 60, "currency": "USD", "unit": "hourly"}},
+            {"title": "Unknown currency", "salary": {"value": 100000, "currency": "XYZ"}},
+            {"title": "No salary"},
+        ]
+    )
+
+    by_title = {j.title: j for j in recorded.added}
+    assert by_title["Hourly"].salary_annual_usd == 124_800.0
+    assert by_title["Unknown currency"].salary_annual_usd is None
+    assert by_title["No salary"].salary_annual_usd is None
+
+
+def test_company_names_are_canonicalized_to_company_ids(recorded: _Recorded) -> None:
+    svc = IngestionService()
+    svc.ingest_batch(
+        [
+            {"title": "One", "companyName": "ACME, Inc."},
+            {"title": "Two", "companyName": "Acme Incorporated"},
+            {"title": "Three", "companyName": "Globex Corporation"},
+            {"title": "Four"},
+        ]
+    )
+
+    by_title = {j.title: j for j in recorded.added}
+    assert by_title["One"].company_id is not None
+    assert by_title["One"].company_id == by_title["Two"].company_id
+    assert by_title["Three"].company_id not in (None, by_title["One"].company_id)
+    assert by_title["Four"].company_id is None
+    # The verbatim name is still stored alongside the reference
+    assert by_title["Two"].company_name == "Acme Incorporated"
+
+
+def test_plain_text_description_is_extracted_at_ingest(recorded: _Recorded) -> None:
+    svc = IngestionService()
+    svc.ingest_batch(
+        [
+            {
+                "title": "Html",
+                "fullDescription": "<div><p><b>Short</b></p><p>&nbsp;</p></div>",
+            },
+        ]
+    )
+
+    [job] = recorded.added
+    assert job.description_text == "Short"
+    assert job.description_length == 5
+    assert job.description_word_count == 1
+    # Rules see the extracted text and its length, not the markup
+    [canonical] = recorded.evaluated
+    assert canonical["description"] == "Short"
+    assert canonical["description_length"] == 5
+
+
+def test_shadow_candidate_sees_decisions_without_affecting_persistence(
+    recorded: _Recorded,
+) -> None:
+    def no_engineers(job: dict[str, Any]) -> tuple[bool, str | None]:
+        ok = "engineer" not in str(job.get("title", "")).lower()
+        return (ok, None) if ok else (False, "No engineers")
+
+    shadow = ShadowEvaluator(ApprovalEngine([no_engineers]))
+    IngestionService.set_shadow_evaluator(shadow)
+    try:
+        IngestionService().ingest_batch(
+            [
+                {"title": "Engineer", "description": "d" * 25},
+                {"title": "Please reject", "description": "d" * 25},
+            ]
+        )
+        shadow.drain()
+        report = IngestionService.get_shadow_report()
+    finally:
+        IngestionService.set_shadow_evaluator(None)
+
+    assert report is not None and report.evaluated == 2
+    assert report.newly_rejected == 1 and report.newly_approved == 1
+    assert {type(j) for j in recorded.added} == {Job, RejectedJob}
+    assert IngestionService.get_shadow_report() is None
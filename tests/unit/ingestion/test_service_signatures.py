@@ -20,7 +20,7 @@ def test_ingest_batch_returns_processing_id_and_status() -> None:
     assert status.get("processed") == 1
 
 
-def test_register_source_schema_raises_not_implemented() -> None:
+def test_register_source_schema_requires_detection_keys() -> None:
     service = IngestionService()
-    with pytest.raises(NotImplementedError):
+    with pytest.raises(ValueError):
         service.register_source_schema("source-x", {})
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from job_ingestion.approval.outcomes import RuleSetSignature
+from job_ingestion.approval.rules.builtin import get_rules as builtin_rules
+from job_ingestion.ingestion.simulation import CandidateRules, main, simulate_rule_set
+from job_ingestion.storage.models import (
+    ApprovalRuleSet,
+    ApprovalStatus,
+    Base,
+    Job,
+    RejectedJob,
+)
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+
+BUILTIN = tuple(getattr(rule, "__name__", "") for rule in builtin_rules())
+
+
+@pytest.fixture()  # type: ignore[misc]
+def database_url(tmp_path: Path) -> str:
+    url = f"sqlite:///{tmp_path / 'history.sqlite3'}"
+    engine = get_engine(url)
+    Base.metadata.create_all(bind=engine)
+    old = RuleSetSignature.from_pairs([("has_title", ""), ("salary_floor", "")])
+    with get_session(get_sessionmaker(engine)) as s:
+        s.add(ApprovalRuleSet(version=old.version, rules=old.to_json()))
+        s.add(Job(external_id="a", title="Summer intern", approval_status=ApprovalStatus.APPROVED))
+        s.add(Job(external_id="b", title="Engineer", approval_status=ApprovalStatus.APPROVED))
+        s.add(
+            RejectedJob(
+                external_id="c",
+                title="Analyst",
+                rejection_reasons="Salary too low",
+                rule_set_version=old.version,
+                rule_failures=old.encode(["salary_floor"]),
+            )
+        )
+        s.add(RejectedJob(external_id="d", title="Clerk", rejection_reasons="Too vague"))
+        s.add(RejectedJob(external_id="e", title="Intern", rejection_reasons="Too vague"))
+    engine.dispose()
+    return url
+
+
+@pytest.fixture()  # type: ignore[misc]
+def candidate(tmp_path: Path) -> CandidateRules:
+    path = tmp_path / "candidate.json"
+    condition = {"field": "title", "operator": "matches", "value": "intern", "ignore_case": True}
+    rule = {"id": "no_interns", "condition": {"not": condition}, "reason": "No internships"}
+    path.write_text(json.dumps({"approvalRules": {"version": "1", "rules": [rule]}}))
+    return CandidateRules(rules_path=str(path), exclude=BUILTIN)
+
+
+def test_simulation_reports_flips_and_causes(database_url: str, candidate: CandidateRules) -> None:
+    report = simulate_rule_set(candidate, database_url, chunk_size=2, batch_size=1)
+
+    assert report.rows_scanned == 5 and report.unchanged == 2
+    assert report.approved_to_rejected == 1
+    assert report.newly_failing == {"no_interns": 1}
+    # Stored rule outcomes are decoded; rows without them fall back to their reasons
+    assert report.rejected_to_approved == 2
+    assert report.cleared == {"salary_floor": 1, "Too vague": 1}
+    assert sorted(flip.external_id or "" for flip in report.samples) == ["a", "c", "d"]
+
+
+def test_parallel_workers_match_in_process_scan(
+    database_url: str, candidate: CandidateRules
+) -> None:
+    serial = simulate_rule_set(candidate, database_url, chunk_size=1)
+    parallel = simulate_rule_set(candidate, database_url, workers=2, chunk_size=1)
+
+    assert parallel.rows_scanned == serial.rows_scanned == 5
+    assert parallel.newly_failing == serial.newly_failing
+    assert parallel.cleared == serial.cleared
+    assert len(parallel.samples) == len(serial.samples)
+
+
+def test_sample_size_bounds_samples(database_url: str, candidate: CandidateRules) -> None:
+    report = simulate_rule_set(candidate, database_url, chunk_size=1, sample_size=1)
+    assert report.flipped == 3 and len(report.samples) == 1
+
+
+def test_invalid_sizes_are_rejected(candidate: CandidateRules) -> None:
+    with pytest.raises(ValueError):
+        simulate_rule_set(candidate, "sqlite://", chunk_size=0)
+    with pytest.raises(ValueError):
+        simulate_rule_set(candidate, "sqlite://", workers=-1)
+
+
+def test_cli_prints_json_report(
+    database_url: str, candidate: CandidateRules, capsys: pytest.CaptureFixture[str]
+) -> None:
+    main(
+        [
+            "--database-url",
+            database_url,
+            "--rules-path",
+            candidate.rules_path,
+            "--exclude",
+            ",".join(BUILTIN),
+            "--workers",
+            "0",
+        ]
+    )
+    body = json.loads(capsys.readouterr().out)
+    assert body["flipped"] == 3 and body["newly_failing"] == {"no_interns": 1}
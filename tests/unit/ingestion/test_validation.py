@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from job_ingestion.ingestion.validation import compile_schema, get_validator, schema_version
+
+JOB_SCHEMA: dict[str, Any] = {
+    "$id": "ladders",
+    "type": "object",
+    "required": ["jobId", "title"],
+    "properties": {
+        "jobId": {"type": ["string", "integer"]},
+        "title": {"type": "string", "minLength": 1},
+        "salary": {
+            "anyOf": [
+                {"type": "number", "minimum": 0},
+                {
+                    "type": "object",
+                    "properties": {"value": {"type": "number"}, "currency": {"type": "string"}},
+                },
+            ]
+        },
+        "locations": {"type": "array", "items": {"type": "object", "required": ["text"]}},
+        "remoteFlag": {"enum": ["REMOTE", "ONSITE", "HYBRID"]},
+    },
+}
+
+
+def test_valid_record_returns_none() -> None:
+    validate = compile_schema(JOB_SCHEMA)
+    record = {
+        "jobId": 1,
+        "title": "SWE",
+        "salary": {"value": 150000, "currency": "USD"},
+        "locations": [{"text": "NYC"}],
+        "remoteFlag": "REMOTE",
+    }
+    assert validate(record) is None
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "record,path,keyword",
+    [
+        ({"title": "SWE"}, (), "required"),
+        ({"jobId": 1.5, "title": "SWE"}, ("jobId",), "type"),
+        ({"jobId": 1, "title": ""}, ("title",), "minLength"),
+        ({"jobId": 1, "title": "SWE", "salary": "lots"}, ("salary",), "anyOf"),
+        (
+            {"jobId": 1, "title": "SWE", "locations": [{"text": "a"}, {}]},
+            ("locations", 1),
+            "required",
+        ),
+        ({"jobId": 1, "title": "SWE", "remoteFlag": "MARS"}, ("remoteFlag",), "enum"),
+        ([], (), "type"),
+    ],
+)
+def test_invalid_records_report_structured_issue(
+    record: Any, path: tuple[str | int, ...], keyword: str
+) -> None:
+    issue = compile_schema(JOB_SCHEMA)(record)
+    assert issue is not None
+    assert issue.path == path
+    assert issue.keyword == keyword
+    assert issue.as_dict()["path"] == list(path)
+
+
+def test_bool_is_not_a_number_and_additional_properties() -> None:
+    validate = compile_schema(
+        {
+            "type": "object",
+            "properties": {"score": {"type": "number"}},
+            "additionalProperties": False,
+        }
+    )
+    assert validate({"score": 1}) is None
+    assert validate({"score": True}) is not None
+    issue = validate({"score": 1, "extra": 2})
+    assert issue is not None and issue.reason == "extra: unexpected property 'extra'"
+
+
+def test_unsupported_type_raises() -> None:
+    with pytest.raises(ValueError):
+        compile_schema({"type": "date"})
+
+
+def test_get_validator_compiles_once_per_version() -> None:
+    v1 = get_validator({"$id": "src", "version": 1, "required": ["a"]})
+    again = get_validator({"$id": "src", "version": 1, "required": ["a"]})
+    v2 = get_validator({"$id": "src", "version": 2, "required": ["a"]})
+    assert v1 is again
+    assert v1 is not v2
+
+
+def test_schema_version_is_key_order_independent() -> None:
+    assert schema_version({"a": 1, "b": [1, 2]}) == schema_version({"b": [1, 2], "a": 1})
+
+
+def test_schemas_sharing_a_version_do_not_share_a_validator() -> None:
+    # No $id: both would otherwise be keyed "@1"
+    loose = get_validator({"version": 1, "required": ["a"]})
+    strict = get_validator({"version": 1, "required": ["a", "b"]})
+    assert loose is not strict
+    assert loose({"a": 1}) is None
+    assert strict({"a": 1}) is not None
+    assert schema_version({"$id": "src", "version": 1}).startswith("src@1#")
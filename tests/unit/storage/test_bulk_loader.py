@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+from job_ingestion.storage.models import ApprovalStatus, Base, Job, RejectedJob
+from job_ingestion.storage.repositories import (
+    _CopyStream,
+    _merge_sql,
+    bulk_insert_jobs,
+    get_engine,
+    get_session,
+    get_sessionmaker,
+)
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture()  # type: ignore[misc]
+def session_maker() -> sessionmaker[Session]:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    return get_sessionmaker(eng)
+
+
+def test_inserts_and_upserts_on_external_id(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        s.add(Job(external_id="a", title="Old", approval_status=ApprovalStatus.APPROVED))
+    rows = [
+        {"external_id": "a", "title": "New", "approval_status": ApprovalStatus.APPROVED},
+        {"external_id": "b", "title": "First", "approval_status": ApprovalStatus.APPROVED},
+        {"external_id": "b", "title": "Last", "approval_status": ApprovalStatus.APPROVED},
+    ]
+    with get_session(session_maker) as s:
+        assert bulk_insert_jobs(s, Job, rows) == 2
+    with get_session(session_maker) as s:
+        titles = dict(s.execute(select(Job.external_id, Job.title)).tuples().all())
+    assert titles == {"a": "New", "b": "Last"}
+
+
+def test_rejected_rows_get_column_defaults(session_maker: sessionmaker[Session]) -> None:
+    rows = [{"title": "Too low", "rejection_reasons": "Salary too low"}] * 2
+    with get_session(session_maker) as s:
+        assert bulk_insert_jobs(s, RejectedJob, rows) == 2
+    with get_session(session_maker) as s:
+        stored = list(s.execute(select(RejectedJob)).scalars())
+    assert len(stored) == 2
+    assert all(r.rejection_reasons == "Salary too low" for r in stored)
+
+
+def test_none_takes_column_default_and_rejected_copies_are_replaced(
+    session_maker: sessionmaker[Session],
+) -> None:
+    with get_session(session_maker) as s:
+        s.add(Job(external_id="a", title="Approved", approval_status=ApprovalStatus.APPROVED))
+    rows = [
+        {"external_id": "a", "title": t, "rejection_reasons": "No", "is_salary_confidential": None}
+        for t in ("First", "Second")
+    ]
+    with get_session(session_maker) as s:
+        assert bulk_insert_jobs(s, RejectedJob, rows) == 1
+        assert bulk_insert_jobs(s, RejectedJob, rows[1:]) == 1
+    with get_session(session_maker) as s:
+        assert s.scalars(select(Job)).all() == []
+        [stored] = s.scalars(select(RejectedJob)).all()
+    assert stored.title == "Second" and stored.is_salary_confidential is False
+
+
+def test_unknown_column_is_rejected(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s, pytest.raises(ValueError, match="nope"):
+        bulk_insert_jobs(s, Job, [{"title": "x", "nope": 1}])
+
+
+def test_copy_stream_reads_in_bounded_chunks() -> None:
+    rows = [{"a": i, "b": None} for i in range(100)]
+    stream = _CopyStream(["a", "b"], rows)
+    chunks = []
+    while chunk := stream.read(64):
+        assert len(chunk) <= 64
+        chunks.append(chunk)
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(lines) == 100
+    assert lines[7] == '"7",\\N'
+
+
+def test_merge_statement_upserts_on_unique_columns() -> None:
+    sql = _merge_sql(Job.__table__, ["external_id", "title"], "_stage_jobs")
+    assert sql.startswith("INSERT INTO jobs (external_id, title) SELECT external_id, title")
+    assert "ON CONFLICT (external_id) DO UPDATE SET title = EXCLUDED.title" in sql
+    assert sql.endswith(", updated_at = now()")
+    plain = _merge_sql(RejectedJob.__table__, ["title"], "_stage_rejected_jobs")
+    assert "ON CONFLICT" not in plain
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+from job_ingestion.storage.index_advisor import advise
+from job_ingestion.storage.models import ApprovalStatus, Base, Job
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+
+@pytest.fixture()  # type: ignore[misc]
+def engine() -> Engine:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    with get_session(get_sessionmaker(eng)) as s:
+        for i in range(30):
+            s.add(
+                Job(external_id=f"e{i}", title=f"Job {i}", approval_status=ApprovalStatus.APPROVED)
+            )
+    return eng
+
+
+def test_canonical_queries_use_indexes(engine: Engine) -> None:
+    plans = advise(engine, min_rows=10)
+    assert {p.query for p in plans} >= {"active_jobs_by_date", "active_jobs_by_company"}
+    assert all(p.plan for p in plans)
+    assert [f for p in plans for f in p.findings] == []
+
+
+def test_full_scans_of_large_tables_are_flagged(engine: Engine) -> None:
+    queries = {"by_title": select(Job.id).where(Job.title == "Job 3")}
+    [plan] = advise(engine, min_rows=10, queries=queries)
+    assert [(f.table, f.rows) for f in plan.findings] == [("jobs", 30)]
+    # Small tables are not worth an index
+    [plan] = advise(engine, min_rows=100, queries=queries)
+    assert plan.findings == ()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from job_ingestion.storage.job_queries import JobFilters, list_jobs
+from job_ingestion.storage.models import ApprovalStatus, Base, Company, Job, RejectedJob
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from job_ingestion.transformation.companies import CompanyIndex
+from sqlalchemy.orm import Session, sessionmaker
+
+_START = datetime(2024, 1, 1)
+
+
+@pytest.fixture()  # type: ignore[misc]
+def session_maker() -> sessionmaker[Session]:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    sm = get_sessionmaker(eng)
+    with get_session(sm) as s:
+        s.add(Company(id=1, canonical_key="acme", name="Acme Inc"))
+        for i in range(20):
+            s.add(
+                Job(
+                    external_id=f"j{i}",
+                    title=f"Job {i}",
+                    approval_status=ApprovalStatus.APPROVED,
+                    # Three jobs share each posting date; the last four have none
+                    posting_date=_START + timedelta(days=i // 3) if i < 16 else None,
+                    company_id=1 if i % 2 else None,
+                    country_code="US" if i % 4 else "CA",
+                    salary_annual_usd=50_000 + 5_000 * i,
+                    full_description="<p>long</p>",
+                )
+            )
+        s.add(Job(external_id="p", title="Pending", approval_status=ApprovalStatus.PENDING))
+        s.add(
+            Job(
+                external_id="old",
+                title="Inactive",
+                approval_status=ApprovalStatus.APPROVED,
+                is_active=False,
+            )
+        )
+        s.add(
+            RejectedJob(title="Rejected", rejection_reasons="Salary too low", posting_date=_START)
+        )
+    return sm
+
+
+def _all_pages(sm: sessionmaker[Session], limit: int, **kwargs: object) -> list[str]:
+    titles: list[str] = []
+    cursor = None
+    with get_session(sm) as s:
+        while True:
+            page = list_jobs(s, limit=limit, cursor=cursor, **kwargs)  # type: ignore[arg-type]
+            assert len(page.rows) <= limit
+            titles.extend(row.title for row in page.rows)
+            if page.next_cursor is None:
+                return titles
+            cursor = page.next_cursor
+
+
+def test_keyset_pages_cover_dated_then_undated_jobs(session_maker: sessionmaker[Session]) -> None:
+    titles = _all_pages(session_maker, limit=7)
+    dated = sorted(range(16), key=lambda i: (i // 3, i), reverse=True)
+    assert titles == [f"Job {i}" for i in dated] + ["Job 19", "Job 18", "Job 17", "Job 16"]
+
+
+def test_filters(session_maker: sessionmaker[Session]) -> None:
+    by_country = _all_pages(session_maker, 5, filters=JobFilters(country_code="ca"))
+    assert sorted(by_country) == sorted(f"Job {i}" for i in range(0, 20, 4))
+    by_company = _all_pages(session_maker, 50, filters=JobFilters(company="ACME, Inc."))
+    assert len(by_company) == 10
+    salary = JobFilters(salary_min=100_000, salary_max=120_000)
+    assert sorted(_all_pages(session_maker, 50, filters=salary)) == [
+        f"Job {i}" for i in range(10, 15)
+    ]
+    everything = _all_pages(session_maker, 50, filters=JobFilters(status=None, active=None))
+    assert {"Pending", "Inactive"} <= set(everything) and len(everything) == 22
+
+
+def test_rows_carry_listing_columns_only(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        [row] = list_jobs(s, RejectedJob, limit=1).rows
+        assert row.rejection_reasons == "Salary too low"
+        assert "full_description" not in row._fields
+        with pytest.raises(ValueError, match="cursor"):
+            list_jobs(s, cursor="bogus")
+
+
+def test_company_filter_matches_companies_with_overlong_names(
+    session_maker: sessionmaker[Session],
+) -> None:
+    name = "Acme " * 60 + "Holdings"
+    [company_id] = CompanyIndex(session_maker).resolve([name])
+    with get_session(session_maker) as s:
+        s.add(Job(title="Long", approval_status=ApprovalStatus.APPROVED, company_id=company_id))
+    assert _all_pages(session_maker, 50, filters=JobFilters(company=name.upper())) == ["Long"]
@@ -2,11 +2,19 @@ from typing import Any
 
 import pytest
 from job_ingestion.storage.models import ApprovalStatus, Base, Job
-from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from job_ingestion.storage.repositories import (
+    get_engine,
+    get_session,
+    get_sessionmaker,
+    get_shared_sessionmaker,
+    json_contains,
+)
 from sqlalchemy import inspect, select
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 
 @pytest.fixture()  # type: ignore[misc]
@@ -88,3 +96,30 @@ def test_session_commit_and_rollback(session_maker: Any) -> None:
     with get_session(session_maker) as s:
         count2 = s.execute(select(Job)).all()
         assert len(count2) == 1
+
+
+def test_json_columns_are_jsonb_with_gin_indexes_on_postgres(engine: Any) -> None:
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    ddl = str(CreateTable(Job.__table__).compile(dialect=dialect))
+    assert "classifications_data JSONB" in ddl
+    assert "approval_context JSONB" in ddl
+
+    gin = {i.name: i for i in Job.__table__.indexes}["ix_jobs_classifications_data_gin"]
+    index_ddl = str(CreateIndex(gin).compile(dialect=dialect))
+    assert "USING gin (classifications_data jsonb_path_ops)" in index_ddl
+    # GIN indexes are PostgreSQL-only; SQLite keeps JSON as text without them
+    sqlite_indexes = {i["name"] for i in inspect(engine).get_indexes("jobs")}
+    assert "ix_jobs_classifications_data_gin" not in sqlite_indexes
+
+    query = select(Job.id).where(json_contains(Job.classifications_data, {"id": 42}))
+    assert "classifications_data @>" in str(query.compile(dialect=dialect))
+
+
+def test_shared_sessionmaker_is_built_once_per_url(tmp_path: Any) -> None:
+    url = f"sqlite+pysqlite:///{tmp_path / 'shared.sqlite3'}"
+    sm = get_shared_sessionmaker(url)
+    assert get_shared_sessionmaker(url) is sm
+    # Tables were created on first use
+    assert "jobs" in inspect(sm.kw["bind"]).get_table_names()
+    other = get_shared_sessionmaker(f"sqlite+pysqlite:///{tmp_path / 'other.sqlite3'}")
+    assert other.kw["bind"] is not sm.kw["bind"]
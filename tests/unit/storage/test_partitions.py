@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Any
+
+import pytest
+from job_ingestion.storage import partitions
+from job_ingestion.storage.models import Base, RejectedJob
+from job_ingestion.storage.partitions import ensure_partitions, maintain_partitions
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+
+@pytest.fixture()  # type: ignore[misc]
+def engine() -> Engine:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    with get_session(get_sessionmaker(eng)) as s:
+        for month in range(1, 13):
+            for i in range(3):
+                s.add(
+                    RejectedJob(
+                        title=f"Job {month}-{i}",
+                        rejection_reasons="Salary too low",
+                        created_at=datetime(2024, month, 15, tzinfo=timezone.utc),
+                    )
+                )
+    return eng
+
+
+def test_retention_deletes_in_batches_when_not_partitioned(engine: Engine) -> None:
+    report = partitions.enforce_retention(engine, 3, today=date(2024, 12, 20), batch_size=4)
+    assert not report.partitioned
+    assert report.deleted_rows == 24
+    with engine.connect() as conn:
+        kept = conn.execute(select(RejectedJob.created_at)).scalars().all()
+    assert len(kept) == 12
+    assert min(kept).month == 9
+
+
+def test_maintenance_keeps_everything_without_retention(engine: Engine) -> None:
+    report = maintain_partitions(engine, months_ahead=3, retention_months=0)
+    assert report.created == [] and report.deleted_rows == 0
+    with pytest.raises(ValueError):
+        maintain_partitions(engine, months_ahead=-1)
+
+
+def test_ensure_partitions_creates_only_missing_months(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        partitions, "list_partitions", lambda _conn: {date(2024, 12, 1): "rejected_jobs_p2024_12"}
+    )
+    executed: list[str] = []
+
+    class _Conn:
+        def execute(self, statement: Any) -> None:  # noqa: ANN401
+            executed.append(str(statement))
+
+    created = ensure_partitions(_Conn(), 2, today=date(2024, 11, 5))  # type: ignore[arg-type]
+    assert created == ["rejected_jobs_p2024_11", "rejected_jobs_p2025_01"]
+    assert executed[1] == (
+        "CREATE TABLE IF NOT EXISTS rejected_jobs_p2025_01 PARTITION OF rejected_jobs "
+        "FOR VALUES FROM ('2025-01-01') TO ('2025-02-01')"
+    )
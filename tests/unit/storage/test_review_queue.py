@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+from job_ingestion.storage.models import ApprovalStatus, Base, Job, RejectedJob, ReviewQueueItem
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from job_ingestion.storage.review_queue import (
+    MAX_BULK_IDS,
+    approve_reviewed,
+    enqueue_for_review,
+    list_review_queue,
+    reject_reviewed,
+)
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture()  # type: ignore[misc]
+def session_maker() -> sessionmaker[Session]:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    sm = get_sessionmaker(eng)
+    with get_session(sm) as s:
+        for i in range(25):
+            job = Job(
+                external_id=f"r{i}",
+                title=f"Job {i}",
+                salary_min=96_000,
+                approval_status=ApprovalStatus.MANUAL_REVIEW,
+            )
+            s.add(job)
+            # Five distinct scores so pages must break ties on job_id
+            enqueue_for_review(
+                s, job, 0.5 + (i % 5) / 10, ["Salary too low"], "feed" if i % 2 else None
+            )
+        s.add(Job(external_id="done", title="Approved", approval_status=ApprovalStatus.APPROVED))
+    return sm
+
+
+def test_keyset_pages_cover_the_queue_in_order(session_maker: sessionmaker[Session]) -> None:
+    seen: list[tuple[float, int]] = []
+    cursor = None
+    with get_session(session_maker) as s:
+        while True:
+            page = list_review_queue(s, limit=7, cursor=cursor)
+            seen.extend((item.score, item.job_id) for item in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+    assert len(seen) == 25 and len(set(seen)) == 25
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_schema_filter_and_invalid_cursor(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        page = list_review_queue(s, limit=100, schema_name="feed")
+        assert len(page.items) == 12 and page.next_cursor is None
+        with pytest.raises(ValueError):
+            list_review_queue(s, cursor="nonsense")
+
+
+def test_bulk_approve_and_reject_move_rows(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        ids = [item.job_id for item in list_review_queue(s, limit=4).items]
+        approved_job = s.execute(select(Job.id).where(Job.external_id == "done")).scalar_one()
+
+    with get_session(session_maker) as s:
+        # Jobs that are not in review are ignored
+        assert approve_reviewed(s, [ids[0], ids[1], approved_job]) == 2
+    with get_session(session_maker) as s:
+        assert reject_reviewed(s, [ids[2]]) == 1
+        assert reject_reviewed(s, [ids[3]], reason="Not a fit") == 1
+
+    with get_session(session_maker) as s:
+        statuses = dict(s.execute(select(Job.id, Job.approval_status).where(Job.id.in_(ids))).all())
+        assert statuses == {
+            ids[0]: ApprovalStatus.APPROVED,
+            ids[1]: ApprovalStatus.APPROVED,
+        }
+        rejected = {r.title: r for r in s.execute(select(RejectedJob)).scalars()}
+        assert {r.rejection_reasons for r in rejected.values()} == {"Salary too low", "Not a fit"}
+        assert all(r.salary_min == 96_000 for r in rejected.values())
+        assert s.execute(select(func.count()).select_from(ReviewQueueItem)).scalar_one() == 21
+
+
+def test_bulk_calls_are_bounded(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        with pytest.raises(ValueError):
+            approve_reviewed(s, list(range(MAX_BULK_IDS + 1)))
+        assert reject_reviewed(s, []) == 0
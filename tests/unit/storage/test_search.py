@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+from job_ingestion.storage.models import ApprovalStatus, Base, Job
+from job_ingestion.storage.repositories import (
+    bulk_insert_jobs,
+    get_engine,
+    get_session,
+    get_sessionmaker,
+)
+from job_ingestion.storage.search import backfill_statements, search_jobs
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import text
+
+
+def _job(external_id: str, title: str, description: str, **kwargs: object) -> Job:
+    return Job(
+        external_id=external_id,
+        title=title,
+        company_name=kwargs.pop("company_name", "Acme"),
+        description_text=description,
+        approval_status=kwargs.pop("approval_status", ApprovalStatus.APPROVED),
+        **kwargs,
+    )
+
+
+@pytest.fixture()  # type: ignore[misc]
+def session_maker() -> sessionmaker[Session]:
+    eng = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=eng)
+    sm = get_sessionmaker(eng)
+    with get_session(sm) as s:
+        s.add(_job("title", "Python Engineer", "Build services."))
+        s.add(_job("company", "Developer", "Build services.", company_name="Python Software"))
+        s.add(_job("text", "Developer", "Mostly Python, some engineering."))
+        s.add(_job("pending", "Python Engineer", "Build services.", approval_status="PENDING"))
+        s.add(_job("inactive", "Python Engineer", "Build services.", is_active=False))
+        for i in range(7):
+            s.add(_job(f"bulk{i}", f"Data Analyst {i}", "Reporting in SQL."))
+    return sm
+
+
+def _ids(sm: sessionmaker[Session], query: str, limit: int = 20) -> list[str]:
+    found: list[str] = []
+    cursor = None
+    with get_session(sm) as s:
+        while True:
+            page = search_jobs(s, query, limit=limit, cursor=cursor)
+            assert len(page.rows) <= limit
+            found.extend(row.external_id for row in page.rows)
+            if page.next_cursor is None:
+                return found
+            cursor = page.next_cursor
+
+
+def test_ranks_title_over_company_over_description(session_maker: sessionmaker[Session]) -> None:
+    assert _ids(session_maker, "python") == ["title", "company", "text"]
+    # Every word must match, after stemming
+    assert _ids(session_maker, "python engineers") == ["title", "text"]
+    assert _ids(session_maker, "cobol") == []
+
+
+def test_keyset_pages_cover_every_match_once(session_maker: sessionmaker[Session]) -> None:
+    ids = _ids(session_maker, "analyst", limit=3)
+    assert sorted(ids) == sorted(f"bulk{i}" for i in range(7))
+
+
+def test_index_follows_approval_activity_and_deletes(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        s.execute(
+            update(Job)
+            .where(Job.external_id == "pending")
+            .values(approval_status=ApprovalStatus.APPROVED)
+        )
+        s.execute(update(Job).where(Job.external_id == "title").values(is_active=False))
+        s.delete(s.scalars(select(Job).where(Job.external_id == "company")).one())
+    assert _ids(session_maker, "python") == ["pending", "text"]
+
+
+def test_bulk_upserts_are_indexed_in_the_same_transaction(
+    session_maker: sessionmaker[Session],
+) -> None:
+    rows = [
+        {"external_id": "bulk0", "title": "Rust Engineer", "approval_status": "APPROVED"},
+        {"external_id": "new", "title": "Rust Developer", "approval_status": "APPROVED"},
+    ]
+    with get_session(session_maker) as s:
+        bulk_insert_jobs(s, Job, rows)
+        assert sorted(row.external_id for row in search_jobs(s, "rust").rows) == ["bulk0", "new"]
+    assert "bulk0" not in _ids(session_maker, "analyst")
+
+
+def test_backfill_rebuilds_the_index(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        s.execute(text("INSERT INTO jobs_fts (jobs_fts) VALUES ('delete-all')"))
+    assert _ids(session_maker, "python") == []
+    with get_session(session_maker) as s:
+        for statement in backfill_statements("sqlite"):
+            s.execute(text(statement))
+    assert _ids(session_maker, "python") == ["title", "company", "text"]
+
+
+def test_invalid_queries(session_maker: sessionmaker[Session]) -> None:
+    with get_session(session_maker) as s:
+        with pytest.raises(ValueError):
+            search_jobs(s, "  ?! ")
+        with pytest.raises(ValueError):
+            search_jobs(s, "python", cursor="nope")
+        # FTS5 query syntax in user input is matched as plain words
+        assert [r.external_id for r in search_jobs(s, '"python*" -(').rows] == [
+            "title",
+            "company",
+            "text",
+        ]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from job_ingestion.storage.models import Base, Company
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from job_ingestion.transformation.companies import CompanyIndex
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+
+def _session_maker(tmp_path: Path) -> sessionmaker[Session]:
+    engine = get_engine(f"sqlite:///{tmp_path / 'companies.sqlite3'}")
+    Base.metadata.create_all(bind=engine)
+    return get_sessionmaker(engine)
+
+
+def test_resolve_interns_variants_to_one_company(tmp_path: Path) -> None:
+    sm = _session_maker(tmp_path)
+    index = CompanyIndex(sm)
+
+    ids = index.resolve(["ACME, Inc.", "Acme Incorporated", "acme", "Globex", None, "  "])
+    assert ids[0] is not None
+    assert ids[0] == ids[1] == ids[2]
+    assert ids[3] not in (None, ids[0])
+    assert ids[4] is None and ids[5] is None
+
+    with sm() as session:
+        rows = session.execute(select(Company.canonical_key, Company.name)).all()
+    # Display name is the first spelling seen
+    assert sorted(rows) == [("acme", "ACME, Inc."), ("globex", "Globex")]
+
+
+def test_warm_loads_existing_companies(tmp_path: Path) -> None:
+    sm = _session_maker(tmp_path)
+    with get_session(sm) as session:
+        session.add(Company(canonical_key="initech", name="Initech LLC"))
+
+    index = CompanyIndex(sm)
+    assert index.warm() == 1
+    assert len(index) == 1
+    assert index.get("INITECH, L.L.C.") is not None
+
+
+def test_resolve_reuses_companies_created_by_another_index(tmp_path: Path) -> None:
+    sm = _session_maker(tmp_path)
+    first = CompanyIndex(sm)
+    second = CompanyIndex(sm)
+    second.warm()  # warmed before `first` creates the company, so its map is stale
+
+    [created] = first.resolve(["Umbrella Corp"])
+    [reused] = second.resolve(["Umbrella Corporation"])
+    assert created == reused
+
+    with sm() as session:
+        assert session.scalar(select(func.count()).select_from(Company)) == 1
+
+
+def test_overlong_names_get_distinct_keys_that_fit_the_column(tmp_path: Path) -> None:
+    sm = _session_maker(tmp_path)
+    index = CompanyIndex(sm)
+    long_a, long_b = "Acme " * 60 + "Alpha", "Acme " * 60 + "Beta"
+
+    ids = index.resolve([long_a, long_b, "Globex"])
+    assert None not in ids and len(set(ids)) == 3
+    assert index.get(long_a.upper()) == ids[0]
+
+    with sm() as session:
+        keys = list(session.scalars(select(Company.canonical_key)))
+    assert all(len(key) <= 255 for key in keys)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from job_ingestion.storage.models import Base, CurrencyRate
+from job_ingestion.storage.repositories import get_engine, get_session, get_sessionmaker
+from job_ingestion.transformation.currency import (
+    ISO_4217_CODES,
+    CsvRatesSource,
+    CurrencyConverter,
+    DatabaseRatesSource,
+    RateRow,
+    StaticRatesSource,
+)
+
+
+class _CountingSource:
+    def __init__(self, rows: list[RateRow]) -> None:
+        self.rows = rows
+        self.loads = 0
+
+    def load(self) -> list[RateRow]:
+        self.loads += 1
+        return list(self.rows)
+
+
+class TestCurrencyConverter:
+    def test_unknown_currency_has_no_rate(self) -> None:
+        conv = CurrencyConverter(StaticRatesSource())
+        assert conv.convert(100, "USD") == 100
+        assert conv.convert(100_000, "JPY") == pytest.approx(670.0)
+        assert conv.convert(100, "XYZ") is None
+        # Valid ISO code that the table has no rate for
+        assert "ISK" in ISO_4217_CODES
+        assert conv.convert(100, "ISK") is None
+
+    def test_effective_dates_select_rate_as_of_day(self) -> None:
+        rows = [
+            RateRow("EUR", 1.10, date(2024, 1, 1)),
+            RateRow("EUR", 1.05, date(2024, 6, 1)),
+        ]
+        conv = CurrencyConverter(_CountingSource(rows))
+        assert conv.rate("EUR") == 1.05
+        assert conv.rate("EUR", on=date(2024, 3, 1)) == 1.10
+        assert conv.rate("EUR", on=date(2023, 12, 31)) is None
+
+    def test_future_rates_are_not_in_effect_yet(self) -> None:
+        next_year = date.today() + timedelta(days=365)
+        rows = [
+            RateRow("EUR", 1.10, date(2024, 1, 1)),
+            RateRow("EUR", 1.30, next_year),
+            RateRow("GBP", 1.25, next_year),
+        ]
+        conv = CurrencyConverter(_CountingSource(rows))
+        assert conv.rate("EUR") == 1.10
+        assert conv.rate("GBP") is None
+        assert conv.rate("EUR", on=next_year) == 1.30
+
+    def test_table_is_loaded_once_per_refresh_interval(self) -> None:
+        now = [0.0]
+        source = _CountingSource([RateRow("CAD", 0.74, date(2024, 1, 1))])
+        conv = CurrencyConverter(source, refresh_interval=60, clock=lambda: now[0])
+        for _ in range(100):
+            conv.convert(1, "CAD")
+        assert source.loads == 1
+        now[0] = 61.0
+        conv.convert(1, "CAD")
+        assert source.loads == 2
+
+    def test_non_iso_codes_are_ignored(self) -> None:
+        conv = CurrencyConverter(StaticRatesSource({"USD": 1.0, "BTC": 40_000.0}))
+        assert conv.rate("BTC") is None
+
+    def test_convert_many_is_vectorized_with_nan_for_unknown(self) -> None:
+        conv = CurrencyConverter(StaticRatesSource({"USD": 1.0, "CAD": 0.75}))
+        out = conv.convert_many([100, 200, 300, None], ["usd", "CAD", "XYZ", "USD"])
+        assert out[0] == 100 and out[1] == 150
+        assert math.isnan(out[2]) and math.isnan(out[3])
+
+    def test_to_annual_usd_many(self) -> None:
+        conv = CurrencyConverter(StaticRatesSource({"USD": 1.0, "CAD": 0.75}))
+        out = conv.to_annual_usd_many(
+            [50, 100_000, 8000], [None, "CAD", "USD"], ["hourly", None, "monthly"]
+        )
+        assert out.tolist() == [104_000.0, 75_000.0, 96_000.0]
+
+    def test_many_reads_values_like_the_salary_rule(self) -> None:
+        conv = CurrencyConverter(StaticRatesSource({"USD": 1.0, "CAD": 0.75}))
+        out = conv.to_annual_usd_many(
+            ["120000", " 40 ", "n/a", 100], [" cad ", None, None, "USD"], [None, "hourly", None, 3]
+        )
+        assert out[0] == 90_000.0 and out[1] == 83_200.0 and out[3] == 100.0
+        # Non-numeric amount and a currency code with no rate
+        assert math.isnan(out[2])
+        assert math.isnan(conv.convert_many([1], [7])[0])
+
+
+def test_csv_rates_source(tmp_path: Path) -> None:
+    path = tmp_path / "rates.csv"
+    path.write_text("currency,rate_to_usd,effective_date\ngbp,1.25,2024-02-01\n", encoding="utf-8")
+    conv = CurrencyConverter(CsvRatesSource(path))
+    assert conv.convert(100, "GBP") == pytest.approx(125.0)
+
+
+def test_database_rates_source() -> None:
+    engine = get_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    sm = get_sessionmaker(engine)
+    with get_session(sm) as s:
+        s.add(CurrencyRate(currency="CHF", rate_to_usd=1.12, effective_date=date(2024, 1, 1)))
+    conv = CurrencyConverter(DatabaseRatesSource(sm))
+    assert conv.convert(100, "CHF") == pytest.approx(112.0)
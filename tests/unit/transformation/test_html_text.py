@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+from job_ingestion.transformation.html_text import HtmlTextExtractor, extract_text
+
+
+def test_missing_value_returns_none() -> None:
+    assert extract_text(None) is None
+
+
+def test_plain_text_skips_parser_but_normalizes_whitespace() -> None:
+    result = extract_text("  Build   reliable\tservices  ")
+    assert result is not None
+    assert result.text == "Build reliable services"
+    assert (result.length, result.word_count) == (23, 3)
+
+
+def test_markup_is_removed_and_entities_decoded() -> None:
+    result = extract_text(
+        "<div><h2>About&nbsp;us</h2><p>We build <b>data</b> tools &amp; APIs.</p></div>"
+    )
+    assert result is not None
+    assert result.text == "About us\nWe build data tools & APIs."
+    assert result.word_count == 7
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "html",
+    [
+        "<p>Visible</p><script>var hidden = '<p>nope</p>';</script>",
+        "<style>p { color: red }</style><p>Visible</p>",
+        "<p>Visible</p><noscript>Enable JS</noscript>",
+    ],
+)
+def test_invisible_content_is_dropped(html: str) -> None:
+    result = extract_text(html)
+    assert result is not None
+    assert result.text == "Visible"
+
+
+def test_lists_and_breaks_become_lines() -> None:
+    result = extract_text("Skills:<br/>\n<ul>\n  <li>Python</li>\n  <li>SQL</li>\n</ul>")
+    assert result is not None
+    assert result.text == "Skills:\n- Python\n- SQL"
+
+
+def test_extractor_accepts_chunked_input() -> None:
+    parser = HtmlTextExtractor()
+    for chunk in ("<p>Hel", "lo <b", ">wor", "ld</b></p>"):
+        parser.feed(chunk)
+    assert parser.text() == "Hello world"
+
+
+def test_large_descriptions_are_extracted_completely() -> None:
+    paragraph = "<p>Design <em>scalable</em> systems &amp; mentor engineers.</p>"
+    html = paragraph * 2000  # ~120KB of markup
+    result = extract_text(html)
+    assert result is not None
+    assert result.word_count == 5 * 2000
+    assert "<" not in result.text
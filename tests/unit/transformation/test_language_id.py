@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from job_ingestion.transformation.language_id import (
+    LanguageIdentifier,
+    build_profile,
+    get_language_identifier,
+    trigrams,
+)
+
+SAMPLES = {
+    "en": [
+        "Seeking an experienced electrician to install and repair wiring in residential buildings.",
+        "Delivery driver needed for evening shifts. Clean driving record and reliable vehicle.",
+        "Marketing Coordinator - plan events, manage social media accounts and prepare reports.",
+    ],
+    "fr": [
+        "Nous cherchons un électricien d'expérience pour installer et réparer le câblage.",
+        "Chauffeur-livreur recherché pour des quarts de soir. Dossier de conduite exigé.",
+        "Coordonnateur marketing - planifier des événements et gérer les réseaux sociaux.",
+    ],
+    "es": ["Buscamos un electricista con experiencia para instalar y reparar el cableado."],
+    "de": ["Wir suchen einen erfahrenen Elektriker für die Installation von Leitungen."],
+}
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "code,text", [(code, text) for code, texts in SAMPLES.items() for text in texts]
+)
+def test_detects_bundled_languages(code: str, text: str) -> None:
+    assert get_language_identifier().detect(text) == code
+
+
+@pytest.mark.parametrize("text", [None, "", "OK", "12345 !!!", "Sr. SWE"])  # type: ignore[misc]
+def test_short_or_empty_text_is_not_classified(text: str | None) -> None:
+    assert LanguageIdentifier().detect(text) is None
+
+
+def test_batch_matches_single_and_reuses_cache() -> None:
+    texts = [*SAMPLES["en"], None, *SAMPLES["fr"], SAMPLES["en"][0]]
+    identifier = LanguageIdentifier()
+    batch = identifier.detect_many(texts)
+    assert batch == [LanguageIdentifier().detect(t) for t in texts]
+    # Every distinct text was cached by the batch pass
+    assert len(identifier._cache) == 6
+    assert identifier.detect_many(texts) == batch
+
+
+def test_profiles_are_built_from_ranked_trigrams() -> None:
+    assert trigrams("Hi, Zoë!") == ["_hi", "hi_", "_zo", "zoë", "oë_"]
+    profile = build_profile(["aaa aaa ab"], size=3)
+    # Most frequent first, ties in code point order
+    assert profile == "_aaaa_aaa"
+    identifier = LanguageIdentifier(
+        {"x": build_profile(["abc " * 20]), "y": build_profile(["xyz " * 20])}, min_trigrams=3
+    )
+    assert identifier.detect("abc abc abc abc") == "x"
+    assert identifier.detect("xyz xyz xyz xyz") == "y"
+    with pytest.raises(ValueError):
+        LanguageIdentifier({})
+
+
+def test_classification_is_well_under_a_millisecond() -> None:
+    identifier = LanguageIdentifier(cache_size=0)
+    text = SAMPLES["en"][0] * 20
+    identifier.detect(text)
+    started = time.perf_counter()
+    for i in range(50):
+        identifier.detect(f"{i} {text}")
+    assert (time.perf_counter() - started) / 50 < 0.005
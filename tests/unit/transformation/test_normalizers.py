@@ -3,6 +3,7 @@ from job_ingestion.transformation.normalizers import (
     CompanyValidator,
     LocationNormalizer,
     SalaryNormalizer,
+    canonical_company_key,
 )
 
 
@@ -14,7 +15,49 @@ class TestLocationNormalizer:
 
     def test_collapses_whitespace(self) -> None:
         n = LocationNormalizer()
-        assert n.normalize("  New   York   City  ") == "New York City"
+        loc = n.normalize("  New   York   City  ")
+        assert loc is not None and loc.text == "New York City"
+        assert loc.city == "New York"
+
+    @pytest.mark.parametrize(  # type: ignore[misc]
+        "raw,city,region_code,country_code",
+        [
+            ("Austin, TX", "Austin", "TX", "US"),
+            ("San Francisco, CA", "San Francisco", "CA", "US"),
+            ("Vancouver, CA", "Vancouver", "BC", "CA"),
+            ("Toronto, ON, Canada", "Toronto", "ON", "CA"),
+            ("Ottawa, Ontario K1A 0B1", "Ottawa", "ON", "CA"),
+            ("New York, NY 10001", "New York", "NY", "US"),
+            ("Smallville, KS", "Smallville", "KS", "US"),
+            ("London, UK", "London", None, "GB"),
+            ("Texas", None, "TX", "US"),
+            ("USA", None, None, "US"),
+        ],
+    )
+    def test_resolves_structured_location(
+        self, raw: str, city: str | None, region_code: str | None, country_code: str
+    ) -> None:
+        loc = LocationNormalizer().normalize(raw)
+        assert loc is not None
+        assert (loc.city, loc.region_code, loc.country_code) == (city, region_code, country_code)
+
+    def test_unresolvable_keeps_text_only(self) -> None:
+        loc = LocationNormalizer().normalize("Unknown Format")
+        assert loc is not None and loc.text == "Unknown Format"
+        assert loc.country_code is None
+
+    def test_repeated_strings_hit_cache(self) -> None:
+        n = LocationNormalizer()
+        first = n.normalize("Seattle, WA")
+        assert n.normalize("Seattle,   WA") is first
+
+    def test_resolve_country_from_dict(self) -> None:
+        n = LocationNormalizer()
+        assert n.resolve_country({"country": "CA"}) == "CA"
+        assert n.resolve_country({"country": "United Kingdom"}) == "GB"
+        assert n.resolve_country({"city": "Austin", "state": "TX"}) == "US"
+        assert n.resolve_country({"country": "Narnia"}) == "Narnia"
+        assert n.resolve_country({}) is None
 
 
 class TestSalaryNormalizer:
@@ -43,3 +86,33 @@ class TestCompanyValidator:
     def test_invalid_company(self, raw: str) -> None:
         v = CompanyValidator()
         assert v.validate(raw) is False
+
+
+class TestCanonicalCompanyKey:
+    @pytest.mark.parametrize(  # type: ignore[misc]
+        "raw",
+        [
+            "Acme Inc",
+            "ACME, Inc.",
+            "Acme Incorporated",
+            "The Acme Company",
+            "acme  llc",
+            "Acme & Co",
+            "Acme and Company, Inc.",
+        ],
+    )
+    def test_variants_share_a_key(self, raw: str) -> None:
+        assert canonical_company_key(raw) == "acme"
+
+    def test_punctuation_accents_and_ampersand(self) -> None:
+        assert canonical_company_key("Procter & Gamble Co.") == "procter and gamble"
+        assert canonical_company_key("Nestlé S.A.") == "nestle"
+        assert canonical_company_key("McDonald's Corporation") == "mcdonalds"
+
+    def test_suffix_only_names_keep_their_words(self) -> None:
+        assert canonical_company_key("The Company") == "company"
+        assert canonical_company_key("And Co") == "and"
+
+    @pytest.mark.parametrize("raw", ["", "   ", "12345", "---"])  # type: ignore[misc]
+    def test_implausible_names_have_no_key(self, raw: str) -> None:
+        assert canonical_company_key(raw) is None
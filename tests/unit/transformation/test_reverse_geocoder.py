@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+from job_ingestion.transformation.reverse_geocoder import ReverseGeocoder
+
+
+class TestReverseGeocoder:
+    @pytest.mark.parametrize(  # type: ignore[misc]
+        "lat,lon,country,region",
+        [
+            (30.27, -97.74, "US", "TX"),  # Austin
+            (47.61, -122.33, "US", "WA"),  # Seattle
+            (43.65, -79.38, "CA", "ON"),  # Toronto
+            (49.28, -123.12, "CA", "BC"),  # Vancouver
+            (44.37, -100.35, "US", "SD"),  # rural South Dakota, region centroid
+            (48.86, 2.35, "FR", None),  # Paris
+            (32.7157, -117.1611, "US", "CA"),  # San Diego
+            (31.7775, -106.4425, "US", "TX"),  # El Paso
+            (42.3314, -83.0458, "US", "MI"),  # Detroit
+            (42.30, -83.00, "CA", "ON"),  # Windsor, south of Detroit
+            (43.0962, -79.0377, "US", "NY"),  # Niagara Falls, NY
+            (43.0896, -79.0849, "CA", "ON"),  # Niagara Falls, ON
+            (48.4284, -123.3656, "CA", "BC"),  # Victoria, south of the 49th parallel
+            (24.5551, -81.78, "US", "FL"),  # Key West
+            (18.4655, -66.1057, "US", "PR"),  # San Juan
+            (17.75, -64.75, "US", "VI"),  # St. Croix
+            (21.31, -157.86, "US", "HI"),  # Honolulu
+            (58.30, -134.42, "US", "AK"),  # Juneau
+        ],
+    )
+    def test_lookup_resolves_country_and_region(
+        self, lat: float, lon: float, country: str, region: str | None
+    ) -> None:
+        match = ReverseGeocoder().lookup(lat, lon)
+        assert match is not None
+        assert (match.country_code, match.region_code) == (country, region)
+
+    @pytest.mark.parametrize(  # type: ignore[misc]
+        "lat,lon,country",
+        [
+            (32.5149, -117.0382, "MX"),  # Tijuana, next to San Diego
+            (31.6904, -106.4245, "MX"),  # Ciudad Juarez, next to El Paso
+            (25.8797, -97.5042, None),  # Matamoros, across from Brownsville
+            (32.6245, -115.4523, None),  # Mexicali, next to Calexico
+            (23.1136, -82.3666, None),  # Havana
+            (25.0443, -77.3504, None),  # Nassau
+            (25.73, -79.27, None),  # Bimini, 80 km from Miami
+            (18.43, -64.62, None),  # Tortola (British Virgin Islands)
+            (32.30, -64.78, None),  # Bermuda
+            (46.78, -56.18, None),  # Saint-Pierre
+            (64.18, -51.72, None),  # Nuuk
+        ],
+    )
+    def test_points_outside_us_and_canada_are_not_attributed_to_them(
+        self, lat: float, lon: float, country: str | None
+    ) -> None:
+        match = ReverseGeocoder().lookup(lat, lon)
+        assert (match.country_code if match else None) == country
+        assert ReverseGeocoder().lookup_many([lat], [lon]) == [match]
+
+    def test_city_is_reported_only_when_close(self) -> None:
+        geocoder = ReverseGeocoder()
+        near = geocoder.lookup(30.30, -97.70)
+        assert near is not None and near.city == "Austin"
+        rural = geocoder.lookup(31.00, -100.00)
+        assert rural is not None and (rural.country_code, rural.city) == ("US", None)
+        assert ReverseGeocoder(city_radius_km=500).lookup(31.00, -100.00) is not None
+
+    @pytest.mark.parametrize(  # type: ignore[misc]
+        "lat,lon",
+        [(None, None), ("30.2", "-97.7"), (0.0, 0.0), (95.0, 10.0), (-10.0, -140.0)],
+    )
+    def test_lookup_returns_none_for_invalid_or_remote_points(
+        self, lat: object, lon: object
+    ) -> None:
+        assert ReverseGeocoder().lookup(lat, lon) is None
+
+    def test_lookup_many_matches_single_lookups(self) -> None:
+        geocoder = ReverseGeocoder()
+        lats = [30.27, None, -33.87, 64.0, 51.5, 21.3, -45.0, 42.30, 52.9, 13.44]
+        lons = [-97.74, -97.74, 151.21, -150.0, -0.12, -157.8, 170.0, -83.00, 172.9, 144.79]
+        batch = geocoder.lookup_many(lats, lons)
+        assert batch[1] is None and batch[6] is None
+        assert [m.country_code for m in batch if m] == [
+            "US",
+            "AU",
+            "US",
+            "GB",
+            "US",
+            "CA",
+            "US",
+            "US",
+        ]
+        for lat, lon, got in zip(lats, lons, batch, strict=True):
+            expected = geocoder.lookup(lat, lon)
+            assert (got is None) == (expected is None)
+            if got is not None and expected is not None:
+                assert (got.country_code, got.region_code, got.city) == (
+                    expected.country_code,
+                    expected.region_code,
+                    expected.city,
+                )
+
+    def test_lookup_many_rejects_mismatched_lengths(self) -> None:
+        with pytest.raises(ValueError):
+            ReverseGeocoder().lookup_many([1.0], [])